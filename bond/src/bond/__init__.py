@@ -4,6 +4,14 @@ A skilled agent that gets things done, and "bonding" = connecting.
 """
 
 from bond.agent import BondAgent, StreamHandlers
+from bond.governor import (
+    GovernorStats,
+    LLMGovernor,
+    Priority,
+    get_default_governor,
+    set_default_governor,
+)
+from bond.session import AgentSession
 from bond.utils import (
     create_print_handlers,
     create_sse_handlers,
@@ -16,6 +24,13 @@ __all__ = [
     # Core
     "BondAgent",
     "StreamHandlers",
+    "AgentSession",
+    # Admission control
+    "LLMGovernor",
+    "GovernorStats",
+    "Priority",
+    "get_default_governor",
+    "set_default_governor",
     # Utilities
     "create_websocket_handlers",
     "create_sse_handlers",
@@ -1,25 +1,33 @@
 """Core agent runtime with high-fidelity streaming."""
 
+import itertools
 import json
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncIterable, Callable, Iterator, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from pydantic_ai import Agent
+from pydantic_ai import Agent, RunContext
 from pydantic_ai.messages import (
-    FinalResultEvent,
+    AgentStreamEvent,
     FunctionToolCallEvent,
     FunctionToolResultEvent,
     ModelMessage,
+    ModelRequest,
     PartDeltaEvent,
     PartEndEvent,
     PartStartEvent,
+    RetryPromptPart,
     TextPartDelta,
     ThinkingPartDelta,
     ToolCallPartDelta,
 )
 from pydantic_ai.models import Model
+from pydantic_ai.settings import ModelSettings
 from pydantic_ai.tools import Tool
+from pydantic_ai.usage import RunUsage
+
+from bond.governor import LLMGovernor, Priority, get_default_governor
+from bond.session import CHARS_PER_TOKEN, AgentSession, estimate_tokens
 
 T = TypeVar("T")
 DepsT = TypeVar("DepsT")
@@ -35,6 +43,9 @@ class StreamHandlers:
         on_block_start: A new block (Text, Thinking, or Tool Call) has started.
         on_block_end: A block has finished generating.
         on_complete: The entire response is finished.
+        on_attempt: The response is being generated again, e.g. after its
+            output failed validation or a rate-limited call was retried.
+            Everything streamed for it so far is discarded.
 
     Content Events (Typing Effect):
         on_text_delta: Incremental text content.
@@ -71,6 +82,91 @@ class StreamHandlers:
     # Lifecycle: Response complete
     on_complete: Callable[[Any], None] | None = None
 
+    # Lifecycle: Response restarted
+    on_attempt: Callable[[int], None] | None = None  # (attempt number, from 2)
+
+
+def _dispatch(
+    event: AgentStreamEvent,
+    handlers: StreamHandlers,
+    tool_id_to_name: dict[str, str],
+) -> None:
+    """Forward one streamed event to the matching handler."""
+    # --- 1. BLOCK LIFECYCLE (Open/Close) ---
+    if isinstance(event, PartStartEvent):
+        if handlers.on_block_start:
+            kind = getattr(event.part, "part_kind", "unknown")
+            handlers.on_block_start(kind, event.index)
+        # The first chunk of a part arrives with its start
+        content = getattr(event.part, "content", None)
+        if event.part.part_kind == "text" and content and handlers.on_text_delta:
+            handlers.on_text_delta(content)
+        elif event.part.part_kind == "thinking" and content and handlers.on_thinking_delta:
+            handlers.on_thinking_delta(content)
+
+    elif isinstance(event, PartEndEvent):
+        if handlers.on_block_end:
+            kind = getattr(event.part, "part_kind", "unknown")
+            handlers.on_block_end(kind, event.index)
+
+    # --- 2. DELTAS (Typing Effect) ---
+    elif isinstance(event, PartDeltaEvent):
+        delta = event.delta
+
+        if isinstance(delta, TextPartDelta):
+            if handlers.on_text_delta:
+                handlers.on_text_delta(delta.content_delta)
+
+        elif isinstance(delta, ThinkingPartDelta):
+            if handlers.on_thinking_delta and delta.content_delta:
+                handlers.on_thinking_delta(delta.content_delta)
+
+        elif isinstance(delta, ToolCallPartDelta):
+            if handlers.on_tool_call_delta:
+                name_d = delta.tool_name_delta or ""
+                args_d = delta.args_delta or ""
+                # Handle dict args (rare but possible)
+                if isinstance(args_d, dict):
+                    args_d = json.dumps(args_d)
+                handlers.on_tool_call_delta(name_d, args_d)
+
+    # --- 3. EXECUTION (Tool Running/Results) ---
+    elif isinstance(event, FunctionToolCallEvent):
+        # Tool call fully formed, starting execution
+        tool_id_to_name[event.tool_call_id] = event.part.tool_name
+        if handlers.on_tool_execute:
+            handlers.on_tool_execute(
+                event.tool_call_id,
+                event.part.tool_name,
+                event.part.args_as_dict(),
+            )
+
+    elif isinstance(event, FunctionToolResultEvent):
+        # Tool returned data
+        if handlers.on_tool_result:
+            tool_name = tool_id_to_name.get(event.tool_call_id, "unknown")
+            handlers.on_tool_result(
+                event.tool_call_id,
+                tool_name,
+                str(event.part.content),
+            )
+
+
+def _is_retry_request(messages: list[ModelMessage]) -> bool:
+    """Check whether the request about to be sent asks the model to try again."""
+    return (
+        bool(messages)
+        and isinstance(messages[-1], ModelRequest)
+        and any(isinstance(part, RetryPromptPart) for part in messages[-1].parts)
+    )
+
+
+def _start_attempt(handlers: StreamHandlers | None, attempts: Iterator[int]) -> None:
+    """Count a try at the response, telling handlers if it is a restart."""
+    attempt = next(attempts)
+    if attempt > 1 and handlers and handlers.on_attempt:
+        handlers.on_attempt(attempt)
+
 
 @dataclass
 class BondAgent(Generic[T, DepsT]):
@@ -81,10 +177,12 @@ class BondAgent(Generic[T, DepsT]):
     - Block start/end notifications for UI rendering
     - Real-time streaming of text, thinking, and tool arguments
     - Tool execution and result callbacks
-    - Message history management
+    - Stateless calls by default, with opt-in bounded sessions
     - Dynamic instruction override
     - Toolset composition
     - Retry handling
+    - Provider settings such as prompt-cache breakpoints
+    - Shared admission control through an LLMGovernor, with per-agent priority
 
     Example:
         agent = BondAgent(
@@ -110,6 +208,10 @@ class BondAgent(Generic[T, DepsT]):
     deps: DepsT | None = None
     output_type: type[T] = str  # type: ignore[assignment]
     max_retries: int = 3
+    model_settings: ModelSettings | None = None
+    # Calls go through this governor, or the default one if None
+    governor: LLMGovernor | None = None
+    priority: Priority = Priority.NORMAL
 
     _agent: Agent[DepsT, T] | None = field(default=None, init=False, repr=False)
     _history: list[ModelMessage] = field(default_factory=list, init=False, repr=False)
@@ -133,6 +235,7 @@ class BondAgent(Generic[T, DepsT]):
             "output_type": self.output_type,
             "retries": self.max_retries,
             "deps_type": type(self.deps) if self.deps else None,
+            "model_settings": self.model_settings,
         }
         if self.instructions:
             agent_kwargs["system_prompt"] = self.instructions
@@ -145,13 +248,33 @@ class BondAgent(Generic[T, DepsT]):
         *,
         handlers: StreamHandlers | None = None,
         dynamic_instructions: str | None = None,
+        usage: RunUsage | None = None,
+        session: AgentSession | None = None,
+        record: bool = True,
+        priority: Priority | None = None,
     ) -> T:
         """Send prompt and get response with high-fidelity streaming.
 
+        Calls are stateless: without a session, the model sees only the
+        preset history (empty unless set with ``set_message_history``) and
+        this prompt, and nothing is remembered afterwards. Pass the same
+        session to related calls for them to see each other.
+
         Args:
             prompt: The user's message/question.
             handlers: Optional callbacks for streaming events.
             dynamic_instructions: Override system prompt for this call only.
+            usage: Optional usage counter, updated in place with this call's
+                tokens (including prompt-cache reads and writes). Pass a
+                fresh RunUsage to measure a single call.
+            session: Optional conversation this call belongs to. Its bounded
+                history is sent with the prompt and the call's messages are
+                added to it.
+            record: Whether to add the call's messages to the session. Pass
+                False to record the turn yourself, e.g. with
+                ``AgentSession.record_exchange``.
+            priority: Admission priority for this call. Defaults to the
+                agent's ``priority``.
 
         Returns:
             The agent's response of type T.
@@ -168,104 +291,90 @@ class BondAgent(Generic[T, DepsT]):
                 output_type=self.output_type,
                 retries=self.max_retries,
                 deps_type=type(self.deps) if self.deps else None,
+                model_settings=self.model_settings,
             )
 
+        history = self._history
+        if session is not None:
+            history = session.window(dynamic_instructions or self.instructions)
+
+        attempts = itertools.count(1)
+        governor = self.governor or get_default_governor()
+        if governor is None:
+            return await self._run(
+                active_agent, prompt, history, handlers, usage, session, record, attempts
+            )
+
+        # Rate-limited calls are retried by the governor, so track usage to settle tokens
+        run_usage = usage if usage is not None else RunUsage()
+        instructions = dynamic_instructions or self.instructions
+        estimated = (len(prompt) + len(instructions)) // CHARS_PER_TOKEN + estimate_tokens(history)
+        return await governor.run(
+            lambda: self._run(
+                active_agent, prompt, history, handlers, run_usage, session, record, attempts
+            ),
+            priority=priority if priority is not None else self.priority,
+            estimated_tokens=estimated,
+            usage=run_usage,
+        )
+
+    async def _run(
+        self,
+        active_agent: Agent[DepsT, T],
+        prompt: str,
+        history: list[ModelMessage],
+        handlers: StreamHandlers | None,
+        usage: RunUsage | None,
+        session: AgentSession | None,
+        record: bool,
+        attempts: Iterator[int],
+    ) -> T:
+        """Make one model call, streaming its events to handlers if given.
+
+        ``attempts`` numbers the tries at a response across retried calls,
+        so handlers hear of every restart.
+        """
+        _start_attempt(handlers, attempts)
+        event_stream_handler = None
         if handlers:
             # Track tool call IDs to names for result lookup
             tool_id_to_name: dict[str, str] = {}
 
-            async with active_agent.run_stream(
-                prompt,
-                deps=self.deps,
-                message_history=self._history,
-            ) as result:
-                async for event in result.stream():
-                    # --- 1. BLOCK LIFECYCLE (Open/Close) ---
-                    if isinstance(event, PartStartEvent):
-                        if handlers.on_block_start:
-                            kind = getattr(event.part, "part_kind", "unknown")
-                            handlers.on_block_start(kind, event.index)
-
-                    elif isinstance(event, PartEndEvent):
-                        if handlers.on_block_end:
-                            kind = getattr(event.part, "part_kind", "unknown")
-                            handlers.on_block_end(kind, event.index)
-
-                    # --- 2. DELTAS (Typing Effect) ---
-                    elif isinstance(event, PartDeltaEvent):
-                        delta = event.delta
-
-                        if isinstance(delta, TextPartDelta):
-                            if handlers.on_text_delta:
-                                handlers.on_text_delta(delta.content_delta)
-
-                        elif isinstance(delta, ThinkingPartDelta):
-                            if handlers.on_thinking_delta and delta.content_delta:
-                                handlers.on_thinking_delta(delta.content_delta)
-
-                        elif isinstance(delta, ToolCallPartDelta):
-                            if handlers.on_tool_call_delta:
-                                name_d = delta.tool_name_delta or ""
-                                args_d = delta.args_delta or ""
-                                # Handle dict args (rare but possible)
-                                if isinstance(args_d, dict):
-                                    args_d = json.dumps(args_d)
-                                handlers.on_tool_call_delta(name_d, args_d)
-
-                    # --- 3. EXECUTION (Tool Running/Results) ---
-                    elif isinstance(event, FunctionToolCallEvent):
-                        # Tool call fully formed, starting execution
-                        tool_id_to_name[event.tool_call_id] = event.part.tool_name
-                        if handlers.on_tool_execute:
-                            handlers.on_tool_execute(
-                                event.tool_call_id,
-                                event.part.tool_name,
-                                event.part.args_as_dict(),
-                            )
-
-                    elif isinstance(event, FunctionToolResultEvent):
-                        # Tool returned data
-                        if handlers.on_tool_result:
-                            tool_name = tool_id_to_name.get(event.tool_call_id, "unknown")
-                            handlers.on_tool_result(
-                                event.tool_call_id,
-                                tool_name,
-                                str(event.result.content),
-                            )
-
-                    # --- 4. COMPLETION ---
-                    elif isinstance(event, FinalResultEvent):
-                        pass  # Handled after stream
-
-                # Stream finished
-                self._history = list(result.all_messages())
-
-                if handlers.on_complete:
-                    handlers.on_complete(result.output)
-
-                data: T = result.output
-                return data
-
-        # Non-streaming fallback
+            async def event_stream_handler(
+                ctx: RunContext[DepsT], events: AsyncIterable[AgentStreamEvent]
+            ) -> None:
+                # A request that carries a retry prompt regenerates the response
+                if _is_retry_request(ctx.messages):
+                    _start_attempt(handlers, attempts)
+                async for event in events:
+                    _dispatch(event, handlers, tool_id_to_name)
+
         result = await active_agent.run(
             prompt,
             deps=self.deps,
-            message_history=self._history,
+            message_history=history,
+            usage=usage,
+            event_stream_handler=event_stream_handler,
         )
-        self._history = list(result.all_messages())
-        non_stream_data: T = result.output
-        return non_stream_data
+        if session is not None and record:
+            await session.record(result.new_messages())
+
+        if handlers and handlers.on_complete:
+            handlers.on_complete(result.output)
+
+        data: T = result.output
+        return data
 
     def get_message_history(self) -> list[ModelMessage]:
-        """Get current conversation history."""
+        """Get the history sent with every call made without a session."""
         return list(self._history)
 
     def set_message_history(self, history: list[ModelMessage]) -> None:
-        """Replace conversation history."""
+        """Replace the history sent with every call made without a session."""
         self._history = list(history)
 
     def clear_history(self) -> None:
-        """Clear conversation history."""
+        """Clear the history sent with every call made without a session."""
         self._history = []
 
     def clone_with_history(self, history: list[ModelMessage]) -> "BondAgent[T, DepsT]":
@@ -285,6 +394,9 @@ class BondAgent(Generic[T, DepsT]):
             deps=self.deps,
             output_type=self.output_type,
             max_retries=self.max_retries,
+            model_settings=self.model_settings,
+            governor=self.governor,
+            priority=self.priority,
         )
         clone.set_message_history(history)
         return clone
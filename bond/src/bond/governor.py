@@ -0,0 +1,348 @@
+"""Process-wide admission control for LLM calls.
+
+Concurrent agents share one provider quota. If every agent calls the
+provider whenever it likes, and retries on its own when rate limited, a
+burst of investigations turns into a retry storm. An ``LLMGovernor`` sits
+in front of every ``BondAgent.ask`` and admits calls one at a time:
+
+- Request-per-minute and token-per-minute buckets pace calls to the quota.
+  Tokens are reserved from an estimate of the prompt, then settled against
+  the usage the provider reports.
+- Concurrency adapts AIMD-style: each success raises the limit by about one
+  call per round of in-flight calls, and each 429/529 halves it.
+- A rate-limited call is retried by the governor after a shared cooldown,
+  honouring ``Retry-After``, instead of by each agent on its own.
+- Waiting calls are admitted by priority, then in arrival order, so the
+  call a user is waiting on jumps ahead of speculative ones.
+
+Queue wait times are totalled in ``stats`` and reported to an optional
+``on_queue_wait`` callback, for export as a metric.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TypeVar
+
+from pydantic_ai.usage import RunUsage
+
+T = TypeVar("T")
+
+# Provider status codes that mean "slow down": rate limited and overloaded
+RATE_LIMIT_STATUS_CODES = frozenset({429, 529})
+
+# Default ceiling on calls in flight at once
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Default number of times a rate-limited call is retried
+DEFAULT_RATE_LIMIT_RETRIES = 3
+
+# First backoff after a rate limit without Retry-After; doubles per retry
+DEFAULT_BACKOFF_SECONDS = 1.0
+
+# Longest backoff after a rate limit
+MAX_BACKOFF_SECONDS = 60.0
+
+# Factor the concurrency limit is multiplied by on a rate limit
+DECREASE_FACTOR = 0.5
+
+
+class Priority(IntEnum):
+    """Admission priority of a call; lower values are admitted first."""
+
+    CRITICAL = 0
+    NORMAL = 1
+    SPECULATIVE = 2
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Check whether an error, or an error it wraps, is a 429/529 response."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if getattr(current, "status_code", None) in RATE_LIMIT_STATUS_CODES:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Read the Retry-After header of a rate-limit error, in seconds."""
+    headers = getattr(error, "headers", None) or {}
+    try:
+        value = float(headers.get("retry-after", ""))
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+def _used_tokens(usage: RunUsage | None) -> int:
+    """Count the tokens a usage counter has recorded so far."""
+    return usage.input_tokens + usage.output_tokens if usage is not None else 0
+
+
+class _Bucket:
+    """Token bucket refilled continuously to ``per_minute`` per minute."""
+
+    def __init__(self, per_minute: int, now: float) -> None:
+        self.capacity = float(per_minute)
+        self.level = self.capacity
+        self.rate = per_minute / 60.0
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` can be taken; requests over capacity wait for a full bucket."""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(missing, 0.0) / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        """Take ``amount``; a negative amount returns it. The level may go into debt."""
+        self._refill(now)
+        self.level = min(self.capacity, self.level - amount)
+
+
+@dataclass
+class GovernorStats:
+    """Counters of an ``LLMGovernor``.
+
+    Attributes:
+        in_flight: Calls currently running.
+        queued: Calls waiting for admission.
+        concurrency_limit: Current adaptive limit on calls in flight.
+        admitted: Calls admitted, retries included.
+        rate_limited: Calls that got a 429/529 response.
+        queue_wait_seconds: Total time calls waited for admission.
+        max_queue_wait_seconds: Longest wait for admission.
+    """
+
+    in_flight: int = 0
+    queued: int = 0
+    concurrency_limit: float = 0.0
+    admitted: int = 0
+    rate_limited: int = 0
+    queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+
+    @property
+    def mean_queue_wait_seconds(self) -> float:
+        """Average time a call waited for admission."""
+        return self.queue_wait_seconds / self.admitted if self.admitted else 0.0
+
+
+class LLMGovernor:
+    """Shared gate that paces, prioritizes and retries LLM calls.
+
+    Example:
+        governor = LLMGovernor(requests_per_minute=50, tokens_per_minute=40_000)
+        set_default_governor(governor)  # every BondAgent now goes through it
+
+    Attributes:
+        max_concurrency: Ceiling of the adaptive concurrency limit.
+        min_concurrency: Floor of the adaptive concurrency limit.
+        rate_limit_retries: Times a rate-limited call is retried.
+        backoff_seconds: First backoff without Retry-After; doubles per retry.
+        on_queue_wait: Called with each admitted call's priority and wait.
+        stats: Counters, e.g. for a metrics exporter.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+        rate_limit_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        on_queue_wait: Callable[[Priority, float], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the governor.
+
+        Args:
+            requests_per_minute: Request quota. None is unlimited.
+            tokens_per_minute: Input plus output token quota. None is unlimited.
+            max_concurrency: Ceiling of the adaptive concurrency limit, which
+                starts here.
+            min_concurrency: Floor of the adaptive concurrency limit.
+            rate_limit_retries: Times a rate-limited call is retried.
+            backoff_seconds: First backoff without Retry-After.
+            on_queue_wait: Called with each admitted call's priority and
+                queue wait in seconds.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.rate_limit_retries = rate_limit_retries
+        self.backoff_seconds = backoff_seconds
+        self.on_queue_wait = on_queue_wait
+        self._clock = clock
+        now = clock()
+        self._requests = _Bucket(requests_per_minute, now) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute, now) if tokens_per_minute else None
+        self._limit = float(max_concurrency)
+        self._cooldown_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+        self.stats = GovernorStats(concurrency_limit=self._limit)
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Calls currently allowed in flight."""
+        return max(self.min_concurrency, math.floor(self._limit))
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        priority: Priority = Priority.NORMAL,
+        estimated_tokens: int = 0,
+        usage: RunUsage | None = None,
+    ) -> T:
+        """Run an LLM call once admitted, retrying it if rate limited.
+
+        Args:
+            call: Makes the LLM call. Called again for each retry.
+            priority: Admission priority.
+            estimated_tokens: Tokens to reserve before the call.
+            usage: Counter the call adds its usage to. The tokens it adds
+                settle the reservation; without it the estimate stands.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            Exception: The call's error, including a rate limit once the
+                retries are used up.
+        """
+        attempt = 0
+        while True:
+            await self._acquire(priority, estimated_tokens)
+            before = _used_tokens(usage)
+            succeeded = False
+            backoff: float | None = None
+            try:
+                result = await call()
+                succeeded = True
+                return result
+            except Exception as e:
+                if not is_rate_limited(e):
+                    raise
+                backoff = _retry_after(e)
+                if backoff is None:
+                    backoff = min(self.backoff_seconds * 2**attempt, MAX_BACKOFF_SECONDS)
+                if attempt >= self.rate_limit_retries:
+                    raise
+            finally:
+                # Also on cancellation, or the slot would stay taken for good
+                used = _used_tokens(usage) - before if usage is not None else estimated_tokens
+                await self._release(estimated_tokens, used, succeeded=succeeded, backoff=backoff)
+            attempt += 1
+
+    def _admission_delay(self, entry: tuple[int, int], tokens: int, now: float) -> float:
+        """Seconds until a waiter may be admitted; infinite while blocked by others."""
+        if self._waiters[0] != entry or self.stats.in_flight >= self.concurrency_limit:
+            return math.inf
+        delay = self._cooldown_until - now
+        if self._requests is not None:
+            delay = max(delay, self._requests.wait_time(1, now))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.wait_time(tokens, now))
+        return max(delay, 0.0)
+
+    async def _acquire(self, priority: Priority, tokens: int) -> None:
+        """Wait until a call may start, then reserve its request and tokens."""
+        start = self._clock()
+        entry = (int(priority), next(self._sequence))
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            self.stats.queued += 1
+            try:
+                while (delay := self._admission_delay(entry, tokens, self._clock())) > 0:
+                    timeout = None if math.isinf(delay) else delay
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout)
+                    except TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self.stats.queued -= 1
+                # The next waiter may now be at the head, and admissible
+                self._condition.notify_all()
+
+            now = self._clock()
+            if self._requests is not None:
+                self._requests.take(1, now)
+            if self._tokens is not None:
+                self._tokens.take(tokens, now)
+            self.stats.in_flight += 1
+            self.stats.admitted += 1
+
+        waited = self._clock() - start
+        self.stats.queue_wait_seconds += waited
+        self.stats.max_queue_wait_seconds = max(self.stats.max_queue_wait_seconds, waited)
+        if self.on_queue_wait is not None:
+            self.on_queue_wait(priority, waited)
+
+    async def _release(
+        self,
+        reserved: int,
+        used: int,
+        *,
+        succeeded: bool,
+        backoff: float | None = None,
+    ) -> None:
+        """Finish a call: settle its tokens and adapt the concurrency limit.
+
+        Args:
+            reserved: Tokens reserved at admission.
+            used: Tokens the call actually used.
+            succeeded: Whether the call succeeded.
+            backoff: Cooldown before any call is admitted, if rate limited.
+        """
+        async with self._condition:
+            now = self._clock()
+            self.stats.in_flight -= 1
+            if self._tokens is not None:
+                self._tokens.take(used - reserved, now)
+            if backoff is not None:
+                self.stats.rate_limited += 1
+                self._limit = max(float(self.min_concurrency), self._limit * DECREASE_FACTOR)
+                self._cooldown_until = max(self._cooldown_until, now + backoff)
+            elif succeeded:
+                self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+            self.stats.concurrency_limit = self._limit
+            self._condition.notify_all()
+
+
+_default_governor: LLMGovernor | None = None
+
+
+def set_default_governor(governor: LLMGovernor | None) -> None:
+    """Install the governor used by agents without one of their own.
+
+    Args:
+        governor: Governor to share, or None to stop governing calls.
+    """
+    global _default_governor
+    _default_governor = governor
+
+
+def get_default_governor() -> LLMGovernor | None:
+    """Get the governor used by agents without one of their own."""
+    return _default_governor
@@ -0,0 +1,238 @@
+"""Conversation scope for related agent calls.
+
+``BondAgent.ask`` is stateless: each call sees only its own prompt. Calls
+that should see each other, such as a query and the retries that fix it,
+share an ``AgentSession``. A session holds the turns of one conversation and
+sends a bounded window of them with every call:
+
+- Only the newest turns that fit in ``max_history_tokens`` are sent.
+- Older turns are folded into a short summary that is sent in their place.
+- The current call's system prompt is always put at the head of the window,
+  so a turn dropped from the window never takes the instructions with it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field, replace
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelRequestPart,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+
+# Default token budget for the history sent with each call in a session
+DEFAULT_SESSION_HISTORY_TOKENS = 4000
+
+# Rough characters per token, used to estimate history size without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Characters kept from each side of a turn in the default summary
+SUMMARY_EXCERPT_CHARS = 300
+
+Summarizer = Callable[[str | None, Sequence[Sequence[ModelMessage]]], Awaitable[str]]
+
+
+def estimate_tokens(messages: Sequence[ModelMessage]) -> int:
+    """Estimate the prompt tokens a list of messages will use.
+
+    Args:
+        messages: Messages to measure.
+
+    Returns:
+        Approximate token count.
+    """
+    chars = 0
+    for message in messages:
+        for part in message.parts:
+            if isinstance(part, ToolCallPart):
+                chars += len(part.tool_name) + len(part.args_as_json_str())
+            else:
+                content = getattr(part, "content", "")
+                chars += len(content) if isinstance(content, str) else len(str(content))
+    return chars // CHARS_PER_TOKEN
+
+
+def _excerpt(text: str) -> str:
+    """Shorten text to a single-line excerpt."""
+    flat = " ".join(text.split())
+    if len(flat) <= SUMMARY_EXCERPT_CHARS:
+        return flat
+    return flat[: SUMMARY_EXCERPT_CHARS - 3] + "..."
+
+
+async def summarize_turns(
+    previous: str | None,
+    turns: Sequence[Sequence[ModelMessage]],
+) -> str:
+    """Summarize turns by excerpting each prompt and final answer.
+
+    This is the default summarizer. It makes no model calls, which keeps
+    reflexion chains cheap: what a retry needs from earlier attempts is
+    mostly what was asked and what came back.
+
+    Args:
+        previous: Summary of turns dropped earlier, if any.
+        turns: Turns being dropped from the window, oldest first.
+
+    Returns:
+        Summary covering ``previous`` and ``turns``.
+    """
+    lines = [previous] if previous else []
+    for turn in turns:
+        asked = next(
+            (
+                part.content
+                for message in turn
+                if isinstance(message, ModelRequest)
+                for part in message.parts
+                if isinstance(part, UserPromptPart) and isinstance(part.content, str)
+            ),
+            "",
+        )
+        answered = ""
+        for message in turn:
+            if isinstance(message, ModelResponse):
+                for part in message.parts:
+                    if isinstance(part, TextPart):
+                        answered = part.content
+                    elif isinstance(part, ToolCallPart):
+                        answered = f"{part.tool_name}({part.args_as_json_str()})"
+        lines.append(f"- Asked: {_excerpt(asked)}\n  Answered: {_excerpt(answered)}")
+    return "\n".join(lines)
+
+
+@dataclass
+class AgentSession:
+    """Bounded conversation shared by a sequence of ``ask`` calls.
+
+    A session is not safe to share between concurrent calls; give each
+    independent line of work (e.g. one hypothesis) its own session.
+
+    Attributes:
+        key: Label for logs, e.g. ``"<investigation>:<hypothesis>"``.
+        max_history_tokens: Estimated token budget for the turns sent with
+            each call. None sends every turn.
+        summarizer: Folds turns that no longer fit into a running summary.
+            None drops them without a summary.
+    """
+
+    key: str = ""
+    max_history_tokens: int | None = DEFAULT_SESSION_HISTORY_TOKENS
+    summarizer: Summarizer | None = summarize_turns
+    summary: str | None = field(default=None, init=False)
+    _turns: list[list[ModelMessage]] = field(default_factory=list, init=False, repr=False)
+
+    @classmethod
+    def from_messages(
+        cls,
+        messages: Sequence[ModelMessage],
+        **kwargs: object,
+    ) -> AgentSession:
+        """Start a session from an existing message history.
+
+        Args:
+            messages: History to continue, treated as a single turn.
+            **kwargs: Session settings.
+
+        Returns:
+            The new session.
+        """
+        session = cls(**kwargs)  # type: ignore[arg-type]
+        if messages:
+            session._turns.append(list(messages))
+        return session
+
+    @property
+    def turn_count(self) -> int:
+        """Number of turns kept in full."""
+        return len(self._turns)
+
+    def messages(self) -> list[ModelMessage]:
+        """Return every message kept in full, oldest first."""
+        return [message for turn in self._turns for message in turn]
+
+    def window(self, system_prompt: str | None = None) -> list[ModelMessage]:
+        """Build the message history to send with the next call.
+
+        Args:
+            system_prompt: System prompt of the next call. It replaces any
+                system prompt stored in the kept turns.
+
+        Returns:
+            Messages to pass as history. Empty for a new session without a
+            summary.
+        """
+        messages = [_without_system_prompt(m) for m in self.messages()]
+        head: list[ModelRequestPart] = []
+        if system_prompt:
+            head.append(SystemPromptPart(content=system_prompt))
+        if self.summary:
+            head.append(UserPromptPart(content=f"Summary of earlier turns:\n{self.summary}"))
+        if not messages:
+            # A trailing request is merged with the next prompt
+            return [ModelRequest(parts=head)] if self.summary else []
+        if head and isinstance(messages[0], ModelRequest):
+            messages[0] = replace(messages[0], parts=[*head, *messages[0].parts])
+        return messages
+
+    async def record(self, turn: Sequence[ModelMessage]) -> None:
+        """Add a finished call's messages and trim the window to budget.
+
+        Args:
+            turn: Messages produced by the call, starting with its request.
+        """
+        if turn:
+            self._turns.append(list(turn))
+        await self._trim()
+
+    async def record_exchange(self, prompt: str, answer: str) -> None:
+        """Add a turn that was answered outside the session.
+
+        Use this when a result for this conversation came from elsewhere,
+        e.g. a batched call, so later calls still see it.
+
+        Args:
+            prompt: Prompt the answer responds to.
+            answer: The answer, as the model would have written it.
+        """
+        await self.record(
+            [
+                ModelRequest(parts=[UserPromptPart(content=prompt)]),
+                ModelResponse(parts=[TextPart(content=answer)]),
+            ]
+        )
+
+    async def _trim(self) -> None:
+        """Drop or summarize the oldest turns until the rest fit the budget.
+
+        The newest turn is always kept, even if it alone is over budget.
+        """
+        if self.max_history_tokens is None:
+            return
+        dropped: list[list[ModelMessage]] = []
+        while len(self._turns) > 1 and estimate_tokens(self.messages()) > self.max_history_tokens:
+            dropped.append(self._turns.pop(0))
+        if dropped and self.summarizer is not None:
+            self.summary = await self.summarizer(self.summary, dropped)
+
+    def clear(self) -> None:
+        """Forget every turn and the summary."""
+        self._turns = []
+        self.summary = None
+
+
+def _without_system_prompt(message: ModelMessage) -> ModelMessage:
+    """Return a message with its system prompt parts removed."""
+    if not isinstance(message, ModelRequest):
+        return message
+    parts = [part for part in message.parts if not isinstance(part, SystemPromptPart)]
+    if len(parts) == len(message.parts):
+        return message
+    return replace(message, parts=parts)
@@ -165,3 +165,162 @@ class TestBondAgentInitialization:
 
             call_kwargs = MockAgent.call_args.kwargs
             assert "system_prompt" not in call_kwargs
+
+
+class TestBondAgentModelSettings:
+    """Tests for provider settings and usage reporting."""
+
+    @pytest.mark.asyncio
+    async def test_model_settings_reach_dynamic_agent(self) -> None:
+        """Test settings such as cache breakpoints apply to per-call agents."""
+        settings = {"anthropic_cache_instructions": True}
+        with patch("bond.agent.Agent") as MockAgent:
+            mock_result = MagicMock()
+            mock_result.all_messages.return_value = []
+            MockAgent.return_value.run = AsyncMock(return_value=mock_result)
+
+            agent: BondAgent[str, None] = BondAgent(
+                name="test",
+                instructions="",
+                model="test-model",
+                model_settings=settings,  # type: ignore[arg-type]
+            )
+            assert MockAgent.call_args.kwargs["model_settings"] == settings
+
+            await agent.ask("prompt", dynamic_instructions="cached prefix")
+
+            assert MockAgent.call_args.kwargs["model_settings"] == settings
+
+    @pytest.mark.asyncio
+    async def test_usage_counts_a_single_call(self) -> None:
+        """Test a usage counter passed to ask is updated with the call's tokens."""
+        from pydantic_ai.models.test import TestModel
+        from pydantic_ai.usage import RunUsage
+
+        agent: BondAgent[str, None] = BondAgent(
+            name="test",
+            instructions="You are helpful.",
+            model=TestModel(),
+        )
+        usage = RunUsage()
+
+        await agent.ask("hello", usage=usage)
+
+        assert usage.requests == 1
+        assert usage.input_tokens > 0
+
+
+class TestBondAgentStreaming:
+    """Tests for streaming a call's events to handlers."""
+
+    @pytest.mark.asyncio
+    async def test_text_and_structured_output_are_streamed(self) -> None:
+        """Test every text chunk, including the first, reaches the handlers."""
+        from collections.abc import AsyncIterator
+
+        from pydantic_ai import PromptedOutput
+        from pydantic_ai.messages import ModelMessage
+        from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+        from bond import StreamHandlers
+
+        async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+            for chunk in ['{"message": ', '"hello', ' there"}']:
+                yield chunk
+
+        agent: BondAgent[SimpleResponse, None] = BondAgent(
+            name="test",
+            instructions="Answer in JSON.",
+            model=FunctionModel(stream_function=stream),
+            output_type=PromptedOutput(SimpleResponse),  # type: ignore[arg-type]
+        )
+        deltas: list[str] = []
+        blocks: list[str] = []
+        completed: list[object] = []
+
+        result = await agent.ask(
+            "greet",
+            handlers=StreamHandlers(
+                on_block_start=lambda kind, idx: blocks.append(kind),
+                on_text_delta=deltas.append,
+                on_complete=completed.append,
+            ),
+        )
+
+        assert result == SimpleResponse(message="hello there")
+        assert "".join(deltas) == '{"message": "hello there"}'
+        assert blocks == ["text"]
+        assert completed == [result]
+
+    @pytest.mark.asyncio
+    async def test_output_retry_restarts_the_stream(self) -> None:
+        """Test handlers hear when invalid output is regenerated."""
+        from collections.abc import AsyncIterator
+
+        from pydantic_ai import PromptedOutput
+        from pydantic_ai.messages import ModelMessage
+        from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+        from bond import StreamHandlers
+
+        answers = iter(['{"wrong": 1}', '{"message": "hello"}'])
+
+        async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+            yield next(answers)
+
+        agent: BondAgent[SimpleResponse, None] = BondAgent(
+            name="test",
+            instructions="Answer in JSON.",
+            model=FunctionModel(stream_function=stream),
+            output_type=PromptedOutput(SimpleResponse),  # type: ignore[arg-type]
+        )
+        events: list[object] = []
+
+        result = await agent.ask(
+            "greet",
+            handlers=StreamHandlers(on_text_delta=events.append, on_attempt=events.append),
+        )
+
+        assert result == SimpleResponse(message="hello")
+        assert events == ['{"wrong": 1}', 2, '{"message": "hello"}']
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_retry_restarts_the_stream(self) -> None:
+        """Test handlers hear when the governor retries a call that already streamed."""
+        from collections.abc import AsyncIterator
+
+        from pydantic_ai import PromptedOutput
+        from pydantic_ai.exceptions import ModelHTTPError
+        from pydantic_ai.messages import ModelMessage
+        from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+        from bond import LLMGovernor, StreamHandlers
+
+        calls = 0
+
+        async def stream(messages: list[ModelMessage], info: AgentInfo) -> AsyncIterator[str]:
+            nonlocal calls
+            calls += 1
+            yield '{"message": '
+            if calls == 1:
+                error = ModelHTTPError(status_code=429, model_name="test", body=None)
+                error.headers = {"retry-after": "0"}
+                raise error
+            yield '"hello"}'
+
+        agent: BondAgent[SimpleResponse, None] = BondAgent(
+            name="test",
+            instructions="Answer in JSON.",
+            model=FunctionModel(stream_function=stream),
+            output_type=PromptedOutput(SimpleResponse),  # type: ignore[arg-type]
+            governor=LLMGovernor(),
+        )
+        events: list[object] = []
+
+        result = await agent.ask(
+            "greet",
+            handlers=StreamHandlers(on_text_delta=events.append, on_attempt=events.append),
+        )
+
+        assert result == SimpleResponse(message="hello")
+        assert events == ['{"message": ', 2, '{"message": ', '"hello"}']
@@ -0,0 +1,200 @@
+"""Tests for the shared LLM admission governor."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.usage import RunUsage
+
+from bond import BondAgent, LLMGovernor, Priority
+from bond.governor import is_rate_limited
+
+
+def _rate_limited(retry_after: str = "0") -> ModelHTTPError:
+    """Build a 429 response error."""
+    error = ModelHTTPError(status_code=429, model_name="test", body=None)
+    error.headers = {"retry-after": retry_after}
+    return error
+
+
+class TestLLMGovernor:
+    """Tests for LLMGovernor admission."""
+
+    @pytest.mark.asyncio
+    async def test_limits_calls_in_flight(self) -> None:
+        """Test no more calls run at once than the concurrency limit."""
+        governor = LLMGovernor(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(governor.run(call) for _ in range(6)))
+
+        assert peak == 2
+        assert governor.stats.admitted == 6
+
+    @pytest.mark.asyncio
+    async def test_critical_calls_jump_the_queue(self) -> None:
+        """Test a waiting critical call is admitted before earlier speculative ones."""
+        governor = LLMGovernor(max_concurrency=1)
+        gate = asyncio.Event()
+        order: list[str] = []
+
+        async def call(name: str) -> None:
+            order.append(name)
+            if name == "first":
+                await gate.wait()
+
+        first = asyncio.create_task(governor.run(lambda: call("first")))
+        await asyncio.sleep(0)
+        waiting = [
+            asyncio.create_task(
+                governor.run(lambda: call("speculative"), priority=Priority.SPECULATIVE)
+            ),
+            asyncio.create_task(governor.run(lambda: call("critical"), priority=Priority.CRITICAL)),
+        ]
+        await asyncio.sleep(0.01)
+        gate.set()
+        await asyncio.gather(first, *waiting)
+
+        assert order == ["first", "critical", "speculative"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_backs_off_and_retries(self) -> None:
+        """Test a 429 halves concurrency and the call is retried by the governor."""
+        governor = LLMGovernor(max_concurrency=4)
+        attempts = 0
+
+        async def call() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise _rate_limited()
+            return "ok"
+
+        assert await governor.run(call) == "ok"
+        assert attempts == 2
+        assert governor.stats.rate_limited == 1
+        # Halved to 2, then one success adds 1/2
+        assert governor.stats.concurrency_limit == pytest.approx(2.5)
+        assert governor.concurrency_limit == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_are_bounded(self) -> None:
+        """Test a call that stays rate limited fails after its retries."""
+        governor = LLMGovernor(rate_limit_retries=1, min_concurrency=1)
+
+        async def call() -> None:
+            raise _rate_limited()
+
+        with pytest.raises(ModelHTTPError):
+            await governor.run(call)
+
+        assert governor.stats.rate_limited == 2
+        assert governor.stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_frees_its_slot(self) -> None:
+        """Test a cancelled call releases its slot for the next call."""
+        governor = LLMGovernor(max_concurrency=1)
+        started = asyncio.Event()
+
+        async def hang() -> None:
+            started.set()
+            await asyncio.Event().wait()
+
+        async def call() -> str:
+            return "ok"
+
+        task = asyncio.create_task(governor.run(hang))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert governor.stats.in_flight == 0
+        assert await asyncio.wait_for(governor.run(call), timeout=1) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_token_budget_paces_calls(self) -> None:
+        """Test a call waits for the token bucket and the wait is reported."""
+        waits: list[tuple[Priority, float]] = []
+        governor = LLMGovernor(
+            tokens_per_minute=6000, on_queue_wait=lambda p, s: waits.append((p, s))
+        )
+
+        async def call() -> None:
+            return None
+
+        await governor.run(call, estimated_tokens=6000)
+        await governor.run(call, estimated_tokens=10, priority=Priority.CRITICAL)
+
+        # 6000 tokens per minute refill 100 per second, so 10 tokens take ~0.1s
+        assert waits[1][0] == Priority.CRITICAL
+        assert waits[1][1] >= 0.08
+        assert governor.stats.max_queue_wait_seconds == waits[1][1]
+
+    @pytest.mark.asyncio
+    async def test_reservation_is_settled_against_usage(self) -> None:
+        """Test unused reserved tokens are returned to the bucket."""
+        governor = LLMGovernor(tokens_per_minute=6000)
+        usage = RunUsage()
+
+        async def call() -> None:
+            usage.incr(RunUsage(input_tokens=100))
+
+        await governor.run(call, estimated_tokens=6000, usage=usage)
+        await governor.run(call, estimated_tokens=5000, usage=usage)
+
+        assert governor.stats.max_queue_wait_seconds < 0.05
+
+    def test_detects_wrapped_rate_limits(self) -> None:
+        """Test a 429 wrapped in another error is still detected."""
+        try:
+            try:
+                raise _rate_limited()
+            except ModelHTTPError as e:
+                raise RuntimeError("call failed") from e
+        except RuntimeError as wrapped:
+            assert is_rate_limited(wrapped)
+        assert not is_rate_limited(ValueError("bad output"))
+
+
+class TestAgentGovernance:
+    """Tests for BondAgent calls going through a governor."""
+
+    @pytest.mark.asyncio
+    async def test_ask_is_admitted_with_agent_priority(self) -> None:
+        """Test an agent's calls are admitted with its priority and retried on 429."""
+        calls = 0
+
+        def model(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise _rate_limited()
+            return ModelResponse(parts=[TextPart(content="done")])
+
+        priorities: list[Priority] = []
+        governor = LLMGovernor(on_queue_wait=lambda p, s: priorities.append(p))
+        agent: BondAgent[str, None] = BondAgent(
+            name="synthesizer",
+            instructions="Be brief.",
+            model=FunctionModel(model),
+            governor=governor,
+            priority=Priority.CRITICAL,
+        )
+
+        assert await agent.ask("Summarize") == "done"
+        assert priorities == [Priority.CRITICAL, Priority.CRITICAL]
+        assert governor.stats.rate_limited == 1
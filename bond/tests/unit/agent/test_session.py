@@ -0,0 +1,184 @@
+"""Tests for stateless asks and bounded AgentSession history."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from bond import AgentSession, BondAgent
+from bond.session import estimate_tokens
+
+
+def _parts(messages: list[ModelMessage], kind: type) -> list[str]:
+    """Collect the content of every request part of one kind."""
+    return [
+        part.content
+        for message in messages
+        if isinstance(message, ModelRequest)
+        for part in message.parts
+        if isinstance(part, kind)
+    ]
+
+
+class RecordingModel:
+    """Echo model that records the messages of every request."""
+
+    def __init__(self) -> None:
+        """Start with no recorded requests."""
+        self.requests: list[list[ModelMessage]] = []
+
+    def __call__(self, messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        """Record the request and answer with its sequence number."""
+        self.requests.append(messages)
+        return ModelResponse(parts=[TextPart(content=f"answer {len(self.requests)}")])
+
+
+@pytest.fixture
+def recorder() -> RecordingModel:
+    """Create a recording model."""
+    return RecordingModel()
+
+
+@pytest.fixture
+def agent(recorder: RecordingModel) -> BondAgent[str, None]:
+    """Create an agent backed by the recording model."""
+    return BondAgent(name="test", instructions="Be brief.", model=FunctionModel(recorder))
+
+
+def _turn(prompt: str, answer: str) -> list[ModelMessage]:
+    """Build one request/response turn."""
+    return [
+        ModelRequest(parts=[UserPromptPart(content=prompt)]),
+        ModelResponse(parts=[TextPart(content=answer)]),
+    ]
+
+
+class TestStatelessAsk:
+    """Tests for asks made without a session."""
+
+    @pytest.mark.asyncio
+    async def test_calls_do_not_share_history(
+        self, agent: BondAgent[str, None], recorder: RecordingModel
+    ) -> None:
+        """Test each call sees only its own prompt."""
+        await agent.ask("first")
+        await agent.ask("second")
+
+        assert _parts(recorder.requests[1], UserPromptPart) == ["second"]
+        assert agent.get_message_history() == []
+
+    @pytest.mark.asyncio
+    async def test_preset_history_is_sent_unchanged(
+        self, agent: BondAgent[str, None], recorder: RecordingModel
+    ) -> None:
+        """Test history set on the agent is a fixed preamble."""
+        agent.set_message_history(_turn("context", "noted"))
+
+        await agent.ask("first")
+        await agent.ask("second")
+
+        assert _parts(recorder.requests[1], UserPromptPart) == ["context", "second"]
+        assert len(agent.get_message_history()) == 2
+
+
+class TestAgentSession:
+    """Tests for session-scoped history."""
+
+    @pytest.mark.asyncio
+    async def test_session_calls_see_each_other(
+        self, agent: BondAgent[str, None], recorder: RecordingModel
+    ) -> None:
+        """Test calls in one session see earlier turns and sessions stay apart."""
+        session = AgentSession(key="inv:h1")
+        other = AgentSession(key="inv:h2")
+
+        await agent.ask("query", session=session)
+        await agent.ask("other query", session=other)
+        await agent.ask("fix it", session=session)
+
+        assert _parts(recorder.requests[2], UserPromptPart) == ["query", "fix it"]
+        assert session.turn_count == 2
+        assert other.turn_count == 1
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_current_call_instructions(
+        self, agent: BondAgent[str, None], recorder: RecordingModel
+    ) -> None:
+        """Test each call sends its own instructions exactly once."""
+        session = AgentSession()
+
+        await agent.ask("query", session=session, dynamic_instructions="schema v1")
+        await agent.ask("fix it", session=session, dynamic_instructions="schema v2")
+
+        assert _parts(recorder.requests[1], SystemPromptPart) == ["schema v2"]
+
+    @pytest.mark.asyncio
+    async def test_old_turns_are_summarized(self) -> None:
+        """Test turns beyond the budget are replaced by a summary."""
+        session = AgentSession(max_history_tokens=40)
+
+        await session.record(_turn("a" * 80, "first answer"))
+        await session.record(_turn("b" * 80, "second answer"))
+        await session.record(_turn("c" * 80, "third answer"))
+
+        window = session.window("system")
+        assert session.turn_count == 1
+        assert "second answer" in (session.summary or "")
+        assert _parts(window, SystemPromptPart) == ["system"]
+        summary, prompt = _parts(window, UserPromptPart)
+        assert summary.startswith("Summary of earlier turns:")
+        assert "first answer" in summary
+        assert prompt == "c" * 80
+
+    @pytest.mark.asyncio
+    async def test_newest_turn_is_always_kept(self) -> None:
+        """Test a single turn over budget is still sent."""
+        session = AgentSession(max_history_tokens=1, summarizer=None)
+
+        await session.record(_turn("a" * 80, "x"))
+        await session.record(_turn("b" * 80, "y"))
+
+        assert session.turn_count == 1
+        assert session.summary is None
+        assert estimate_tokens(session.messages()) == 20
+
+    @pytest.mark.asyncio
+    async def test_custom_summarizer(self) -> None:
+        """Test a custom summarizer receives the previous summary and dropped turns."""
+        calls: list[tuple[str | None, int]] = []
+
+        async def summarize(previous: str | None, turns: object) -> str:
+            calls.append((previous, len(turns)))  # type: ignore[arg-type]
+            return f"summary {len(calls)}"
+
+        session = AgentSession(max_history_tokens=1, summarizer=summarize)
+        for prompt in ("a", "b", "c"):
+            await session.record(_turn(prompt * 20, "ok"))
+
+        assert calls == [(None, 1), ("summary 1", 1)]
+        assert session.summary == "summary 2"
+
+    @pytest.mark.asyncio
+    async def test_record_exchange_is_seen_by_next_call(
+        self, agent: BondAgent[str, None], recorder: RecordingModel
+    ) -> None:
+        """Test an answer obtained elsewhere joins the conversation."""
+        session = AgentSession()
+        await session.record_exchange("query for h1", '{"query": "SELECT 1"}')
+
+        await agent.ask("fix it", session=session)
+
+        assert _parts(recorder.requests[0], SystemPromptPart) == ["Be brief."]
+        assert _parts(recorder.requests[0], UserPromptPart) == ["query for h1", "fix it"]
+
+    def test_new_session_window_is_empty(self) -> None:
+        """Test the first call of a session uses the agent's own system prompt."""
+        assert AgentSession().window("system") == []
@@ -9,12 +9,10 @@ from __future__ import annotations
 import time
 from typing import Any
 
-from dataing.adapters.datasource.api.base import APIAdapter
+from dataing.adapters.datasource.api.base import RATE_LIMIT_FIELDS, APIAdapter, Page
 from dataing.adapters.datasource.errors import (
-    AccessDeniedError,
-    AuthenticationFailedError,
+    AdapterError,
     ConnectionFailedError,
-    RateLimitedError,
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
@@ -61,6 +59,9 @@ HUBSPOT_OBJECTS = [
     "tasks",
 ]
 
+# Largest page size accepted by the HubSpot CRM objects API
+HUBSPOT_PAGE_SIZE = 100
+
 HUBSPOT_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="auth", label="Authentication", collapsed_by_default=False),
@@ -85,6 +86,7 @@ HUBSPOT_CONFIG_SCHEMA = ConfigSchema(
             placeholder="contacts,companies,deals",
             description="Comma-separated list of objects (default: all standard objects)",
         ),
+        *RATE_LIMIT_FIELDS,
     ],
 )
 
@@ -128,7 +130,6 @@ class HubSpotAdapter(APIAdapter):
                 - objects: Comma-separated list of objects to include (optional)
         """
         super().__init__(config)
-        self._session: Any = None
         self._source_id: str = ""
 
     @property
@@ -151,20 +152,10 @@ class HubSpotAdapter(APIAdapter):
     async def connect(self) -> None:
         """Establish connection to HubSpot API."""
         try:
-            import httpx
-        except ImportError as e:
-            raise ConnectionFailedError(
-                message="httpx is not installed. Install with: pip install httpx",
-                details={"error": str(e)},
-            ) from e
-
-        try:
-            self._session = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
+            self._client = self._create_client(self.BASE_URL, self._get_headers())
             self._connected = True
+        except AdapterError:
+            raise
         except Exception as e:
             raise ConnectionFailedError(
                 message=f"Failed to initialize HubSpot client: {str(e)}",
@@ -173,9 +164,7 @@ class HubSpotAdapter(APIAdapter):
 
     async def disconnect(self) -> None:
         """Close HubSpot connection."""
-        if self._session:
-            await self._session.aclose()
-            self._session = None
+        await self._close_client()
         self._connected = False
 
     async def test_connection(self) -> ConnectionTestResult:
@@ -185,7 +174,7 @@ class HubSpotAdapter(APIAdapter):
             if not self._connected:
                 await self.connect()
 
-            response = await self._session.get("/crm/v3/objects/contacts?limit=1")
+            response = await self._request("GET", "/crm/v3/objects/contacts", params={"limit": 1})
             latency_ms = int((time.time() - start_time) * 1000)
 
             if response.status_code == 200:
@@ -228,23 +217,12 @@ class HubSpotAdapter(APIAdapter):
 
     async def describe_object(self, object_name: str) -> Table:
         """Get schema for a HubSpot object."""
-        if not self._connected or not self._session:
+        if not self._connected or not self._client:
             raise ConnectionFailedError(message="Not connected to HubSpot")
 
         try:
-            response = await self._session.get(f"/crm/v3/properties/{object_name}")
-
-            if response.status_code == 401:
-                raise AuthenticationFailedError(message="Invalid HubSpot access token")
-            elif response.status_code == 403:
-                raise AccessDeniedError(message=f"Access denied to {object_name} properties")
-            elif response.status_code == 429:
-                raise RateLimitedError(
-                    message="HubSpot API rate limit exceeded",
-                    retry_after_seconds=10,
-                )
-
-            response.raise_for_status()
+            response = await self._request("GET", f"/crm/v3/properties/{object_name}")
+            self._check_response(response, object_name)
             data = response.json()
 
             columns = []
@@ -270,7 +248,7 @@ class HubSpotAdapter(APIAdapter):
                 columns=columns,
             )
 
-        except (AuthenticationFailedError, AccessDeniedError, RateLimitedError):
+        except AdapterError:
             raise
         except Exception as e:
             raise SchemaFetchFailedError(
@@ -284,62 +262,34 @@ class HubSpotAdapter(APIAdapter):
         query: str | None = None,
         limit: int = 100,
     ) -> QueryResult:
-        """Query records from a HubSpot object."""
-        if not self._connected or not self._session:
-            raise ConnectionFailedError(message="Not connected to HubSpot")
-
-        start_time = time.time()
-        try:
-            params: dict[str, Any] = {"limit": min(limit, 100)}
+        """Query records from a HubSpot object.
 
-            response = await self._session.get(
-                f"/crm/v3/objects/{object_name}",
-                params=params,
-            )
-
-            if response.status_code == 401:
-                raise AuthenticationFailedError(message="Invalid HubSpot access token")
-            elif response.status_code == 403:
-                raise AccessDeniedError(message=f"Access denied to {object_name}")
-            elif response.status_code == 429:
-                raise RateLimitedError(
-                    message="HubSpot API rate limit exceeded",
-                    retry_after_seconds=10,
-                )
+        Follows ``paging.next.after`` cursors until ``limit`` records are read.
+        """
+        if not self._connected or not self._client:
+            raise ConnectionFailedError(message="Not connected to HubSpot")
 
-            response.raise_for_status()
+        async def fetch_page(cursor: str | None, page_size: int) -> Page:
+            params: dict[str, Any] = {"limit": page_size}
+            if cursor:
+                params["after"] = cursor
+            response = await self._request("GET", f"/crm/v3/objects/{object_name}", params=params)
+            self._check_response(response, object_name)
             data = response.json()
+            next_page = (data.get("paging") or {}).get("next") or {}
+            return Page(records=data.get("results", []), next_cursor=next_page.get("after"))
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            results = data.get("results", [])
-
-            if not results:
-                return QueryResult(
-                    columns=[],
-                    rows=[],
-                    row_count=0,
-                    execution_time_ms=execution_time_ms,
-                )
-
-            all_keys = set()
-            rows = []
-            for record in results:
-                props = record.get("properties", {})
-                props["id"] = record.get("id")
-                all_keys.update(props.keys())
-                rows.append(props)
-
-            columns = [{"name": key, "data_type": "string"} for key in sorted(all_keys)]
+        def to_row(record: dict[str, Any]) -> dict[str, Any]:
+            row = dict(record.get("properties") or {})
+            row["id"] = record.get("id")
+            return row
 
-            return QueryResult(
-                columns=columns,
-                rows=rows,
-                row_count=len(rows),
-                truncated=data.get("paging") is not None,
-                execution_time_ms=execution_time_ms,
+        start_time = time.time()
+        try:
+            rows, truncated = await self._paginate(
+                fetch_page, limit=limit, page_size=HUBSPOT_PAGE_SIZE, transform=to_row
             )
-
-        except (AuthenticationFailedError, AccessDeniedError, RateLimitedError):
+        except AdapterError:
             raise
         except Exception as e:
             raise ConnectionFailedError(
@@ -347,12 +297,34 @@ class HubSpotAdapter(APIAdapter):
                 details={"error": str(e)},
             ) from e
 
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        if not rows:
+            return QueryResult(
+                columns=[],
+                rows=[],
+                row_count=0,
+                execution_time_ms=execution_time_ms,
+            )
+
+        all_keys: set[str] = set()
+        for row in rows:
+            all_keys.update(row.keys())
+        columns = [{"name": key, "data_type": "string"} for key in sorted(all_keys)]
+
+        return QueryResult(
+            columns=columns,
+            rows=rows,
+            row_count=len(rows),
+            truncated=truncated,
+            execution_time_ms=execution_time_ms,
+        )
+
     async def get_schema(
         self,
         filter: SchemaFilter | None = None,
     ) -> SchemaResponse:
         """Get HubSpot schema."""
-        if not self._connected or not self._session:
+        if not self._connected or not self._client:
             raise ConnectionFailedError(message="Not connected to HubSpot")
 
         try:
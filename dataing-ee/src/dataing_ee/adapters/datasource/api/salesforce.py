@@ -9,8 +9,9 @@ from __future__ import annotations
 import time
 from typing import Any
 
-from dataing.adapters.datasource.api.base import APIAdapter
+from dataing.adapters.datasource.api.base import RATE_LIMIT_FIELDS, APIAdapter, Page
 from dataing.adapters.datasource.errors import (
+    AdapterError,
     AuthenticationFailedError,
     ConnectionFailedError,
     QuerySyntaxError,
@@ -35,10 +36,17 @@ from dataing.adapters.datasource.types import (
     Table,
 )
 
+# Largest batch Salesforce returns per query page
+SALESFORCE_PAGE_SIZE = 2000
+
+# Smallest batch size accepted in the Sforce-Query-Options header
+SALESFORCE_MIN_BATCH_SIZE = 200
+
 SALESFORCE_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
         FieldGroup(id="oauth", label="OAuth Credentials", collapsed_by_default=False),
+        FieldGroup(id="advanced", label="Advanced", collapsed_by_default=True),
     ],
     fields=[
         ConfigField(
@@ -110,6 +118,7 @@ SALESFORCE_CONFIG_SCHEMA = ConfigSchema(
             group="oauth",
             show_if={"field": "auth_type", "value": "password"},
         ),
+        *RATE_LIMIT_FIELDS,
     ],
 )
 
@@ -205,7 +214,13 @@ class SalesforceAdapter(APIAdapter):
                     domain=domain if "sandbox" in domain else None,
                 )
 
+            self._client = self._create_client(
+                f"https://{self._sf.sf_instance}",
+                {"Authorization": f"Bearer {self._sf.session_id}"},
+            )
             self._connected = True
+        except AdapterError:
+            raise
         except Exception as e:
             error_str = str(e).lower()
             if "invalid_grant" in error_str or "authentication" in error_str:
@@ -221,6 +236,7 @@ class SalesforceAdapter(APIAdapter):
 
     async def disconnect(self) -> None:
         """Close Salesforce connection."""
+        await self._close_client()
         self._sf = None
         self._connected = False
 
@@ -257,72 +273,99 @@ class SalesforceAdapter(APIAdapter):
         query: str | None = None,
         limit: int = 100,
     ) -> QueryResult:
-        """Query a Salesforce object using SOQL."""
+        """Query a Salesforce object using SOQL.
+
+        Runs the query through the REST API and follows ``nextRecordsUrl``
+        until ``limit`` records are read.
+        """
         if not self._connected or not self._sf:
             raise ConnectionFailedError(message="Not connected to Salesforce")
 
-        start_time = time.time()
-        try:
-            if query:
-                soql = query
+        if query:
+            soql = query
+        else:
+            # Build default query
+            desc = self._sf.__getattr__(object_name).describe()
+            fields = [f["name"] for f in desc["fields"][:50]]  # Limit fields
+            soql = f"SELECT {', '.join(fields)} FROM {object_name} LIMIT {limit}"
+
+        async def fetch_page(cursor: str | None, page_size: int) -> Page:
+            if cursor:
+                response = await self._request("GET", cursor)
             else:
-                # Build default query
-                desc = self._sf.__getattr__(object_name).describe()
-                fields = [f["name"] for f in desc["fields"][:50]]  # Limit fields
-                soql = f"SELECT {', '.join(fields)} FROM {object_name} LIMIT {limit}"
-
-            result = self._sf.query(soql)
-            records = result.get("records", [])
-
-            execution_time_ms = int((time.time() - start_time) * 1000)
-
-            if not records:
-                return QueryResult(
-                    columns=[],
-                    rows=[],
-                    row_count=0,
-                    execution_time_ms=execution_time_ms,
+                batch_size = max(page_size, SALESFORCE_MIN_BATCH_SIZE)
+                response = await self._request(
+                    "GET",
+                    f"/services/data/v{self._sf.sf_version}/query",
+                    params={"q": soql},
+                    headers={"Sforce-Query-Options": f"batchSize={batch_size}"},
                 )
+            self._raise_for_query_error(response, soql)
+            data = response.json()
+            next_cursor = None if data.get("done", True) else data.get("nextRecordsUrl")
+            return Page(records=data.get("records", []), next_cursor=next_cursor)
+
+        def to_row(record: dict[str, Any]) -> dict[str, Any]:
+            return {
+                key: self._serialize_value(value)
+                for key, value in record.items()
+                if key != "attributes"
+            }
 
-            # Get columns from first record
-            columns = []
-            if records:
-                first = records[0]
-                for key in first.keys():
-                    if key != "attributes":
-                        columns.append({"name": key, "data_type": "string"})
-
-            # Convert records to rows
-            row_dicts = []
-            for record in records:
-                row = {}
-                for key, value in record.items():
-                    if key != "attributes":
-                        row[key] = self._serialize_value(value)
-                row_dicts.append(row)
+        start_time = time.time()
+        try:
+            rows, truncated = await self._paginate(
+                fetch_page, limit=limit, page_size=SALESFORCE_PAGE_SIZE, transform=to_row
+            )
+        except AdapterError:
+            raise
+        except Exception as e:
+            raise ConnectionFailedError(
+                message=f"Failed to query {object_name}: {str(e)}",
+                details={"error": str(e)},
+            ) from e
 
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        if not rows:
             return QueryResult(
-                columns=columns,
-                rows=row_dicts,
-                row_count=len(row_dicts),
-                truncated=result.get("done", True) is False,
+                columns=[],
+                rows=[],
+                row_count=0,
                 execution_time_ms=execution_time_ms,
             )
 
-        except Exception as e:
-            error_str = str(e).lower()
-            if "malformed query" in error_str or "syntax" in error_str:
-                raise QuerySyntaxError(
-                    message=str(e),
-                    query=query[:200] if query else object_name,
-                ) from e
-            elif "request_limit_exceeded" in error_str:
+        # Get columns from first record
+        columns = [{"name": key, "data_type": "string"} for key in rows[0]]
+
+        return QueryResult(
+            columns=columns,
+            rows=rows,
+            row_count=len(rows),
+            truncated=truncated,
+            execution_time_ms=execution_time_ms,
+        )
+
+    def _raise_for_query_error(self, response: Any, soql: str) -> None:
+        """Map Salesforce REST errors to adapter errors.
+
+        Args:
+            response: httpx response from the query endpoint.
+            soql: Query that was sent.
+
+        Raises:
+            QuerySyntaxError: If Salesforce rejected the query.
+            RateLimitedError: If the org's API request limit is exhausted.
+        """
+        if response.status_code in (400, 403):
+            error_str = response.text.lower()
+            if "malformed_query" in error_str or "invalid_field" in error_str:
+                raise QuerySyntaxError(message=response.text, query=soql[:200])
+            if "request_limit_exceeded" in error_str:
                 raise RateLimitedError(
                     message="Salesforce API rate limit exceeded",
                     retry_after_seconds=60,
-                ) from e
-            else:
-                raise
+                )
+        self._check_response(response)
 
     def _serialize_value(self, value: Any) -> Any:
         """Convert Salesforce values to JSON-serializable format."""
@@ -9,12 +9,10 @@ from __future__ import annotations
 import time
 from typing import Any
 
-from dataing.adapters.datasource.api.base import APIAdapter
+from dataing.adapters.datasource.api.base import RATE_LIMIT_FIELDS, APIAdapter, Page
 from dataing.adapters.datasource.errors import (
-    AccessDeniedError,
-    AuthenticationFailedError,
+    AdapterError,
     ConnectionFailedError,
-    RateLimitedError,
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
@@ -187,6 +185,9 @@ STRIPE_OBJECTS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Largest page size accepted by Stripe list endpoints
+STRIPE_PAGE_SIZE = 100
+
 STRIPE_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="auth", label="Authentication", collapsed_by_default=False),
@@ -212,6 +213,7 @@ STRIPE_CONFIG_SCHEMA = ConfigSchema(
             placeholder="customers,charges,invoices",
             description="Comma-separated list of objects (default: all standard objects)",
         ),
+        *RATE_LIMIT_FIELDS,
     ],
 )
 
@@ -255,7 +257,6 @@ class StripeAdapter(APIAdapter):
                 - objects: Comma-separated list of objects to include (optional)
         """
         super().__init__(config)
-        self._session: Any = None
         self._source_id: str = ""
 
     @property
@@ -278,20 +279,10 @@ class StripeAdapter(APIAdapter):
     async def connect(self) -> None:
         """Establish connection to Stripe API."""
         try:
-            import httpx
-        except ImportError as e:
-            raise ConnectionFailedError(
-                message="httpx is not installed. Install with: pip install httpx",
-                details={"error": str(e)},
-            ) from e
-
-        try:
-            self._session = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                headers=self._get_headers(),
-                timeout=30.0,
-            )
+            self._client = self._create_client(self.BASE_URL, self._get_headers())
             self._connected = True
+        except AdapterError:
+            raise
         except Exception as e:
             raise ConnectionFailedError(
                 message=f"Failed to initialize Stripe client: {str(e)}",
@@ -300,9 +291,7 @@ class StripeAdapter(APIAdapter):
 
     async def disconnect(self) -> None:
         """Close Stripe connection."""
-        if self._session:
-            await self._session.aclose()
-            self._session = None
+        await self._close_client()
         self._connected = False
 
     async def test_connection(self) -> ConnectionTestResult:
@@ -312,7 +301,7 @@ class StripeAdapter(APIAdapter):
             if not self._connected:
                 await self.connect()
 
-            response = await self._session.get("/v1/balance")
+            response = await self._request("GET", "/v1/balance")
             latency_ms = int((time.time() - start_time) * 1000)
 
             if response.status_code == 200:
@@ -394,68 +383,39 @@ class StripeAdapter(APIAdapter):
         query: str | None = None,
         limit: int = 100,
     ) -> QueryResult:
-        """Query records from a Stripe object."""
-        if not self._connected or not self._session:
+        """Query records from a Stripe object.
+
+        Follows ``starting_after`` cursors until ``limit`` records are read.
+        """
+        if not self._connected or not self._client:
             raise ConnectionFailedError(message="Not connected to Stripe")
 
         obj_def = STRIPE_OBJECTS.get(object_name)
         if not obj_def:
             raise ConnectionFailedError(message=f"Unknown Stripe object: {object_name}")
 
-        start_time = time.time()
-        try:
-            response = await self._session.get(
-                obj_def["endpoint"],
-                params={"limit": min(limit, 100)},
-            )
-
-            if response.status_code == 401:
-                raise AuthenticationFailedError(message="Invalid Stripe API key")
-            elif response.status_code == 403:
-                raise AccessDeniedError(message=f"Access denied to {object_name}")
-            elif response.status_code == 429:
-                raise RateLimitedError(
-                    message="Stripe API rate limit exceeded",
-                    retry_after_seconds=1,
-                )
+        col_names = [c["name"] for c in obj_def["columns"]]
 
-            response.raise_for_status()
+        async def fetch_page(cursor: str | None, page_size: int) -> Page:
+            params: dict[str, Any] = {"limit": page_size}
+            if cursor:
+                params["starting_after"] = cursor
+            response = await self._request("GET", obj_def["endpoint"], params=params)
+            self._check_response(response, object_name)
             data = response.json()
+            records = data.get("data", [])
+            next_cursor = records[-1]["id"] if data.get("has_more") and records else None
+            return Page(records=records, next_cursor=next_cursor)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            results = data.get("data", [])
-
-            if not results:
-                return QueryResult(
-                    columns=[],
-                    rows=[],
-                    row_count=0,
-                    execution_time_ms=execution_time_ms,
-                )
-
-            col_names = [c["name"] for c in obj_def["columns"]]
-            columns = [{"name": name, "data_type": "string"} for name in col_names]
-
-            rows = []
-            for record in results:
-                row = {}
-                for col_name in col_names:
-                    value = record.get(col_name)
-                    if isinstance(value, dict):
-                        row[col_name] = value
-                    else:
-                        row[col_name] = value
-                rows.append(row)
-
-            return QueryResult(
-                columns=columns,
-                rows=rows,
-                row_count=len(rows),
-                truncated=data.get("has_more", False),
-                execution_time_ms=execution_time_ms,
+        start_time = time.time()
+        try:
+            rows, truncated = await self._paginate(
+                fetch_page,
+                limit=limit,
+                page_size=STRIPE_PAGE_SIZE,
+                transform=lambda record: {name: record.get(name) for name in col_names},
             )
-
-        except (AuthenticationFailedError, AccessDeniedError, RateLimitedError):
+        except AdapterError:
             raise
         except Exception as e:
             raise ConnectionFailedError(
@@ -463,12 +423,29 @@ class StripeAdapter(APIAdapter):
                 details={"error": str(e)},
             ) from e
 
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        if not rows:
+            return QueryResult(
+                columns=[],
+                rows=[],
+                row_count=0,
+                execution_time_ms=execution_time_ms,
+            )
+
+        return QueryResult(
+            columns=[{"name": name, "data_type": "string"} for name in col_names],
+            rows=rows,
+            row_count=len(rows),
+            truncated=truncated,
+            execution_time_ms=execution_time_ms,
+        )
+
     async def get_schema(
         self,
         filter: SchemaFilter | None = None,
     ) -> SchemaResponse:
         """Get Stripe schema."""
-        if not self._connected or not self._session:
+        if not self._connected or not self._client:
             raise ConnectionFailedError(message="Not connected to Stripe")
 
         try:
@@ -15,6 +15,7 @@ from typing import Any
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from bond import set_default_governor
 from dataing.adapters.auth.recovery_admin import AdminContactRecoveryAdapter
 from dataing.adapters.auth.recovery_console import ConsoleRecoveryAdapter
 from dataing.adapters.auth.recovery_email import EmailPasswordRecoveryAdapter
@@ -27,7 +28,13 @@ from dataing.adapters.notifications.email import EmailConfig, EmailNotifier
 from dataing.agents import AgentClient
 from dataing.core.auth.recovery import PasswordRecoveryAdapter
 from dataing.core.orchestrator import InvestigationOrchestrator, OrchestratorConfig
-from dataing.entrypoints.api.deps import _seed_demo_data, settings
+from dataing.entrypoints.api.deps import (
+    _seed_demo_data,
+    build_finding_memory,
+    build_llm_governor,
+    build_llm_response_cache,
+    settings,
+)
 from dataing.entrypoints.api.routes import api_router as ce_api_router
 from dataing.safety.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from dataing_ee.adapters.audit import AuditRepository
@@ -58,9 +65,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     entitlements_adapter = DatabaseEntitlementsAdapter(pool=app_db.pool)
     app.state.entitlements_adapter = entitlements_adapter
 
+    # Every agent in the process shares one governor
+    governor = build_llm_governor()
+    set_default_governor(governor)
+
     llm = AgentClient(
         api_key=settings.anthropic_api_key,
         model=settings.llm_model,
+        response_cache=build_llm_response_cache(app_db),
+        role_models=settings.llm_role_models,
+        governor=governor,
     )
 
     # Create context engine
@@ -82,6 +96,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         context_engine=context_engine,
         circuit_breaker=circuit_breaker,
         config=OrchestratorConfig(),
+        finding_memory=build_finding_memory(app_db),
     )
 
     # Initialize investigation feedback adapter
@@ -196,6 +211,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.warning(f"adapter_close_failed: {cache_key}, error={e}")
 
+    # Finish background validations before the database goes away
+    await orchestrator.close()
+
+    set_default_governor(None)
     await app_db.close()
 
 
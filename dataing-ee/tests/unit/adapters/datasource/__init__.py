@@ -0,0 +1 @@
+"""Data source adapter tests."""
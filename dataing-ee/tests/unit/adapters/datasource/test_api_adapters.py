@@ -0,0 +1,168 @@
+"""Tests for paginated SaaS API adapters."""
+
+import time
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from dataing.adapters.datasource.errors import QuerySyntaxError
+from dataing_ee.adapters.datasource.api.hubspot import HubSpotAdapter
+from dataing_ee.adapters.datasource.api.salesforce import SalesforceAdapter
+from dataing_ee.adapters.datasource.api.stripe import StripeAdapter
+
+
+def _unique_key(prefix: str) -> str:
+    """Return an API key that does not share a rate limiter with other tests."""
+    return f"{prefix}-{time.monotonic_ns()}"
+
+
+def _stripe_page(request: httpx.Request) -> httpx.Response:
+    """Serve 250 Stripe customers using starting_after cursors."""
+    total = 250
+    start = int(request.url.params.get("starting_after", "cus_-1").split("_")[1]) + 1
+    end = min(start + int(request.url.params["limit"]), total)
+    data = [{"id": f"cus_{i}", "email": f"{i}@example.com"} for i in range(start, end)]
+    return httpx.Response(200, json={"data": data, "has_more": end < total})
+
+
+@pytest.fixture
+async def stripe() -> Any:
+    """Create a connected Stripe adapter."""
+    adapter = StripeAdapter(
+        {"api_key": _unique_key("sk_test"), "rate_limit_requests_per_minute": 60000}
+    )
+    await adapter.connect()
+    yield adapter
+    await adapter.disconnect()
+
+
+class TestStripePagination:
+    """Tests for Stripe cursor pagination."""
+
+    @respx.mock
+    async def test_follows_cursors_up_to_limit(self, stripe: StripeAdapter) -> None:
+        """Test that several pages are read to fill the limit."""
+        route = respx.get("https://api.stripe.com/v1/customers").mock(side_effect=_stripe_page)
+
+        result = await stripe.query_object("customers", limit=230)
+
+        assert result.row_count == 230
+        assert result.rows[-1]["id"] == "cus_229"
+        assert result.truncated is True
+        assert [c.request.url.params["limit"] for c in route.calls] == ["100", "100", "30"]
+
+    @respx.mock
+    async def test_reads_all_pages(self, stripe: StripeAdapter) -> None:
+        """Test that a limit beyond the data returns every record."""
+        respx.get("https://api.stripe.com/v1/customers").mock(side_effect=_stripe_page)
+
+        result = await stripe.query_object("customers", limit=1000)
+
+        assert result.row_count == 250
+        assert result.truncated is False
+
+    @respx.mock
+    async def test_retries_rate_limited_page(self, stripe: StripeAdapter) -> None:
+        """Test that a 429 with Retry-After is retried instead of raised."""
+        route = respx.get("https://api.stripe.com/v1/customers").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"data": [{"id": "cus_1"}], "has_more": False}),
+            ]
+        )
+
+        result = await stripe.query_object("customers", limit=10)
+
+        assert result.row_count == 1
+        assert route.call_count == 2
+
+
+class TestHubSpotPagination:
+    """Tests for HubSpot cursor pagination."""
+
+    @respx.mock
+    async def test_follows_paging_after(self) -> None:
+        """Test that paging.next.after is followed and properties are flattened."""
+        adapter = HubSpotAdapter(
+            {"access_token": _unique_key("pat"), "rate_limit_requests_per_minute": 60000}
+        )
+        await adapter.connect()
+        route = respx.get("https://api.hubapi.com/crm/v3/objects/contacts").mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={
+                        "results": [{"id": "1", "properties": {"email": "a@x.io"}}],
+                        "paging": {"next": {"after": "1"}},
+                    },
+                ),
+                httpx.Response(200, json={"results": [{"id": "2", "properties": {}}]}),
+            ]
+        )
+
+        result = await adapter.query_object("contacts", limit=50)
+        await adapter.disconnect()
+
+        assert result.rows == [{"email": "a@x.io", "id": "1"}, {"id": "2"}]
+        assert route.calls[1].request.url.params["after"] == "1"
+        assert result.truncated is False
+
+
+class FakeSalesforce:
+    """Stand-in for the simple_salesforce session attributes."""
+
+    sf_instance = "acme.my.salesforce.com"
+    sf_version = "59.0"
+    session_id = "session"
+
+
+@pytest.fixture
+async def salesforce() -> Any:
+    """Create a Salesforce adapter wired to a fake session."""
+    adapter = SalesforceAdapter(
+        {"username": _unique_key("user"), "rate_limit_requests_per_minute": 60000}
+    )
+    adapter._sf = FakeSalesforce()
+    adapter._client = adapter._create_client("https://acme.my.salesforce.com", {})
+    adapter._connected = True
+    yield adapter
+    await adapter.disconnect()
+
+
+class TestSalesforcePagination:
+    """Tests for Salesforce nextRecordsUrl pagination."""
+
+    @respx.mock
+    async def test_follows_next_records_url(self, salesforce: SalesforceAdapter) -> None:
+        """Test that query locators are followed and attributes stripped."""
+        first = respx.get("https://acme.my.salesforce.com/services/data/v59.0/query").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "done": False,
+                    "nextRecordsUrl": "/services/data/v59.0/query/01g-2000",
+                    "records": [{"attributes": {"type": "Account"}, "Id": "001"}],
+                },
+            )
+        )
+        respx.get("https://acme.my.salesforce.com/services/data/v59.0/query/01g-2000").mock(
+            return_value=httpx.Response(200, json={"done": True, "records": [{"Id": "002"}]})
+        )
+
+        result = await salesforce.query_object("Account", query="SELECT Id FROM Account")
+
+        assert result.rows == [{"Id": "001"}, {"Id": "002"}]
+        assert first.calls[0].request.url.params["q"] == "SELECT Id FROM Account"
+        assert first.calls[0].request.headers["Sforce-Query-Options"] == "batchSize=200"
+
+    @respx.mock
+    async def test_malformed_query(self, salesforce: SalesforceAdapter) -> None:
+        """Test that rejected SOQL surfaces as QuerySyntaxError."""
+        respx.get("https://acme.my.salesforce.com/services/data/v59.0/query").mock(
+            return_value=httpx.Response(400, json=[{"errorCode": "MALFORMED_QUERY"}])
+        )
+
+        with pytest.raises(QuerySyntaxError):
+            await salesforce.query_object("Account", query="SELEC Id FROM Account")
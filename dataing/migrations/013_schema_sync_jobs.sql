@@ -0,0 +1,32 @@
+-- Schema sync jobs
+-- Tracks background schema syncs so progress can be polled. Syncs write only
+-- the difference from the stored datasets, so re-running an interrupted job
+-- resumes it: datasets merged before the interruption no longer differ.
+
+CREATE TABLE IF NOT EXISTS schema_sync_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    tenant_id UUID NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+    datasource_id UUID NOT NULL REFERENCES data_sources(id) ON DELETE CASCADE,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',  -- pending, running, completed, failed
+    phase VARCHAR(20) NOT NULL DEFAULT 'discovering',  -- discovering, merging, removing, done
+    tables_discovered INTEGER NOT NULL DEFAULT 0,
+    tables_processed INTEGER NOT NULL DEFAULT 0,
+    datasets_changed INTEGER NOT NULL DEFAULT 0,
+    datasets_removed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at TIMESTAMPTZ DEFAULT NOW(),
+    completed_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_schema_sync_jobs_datasource
+    ON schema_sync_jobs(datasource_id, created_at DESC);
+
+-- At most one pending or running job per datasource, so concurrent sync
+-- requests cannot start duplicate runs
+CREATE UNIQUE INDEX IF NOT EXISTS idx_schema_sync_jobs_active
+    ON schema_sync_jobs(datasource_id) WHERE status IN ('pending', 'running');
+
+CREATE TRIGGER update_schema_sync_jobs_updated_at BEFORE UPDATE ON schema_sync_jobs
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
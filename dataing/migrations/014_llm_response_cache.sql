@@ -0,0 +1,19 @@
+-- LLM response cache
+-- Validated agent outputs keyed by a hash of agent, model, rendered prompts,
+-- output schema and conversation history. Re-running an investigation serves
+-- recorded responses instead of calling the model again. Entries are
+-- partitioned by tenant ID, or 'global' for calls outside a tenant.
+
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    namespace VARCHAR(64) NOT NULL,
+    cache_key CHAR(64) NOT NULL,
+    agent_name VARCHAR(100) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    response TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ,
+    PRIMARY KEY (namespace, cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires
+    ON llm_response_cache(expires_at) WHERE expires_at IS NOT NULL;
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""Benchmark building a SchemaResponse for a synthetic high-cardinality schema.
+
+Builds the nested catalog dictionaries the way a SQL adapter does (one
+normalize_type call per column) and times ``_build_schema_response`` on the
+result. Peak memory is measured in a separate run because tracemalloc slows
+allocation down.
+
+Usage:
+    python scripts/benchmark_schema_build.py [--columns 100000] [--columns-per-table 100]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# Add the src directory to the path so we can import the package
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from dataing.adapters.datasource.sql.postgres import PostgresAdapter
+from dataing.adapters.datasource.type_mapping import normalize_type
+from dataing.adapters.datasource.types import SchemaResponse, SourceType
+
+# Native types cycled through the synthetic columns, as a driver reports them
+NATIVE_TYPES = [
+    "integer",
+    "bigint",
+    "character varying(255)",
+    "text",
+    "numeric(18,4)",
+    "timestamp with time zone",
+    "timestamp without time zone",
+    "boolean",
+    "date",
+    "jsonb",
+    "uuid",
+    "double precision",
+    "integer[]",
+    "USER-DEFINED",
+]
+
+# Tables per schema in the synthetic catalog
+TABLES_PER_SCHEMA = 100
+
+
+def synthetic_catalogs(
+    total_columns: int,
+    columns_per_table: int,
+    stream: bool = True,
+) -> list[dict[str, Any]]:
+    """Build catalog dictionaries for a synthetic warehouse.
+
+    Args:
+        total_columns: Number of columns across all tables.
+        columns_per_table: Columns in each table.
+        stream: Yield table dictionaries lazily instead of building them upfront.
+
+    Returns:
+        Catalog dictionaries in the shape adapters pass to the builder.
+    """
+
+    def tables(schema_idx: int, count: int) -> Iterator[dict[str, Any]]:
+        for t in range(count):
+            yield {
+                "name": f"table_{t}",
+                "table_type": "table",
+                "native_type": "BASE TABLE",
+                "native_path": f"analytics.schema_{schema_idx}.table_{t}",
+                "columns": [
+                    {
+                        "name": f"column_{c}",
+                        "data_type": normalize_type(
+                            NATIVE_TYPES[c % len(NATIVE_TYPES)], SourceType.POSTGRESQL
+                        ),
+                        "native_type": NATIVE_TYPES[c % len(NATIVE_TYPES)],
+                        "nullable": c != 0,
+                        "is_primary_key": c == 0,
+                        "is_partition_key": False,
+                    }
+                    for c in range(columns_per_table)
+                ],
+            }
+
+    total_tables = max(1, total_columns // columns_per_table)
+    schemas = []
+    for s, start in enumerate(range(0, total_tables, TABLES_PER_SCHEMA)):
+        count = min(TABLES_PER_SCHEMA, total_tables - start)
+        schema_tables = tables(s, count)
+        schemas.append(
+            {"name": f"schema_{s}", "tables": schema_tables if stream else list(schema_tables)}
+        )
+    return [{"name": "analytics", "schemas": schemas}]
+
+
+def build(total_columns: int, columns_per_table: int, stream: bool) -> SchemaResponse:
+    """Build the synthetic schema end to end."""
+    adapter = PostgresAdapter({})
+    return adapter._build_schema_response(
+        "benchmark", synthetic_catalogs(total_columns, columns_per_table, stream)
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--columns", type=int, default=100_000)
+    parser.add_argument("--columns-per-table", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="materialize every table dictionary before building",
+    )
+    args = parser.parse_args()
+    stream = not args.no_stream
+
+    timings = []
+    for _ in range(args.repeat):
+        normalize_type.cache_clear()
+        start = time.perf_counter()
+        response = build(args.columns, args.columns_per_table, stream)
+        timings.append(time.perf_counter() - start)
+    columns = sum(
+        len(table.columns)
+        for catalog in response.catalogs
+        for schema in catalog.schemas
+        for table in schema.tables
+    )
+
+    tracemalloc.start()
+    build(args.columns, args.columns_per_table, stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"columns built:  {columns}")
+    print(f"best time:      {min(timings):.3f}s")
+    print(f"peak memory:    {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ and profiles the affected columns to provide context for investigation.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -18,6 +19,37 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
+def anomaly_window(
+    anomaly_date: str,
+    days_before: int = 0,
+    days_after: int = 0,
+) -> dict[str, datetime] | None:
+    """Build timestamp bounds around an anomaly date for query parameters.
+
+    Queries filter on ``created_at >= :window_start_ts AND created_at <
+    :window_end_ts`` rather than ``DATE(created_at)``, so the database can
+    use an index on created_at.
+
+    Args:
+        anomaly_date: Date of the anomaly in "YYYY-MM-DD" format.
+        days_before: Days before the anomaly date to include.
+        days_after: Days after the anomaly date to include.
+
+    Returns:
+        The inclusive start and exclusive end of the window, keyed by
+        parameter name, or None if the date cannot be parsed.
+    """
+    try:
+        day = date.fromisoformat(anomaly_date)
+    except (TypeError, ValueError):
+        logger.warning("invalid_anomaly_date", anomaly_date=anomaly_date)
+        return None
+    return {
+        "window_start_ts": datetime.combine(day - timedelta(days=days_before), time.min),
+        "window_end_ts": datetime.combine(day + timedelta(days=days_after + 1), time.min),
+    }
+
+
 @dataclass
 class AnomalyConfirmation:
     """Result of anomaly confirmation check.
@@ -113,11 +145,22 @@ class AnomalyContext:
         else:
             column_name = self._extract_column_name(spec.display_name, anomaly.dataset_id)
 
+        window = anomaly_window(anomaly.anomaly_date)
+        if window is None:
+            return AnomalyConfirmation(
+                exists=False,
+                actual_value=None,
+                expected_range=None,
+                sample_rows=[],
+                profile={},
+                message=f"Invalid anomaly date: {anomaly.anomaly_date!r}",
+            )
+
         try:
             if is_null_rate:
-                return await self._confirm_null_rate_anomaly(adapter, anomaly, column_name)
+                return await self._confirm_null_rate_anomaly(adapter, anomaly, column_name, window)
             elif "row_count" in anomaly.anomaly_type.lower():
-                return await self._confirm_row_count_anomaly(adapter, anomaly)
+                return await self._confirm_row_count_anomaly(adapter, anomaly, window)
             else:
                 # Generic metric confirmation
                 return await self._confirm_generic_anomaly(adapter, anomaly, column_name)
@@ -137,6 +180,7 @@ class AnomalyContext:
         adapter: SQLAdapter,
         anomaly: AnomalyAlert,
         column_name: str,
+        window: dict[str, datetime],
     ) -> AnomalyConfirmation:
         """Confirm a NULL rate anomaly.
 
@@ -144,6 +188,7 @@ class AnomalyContext:
             adapter: Connected database adapter.
             anomaly: The anomaly alert.
             column_name: Name of the column to check.
+            window: Timestamp bounds of the anomaly date.
 
         Returns:
             AnomalyConfirmation for NULL rate check.
@@ -158,10 +203,10 @@ class AnomalyContext:
             ROUND(100.0 * SUM(CASE WHEN {column_name} IS NULL
                 THEN 1 ELSE 0 END) / COUNT(*), 2) as null_rate
         FROM {table_name}
-        WHERE DATE(created_at) = '{anomaly.anomaly_date}'
+        WHERE created_at >= :window_start_ts AND created_at < :window_end_ts
         """
 
-        result = await adapter.execute_query(null_query)
+        result = await adapter.execute_query(null_query, params=window)
 
         if not result.rows:
             return AnomalyConfirmation(
@@ -182,12 +227,12 @@ class AnomalyContext:
         sample_query = f"""
         SELECT *
         FROM {table_name}
-        WHERE DATE(created_at) = '{anomaly.anomaly_date}'
+        WHERE created_at >= :window_start_ts AND created_at < :window_end_ts
           AND {column_name} IS NULL
         LIMIT {self.sample_size}
         """
 
-        sample_result = await adapter.execute_query(sample_query)
+        sample_result = await adapter.execute_query(sample_query, params=window)
         sample_rows = [dict(r) for r in sample_result.rows]
 
         # Determine if anomaly is confirmed
@@ -220,12 +265,14 @@ class AnomalyContext:
         self,
         adapter: SQLAdapter,
         anomaly: AnomalyAlert,
+        window: dict[str, datetime],
     ) -> AnomalyConfirmation:
         """Confirm a row count anomaly.
 
         Args:
             adapter: Connected database adapter.
             anomaly: The anomaly alert.
+            window: Timestamp bounds of the anomaly date.
 
         Returns:
             AnomalyConfirmation for row count check.
@@ -235,10 +282,10 @@ class AnomalyContext:
         count_query = f"""
         SELECT COUNT(*) as row_count
         FROM {table_name}
-        WHERE DATE(created_at) = '{anomaly.anomaly_date}'
+        WHERE created_at >= :window_start_ts AND created_at < :window_end_ts
         """
 
-        result = await adapter.execute_query(count_query)
+        result = await adapter.execute_query(count_query, params=window)
 
         if not result.rows:
             return AnomalyConfirmation(
@@ -321,12 +368,17 @@ class AnomalyContext:
             adapter: Connected database adapter.
             table_name: Name of the table.
             column_name: Name of the column.
-            date: Optional date filter.
+            date: Optional date filter in "YYYY-MM-DD" format.
 
         Returns:
-            ColumnProfile with statistics.
+            ColumnProfile with statistics, empty if the date cannot be parsed.
         """
-        date_filter = f"WHERE DATE(created_at) = '{date}'" if date else ""
+        params = anomaly_window(date) if date else None
+        if date and params is None:
+            return ColumnProfile(total_count=0, null_count=0, null_rate=0, distinct_count=0)
+        date_filter = (
+            "WHERE created_at >= :window_start_ts AND created_at < :window_end_ts" if date else ""
+        )
 
         profile_query = f"""
         SELECT
@@ -339,7 +391,7 @@ class AnomalyContext:
         {date_filter}
         """
 
-        result = await adapter.execute_query(profile_query)
+        result = await adapter.execute_query(profile_query, params=params)
 
         if not result.rows:
             return ColumnProfile(
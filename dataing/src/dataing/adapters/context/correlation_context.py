@@ -8,12 +8,15 @@ issues or cross-table patterns.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from dataing.adapters.datasource.types import SchemaResponse, Table
 
+from .anomaly_context import anomaly_window
+
 if TYPE_CHECKING:
     from dataing.adapters.datasource.sql.base import SQLAdapter
     from dataing.core.domain_types import AnomalyAlert
@@ -108,6 +111,10 @@ class CorrelationContext:
 
         correlations: list[Correlation] = []
 
+        window = anomaly_window(anomaly.anomaly_date)
+        if window is None:
+            return correlations
+
         # Get the target table from schema
         target_table = self._get_table(schema, anomaly.dataset_id)
         if not target_table:
@@ -121,7 +128,7 @@ class CorrelationContext:
             try:
                 correlation = await self._analyze_table_correlation(
                     adapter,
-                    anomaly,
+                    window,
                     anomaly.dataset_id,
                     related["table"],
                     related["join_column"],
@@ -163,6 +170,12 @@ class CorrelationContext:
             date=center_date,
         )
 
+        window = anomaly_window(
+            center_date, days_before=self.lookback_days, days_after=self.lookback_days
+        )
+        if window is None:
+            return None
+
         # Query for time series data
         query = f"""
         SELECT
@@ -172,14 +185,14 @@ class CorrelationContext:
             ROUND(100.0 * SUM(CASE WHEN {column_name} IS NULL THEN 1 ELSE 0 END)
                 / COUNT(*), 2) as null_rate
         FROM {table_name}
-        WHERE created_at >= DATE('{center_date}') - INTERVAL '{self.lookback_days}' DAY
-          AND created_at <= DATE('{center_date}') + INTERVAL '{self.lookback_days}' DAY
+        WHERE created_at >= :window_start_ts
+          AND created_at < :window_end_ts
         GROUP BY DATE(created_at)
         ORDER BY date
         """
 
         try:
-            result = await adapter.execute_query(query)
+            result = await adapter.execute_query(query, params=window)
         except Exception as e:
             logger.warning("time_series_query_failed", error=str(e))
             return None
@@ -221,7 +234,11 @@ class CorrelationContext:
         Returns:
             List of upstream anomalies detected.
         """
-        upstream_anomalies = []
+        upstream_anomalies: list[dict[str, Any]] = []
+
+        window = anomaly_window(anomaly.anomaly_date)
+        if window is None:
+            return upstream_anomalies
 
         related_tables = self._find_related_tables(schema, anomaly.dataset_id)
 
@@ -235,10 +252,10 @@ class CorrelationContext:
                     ROUND(100.0 * SUM(CASE WHEN {related["join_column"]} IS NULL THEN 1 ELSE 0 END)
                         / COUNT(*), 2) as null_rate
                 FROM {related["table"]}
-                WHERE DATE(created_at) = '{anomaly.anomaly_date}'
+                WHERE created_at >= :window_start_ts AND created_at < :window_end_ts
                 """
 
-                result = await adapter.execute_query(query)
+                result = await adapter.execute_query(query, params=window)
 
                 if result.rows and result.rows[0].get("null_rate", 0) > 5:
                     upstream_anomalies.append(
@@ -317,7 +334,7 @@ class CorrelationContext:
     async def _analyze_table_correlation(
         self,
         adapter: SQLAdapter,
-        anomaly: AnomalyAlert,
+        window: dict[str, datetime],
         source_table: str,
         related_table: str,
         join_column: str,
@@ -326,7 +343,7 @@ class CorrelationContext:
 
         Args:
             adapter: Connected database adapter.
-            anomaly: The anomaly being investigated.
+            window: Timestamp bounds of the anomaly date.
             source_table: The primary table.
             related_table: The related table.
             join_column: Column to join on.
@@ -344,12 +361,12 @@ class CorrelationContext:
                 / NULLIF(COUNT(s.{join_column}), 0), 2) as unmatched_rate
         FROM {source_table} s
         LEFT JOIN {related_table} r ON s.{join_column} = r.{join_column}
-        WHERE DATE(s.created_at) = '{anomaly.anomaly_date}'
+        WHERE s.created_at >= :window_start_ts AND s.created_at < :window_end_ts
           AND s.{join_column} IS NOT NULL
         """
 
         try:
-            result = await adapter.execute_query(query)
+            result = await adapter.execute_query(query, params=window)
         except Exception:
             return None
 
@@ -374,7 +391,10 @@ class CorrelationContext:
                 f"{unmatched_rate}% of {source_table}.{join_column} values "
                 f"have no matching record in {related_table}"
             ),
-            evidence_query=query,
+            # Inline the bounds so the stored evidence can be re-run as-is
+            evidence_query=query.replace(
+                ":window_start_ts", f"'{window['window_start_ts'].isoformat(sep=' ')}'"
+            ).replace(":window_end_ts", f"'{window['window_end_ts'].isoformat(sep=' ')}'"),
         )
 
     def _detect_pattern(
@@ -21,7 +21,7 @@ from dataing.core.exceptions import SchemaDiscoveryError
 
 from .anomaly_context import AnomalyConfirmation, AnomalyContext
 from .correlation_context import Correlation, CorrelationContext
-from .schema_context import SchemaContextBuilder
+from .schema_context import SchemaContextBuilder, anomaly_partition_filter
 
 if TYPE_CHECKING:
     from dataing.adapters.datasource.base import BaseAdapter
@@ -106,8 +106,11 @@ class ContextEngine:
         log.info("gathering_context")
 
         # 1. Schema Discovery (REQUIRED)
+        # Date partitions far from the anomaly are not listed
         try:
-            schema = await self.schema_builder.build(adapter)
+            schema = await self.schema_builder.build(
+                adapter, partition_filter=anomaly_partition_filter(alert.anomaly_date)
+            )
         except Exception as e:
             log.error("schema_discovery_failed", error=str(e))
             raise SchemaDiscoveryError(f"Failed to discover schema: {e}") from e
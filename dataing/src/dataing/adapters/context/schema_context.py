@@ -9,17 +9,51 @@ Updated to use the unified SchemaResponse type from the datasource layer.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from dataing.adapters.datasource.types import SchemaResponse, Table
+from dataing.adapters.datasource.types import SchemaFilter, SchemaResponse, Table
 
 if TYPE_CHECKING:
     from dataing.adapters.datasource.base import BaseAdapter
 
 logger = structlog.get_logger()
 
+# Hive partition keys that commonly hold a date
+DATE_PARTITION_KEYS = ("date", "dt", "ds", "day", "event_date")
+
+# Days before the anomaly kept for comparison when pruning date partitions
+DEFAULT_PARTITION_LOOKBACK_DAYS = 7
+
+
+def anomaly_partition_filter(
+    anomaly_date: str,
+    lookback_days: int = DEFAULT_PARTITION_LOOKBACK_DAYS,
+) -> dict[str, Any] | None:
+    """Build a partition filter for the days around an anomaly.
+
+    Object store adapters use it to skip listing date partitions outside
+    the window, which keeps discovery of large partitioned buckets fast.
+    The days before the anomaly are kept so queries can compare against
+    a baseline.
+
+    Args:
+        anomaly_date: Date of the anomaly in "YYYY-MM-DD" format.
+        lookback_days: Days before the anomaly to keep.
+
+    Returns:
+        Accepted dates per common date partition key, or None if the date
+        cannot be parsed.
+    """
+    try:
+        day = date.fromisoformat(anomaly_date)
+    except ValueError:
+        return None
+    window = [(day - timedelta(days=n)).isoformat() for n in range(lookback_days, -1, -1)]
+    return dict.fromkeys(DATE_PARTITION_KEYS, window)
+
 
 class SchemaContextBuilder:
     """Builds schema context from database adapters.
@@ -46,12 +80,15 @@ class SchemaContextBuilder:
         self,
         adapter: BaseAdapter,
         table_filter: str | None = None,
+        partition_filter: dict[str, Any] | None = None,
     ) -> SchemaResponse:
         """Build schema context from a database adapter.
 
         Args:
             adapter: Connected data source adapter.
             table_filter: Optional pattern to filter tables (not yet used).
+            partition_filter: Optional hive partition values to keep; object
+                store adapters do not list partitions outside it.
 
         Returns:
             SchemaResponse with discovered catalogs, schemas, and tables.
@@ -62,7 +99,9 @@ class SchemaContextBuilder:
         logger.info("discovering_schema", table_filter=table_filter)
 
         try:
-            schema = await adapter.get_schema()
+            schema = await adapter.get_schema(
+                SchemaFilter(partition_filter=partition_filter) if partition_filter else None
+            )
             table_count = sum(
                 len(table.columns)
                 for catalog in schema.catalogs
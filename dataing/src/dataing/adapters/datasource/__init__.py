@@ -21,6 +21,7 @@ from dataing.adapters.datasource.errors import (
     AuthenticationFailedError,
     ConnectionFailedError,
     ConnectionTimeoutError,
+    QueryBudgetExceededError,
     QuerySyntaxError,
     QueryTimeoutError,
     RateLimitedError,
@@ -56,6 +57,7 @@ from dataing.adapters.datasource.types import (
     ConnectionTestResult,
     FieldGroup,
     NormalizedType,
+    QueryCostEstimate,
     QueryResult,
     Schema,
     SchemaFilter,
@@ -99,6 +101,7 @@ __all__ = [
     "ConnectionTestResult",
     "FieldGroup",
     "NormalizedType",
+    "QueryCostEstimate",
     "QueryResult",
     "Schema",
     "SchemaFilter",
@@ -115,6 +118,7 @@ __all__ = [
     "ConnectionTimeoutError",
     "AuthenticationFailedError",
     "AccessDeniedError",
+    "QueryBudgetExceededError",
     "QuerySyntaxError",
     "QueryTimeoutError",
     "RateLimitedError",
@@ -1,28 +1,213 @@
 """Base class for API adapters.
 
 This module provides the abstract base class for all API-based
-data source adapters.
+data source adapters, together with the shared HTTP machinery they use:
+one pooled client per adapter, a token-bucket limiter per API key that
+enforces the declared request rate, retries that honour ``Retry-After``,
+and cursor pagination up to a row budget with next-page prefetch.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import math
+import time
 from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 from dataing.adapters.datasource.base import BaseAdapter
+from dataing.adapters.datasource.errors import (
+    AccessDeniedError,
+    AuthenticationFailedError,
+    ConnectionFailedError,
+    RateLimitedError,
+)
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
+    ConfigField,
     QueryLanguage,
     QueryResult,
     Table,
 )
 
+# Retries for a throttled or temporarily unavailable request before giving up
+DEFAULT_MAX_RETRIES = 5
+
+# First backoff delay when a throttled response carries no Retry-After header
+DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
+
+# Longest Retry-After the adapter waits out instead of surfacing the error
+MAX_RETRY_WAIT_SECONDS = 60.0
+
+# Connections kept open in each adapter's HTTP client pool
+DEFAULT_MAX_CONNECTIONS = 10
+
+# HTTP status codes that are retried after a delay
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Rate limit settings shared by API adapters
+RATE_LIMIT_FIELDS = [
+    ConfigField(
+        name="rate_limit_requests_per_minute",
+        label="Requests per Minute",
+        type="integer",
+        required=False,
+        group="advanced",
+        min_value=1,
+        description="Override the request rate allowed per API key (default: the API's limit)",
+    ),
+    ConfigField(
+        name="max_retries",
+        label="Max Retries",
+        type="integer",
+        required=False,
+        group="advanced",
+        default_value=DEFAULT_MAX_RETRIES,
+        min_value=0,
+        max_value=20,
+        description="Retries for rate-limited requests before giving up",
+    ),
+]
+
+# Fetches one page given the cursor of the previous page and a page size
+PageFetcher = Callable[[str | None, int], Awaitable["Page"]]
+
+
+@dataclass
+class Page:
+    """One page of records from a paginated API."""
+
+    records: list[dict[str, Any]] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+class TokenBucket:
+    """Token-bucket limiter pacing requests to a fixed rate.
+
+    Callers reserve a token before each request. When the bucket is empty
+    the reservation goes into debt and the caller sleeps until its token
+    has been refilled, so concurrent callers are spaced evenly without a
+    lock. A server-side ``Retry-After`` pauses every caller sharing the
+    bucket.
+    """
+
+    def __init__(self, requests_per_minute: float, capacity: float | None = None) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate.
+            capacity: Burst size. Defaults to one second's worth of requests.
+        """
+        self._rate = requests_per_minute / 60.0
+        self._capacity = capacity or max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Get the sustained request rate."""
+        return self._rate * 60.0
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1
+        debt_wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        return max(debt_wait, self._paused_until - now)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for a number of seconds.
+
+        Args:
+            seconds: Delay requested by the server.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+# Buckets shared by every adapter instance using the same API key
+_token_buckets: dict[str, TokenBucket] = {}
+
+
+def get_token_bucket(key: str, requests_per_minute: float) -> TokenBucket:
+    """Get the process-wide token bucket for an API key.
+
+    Args:
+        key: Identifier of the credential the quota belongs to.
+        requests_per_minute: Rate allowed for the credential.
+
+    Returns:
+        Bucket shared by all callers using the same key and rate.
+    """
+    digest = hashlib.sha256(f"{key}:{requests_per_minute}".encode()).hexdigest()
+    bucket = _token_buckets.get(digest)
+    if bucket is None:
+        bucket = TokenBucket(requests_per_minute)
+        _token_buckets[digest] = bucket
+    return bucket
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
 
 class APIAdapter(BaseAdapter):
     """Abstract base class for API adapters.
 
-    Extends BaseAdapter with API-specific query capabilities.
+    Extends BaseAdapter with API-specific query capabilities and a shared
+    request engine. Subclasses create their client with ``_create_client``
+    and send every call through ``_request`` so that rate limits and
+    retries apply uniformly.
     """
 
+    # Whether the next page may be requested while the current one is processed
+    PAGE_PREFETCH = True
+
+    # Configuration keys tried in order to identify the API quota
+    RATE_LIMIT_KEY_FIELDS = ("api_key", "access_token", "client_id", "username")
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the adapter without an HTTP client.
+
+        Args:
+            config: Configuration dictionary.
+        """
+        super().__init__(config)
+        self._client: Any = None
+
     @property
     def capabilities(self) -> AdapterCapabilities:
         """API adapters typically have rate limits."""
@@ -115,3 +300,184 @@ class APIAdapter(BaseAdapter):
             QueryResult with sampled records.
         """
         return await self.query_object(object_name, limit=n)
+
+    def _create_client(
+        self,
+        base_url: str,
+        headers: dict[str, str],
+        timeout: float = 30.0,
+    ) -> Any:
+        """Create the pooled HTTP client used for every call.
+
+        Args:
+            base_url: Base URL of the API.
+            headers: Headers sent with every request.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            httpx.AsyncClient with keep-alive connections.
+
+        Raises:
+            ConnectionFailedError: If httpx is not installed.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ConnectionFailedError(
+                message="httpx is not installed. Install with: pip install httpx",
+                details={"error": str(e)},
+            ) from e
+
+        return httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_CONNECTIONS,
+            ),
+        )
+
+    async def _close_client(self) -> None:
+        """Close the HTTP client if one is open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _rate_limiter(self) -> TokenBucket:
+        """Get the token bucket for this adapter's API key.
+
+        The rate comes from ``rate_limit_requests_per_minute`` in the config
+        when set, otherwise from the adapter's declared capabilities.
+        """
+        rate = self._config.get("rate_limit_requests_per_minute")
+        if not rate:
+            rate = self.capabilities.rate_limit_requests_per_minute or 60
+        key = next(
+            (str(self._config[k]) for k in self.RATE_LIMIT_KEY_FIELDS if self._config.get(k)),
+            str(id(self)),
+        )
+        return get_token_bucket(f"{self.source_type.value}:{key}", float(rate))
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request through the rate limiter, retrying when throttled.
+
+        Args:
+            method: HTTP method.
+            url: URL relative to the client's base URL, or absolute.
+            **kwargs: Passed to ``httpx.AsyncClient.request``.
+
+        Returns:
+            The httpx response.
+
+        Raises:
+            ConnectionFailedError: If the adapter is not connected.
+            RateLimitedError: If the API is still throttling after all retries,
+                or asks for a longer wait than the adapter is willing to take.
+        """
+        if self._client is None:
+            raise ConnectionFailedError(message=f"Not connected to {self.source_type.value}")
+
+        limiter = self._rate_limiter()
+        max_retries = int(self._config.get("max_retries", DEFAULT_MAX_RETRIES))
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response = await self._client.request(method, url, **kwargs)
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = DEFAULT_RETRY_BACKOFF_SECONDS * 2**attempt
+            if attempt >= max_retries or delay > MAX_RETRY_WAIT_SECONDS:
+                if response.status_code != 429:
+                    return response
+                raise RateLimitedError(
+                    message=f"{self.source_type.value} API rate limit exceeded",
+                    retry_after_seconds=math.ceil(delay),
+                )
+            limiter.pause(delay)
+            attempt += 1
+
+    def _check_response(self, response: Any, resource: str | None = None) -> None:
+        """Raise the adapter error matching an unsuccessful response.
+
+        Args:
+            response: httpx response.
+            resource: Object the request was for, used in error details.
+
+        Raises:
+            AuthenticationFailedError: On HTTP 401.
+            AccessDeniedError: On HTTP 403.
+            httpx.HTTPStatusError: On any other error status.
+        """
+        if response.status_code == 401:
+            raise AuthenticationFailedError(message=f"Invalid {self.source_type.value} credentials")
+        if response.status_code == 403:
+            raise AccessDeniedError(
+                message=f"Access denied to {resource or response.request.url.path}",
+                resource=resource,
+            )
+        response.raise_for_status()
+
+    async def _paginate(
+        self,
+        fetch_page: PageFetcher,
+        limit: int,
+        page_size: int,
+        transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Follow cursors until the row budget is spent or the data ends.
+
+        As soon as a page arrives its cursor is used to request the next page
+        (when ``PAGE_PREFETCH`` is set), so the following request is in flight
+        while the current page is transformed.
+
+        Args:
+            fetch_page: Fetches one page for a cursor and page size.
+            limit: Maximum number of records to return.
+            page_size: Largest page the API serves.
+            transform: Optional conversion applied to each record.
+
+        Returns:
+            Tuple of (records, truncated), where truncated is True if more
+            records were available beyond the budget.
+        """
+        records: list[dict[str, Any]] = []
+        if limit <= 0:
+            return records, False
+
+        pending: asyncio.Future[Page] | None = asyncio.ensure_future(
+            fetch_page(None, min(page_size, limit))
+        )
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                remaining = limit - len(records)
+                batch = page.records[:remaining]
+                remaining -= len(batch)
+                next_cursor = page.next_cursor if page.records else None
+
+                if next_cursor and remaining > 0 and self.PAGE_PREFETCH:
+                    pending = asyncio.ensure_future(
+                        fetch_page(next_cursor, min(page_size, remaining))
+                    )
+                    # Let the prefetch send its request before transforming
+                    await asyncio.sleep(0)
+
+                if transform is not None:
+                    batch = [transform(record) for record in batch]
+                records.extend(batch)
+
+                if remaining <= 0:
+                    return records, bool(next_cursor) or len(page.records) > len(batch)
+                if next_cursor and pending is None:
+                    pending = asyncio.ensure_future(
+                        fetch_page(next_cursor, min(page_size, remaining))
+                    )
+            return records, False
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
@@ -6,20 +6,64 @@ providing a consistent interface for connecting to and querying data sources.
 
 from __future__ import annotations
 
+import gc
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Self
 
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
+    Catalog,
+    Column,
     ConnectionTestResult,
+    Schema,
     SchemaFilter,
     SchemaResponse,
     SourceCategory,
     SourceType,
+    Table,
 )
 
 
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause cyclic garbage collection while a large object graph is built.
+
+    Schema models hold no reference cycles, so collections triggered by the
+    allocation burst of a 100k-column schema only re-scan the objects being
+    built and account for roughly half of the build time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _build_table(table_data: Mapping[str, Any] | Table) -> Table:
+    """Build a Table from adapter output, reusing model instances as-is."""
+    if isinstance(table_data, Table):
+        return table_data
+    return Table(
+        name=table_data["name"],
+        table_type=table_data.get("table_type", "table"),
+        native_type=table_data.get("native_type", "TABLE"),
+        native_path=table_data.get("native_path", table_data["name"]),
+        columns=[
+            col if isinstance(col, Column) else Column(**col)
+            for col in table_data.get("columns", [])
+        ],
+        row_count=table_data.get("row_count"),
+        size_bytes=table_data.get("size_bytes"),
+        last_modified=table_data.get("last_modified"),
+        description=table_data.get("description"),
+    )
+
+
 class BaseAdapter(ABC):
     """Abstract base class for all data source adapters.
 
@@ -120,68 +164,45 @@ class BaseAdapter(ABC):
     def _build_schema_response(
         self,
         source_id: str,
-        catalogs: list[dict[str, Any]],
+        catalogs: Iterable[Mapping[str, Any]],
     ) -> SchemaResponse:
         """Helper to build a SchemaResponse from catalog data.
 
+        Schemas, tables and columns may be given as any iterable, including
+        generators, so adapters can stream tables into the response instead
+        of holding every table dictionary in memory first. Table and Column
+        instances are used as-is.
+
         Args:
             source_id: ID of the data source.
-            catalogs: List of catalog dictionaries.
+            catalogs: Catalog dictionaries.
 
         Returns:
             Properly formatted SchemaResponse.
         """
-        from dataing.adapters.datasource.types import (
-            Catalog,
-            Column,
-            Schema,
-            Table,
-        )
-
-        parsed_catalogs = []
-        for cat_data in catalogs:
-            schemas = []
-            for schema_data in cat_data.get("schemas", []):
-                tables = []
-                for table_data in schema_data.get("tables", []):
-                    columns = [Column(**col_data) for col_data in table_data.get("columns", [])]
-                    tables.append(
-                        Table(
-                            name=table_data["name"],
-                            table_type=table_data.get("table_type", "table"),
-                            native_type=table_data.get("native_type", "TABLE"),
-                            native_path=table_data.get("native_path", table_data["name"]),
-                            columns=columns,
-                            row_count=table_data.get("row_count"),
-                            size_bytes=table_data.get("size_bytes"),
-                            last_modified=table_data.get("last_modified"),
-                            description=table_data.get("description"),
-                        )
-                    )
-                schemas.append(
-                    Schema(
-                        name=schema_data.get("name", "default"),
-                        tables=tables,
-                    )
-                )
-            parsed_catalogs.append(
+        with _gc_paused():
+            parsed_catalogs = [
                 Catalog(
                     name=cat_data.get("name", "default"),
-                    schemas=schemas,
+                    schemas=[
+                        Schema(
+                            name=schema_data.get("name", "default"),
+                            tables=[_build_table(t) for t in schema_data.get("tables", [])],
+                        )
+                        for schema_data in cat_data.get("schemas", [])
+                    ],
                 )
+                for cat_data in catalogs
+            ]
+
+            return SchemaResponse(
+                source_id=source_id,
+                source_type=self.source_type,
+                source_category=self._get_source_category(),
+                fetched_at=datetime.now(),
+                catalogs=parsed_catalogs,
             )
 
-        # Determine source category
-        source_category = self._get_source_category()
-
-        return SchemaResponse(
-            source_id=source_id,
-            source_type=self.source_type,
-            source_category=source_category,
-            fetched_at=datetime.now(),
-            catalogs=parsed_catalogs,
-        )
-
     def _get_source_category(self) -> SourceCategory:
         """Determine source category based on source type."""
         from dataing.adapters.datasource.types import SourceCategory, SourceType
@@ -6,16 +6,49 @@ data source adapters, adding scan and aggregation capabilities.
 
 from __future__ import annotations
 
+import time
 from abc import abstractmethod
 from typing import Any
 
 from dataing.adapters.datasource.base import BaseAdapter
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
+    ConfigField,
     QueryLanguage,
     QueryResult,
 )
 
+# Maximum number of collections whose schema is inferred at the same time
+DEFAULT_SCHEMA_INFERENCE_CONCURRENCY = 8
+
+# Seconds an inferred collection schema is reused before it is sampled again
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS = 600
+
+# Schema inference settings shared by document adapters
+SCHEMA_INFERENCE_FIELDS = [
+    ConfigField(
+        name="schema_inference_concurrency",
+        label="Schema Inference Concurrency",
+        type="integer",
+        required=False,
+        group="advanced",
+        default_value=DEFAULT_SCHEMA_INFERENCE_CONCURRENCY,
+        min_value=1,
+        max_value=64,
+        description="Maximum number of collections sampled at the same time",
+    ),
+    ConfigField(
+        name="schema_cache_ttl_seconds",
+        label="Schema Cache TTL (seconds)",
+        type="integer",
+        required=False,
+        group="advanced",
+        default_value=DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+        min_value=0,
+        description="How long an inferred collection schema is reused",
+    ),
+]
+
 
 class DocumentAdapter(BaseAdapter):
     """Abstract base class for document/NoSQL database adapters.
@@ -23,6 +56,45 @@ class DocumentAdapter(BaseAdapter):
     Extends BaseAdapter with document scanning and aggregation capabilities.
     """
 
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the adapter with an empty schema cache.
+
+        Args:
+            config: Configuration dictionary.
+        """
+        super().__init__(config)
+        self._schema_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def _get_cached_schema(self, collection: str) -> dict[str, Any] | None:
+        """Get a previously inferred schema if it is still fresh.
+
+        Adapters are reused across investigations, so this avoids sampling
+        every collection again on each schema request.
+
+        Args:
+            collection: Collection name.
+
+        Returns:
+            Cached schema dictionary, or None if missing or expired.
+        """
+        entry = self._schema_cache.get(collection)
+        if entry is None:
+            return None
+        ttl = float(self._config.get("schema_cache_ttl_seconds", DEFAULT_SCHEMA_CACHE_TTL_SECONDS))
+        cached_at, schema = entry
+        if time.monotonic() - cached_at > ttl:
+            return None
+        return schema
+
+    def _cache_schema(self, collection: str, schema: dict[str, Any]) -> None:
+        """Store an inferred schema for reuse.
+
+        Args:
+            collection: Collection name.
+            schema: Inferred schema dictionary.
+        """
+        self._schema_cache[collection] = (time.monotonic(), schema)
+
     @property
     def capabilities(self) -> AdapterCapabilities:
         """Document adapters typically don't support SQL."""
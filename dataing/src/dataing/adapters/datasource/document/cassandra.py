@@ -6,6 +6,7 @@ data source interface with schema discovery and CQL query capabilities.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any
 
@@ -19,6 +20,9 @@ from dataing.adapters.datasource.errors import (
     QueryTimeoutError,
     SchemaFetchFailedError,
 )
+from dataing.adapters.datasource.errors import (
+    NotImplementedError as FeatureNotImplementedError,
+)
 from dataing.adapters.datasource.registry import register_adapter
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -64,6 +68,12 @@ CASSANDRA_TYPE_MAP = {
     "frozen": NormalizedType.STRUCT,
 }
 
+# Rows fetched per page when fetch_size is not configured
+DEFAULT_FETCH_SIZE = 5000
+
+# Statements in flight at once when max_concurrent_requests is not configured
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
 CASSANDRA_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
@@ -143,6 +153,28 @@ CASSANDRA_CONFIG_SCHEMA = ConfigSchema(
             min_value=1,
             max_value=300,
         ),
+        ConfigField(
+            name="fetch_size",
+            label="Fetch Size",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=DEFAULT_FETCH_SIZE,
+            min_value=100,
+            max_value=100000,
+            description="Rows fetched per page",
+        ),
+        ConfigField(
+            name="max_concurrent_requests",
+            label="Max Concurrent Requests",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=DEFAULT_MAX_CONCURRENT_REQUESTS,
+            min_value=1,
+            max_value=128,
+            description="Maximum number of statements in flight at once",
+        ),
     ],
 )
 
@@ -192,6 +224,9 @@ class CassandraAdapter(DocumentAdapter):
         self._cluster: Any = None
         self._session: Any = None
         self._source_id: str = ""
+        self._semaphore = asyncio.Semaphore(
+            max(int(config.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)), 1)
+        )
 
     @property
     def source_type(self) -> SourceType:
@@ -238,6 +273,10 @@ class CassandraAdapter(DocumentAdapter):
             )
 
             self._session = self._cluster.connect(keyspace)
+            self._session.default_fetch_size = int(
+                self._config.get("fetch_size", DEFAULT_FETCH_SIZE)
+            )
+            self._session.default_timeout = self._config.get("request_timeout", 10)
             self._connected = True
 
         except Exception as e:
@@ -275,8 +314,8 @@ class CassandraAdapter(DocumentAdapter):
             if not self._connected:
                 await self.connect()
 
-            row = self._session.execute("SELECT release_version FROM system.local").one()
-            version = row.release_version if row else "Unknown"
+            rows = await self._execute("SELECT release_version FROM system.local")
+            version = rows[0].release_version if rows else "Unknown"
 
             latency_ms = int((time.time() - start_time) * 1000)
             return ConnectionTestResult(
@@ -294,6 +333,57 @@ class CassandraAdapter(DocumentAdapter):
                 error_code="CONNECTION_FAILED",
             )
 
+    async def _execute(
+        self,
+        cql: str,
+        params: list[Any] | None = None,
+        max_rows: int | None = None,
+    ) -> list[Any]:
+        """Execute a statement without blocking the event loop.
+
+        Uses the driver's ``execute_async`` and bridges its page callbacks to
+        an asyncio future. Pages of ``fetch_size`` rows are requested one at
+        a time until the result is exhausted or ``max_rows`` rows are held.
+        At most ``max_concurrent_requests`` statements run at once.
+
+        Args:
+            cql: CQL statement with ``%s`` placeholders.
+            params: Positional parameter values.
+            max_rows: Stop paging once this many rows have been fetched.
+
+        Returns:
+            All fetched rows.
+        """
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[list[Any]] = loop.create_future()
+        rows: list[Any] = []
+
+        def resolve(result: list[Any] | BaseException) -> None:
+            if done.done():
+                return
+            if isinstance(result, BaseException):
+                done.set_exception(result)
+            else:
+                done.set_result(result)
+
+        async with self._semaphore:
+            future = self._session.execute_async(cql, params)
+
+            def on_page(page: list[Any]) -> None:
+                rows.extend(page)
+                if future.has_more_pages and (max_rows is None or len(rows) < max_rows):
+                    future.start_fetching_next_page()
+                else:
+                    loop.call_soon_threadsafe(resolve, rows)
+
+            def on_error(exc: BaseException) -> None:
+                loop.call_soon_threadsafe(resolve, exc)
+
+            future.add_callbacks(callback=on_page, errback=on_error)
+            result = await done
+
+        return result[:max_rows] if max_rows is not None else result
+
     async def scan_collection(
         self,
         collection: str,
@@ -314,22 +404,20 @@ class CassandraAdapter(DocumentAdapter):
 
             cql = f"SELECT * FROM {full_table}"
 
+            params: list[Any] = []
             if filter:
                 where_parts = []
                 for key, value in filter.items():
-                    if isinstance(value, str):
-                        where_parts.append(f"{key} = '{value}'")
-                    else:
-                        where_parts.append(f"{key} = {value}")
+                    where_parts.append(f"{key} = %s")
+                    params.append(value)
                 if where_parts:
                     cql += " WHERE " + " AND ".join(where_parts) + " ALLOW FILTERING"
 
-            cql += f" LIMIT {limit}"
+            cql += f" LIMIT {limit + skip}"
 
-            rows = self._session.execute(cql)
+            rows_list = (await self._execute(cql, params or None, max_rows=limit + skip))[skip:]
             execution_time_ms = int((time.time() - start_time) * 1000)
 
-            rows_list = list(rows)
             if not rows_list:
                 return QueryResult(
                     columns=[],
@@ -368,6 +456,70 @@ class CassandraAdapter(DocumentAdapter):
         """Sample rows from a Cassandra table."""
         return await self.scan_collection(name, limit=n)
 
+    async def count_documents(
+        self,
+        collection: str,
+        filter: dict[str, Any] | None = None,
+    ) -> int:
+        """Count rows in a Cassandra table.
+
+        This is a full scan on the coordinator and can be slow on large tables.
+        """
+        if not self._connected or not self._session:
+            raise ConnectionFailedError(message="Not connected to Cassandra")
+
+        keyspace = self._config.get("keyspace", "")
+        full_table = (
+            f"{keyspace}.{collection}" if keyspace and "." not in collection else collection
+        )
+        cql = f"SELECT COUNT(*) AS count FROM {full_table}"
+        params: list[Any] = []
+        if filter:
+            cql += " WHERE " + " AND ".join(f"{key} = %s" for key in filter) + " ALLOW FILTERING"
+            params = list(filter.values())
+
+        rows = await self._execute(cql, params or None)
+        return int(rows[0].count) if rows else 0
+
+    async def aggregate(
+        self,
+        collection: str,
+        pipeline: list[dict[str, Any]],
+    ) -> QueryResult:
+        """Cassandra has no aggregation pipeline."""
+        raise FeatureNotImplementedError("aggregate", adapter_type="cassandra")
+
+    async def infer_schema(
+        self,
+        collection: str,
+        sample_size: int = 100,
+    ) -> dict[str, Any]:
+        """Read a table's declared column types from system_schema.
+
+        Cassandra tables have a fixed schema, so no rows are sampled.
+
+        Args:
+            collection: Table name, optionally qualified with the keyspace.
+            sample_size: Unused.
+
+        Returns:
+            Dictionary with the collection name and CQL type per column.
+        """
+        if not self._connected or not self._session:
+            raise ConnectionFailedError(message="Not connected to Cassandra")
+
+        keyspace, _, table = collection.rpartition(".")
+        keyspace = keyspace or self._config.get("keyspace", "")
+        rows = await self._execute(
+            "SELECT column_name, type FROM system_schema.columns "
+            "WHERE keyspace_name = %s AND table_name = %s",
+            [keyspace, table],
+        )
+        return {
+            "collection": collection,
+            "fields": {row.column_name: row.type for row in rows},
+        }
+
     def _normalize_type(self, cql_type: str) -> NormalizedType:
         """Normalize a CQL type to our standard types."""
         cql_type_lower = cql_type.lower()
@@ -378,6 +530,69 @@ class CassandraAdapter(DocumentAdapter):
 
         return NormalizedType.UNKNOWN
 
+    async def _describe_keyspace(
+        self,
+        ks: str,
+        filter: SchemaFilter | None,
+    ) -> dict[str, Any]:
+        """Build the schema definition for one keyspace.
+
+        Fetches the keyspace's tables and all of its columns with one query
+        each, running concurrently, and groups the columns by table locally.
+
+        Args:
+            ks: Keyspace name.
+            filter: Optional schema filter.
+
+        Returns:
+            Schema dictionary with the keyspace's tables.
+        """
+        table_rows, col_rows = await asyncio.gather(
+            self._execute(
+                "SELECT table_name FROM system_schema.tables WHERE keyspace_name = %s",
+                [ks],
+            ),
+            self._execute(
+                "SELECT table_name, column_name, type, kind FROM system_schema.columns "
+                "WHERE keyspace_name = %s",
+                [ks],
+            ),
+        )
+        table_names = [row.table_name for row in table_rows]
+
+        if filter and filter.table_pattern:
+            table_names = [t for t in table_names if filter.table_pattern in t]
+
+        if filter and filter.max_tables:
+            table_names = table_names[: filter.max_tables]
+
+        columns_by_table: dict[str, list[dict[str, Any]]] = {}
+        for col in col_rows:
+            columns_by_table.setdefault(col.table_name, []).append(
+                {
+                    "name": col.column_name,
+                    "data_type": self._normalize_type(col.type),
+                    "native_type": col.type,
+                    "nullable": col.kind not in ("partition_key", "clustering"),
+                    "is_primary_key": col.kind == "partition_key",
+                    "is_partition_key": col.kind == "clustering",
+                }
+            )
+
+        return {
+            "name": ks,
+            "tables": [
+                {
+                    "name": table_name,
+                    "table_type": "table",
+                    "native_type": "CASSANDRA_TABLE",
+                    "native_path": f"{ks}.{table_name}",
+                    "columns": columns_by_table.get(table_name, []),
+                }
+                for table_name in table_names
+            ],
+        }
+
     async def get_schema(
         self,
         filter: SchemaFilter | None = None,
@@ -392,72 +607,21 @@ class CassandraAdapter(DocumentAdapter):
             if keyspace:
                 keyspaces = [keyspace]
             else:
-                ks_rows = self._session.execute("SELECT keyspace_name FROM system_schema.keyspaces")
+                ks_rows = await self._execute("SELECT keyspace_name FROM system_schema.keyspaces")
                 keyspaces = [
                     row.keyspace_name
                     for row in ks_rows
                     if not row.keyspace_name.startswith("system")
                 ]
 
-            schemas = []
-            for ks in keyspaces:
-                tables_cql = f"""
-                    SELECT table_name
-                    FROM system_schema.tables
-                    WHERE keyspace_name = '{ks}'
-                """
-                table_rows = self._session.execute(tables_cql)
-                table_names = [row.table_name for row in table_rows]
-
-                if filter and filter.table_pattern:
-                    table_names = [t for t in table_names if filter.table_pattern in t]
-
-                if filter and filter.max_tables:
-                    table_names = table_names[: filter.max_tables]
-
-                tables = []
-                for table_name in table_names:
-                    columns_cql = f"""
-                        SELECT column_name, type, kind
-                        FROM system_schema.columns
-                        WHERE keyspace_name = '{ks}' AND table_name = '{table_name}'
-                    """
-                    col_rows = self._session.execute(columns_cql)
-
-                    columns = []
-                    for col in col_rows:
-                        columns.append(
-                            {
-                                "name": col.column_name,
-                                "data_type": self._normalize_type(col.type),
-                                "native_type": col.type,
-                                "nullable": col.kind not in ("partition_key", "clustering"),
-                                "is_primary_key": col.kind == "partition_key",
-                                "is_partition_key": col.kind == "clustering",
-                            }
-                        )
-
-                    tables.append(
-                        {
-                            "name": table_name,
-                            "table_type": "table",
-                            "native_type": "CASSANDRA_TABLE",
-                            "native_path": f"{ks}.{table_name}",
-                            "columns": columns,
-                        }
-                    )
-
-                schemas.append(
-                    {
-                        "name": ks,
-                        "tables": tables,
-                    }
-                )
+            schemas = await asyncio.gather(
+                *(self._describe_keyspace(ks, filter) for ks in keyspaces)
+            )
 
             catalogs = [
                 {
                     "name": "default",
-                    "schemas": schemas,
+                    "schemas": list(schemas),
                 }
             ]
 
@@ -6,17 +6,27 @@ data source interface with schema inference and scan capabilities.
 
 from __future__ import annotations
 
+import asyncio
+import random
 import time
 from typing import Any
 
-from dataing.adapters.datasource.document.base import DocumentAdapter
+from dataing.adapters.datasource.document.base import (
+    DEFAULT_SCHEMA_INFERENCE_CONCURRENCY,
+    SCHEMA_INFERENCE_FIELDS,
+    DocumentAdapter,
+)
 from dataing.adapters.datasource.errors import (
     AccessDeniedError,
     AuthenticationFailedError,
     ConnectionFailedError,
     QueryTimeoutError,
+    RateLimitedError,
     SchemaFetchFailedError,
 )
+from dataing.adapters.datasource.errors import (
+    NotImplementedError as FeatureNotImplementedError,
+)
 from dataing.adapters.datasource.registry import register_adapter
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -46,6 +56,25 @@ DYNAMODB_TYPE_MAP = {
     "NULL": NormalizedType.UNKNOWN,
 }
 
+# Error codes DynamoDB returns when a request exceeds provisioned capacity
+THROTTLING_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+
+# Parallel scan segments used when scan_segments is not configured
+DEFAULT_SCAN_SEGMENTS = 4
+
+# Retries for a throttled request before giving up
+DEFAULT_MAX_RETRIES = 8
+
+# Backoff bounds, in seconds, for throttled requests
+BACKOFF_BASE_SECONDS = 0.05
+BACKOFF_MAX_SECONDS = 5.0
+
 DYNAMODB_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
@@ -107,6 +136,29 @@ DYNAMODB_CONFIG_SCHEMA = ConfigSchema(
             placeholder="prod_",
             description="Only show tables with this prefix",
         ),
+        ConfigField(
+            name="scan_segments",
+            label="Parallel Scan Segments",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=DEFAULT_SCAN_SEGMENTS,
+            min_value=1,
+            max_value=1000,
+            description="Number of segments scanned in parallel (TotalSegments)",
+        ),
+        ConfigField(
+            name="max_retries",
+            label="Max Throttling Retries",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=DEFAULT_MAX_RETRIES,
+            min_value=0,
+            max_value=20,
+            description="Retries with backoff when provisioned throughput is exceeded",
+        ),
+        *SCHEMA_INFERENCE_FIELDS,
     ],
 )
 
@@ -153,6 +205,7 @@ class DynamoDBAdapter(DocumentAdapter):
         self._client: Any = None
         self._resource: Any = None
         self._source_id: str = ""
+        self._throttle_delay = 0.0
 
     @property
     def source_type(self) -> SourceType:
@@ -215,7 +268,7 @@ class DynamoDBAdapter(DocumentAdapter):
             if not self._connected:
                 await self.connect()
 
-            self._client.list_tables(Limit=1)
+            await self._call("list_tables", Limit=1)
 
             latency_ms = int((time.time() - start_time) * 1000)
             return ConnectionTestResult(
@@ -233,40 +286,164 @@ class DynamoDBAdapter(DocumentAdapter):
                 error_code="CONNECTION_FAILED",
             )
 
+    async def _call(self, operation: str, **params: Any) -> dict[str, Any]:
+        """Call a DynamoDB operation in a worker thread with adaptive backoff.
+
+        Throttling errors grow a delay shared by every in-flight request on
+        this adapter, so parallel scan segments slow down together, and each
+        success shrinks it again.
+
+        Args:
+            operation: boto3 client method name, e.g. "scan".
+            **params: Request parameters.
+
+        Returns:
+            The operation's response.
+
+        Raises:
+            RateLimitedError: If still throttled after max_retries attempts.
+        """
+        max_retries = int(self._config.get("max_retries", DEFAULT_MAX_RETRIES))
+        method = getattr(self._client, operation)
+        attempt = 0
+        while True:
+            if self._throttle_delay:
+                await asyncio.sleep(random.uniform(0, self._throttle_delay))
+            try:
+                response: dict[str, Any] = await asyncio.to_thread(method, **params)
+            except Exception as e:
+                code = getattr(e, "response", {}).get("Error", {}).get("Code")
+                if code not in THROTTLING_ERROR_CODES:
+                    raise
+                attempt += 1
+                if attempt > max_retries:
+                    raise RateLimitedError(
+                        message=f"DynamoDB throughput exceeded during {operation}",
+                        retry_after_seconds=int(BACKOFF_MAX_SECONDS),
+                    ) from e
+                self._throttle_delay = min(
+                    BACKOFF_MAX_SECONDS, max(BACKOFF_BASE_SECONDS, self._throttle_delay * 2)
+                )
+                continue
+            self._throttle_delay = (
+                self._throttle_delay / 2 if self._throttle_delay > BACKOFF_BASE_SECONDS else 0.0
+            )
+            return response
+
+    def _scan_params(
+        self,
+        filter: dict[str, Any] | None = None,
+        columns: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build FilterExpression and ProjectionExpression scan parameters."""
+        params: dict[str, Any] = {}
+        names: dict[str, str] = {}
+
+        if filter:
+            values = {}
+            parts = []
+            for i, (key, value) in enumerate(filter.items()):
+                parts.append(f"#attr{i} = :val{i}")
+                names[f"#attr{i}"] = key
+                values[f":val{i}"] = self._serialize_value(value)
+            params["FilterExpression"] = " AND ".join(parts)
+            params["ExpressionAttributeValues"] = values
+
+        if columns:
+            for i, column in enumerate(columns):
+                names[f"#proj{i}"] = column
+            params["ProjectionExpression"] = ", ".join(f"#proj{i}" for i in range(len(columns)))
+
+        if names:
+            params["ExpressionAttributeNames"] = names
+        return params
+
+    async def _parallel_scan(
+        self,
+        table_name: str,
+        limit: int | None = None,
+        **params: Any,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Scan a table with all segments running concurrently.
+
+        Each segment follows LastEvaluatedKey until the table segment is
+        exhausted or ``limit`` items have been collected across segments.
+        A page reads at most an even share of ``limit``, so the first pages
+        of all segments together read about ``limit`` items, not
+        ``limit`` per segment.
+
+        Args:
+            table_name: Table to scan.
+            limit: Maximum items to return, or None for all items.
+            **params: Extra scan parameters (filter, projection, Select).
+
+        Returns:
+            Tuple of raw items and whether more items may remain.
+        """
+        total_segments = max(int(self._config.get("scan_segments", DEFAULT_SCAN_SEGMENTS)), 1)
+        page_limit = -(-limit // total_segments) if limit is not None else None
+        items: list[dict[str, Any]] = []
+        more = False
+
+        async def scan_segment(segment: int) -> None:
+            nonlocal more
+            request: dict[str, Any] = {"TableName": table_name, **params}
+            if total_segments > 1:
+                request["Segment"] = segment
+                request["TotalSegments"] = total_segments
+            while True:
+                if limit is not None and page_limit is not None:
+                    remaining = limit - len(items)
+                    if remaining <= 0:
+                        more = True
+                        return
+                    request["Limit"] = min(remaining, page_limit)
+                response = await self._call("scan", **request)
+                items.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return
+                request["ExclusiveStartKey"] = last_key
+
+        await asyncio.gather(*(scan_segment(i) for i in range(total_segments)))
+
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            more = True
+        return items, more
+
     async def scan_collection(
         self,
         collection: str,
         filter: dict[str, Any] | None = None,
         limit: int = 100,
         skip: int = 0,
+        columns: list[str] | None = None,
     ) -> QueryResult:
-        """Scan a DynamoDB table."""
+        """Scan a DynamoDB table.
+
+        Uses a parallel scan over ``scan_segments`` segments and paginates
+        until ``limit`` matching items are found.
+
+        Args:
+            collection: Table name.
+            filter: Attribute equality filters.
+            limit: Maximum items to return.
+            skip: Number of items to skip.
+            columns: Attributes to project; all attributes if None.
+
+        Returns:
+            QueryResult with scanned items.
+        """
         if not self._connected or not self._client:
             raise ConnectionFailedError(message="Not connected to DynamoDB")
 
         start_time = time.time()
         try:
-            scan_params = {"TableName": collection, "Limit": limit}
-
-            if filter:
-                filter_expression_parts = []
-                expression_values = {}
-                expression_names = {}
-
-                for i, (key, value) in enumerate(filter.items()):
-                    placeholder = f":val{i}"
-                    name_placeholder = f"#attr{i}"
-                    filter_expression_parts.append(f"{name_placeholder} = {placeholder}")
-                    expression_values[placeholder] = self._serialize_value(value)
-                    expression_names[name_placeholder] = key
-
-                if filter_expression_parts:
-                    scan_params["FilterExpression"] = " AND ".join(filter_expression_parts)
-                    scan_params["ExpressionAttributeValues"] = expression_values
-                    scan_params["ExpressionAttributeNames"] = expression_names
-
-            response = self._client.scan(**scan_params)
-            items = response.get("Items", [])
+            items, more = await self._parallel_scan(
+                collection, limit + skip, **self._scan_params(filter, columns)
+            )
+            items = items[skip:]
 
             execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -278,21 +455,23 @@ class DynamoDBAdapter(DocumentAdapter):
                     execution_time_ms=execution_time_ms,
                 )
 
-            all_keys = set()
+            all_keys: set[str] = set()
             for item in items:
                 all_keys.update(item.keys())
 
-            columns = [{"name": key, "data_type": "string"} for key in sorted(all_keys)]
+            result_columns = [{"name": key, "data_type": "string"} for key in sorted(all_keys)]
             rows = [self._deserialize_item(item) for item in items]
 
             return QueryResult(
-                columns=columns,
+                columns=result_columns,
                 rows=rows,
                 row_count=len(rows),
-                truncated=len(items) >= limit,
+                truncated=more,
                 execution_time_ms=execution_time_ms,
             )
 
+        except RateLimitedError:
+            raise
         except Exception as e:
             error_str = str(e).lower()
             if "accessdenied" in error_str or "not authorized" in error_str:
@@ -301,6 +480,92 @@ class DynamoDBAdapter(DocumentAdapter):
                 raise QueryTimeoutError(message=str(e), timeout_seconds=30) from e
             raise
 
+    async def count_documents(
+        self,
+        collection: str,
+        filter: dict[str, Any] | None = None,
+    ) -> int:
+        """Count items in a DynamoDB table.
+
+        Without a filter this returns the table's ItemCount, which DynamoDB
+        refreshes roughly every six hours. With a filter it runs a parallel
+        ``Select=COUNT`` scan, which returns no item data.
+
+        Args:
+            collection: Table name.
+            filter: Attribute equality filters.
+
+        Returns:
+            Number of matching items.
+        """
+        if not self._connected or not self._client:
+            raise ConnectionFailedError(message="Not connected to DynamoDB")
+
+        if not filter:
+            response = await self._call("describe_table", TableName=collection)
+            return int(response.get("Table", {}).get("ItemCount", 0))
+
+        total_segments = max(int(self._config.get("scan_segments", DEFAULT_SCAN_SEGMENTS)), 1)
+        params = self._scan_params(filter)
+
+        async def count_segment(segment: int) -> int:
+            request: dict[str, Any] = {"TableName": collection, "Select": "COUNT", **params}
+            if total_segments > 1:
+                request["Segment"] = segment
+                request["TotalSegments"] = total_segments
+            count = 0
+            while True:
+                response = await self._call("scan", **request)
+                count += int(response.get("Count", 0))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return count
+                request["ExclusiveStartKey"] = last_key
+
+        counts = await asyncio.gather(*(count_segment(i) for i in range(total_segments)))
+        return sum(counts)
+
+    async def aggregate(
+        self,
+        collection: str,
+        pipeline: list[dict[str, Any]],
+    ) -> QueryResult:
+        """DynamoDB has no server-side aggregation."""
+        raise FeatureNotImplementedError("aggregate", adapter_type="dynamodb")
+
+    async def infer_schema(
+        self,
+        collection: str,
+        sample_size: int = 100,
+    ) -> dict[str, Any]:
+        """Infer attribute types from a parallel sample scan.
+
+        Args:
+            collection: Table name.
+            sample_size: Number of items to sample.
+
+        Returns:
+            Dictionary with the collection name and a DynamoDB type code
+            (or "mixed") per attribute under "fields".
+        """
+        if not self._connected or not self._client:
+            raise ConnectionFailedError(message="Not connected to DynamoDB")
+
+        items, _ = await self._parallel_scan(collection, sample_size)
+
+        field_types: dict[str, set[str]] = {}
+        for item in items:
+            for key, value in item.items():
+                field_types.setdefault(key, set()).update(value.keys())
+
+        return {
+            "collection": collection,
+            "fields": {
+                field: next(iter(types)) if len(types) == 1 else "mixed"
+                for field, types in field_types.items()
+            },
+        }
+
     def _serialize_value(self, value: Any) -> dict[str, Any]:
         """Serialize a Python value to DynamoDB format."""
         if isinstance(value, str):
@@ -351,13 +616,6 @@ class DynamoDBAdapter(DocumentAdapter):
             return value["BS"]
         return str(value)
 
-    def _infer_type(self, value: dict[str, Any]) -> NormalizedType:
-        """Infer normalized type from DynamoDB value."""
-        for dynamo_type, normalized in DYNAMODB_TYPE_MAP.items():
-            if dynamo_type in value:
-                return normalized
-        return NormalizedType.UNKNOWN
-
     async def sample(
         self,
         name: str,
@@ -366,6 +624,87 @@ class DynamoDBAdapter(DocumentAdapter):
         """Sample documents from a DynamoDB table."""
         return await self.scan_collection(name, limit=n)
 
+    async def _describe_table(
+        self,
+        table_name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Build the table definition for one DynamoDB table.
+
+        Args:
+            table_name: Table name.
+            semaphore: Bounds concurrent table inference.
+
+        Returns:
+            Table dictionary; columns are empty if the table cannot be read.
+        """
+        try:
+            cached = self._get_cached_schema(table_name)
+            if cached is not None:
+                return cached
+
+            async with semaphore:
+                desc_response, schema_info = await asyncio.gather(
+                    self._call("describe_table", TableName=table_name),
+                    self.infer_schema(table_name, sample_size=10),
+                )
+            table_desc = desc_response.get("Table", {})
+
+            key_schema = table_desc.get("KeySchema", [])
+            pk_names = {k["AttributeName"] for k in key_schema if k["KeyType"] == "HASH"}
+            sk_names = {k["AttributeName"] for k in key_schema if k["KeyType"] == "RANGE"}
+
+            attr_defs = table_desc.get("AttributeDefinitions", [])
+            attr_types = {a["AttributeName"]: a["AttributeType"] for a in attr_defs}
+
+            columns = []
+            for attr_name, attr_type in attr_types.items():
+                columns.append(
+                    {
+                        "name": attr_name,
+                        "data_type": DYNAMODB_TYPE_MAP.get(attr_type, NormalizedType.UNKNOWN),
+                        "native_type": attr_type,
+                        "nullable": attr_name not in pk_names,
+                        "is_primary_key": attr_name in pk_names,
+                        "is_partition_key": attr_name in sk_names,
+                    }
+                )
+
+            for key, native_type in schema_info["fields"].items():
+                if key in attr_types:
+                    continue
+                columns.append(
+                    {
+                        "name": key,
+                        "data_type": DYNAMODB_TYPE_MAP.get(native_type, NormalizedType.UNKNOWN),
+                        "native_type": native_type,
+                        "nullable": True,
+                        "is_primary_key": False,
+                        "is_partition_key": False,
+                    }
+                )
+
+            table = {
+                "name": table_name,
+                "table_type": "collection",
+                "native_type": "DYNAMODB_TABLE",
+                "native_path": table_name,
+                "columns": columns,
+                "row_count": table_desc.get("ItemCount"),
+                "size_bytes": table_desc.get("TableSizeBytes"),
+            }
+            self._cache_schema(table_name, table)
+            return table
+
+        except Exception:
+            return {
+                "name": table_name,
+                "table_type": "collection",
+                "native_type": "DYNAMODB_TABLE",
+                "native_path": table_name,
+                "columns": [],
+            }
+
     async def get_schema(
         self,
         filter: SchemaFilter | None = None,
@@ -380,11 +719,11 @@ class DynamoDBAdapter(DocumentAdapter):
             table_prefix = self._config.get("table_prefix", "")
 
             while True:
-                params = {"Limit": 100}
+                params: dict[str, Any] = {"Limit": 100}
                 if exclusive_start:
                     params["ExclusiveStartTableName"] = exclusive_start
 
-                response = self._client.list_tables(**params)
+                response = await self._call("list_tables", **params)
                 table_names = response.get("TableNames", [])
 
                 for table_name in table_names:
@@ -405,80 +744,15 @@ class DynamoDBAdapter(DocumentAdapter):
                     tables_list = tables_list[: filter.max_tables]
                     break
 
-            tables = []
-            for table_name in tables_list:
-                try:
-                    desc_response = self._client.describe_table(TableName=table_name)
-                    table_desc = desc_response.get("Table", {})
-
-                    key_schema = table_desc.get("KeySchema", [])
-                    pk_names = {k["AttributeName"] for k in key_schema if k["KeyType"] == "HASH"}
-                    sk_names = {k["AttributeName"] for k in key_schema if k["KeyType"] == "RANGE"}
-
-                    attr_defs = table_desc.get("AttributeDefinitions", [])
-                    attr_types = {a["AttributeName"]: a["AttributeType"] for a in attr_defs}
-
-                    columns = []
-                    for attr_name, attr_type in attr_types.items():
-                        columns.append(
-                            {
-                                "name": attr_name,
-                                "data_type": DYNAMODB_TYPE_MAP.get(
-                                    attr_type, NormalizedType.UNKNOWN
-                                ),
-                                "native_type": attr_type,
-                                "nullable": attr_name not in pk_names,
-                                "is_primary_key": attr_name in pk_names,
-                                "is_partition_key": attr_name in sk_names,
-                            }
-                        )
-
-                    scan_response = self._client.scan(TableName=table_name, Limit=10)
-                    sample_items = scan_response.get("Items", [])
-
-                    inferred_columns = set()
-                    for item in sample_items:
-                        for key, value in item.items():
-                            if key not in attr_types and key not in inferred_columns:
-                                inferred_columns.add(key)
-                                columns.append(
-                                    {
-                                        "name": key,
-                                        "data_type": self._infer_type(value),
-                                        "native_type": list(value.keys())[0]
-                                        if value
-                                        else "UNKNOWN",
-                                        "nullable": True,
-                                        "is_primary_key": False,
-                                        "is_partition_key": False,
-                                    }
-                                )
-
-                    item_count = table_desc.get("ItemCount")
-                    table_size = table_desc.get("TableSizeBytes")
-
-                    tables.append(
-                        {
-                            "name": table_name,
-                            "table_type": "collection",
-                            "native_type": "DYNAMODB_TABLE",
-                            "native_path": table_name,
-                            "columns": columns,
-                            "row_count": item_count,
-                            "size_bytes": table_size,
-                        }
-                    )
-
-                except Exception:
-                    tables.append(
-                        {
-                            "name": table_name,
-                            "table_type": "collection",
-                            "native_type": "DYNAMODB_TABLE",
-                            "native_path": table_name,
-                            "columns": [],
-                        }
-                    )
+            concurrency = int(
+                self._config.get(
+                    "schema_inference_concurrency", DEFAULT_SCHEMA_INFERENCE_CONCURRENCY
+                )
+            )
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+            tables = await asyncio.gather(
+                *(self._describe_table(name, semaphore) for name in tables_list)
+            )
 
             catalogs = [
                 {
@@ -486,7 +760,7 @@ class DynamoDBAdapter(DocumentAdapter):
                     "schemas": [
                         {
                             "name": self._config.get("region", "default"),
-                            "tables": tables,
+                            "tables": list(tables),
                         }
                     ],
                 }
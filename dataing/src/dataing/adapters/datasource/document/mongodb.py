@@ -6,11 +6,17 @@ data source interface with schema inference and document scanning.
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
 import time
 from datetime import datetime
 from typing import Any
 
-from dataing.adapters.datasource.document.base import DocumentAdapter
+from dataing.adapters.datasource.document.base import (
+    DEFAULT_SCHEMA_INFERENCE_CONCURRENCY,
+    SCHEMA_INFERENCE_FIELDS,
+    DocumentAdapter,
+)
 from dataing.adapters.datasource.errors import (
     AuthenticationFailedError,
     ConnectionFailedError,
@@ -33,9 +39,13 @@ from dataing.adapters.datasource.types import (
     SourceType,
 )
 
+# Documents sampled per collection when inferring the schema
+DEFAULT_SCHEMA_SAMPLE_SIZE = 100
+
 MONGODB_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
+        FieldGroup(id="advanced", label="Advanced", collapsed_by_default=True),
     ],
     fields=[
         ConfigField(
@@ -55,6 +65,18 @@ MONGODB_CONFIG_SCHEMA = ConfigSchema(
             group="connection",
             description="Database to connect to",
         ),
+        ConfigField(
+            name="schema_sample_size",
+            label="Schema Sample Size",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=DEFAULT_SCHEMA_SAMPLE_SIZE,
+            min_value=1,
+            max_value=10000,
+            description="Documents sampled per collection to infer field types",
+        ),
+        *SCHEMA_INFERENCE_FIELDS,
     ],
 )
 
@@ -359,54 +381,152 @@ class MongoDBAdapter(DocumentAdapter):
         collection: str,
         sample_size: int = 100,
     ) -> dict[str, Any]:
-        """Infer schema from document samples."""
+        """Infer schema from document samples.
+
+        Sampling and type counting run on the server in a single aggregation,
+        so only one small document per (field path, type) pair is returned
+        instead of the sampled documents themselves. Field paths cover top
+        level fields and the fields of embedded documents one level down.
+
+        Args:
+            collection: Collection name.
+            sample_size: Number of documents to sample.
+
+        Returns:
+            Dictionary with the collection name, the dominant type of each
+            field path under "fields", and per-path type counts under
+            "type_histograms".
+        """
         if not self._connected or not self._db:
             raise ConnectionFailedError(message="Not connected to MongoDB")
 
-        sample_result = await self.sample(collection, sample_size)
+        cursor = self._db[collection].aggregate(self._type_histogram_pipeline(sample_size))
+        groups = await cursor.to_list(length=None)
 
-        # Track field types across all documents
-        field_types: dict[str, set[str]] = {}
+        histograms: dict[str, dict[str, int]] = {}
+        for group in groups:
+            path = group["_id"]["path"]
+            bson_type = group["_id"]["type"]
+            histograms.setdefault(path, {})[bson_type] = group["count"]
 
-        for doc in sample_result.rows:
-            for key, value in doc.items():
-                if key not in field_types:
-                    field_types[key] = set()
-                field_types[key].add(self._infer_type(value))
-
-        # Build schema
-        schema: dict[str, Any] = {
+        return {
             "collection": collection,
-            "fields": {},
+            "fields": {path: self._dominant_type(counts) for path, counts in histograms.items()},
+            "type_histograms": histograms,
         }
 
-        for field, types in field_types.items():
-            # If multiple types, use the most common or 'mixed'
-            if len(types) == 1:
-                schema["fields"][field] = list(types)[0]
-            else:
-                schema["fields"][field] = "mixed"
+    @staticmethod
+    def _type_histogram_pipeline(sample_size: int) -> list[dict[str, Any]]:
+        """Build the aggregation that counts BSON types per field path."""
+        child_paths = {
+            "$map": {
+                "input": {"$objectToArray": "$_kv.v"},
+                "as": "child",
+                "in": {
+                    "path": {"$concat": ["$_kv.k", ".", "$$child.k"]},
+                    "type": {"$type": "$$child.v"},
+                },
+            }
+        }
+        return [
+            {"$sample": {"size": sample_size}},
+            {"$project": {"_kv": {"$objectToArray": "$$ROOT"}}},
+            {"$unwind": "$_kv"},
+            {
+                "$project": {
+                    "paths": {
+                        "$concatArrays": [
+                            [{"path": "$_kv.k", "type": {"$type": "$_kv.v"}}],
+                            {
+                                "$cond": [
+                                    {"$eq": [{"$type": "$_kv.v"}, "object"]},
+                                    child_paths,
+                                    [],
+                                ]
+                            },
+                        ]
+                    }
+                }
+            },
+            {"$unwind": "$paths"},
+            {
+                "$group": {
+                    "_id": {"path": "$paths.path", "type": "$paths.type"},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+
+    @staticmethod
+    def _dominant_type(counts: dict[str, int]) -> str:
+        """Pick a field's type from its histogram, ignoring nulls."""
+        types = [t for t in counts if t != "null"]
+        if not types:
+            return "null"
+        if len(types) == 1:
+            return types[0]
+        return "mixed"
+
+    async def _describe_collection(
+        self,
+        coll_name: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Build the table definition for one collection.
 
-        return schema
+        Args:
+            coll_name: Collection name.
+            semaphore: Bounds concurrent inference across collections.
 
-    def _infer_type(self, value: Any) -> str:
-        """Infer the type of a value."""
-        if value is None:
-            return "null"
-        elif isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
-            return "float"
-        elif isinstance(value, str):
-            return "string"
-        elif isinstance(value, list):
-            return "array"
-        elif isinstance(value, dict):
-            return "object"
-        else:
-            return "unknown"
+        Returns:
+            Table dictionary; columns are empty if inference fails.
+        """
+        native_path = f"{self._config.get('database', 'db')}.{coll_name}"
+        try:
+            cached = self._get_cached_schema(coll_name)
+            if cached is not None:
+                return cached
+
+            sample_size = int(self._config.get("schema_sample_size", DEFAULT_SCHEMA_SAMPLE_SIZE))
+            async with semaphore:
+                schema_info, count = await asyncio.gather(
+                    self.infer_schema(coll_name, sample_size=sample_size),
+                    self._db[coll_name].estimated_document_count(),
+                )
+
+            columns = []
+            for field_name, field_type in schema_info.get("fields", {}).items():
+                normalized_type = normalize_type(field_type, SourceType.MONGODB)
+                columns.append(
+                    {
+                        "name": field_name,
+                        "data_type": normalized_type,
+                        "native_type": field_type,
+                        "nullable": True,
+                        "is_primary_key": field_name == "_id",
+                        "is_partition_key": False,
+                    }
+                )
+
+            table = {
+                "name": coll_name,
+                "table_type": "collection",
+                "native_type": "COLLECTION",
+                "native_path": native_path,
+                "columns": columns,
+                "row_count": count,
+            }
+            self._cache_schema(coll_name, table)
+            return table
+        except Exception:
+            # If we can't infer schema, add empty table
+            return {
+                "name": coll_name,
+                "table_type": "collection",
+                "native_type": "COLLECTION",
+                "native_path": native_path,
+                "columns": [],
+            }
 
     async def get_schema(
         self,
@@ -422,65 +542,22 @@ class MongoDBAdapter(DocumentAdapter):
 
             # Apply filter if provided
             if filter and filter.table_pattern:
-                import fnmatch
-
                 pattern = filter.table_pattern.replace("%", "*")
                 collections = [c for c in collections if fnmatch.fnmatch(c, pattern)]
 
-            # Limit collections
+            # Skip system collections and limit the rest
             max_tables = filter.max_tables if filter else 1000
-            collections = collections[:max_tables]
-
-            # Build tables with inferred schemas
-            tables = []
-            for coll_name in collections:
-                # Skip system collections
-                if coll_name.startswith("system."):
-                    continue
-
-                try:
-                    # Sample documents to infer schema
-                    schema_info = await self.infer_schema(coll_name, sample_size=50)
-
-                    # Get document count
-                    count = await self.count_documents(coll_name)
-
-                    # Build columns from inferred schema
-                    columns = []
-                    for field_name, field_type in schema_info.get("fields", {}).items():
-                        normalized_type = normalize_type(field_type, SourceType.MONGODB)
-                        columns.append(
-                            {
-                                "name": field_name,
-                                "data_type": normalized_type,
-                                "native_type": field_type,
-                                "nullable": True,
-                                "is_primary_key": field_name == "_id",
-                                "is_partition_key": False,
-                            }
-                        )
-
-                    tables.append(
-                        {
-                            "name": coll_name,
-                            "table_type": "collection",
-                            "native_type": "COLLECTION",
-                            "native_path": f"{self._config.get('database', 'db')}.{coll_name}",
-                            "columns": columns,
-                            "row_count": count,
-                        }
-                    )
-                except Exception:
-                    # If we can't infer schema, add empty table
-                    tables.append(
-                        {
-                            "name": coll_name,
-                            "table_type": "collection",
-                            "native_type": "COLLECTION",
-                            "native_path": f"{self._config.get('database', 'db')}.{coll_name}",
-                            "columns": [],
-                        }
-                    )
+            collections = [c for c in collections if not c.startswith("system.")][:max_tables]
+
+            concurrency = int(
+                self._config.get(
+                    "schema_inference_concurrency", DEFAULT_SCHEMA_INFERENCE_CONCURRENCY
+                )
+            )
+            semaphore = asyncio.Semaphore(max(concurrency, 1))
+            tables = await asyncio.gather(
+                *(self._describe_collection(name, semaphore) for name in collections)
+            )
 
             # Build catalog structure
             catalogs = [
@@ -489,7 +566,7 @@ class MongoDBAdapter(DocumentAdapter):
                     "schemas": [
                         {
                             "name": self._config.get("database", "default"),
-                            "tables": tables,
+                            "tables": list(tables),
                         }
                     ],
                 }
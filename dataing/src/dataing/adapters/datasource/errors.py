@@ -28,6 +28,7 @@ class ErrorCode(str, Enum):
     QUERY_TIMEOUT = "QUERY_TIMEOUT"
     QUERY_CANCELLED = "QUERY_CANCELLED"
     RESOURCE_EXHAUSTED = "RESOURCE_EXHAUSTED"
+    QUERY_BUDGET_EXCEEDED = "QUERY_BUDGET_EXCEEDED"
 
     # Rate limiting
     RATE_LIMITED = "RATE_LIMITED"
@@ -263,6 +264,29 @@ class ResourceExhaustedError(AdapterError):
         )
 
 
+class QueryBudgetExceededError(AdapterError):
+    """Query was rejected before execution because it would cost too much."""
+
+    def __init__(
+        self,
+        message: str = "Query exceeds the scan budget",
+        estimate: dict[str, Any] | None = None,
+        budget: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize query budget exceeded error."""
+        details: dict[str, Any] = {}
+        if estimate:
+            details["estimate"] = estimate
+        if budget:
+            details["budget"] = budget
+        super().__init__(
+            code=ErrorCode.QUERY_BUDGET_EXCEEDED,
+            message=message,
+            details=details if details else None,
+            retryable=False,
+        )
+
+
 class RateLimitedError(AdapterError):
     """Request was rate limited."""
 
@@ -6,17 +6,68 @@ data source adapters.
 
 from __future__ import annotations
 
+import asyncio
+import re
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import Any
 
 from dataing.adapters.datasource.base import BaseAdapter
+from dataing.adapters.datasource.filesystem.schema_cache import (
+    SchemaCache,
+    default_schema_cache_dir,
+)
+from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
+    ConfigField,
     QueryLanguage,
     QueryResult,
+    SourceType,
     Table,
 )
 
+# Maximum number of files whose schema is inferred at the same time
+DEFAULT_SCHEMA_INFERENCE_CONCURRENCY = 8
+
+# Rows read from the start of CSV/JSON files to sniff column types
+DEFAULT_SNIFF_SAMPLE_ROWS = 1000
+
+_EXTENSION_FORMATS = {
+    ".parquet": "parquet",
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".orc": "orc",
+}
+
+# Schema inference settings shared by all filesystem adapters
+SCHEMA_INFERENCE_FIELDS = [
+    ConfigField(
+        name="schema_inference_concurrency",
+        label="Schema Inference Concurrency",
+        type="integer",
+        required=False,
+        group="format",
+        default_value=DEFAULT_SCHEMA_INFERENCE_CONCURRENCY,
+        min_value=1,
+        max_value=64,
+        description="Maximum number of files whose schema is read at the same time",
+    ),
+    ConfigField(
+        name="schema_cache_enabled",
+        label="Cache Inferred Schemas",
+        type="boolean",
+        required=False,
+        group="format",
+        default_value=True,
+        description="Reuse inferred schemas for files whose size and version are unchanged",
+    ),
+]
+
+# Hive-style partition directory, e.g. ``date=2026-01-10``
+_HIVE_PARTITION_PATTERN = re.compile(r"^([^=/]+)=([^/]*)$")
+
 
 @dataclass
 class FileInfo:
@@ -27,6 +78,71 @@ class FileInfo:
     size_bytes: int
     last_modified: str | None = None
     file_format: str | None = None
+    etag: str | None = None
+
+
+def detect_file_format(path: str) -> str | None:
+    """Detect a file's format from its extension.
+
+    Args:
+        path: File path or URL.
+
+    Returns:
+        Format name (parquet, csv, json, orc), or None if unrecognised.
+    """
+    lowered = path.lower()
+    for ext, fmt in _EXTENSION_FORMATS.items():
+        if lowered.endswith(ext):
+            return fmt
+    return None
+
+
+def build_describe_sql(path: str, file_format: str, sample_rows: int) -> str:
+    """Build a DuckDB query that describes a file without scanning it.
+
+    Parquet and ORC schemas come from the file footer alone. CSV and JSON
+    types are sniffed from the first ``sample_rows`` rows only.
+
+    Args:
+        path: File path or URL.
+        file_format: Format name.
+        sample_rows: Rows to sniff for text formats.
+
+    Returns:
+        DESCRIBE query string.
+    """
+    literal = path.replace("'", "''")
+    if file_format == "parquet":
+        return f"DESCRIBE SELECT * FROM read_parquet('{literal}')"
+    if file_format == "orc":
+        return f"DESCRIBE SELECT * FROM read_orc('{literal}')"
+    if file_format == "csv":
+        return f"DESCRIBE SELECT * FROM read_csv_auto('{literal}', sample_size = {sample_rows})"
+    return f"DESCRIBE SELECT * FROM read_json_auto('{literal}', sample_size = {sample_rows})"
+
+
+def split_dataset_path(path: str) -> tuple[str, list[str]]:
+    """Split a file path into its dataset prefix and hive partition keys.
+
+    ``s3://b/events/date=2026-01-10/part-0.parquet`` yields
+    ``("s3://b/events", ["date"])``.
+
+    Args:
+        path: File path or URL.
+
+    Returns:
+        Tuple of the directory prefix with trailing partition segments
+        removed, and the partition keys in path order.
+    """
+    parts = path.rsplit("/", 1)[0].split("/")
+    partition_keys: list[str] = []
+    while parts:
+        match = _HIVE_PARTITION_PATTERN.match(parts[-1])
+        if not match:
+            break
+        partition_keys.insert(0, match.group(1))
+        parts.pop()
+    return "/".join(parts), partition_keys
 
 
 class FileSystemAdapter(BaseAdapter):
@@ -119,6 +235,174 @@ class FileSystemAdapter(BaseAdapter):
         """
         return await self.read_file(path, limit=n)
 
+    def _get_schema_cache(self) -> SchemaCache | None:
+        """Get the on-disk schema cache, or None if disabled by config."""
+        if self._config.get("schema_cache_enabled", True) is False:
+            return None
+        if not hasattr(self, "_schema_cache"):
+            directory = self._config.get("schema_cache_dir") or default_schema_cache_dir()
+            self._schema_cache = SchemaCache(directory, namespace=self.source_type.value)
+        return self._schema_cache
+
+    async def _infer_tables(
+        self,
+        conn: Any,
+        files: list[FileInfo],
+        root: str,
+        native_type_prefix: str,
+    ) -> list[dict[str, Any]]:
+        """Infer table definitions for many files at once.
+
+        Schemas are read from Parquet/ORC footers or the first rows of text
+        files, with bounded concurrency, and cached on disk by path, size and
+        mtime/ETag. Files below a common dataset prefix (ignoring hive
+        ``key=value`` partition directories) that share an identical schema
+        are collapsed into one logical table whose native path is a glob.
+
+        Args:
+            conn: DuckDB connection able to read the files.
+            files: Files to describe.
+            root: Adapter root path; files directly under it are never merged.
+            native_type_prefix: Prefix for native types, e.g. "S3".
+
+        Returns:
+            Table dictionaries suitable for ``_build_schema_response``.
+        """
+        cache = self._get_schema_cache()
+        concurrency = int(
+            self._config.get("schema_inference_concurrency", DEFAULT_SCHEMA_INFERENCE_CONCURRENCY)
+        )
+        sample_rows = int(self._config.get("sniff_sample_rows", DEFAULT_SNIFF_SAMPLE_ROWS))
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        def describe(path: str, fmt: str) -> list[tuple[str, str]]:
+            # Each worker gets its own cursor; DuckDB connections are not
+            # safe to share across threads.
+            cursor = conn.cursor()
+            try:
+                rows = cursor.execute(build_describe_sql(path, fmt, sample_rows)).fetchall()
+                return [(str(row[0]), str(row[1])) for row in rows]
+            finally:
+                cursor.close()
+
+        async def infer(file: FileInfo) -> tuple[FileInfo, str, list[tuple[str, str]] | None]:
+            fmt = file.file_format or detect_file_format(file.path) or "parquet"
+            cached = cache.get(file) if cache else None
+            if cached is not None:
+                return file, fmt, cached
+            try:
+                async with semaphore:
+                    columns = await asyncio.to_thread(describe, file.path, fmt)
+            except Exception:
+                return file, fmt, None
+            if cache:
+                cache.put(file, columns)
+            return file, fmt, columns
+
+        results = await asyncio.gather(*(infer(f) for f in files))
+        if cache:
+            cache.save()
+
+        # Group files by dataset prefix and format to find collapsible datasets
+        groups: dict[tuple[str, str], list[tuple[FileInfo, list[tuple[str, str]] | None]]] = {}
+        for file, fmt, columns in results:
+            prefix, _ = split_dataset_path(file.path)
+            groups.setdefault((prefix, fmt), []).append((file, columns))
+
+        normalized_root = root.rstrip("/")
+        tables: list[dict[str, Any]] = []
+        for (prefix, fmt), members in groups.items():
+            signatures = {tuple(columns) if columns is not None else None for _, columns in members}
+            mergeable = (
+                len(members) > 1
+                and prefix.rstrip("/") != normalized_root
+                and len(signatures) == 1
+                and None not in signatures
+            )
+            if mergeable:
+                tables.append(self._build_dataset_table(prefix, fmt, members, native_type_prefix))
+                continue
+            for file, columns in members:
+                tables.append(self._build_file_table(file, fmt, columns, native_type_prefix))
+
+        return tables
+
+    def _build_file_table(
+        self,
+        file: FileInfo,
+        fmt: str,
+        columns: list[tuple[str, str]] | None,
+        native_type_prefix: str,
+    ) -> dict[str, Any]:
+        """Build a table dictionary for a single file."""
+        table_name = file.name.rsplit(".", 1)[0].replace("-", "_").replace(" ", "_")
+        return {
+            "name": table_name,
+            "table_type": "file",
+            "native_type": f"{native_type_prefix}_{fmt.upper()}_FILE",
+            "native_path": file.path,
+            "columns": [self._column_dict(name, native) for name, native in columns or []],
+            "size_bytes": file.size_bytes or None,
+            "last_modified": file.last_modified,
+        }
+
+    def _build_dataset_table(
+        self,
+        prefix: str,
+        fmt: str,
+        members: list[tuple[FileInfo, list[tuple[str, str]] | None]],
+        native_type_prefix: str,
+    ) -> dict[str, Any]:
+        """Build a table dictionary for a multi-file dataset."""
+        columns = members[0][1] or []
+        partition_keys: list[str] = []
+        for file, _ in members:
+            for key in split_dataset_path(file.path)[1]:
+                if key not in partition_keys:
+                    partition_keys.append(key)
+
+        # DuckDB may already surface hive keys as columns; flag those and
+        # append the rest.
+        column_names = {name for name, _ in columns}
+        column_dicts = [
+            self._column_dict(name, native, is_partition_key=name in partition_keys)
+            for name, native in columns
+        ] + [
+            self._column_dict(key, "VARCHAR", is_partition_key=True)
+            for key in partition_keys
+            if key not in column_names
+        ]
+
+        ext = members[0][0].name.rsplit(".", 1)[-1]
+        last_modified = max((f.last_modified for f, _ in members if f.last_modified), default=None)
+        table_name = prefix.rsplit("/", 1)[-1].replace("-", "_").replace(" ", "_")
+        return {
+            "name": table_name,
+            "table_type": "file",
+            "native_type": f"{native_type_prefix}_{fmt.upper()}_DATASET",
+            "native_path": f"{prefix}/**/*.{ext}",
+            "columns": column_dicts,
+            "size_bytes": sum(f.size_bytes for f, _ in members) or None,
+            "last_modified": last_modified,
+            "description": f"{len(members)} files sharing one schema",
+        }
+
+    @staticmethod
+    def _column_dict(
+        name: str,
+        native_type: str,
+        is_partition_key: bool = False,
+    ) -> dict[str, Any]:
+        """Build a column dictionary from a DuckDB column description."""
+        return {
+            "name": name,
+            "data_type": normalize_type(native_type, SourceType.DUCKDB),
+            "native_type": native_type,
+            "nullable": True,
+            "is_primary_key": False,
+            "is_partition_key": is_partition_key,
+        }
+
     async def sample(
         self,
         path: str,
@@ -6,6 +6,7 @@ data source interface by using DuckDB to query files stored in HDFS.
 
 from __future__ import annotations
 
+import fnmatch
 import time
 from typing import Any
 
@@ -17,8 +18,18 @@ from dataing.adapters.datasource.errors import (
     QueryTimeoutError,
     SchemaFetchFailedError,
 )
-from dataing.adapters.datasource.filesystem.base import FileInfo, FileSystemAdapter
+from dataing.adapters.datasource.filesystem.base import (
+    SCHEMA_INFERENCE_FIELDS,
+    FileInfo,
+    FileSystemAdapter,
+)
+from dataing.adapters.datasource.filesystem.listing import (
+    LISTING_FIELDS,
+    build_lister,
+    duckdb_tree_lister,
+)
 from dataing.adapters.datasource.registry import register_adapter
+from dataing.adapters.datasource.sql.base import bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -112,6 +123,8 @@ HDFS_CONFIG_SCHEMA = ConfigSchema(
                 {"value": "orc", "label": "ORC"},
             ],
         ),
+        *SCHEMA_INFERENCE_FIELDS,
+        *LISTING_FIELDS,
     ],
 )
 
@@ -268,33 +281,40 @@ class HDFSAdapter(FileSystemAdapter):
         self,
         pattern: str = "*",
         recursive: bool = True,
+        partition_filter: dict[str, Any] | None = None,
     ) -> list[FileInfo]:
-        """List files in the HDFS directory."""
+        """List files in the HDFS directory.
+
+        File sizes and modification times come from DuckDB's ``read_blob``
+        metadata. The listing is cached in a local manifest for
+        ``listing_manifest_ttl_seconds``.
+
+        Args:
+            pattern: Glob pattern matched against file names.
+            recursive: Whether to include files in subdirectories.
+            partition_filter: Hive partition values to keep.
+
+        Returns:
+            List of FileInfo objects.
+        """
         if not self._connected or not self._conn:
             raise ConnectionFailedError(message="Not connected to HDFS")
 
         try:
             hdfs_path = self._get_hdfs_url()
-            full_pattern = f"{hdfs_path}/{pattern}"
-
+            root = f"{hdfs_path}/"
+            lister = build_lister(self._config, root=root, list_tree=duckdb_tree_lister(self._conn))
             try:
-                result = self._conn.execute(f"SELECT * FROM glob('{full_pattern}')").fetchall()
-
-                files: list[FileInfo] = []
-                for row in result:
-                    filepath = row[0]
-                    filename = filepath.split("/")[-1]
-                    files.append(
-                        FileInfo(
-                            path=filepath,
-                            name=filename,
-                            size_bytes=0,
-                        )
-                    )
-                return files
+                files = await lister.list(root, partition_filter)
             except Exception:
                 return []
 
+            if not recursive:
+                files = [f for f in files if "/" not in f.path[len(root) :]]
+            if pattern != "*":
+                files = [f for f in files if fnmatch.fnmatch(f.name, pattern)]
+            return sorted(files, key=lambda f: f.path)
+
         except Exception as e:
             raise SchemaFetchFailedError(
                 message=f"Failed to list HDFS files: {str(e)}",
@@ -459,7 +479,8 @@ class HDFSAdapter(FileSystemAdapter):
 
         start_time = time.time()
         try:
-            result = self._conn.execute(sql)
+            bound_sql, args = bind_params(sql, params, "qmark")
+            result = self._conn.execute(bound_sql, args or None)
             columns_info = result.description
             rows = result.fetchall()
 
@@ -510,14 +531,13 @@ class HDFSAdapter(FileSystemAdapter):
 
         try:
             file_extensions = ["*.parquet", "*.csv", "*.json", "*.jsonl", "*.orc"]
-            all_files = []
-
-            for ext in file_extensions:
-                try:
-                    files = await self.list_files(ext)
-                    all_files.extend(files)
-                except Exception:
-                    pass
+            all_files = [
+                f
+                for f in await self.list_files(
+                    partition_filter=filter.partition_filter if filter else None
+                )
+                if any(fnmatch.fnmatch(f.name, ext) for ext in file_extensions)
+            ]
 
             if filter and filter.table_pattern:
                 all_files = [f for f in all_files if filter.table_pattern in f.name]
@@ -525,21 +545,8 @@ class HDFSAdapter(FileSystemAdapter):
             if filter and filter.max_tables:
                 all_files = all_files[: filter.max_tables]
 
-            tables: list[Table] = []
-            for file_info in all_files:
-                try:
-                    table_def = await self.infer_schema(file_info.path)
-                    tables.append(table_def)
-                except Exception:
-                    tables.append(
-                        Table(
-                            name=file_info.name.rsplit(".", 1)[0],
-                            table_type="file",
-                            native_type="HDFS_FILE",
-                            native_path=file_info.path,
-                            columns=[],
-                        )
-                    )
+            root = self._get_hdfs_url().split("?", 1)[0]
+            tables = await self._infer_tables(self._conn, all_files, root, "HDFS")
 
             path = self._config.get("path", "/")
             catalogs = [
@@ -0,0 +1,370 @@
+"""Sharded object listing with an on-disk prefix manifest.
+
+Listing a bucket with millions of objects one page at a time dominates schema
+discovery. This module splits a listing into prefix shards that are listed in
+parallel, remembers each shard's contents in a manifest on disk, and on later
+calls only re-lists shards that are new or older than the manifest TTL.
+
+Shards are discovered with delimiter ("directory") listings, which return
+child prefixes without their contents. Comparing the discovered prefixes with
+the manifest tells which shards were added or removed since the last run.
+Hive-style ``key=value`` prefixes that do not match a partition filter are
+pruned during discovery and never listed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+import structlog
+
+from dataing.adapters.datasource.filesystem.base import FileInfo, detect_file_format
+from dataing.adapters.datasource.filesystem.schema_cache import default_schema_cache_dir
+from dataing.adapters.datasource.types import ConfigField
+
+logger = structlog.get_logger()
+
+# Maximum number of listing requests in flight at once
+DEFAULT_LISTING_CONCURRENCY = 16
+
+# Directory levels below the root that are expanded into separate shards
+DEFAULT_SHARD_DEPTH = 2
+
+# Seconds a shard's manifest entry is trusted before it is listed again
+DEFAULT_MANIFEST_TTL_SECONDS = 300
+
+# Lists the immediate children of a prefix: (files, child prefixes)
+LevelLister = Callable[[str], tuple[list[FileInfo], list[str]]]
+
+# Lists every file below a prefix
+TreeLister = Callable[[str], list[FileInfo]]
+
+# Listing settings shared by object store adapters
+LISTING_FIELDS = [
+    ConfigField(
+        name="listing_concurrency",
+        label="Listing Concurrency",
+        type="integer",
+        required=False,
+        group="format",
+        default_value=DEFAULT_LISTING_CONCURRENCY,
+        min_value=1,
+        max_value=128,
+        description="Maximum number of prefixes listed at the same time",
+    ),
+    ConfigField(
+        name="listing_manifest_ttl_seconds",
+        label="Listing Cache TTL (seconds)",
+        type="integer",
+        required=False,
+        group="format",
+        default_value=DEFAULT_MANIFEST_TTL_SECONDS,
+        min_value=0,
+        description="How long a cached prefix listing is reused before it is refreshed",
+    ),
+]
+
+
+def default_manifest_dir() -> Path:
+    """Get the default directory for listing manifests."""
+    return default_schema_cache_dir().parent / "manifests"
+
+
+def duckdb_tree_lister(conn: Any) -> TreeLister:
+    """Build a tree lister that lists files through DuckDB's ``read_blob``.
+
+    Only file metadata is selected, so object contents are never fetched.
+    Each call uses its own cursor so shards can be listed from worker threads.
+
+    Args:
+        conn: DuckDB connection with the filesystem extension loaded.
+
+    Returns:
+        Blocking callable listing all files below a prefix.
+    """
+
+    def list_tree(prefix: str) -> list[FileInfo]:
+        cursor = conn.cursor()
+        try:
+            rows = cursor.execute(
+                "SELECT filename, size, last_modified FROM read_blob(?)",
+                [f"{prefix}**"],
+            ).fetchall()
+        finally:
+            cursor.close()
+        files = []
+        for path, size, last_modified in rows:
+            name = path.rsplit("/", 1)[-1]
+            files.append(
+                FileInfo(
+                    path=path,
+                    name=name,
+                    size_bytes=size or 0,
+                    last_modified=last_modified.isoformat() if last_modified else None,
+                    file_format=detect_file_format(name),
+                )
+            )
+        return files
+
+    return list_tree
+
+
+def partition_matches(path: str, partition_filter: Mapping[str, Any] | None) -> bool:
+    """Check whether a path's hive partitions satisfy a filter.
+
+    Segments that are not ``key=value`` pairs, and keys absent from the
+    filter, always match. Filter values may be a single value or a
+    collection of accepted values.
+
+    Args:
+        path: Object path or prefix.
+        partition_filter: Mapping of partition key to accepted value(s).
+
+    Returns:
+        False if any partition segment contradicts the filter.
+    """
+    if not partition_filter:
+        return True
+    for segment in path.split("/"):
+        key, sep, value = segment.partition("=")
+        if not sep or key not in partition_filter:
+            continue
+        accepted = partition_filter[key]
+        if isinstance(accepted, list | tuple | set | frozenset):
+            allowed = {str(v) for v in accepted}
+        else:
+            allowed = {str(accepted)}
+        if unquote(value) not in allowed:
+            return False
+    return True
+
+
+def _parent_prefix(prefix: str) -> str:
+    """Get the parent of a ``/``-terminated prefix."""
+    trimmed = prefix.rstrip("/")
+    if "/" not in trimmed:
+        return ""
+    return trimmed.rsplit("/", 1)[0] + "/"
+
+
+class ListingManifest:
+    """On-disk record of the files found under each listed shard.
+
+    One JSON file is kept per listing root, so adapters pointing at
+    different buckets or prefixes never share entries.
+    """
+
+    def __init__(self, directory: str | Path, root: str) -> None:
+        """Initialize the manifest, loading any existing entries.
+
+        Args:
+            directory: Directory holding manifest files.
+            root: Listing root the manifest describes.
+        """
+        digest = hashlib.sha256(root.encode()).hexdigest()[:16]
+        self.path = Path(directory) / f"{digest}.json"
+        self._shards: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load entries from disk, ignoring missing or corrupt files."""
+        try:
+            with self.path.open() as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._shards = data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("listing_manifest_load_failed", path=str(self.path), error=str(e))
+
+    @property
+    def shards(self) -> list[str]:
+        """Get all shard prefixes in the manifest."""
+        return list(self._shards)
+
+    def get(self, shard: str, max_age_seconds: float) -> list[FileInfo] | None:
+        """Get a shard's files if its entry is fresh enough.
+
+        Args:
+            shard: Shard prefix.
+            max_age_seconds: Maximum age of the entry.
+
+        Returns:
+            Files recorded for the shard, or None if missing or stale.
+        """
+        entry = self._shards.get(shard)
+        if entry is None or time.time() - entry["listed_at"] > max_age_seconds:
+            return None
+        return [FileInfo(**f) for f in entry["files"]]
+
+    def put(self, shard: str, files: list[FileInfo]) -> None:
+        """Record a shard's files as of now."""
+        self._shards[shard] = {"listed_at": time.time(), "files": [asdict(f) for f in files]}
+        self._dirty = True
+
+    def discard(self, shard: str) -> None:
+        """Remove a shard that no longer exists."""
+        if self._shards.pop(shard, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write pending changes to disk atomically."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._shards, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("listing_manifest_save_failed", path=str(self.path), error=str(e))
+
+
+class ShardedLister:
+    """Lists a prefix tree as parallel shards backed by a manifest.
+
+    With a level lister, the first ``shard_depth`` directory levels are
+    discovered with delimiter listings and every prefix found at that depth
+    becomes a shard. Without one (stores that only offer recursive listing),
+    the whole root is a single shard that is cached as a unit.
+    """
+
+    def __init__(
+        self,
+        list_tree: TreeLister,
+        list_level: LevelLister | None = None,
+        manifest: ListingManifest | None = None,
+        concurrency: int = DEFAULT_LISTING_CONCURRENCY,
+        shard_depth: int = DEFAULT_SHARD_DEPTH,
+        manifest_ttl_seconds: float = DEFAULT_MANIFEST_TTL_SECONDS,
+    ) -> None:
+        """Initialize the lister.
+
+        Args:
+            list_tree: Blocking callable listing all files below a prefix.
+            list_level: Blocking callable listing one level below a prefix.
+            manifest: Manifest to read and refresh, or None to disable caching.
+            concurrency: Maximum listing calls in flight.
+            shard_depth: Directory levels to expand into shards.
+            manifest_ttl_seconds: Age after which a shard is listed again.
+        """
+        self._list_tree = list_tree
+        self._list_level = list_level
+        self._manifest = manifest
+        self._semaphore = asyncio.Semaphore(max(concurrency, 1))
+        self._shard_depth = shard_depth
+        self._ttl = manifest_ttl_seconds
+
+    async def _run(self, fn: Callable[[str], Any], prefix: str) -> Any:
+        """Run a blocking listing call in a worker thread."""
+        async with self._semaphore:
+            return await asyncio.to_thread(fn, prefix)
+
+    async def list(
+        self,
+        root: str,
+        partition_filter: Mapping[str, Any] | None = None,
+    ) -> list[FileInfo]:
+        """List all files below a root.
+
+        Args:
+            root: Root prefix.
+            partition_filter: Hive partition values to keep; other
+                partitions are skipped without being listed.
+
+        Returns:
+            Files below the root that match the partition filter.
+        """
+        files: list[FileInfo] = []
+        shards = [root]
+
+        if self._list_level is not None:
+            frontier = [root]
+            visited: set[str] = set()
+            discovered: set[str] = set()
+            for _ in range(self._shard_depth):
+                levels = await asyncio.gather(*(self._run(self._list_level, p) for p in frontier))
+                visited.update(frontier)
+                next_frontier: list[str] = []
+                for level_files, children in levels:
+                    files.extend(level_files)
+                    discovered.update(children)
+                    next_frontier.extend(
+                        c for c in children if partition_matches(c, partition_filter)
+                    )
+                frontier = next_frontier
+                if not frontier:
+                    break
+            shards = frontier
+
+            # Drop manifest shards whose parent was listed but no longer has them
+            if self._manifest is not None:
+                for shard in self._manifest.shards:
+                    if _parent_prefix(shard) in visited and shard not in discovered:
+                        self._manifest.discard(shard)
+
+        async def list_shard(shard: str) -> list[FileInfo]:
+            if self._manifest is not None:
+                cached = self._manifest.get(shard, self._ttl)
+                if cached is not None:
+                    return cached
+            shard_files: list[FileInfo] = await self._run(self._list_tree, shard)
+            if self._manifest is not None:
+                self._manifest.put(shard, shard_files)
+            return shard_files
+
+        for shard_files in await asyncio.gather(*(list_shard(s) for s in shards)):
+            files.extend(shard_files)
+
+        if self._manifest is not None:
+            self._manifest.save()
+
+        return [f for f in files if partition_matches(f.path, partition_filter)]
+
+
+def build_lister(
+    config: Mapping[str, Any],
+    root: str,
+    list_tree: TreeLister,
+    list_level: LevelLister | None = None,
+) -> ShardedLister:
+    """Build a ShardedLister from adapter configuration.
+
+    Args:
+        config: Adapter configuration dictionary.
+        root: Fully qualified listing root, used to key the manifest.
+        list_tree: Blocking callable listing all files below a prefix.
+        list_level: Blocking callable listing one level below a prefix.
+
+    Returns:
+        Configured lister.
+    """
+    manifest = None
+    if config.get("schema_cache_enabled", True) is not False:
+        manifest = ListingManifest(
+            config.get("listing_manifest_dir") or default_manifest_dir(),
+            root=root,
+        )
+    return ShardedLister(
+        list_tree=list_tree,
+        list_level=list_level,
+        manifest=manifest,
+        concurrency=int(config.get("listing_concurrency", DEFAULT_LISTING_CONCURRENCY)),
+        manifest_ttl_seconds=float(
+            config.get("listing_manifest_ttl_seconds", DEFAULT_MANIFEST_TTL_SECONDS)
+        ),
+    )
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 import time
+from datetime import UTC, datetime
 from typing import Any
 
 from dataing.adapters.datasource.errors import (
@@ -16,8 +17,13 @@ from dataing.adapters.datasource.errors import (
     QueryTimeoutError,
     SchemaFetchFailedError,
 )
-from dataing.adapters.datasource.filesystem.base import FileInfo, FileSystemAdapter
+from dataing.adapters.datasource.filesystem.base import (
+    SCHEMA_INFERENCE_FIELDS,
+    FileInfo,
+    FileSystemAdapter,
+)
 from dataing.adapters.datasource.registry import register_adapter
+from dataing.adapters.datasource.sql.base import bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -73,6 +79,7 @@ LOCAL_FILE_CONFIG_SCHEMA = ConfigSchema(
                 {"value": "json", "label": "JSON/JSONL"},
             ],
         ),
+        *SCHEMA_INFERENCE_FIELDS,
     ],
 )
 
@@ -227,32 +234,12 @@ class LocalFileAdapter(FileSystemAdapter):
                     for filename in filenames:
                         if self._matches_pattern(filename, pattern):
                             filepath = os.path.join(root, filename)
-                            try:
-                                size = os.path.getsize(filepath)
-                            except Exception:
-                                size = 0
-                            files.append(
-                                FileInfo(
-                                    path=filepath,
-                                    name=filename,
-                                    size_bytes=size,
-                                )
-                            )
+                            files.append(self._stat_file(filepath, filename))
             else:
                 for entry in os.listdir(base_path):
                     filepath = os.path.join(base_path, entry)
                     if os.path.isfile(filepath) and self._matches_pattern(entry, pattern):
-                        try:
-                            size = os.path.getsize(filepath)
-                        except Exception:
-                            size = 0
-                        files.append(
-                            FileInfo(
-                                path=filepath,
-                                name=entry,
-                                size_bytes=size,
-                            )
-                        )
+                        files.append(self._stat_file(filepath, entry))
 
             return files
 
@@ -262,6 +249,19 @@ class LocalFileAdapter(FileSystemAdapter):
                 details={"error": str(e)},
             ) from e
 
+    def _stat_file(self, filepath: str, name: str) -> FileInfo:
+        """Build FileInfo for a local file, including size and mtime."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return FileInfo(path=filepath, name=name, size_bytes=0)
+        return FileInfo(
+            path=filepath,
+            name=name,
+            size_bytes=stat.st_size,
+            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC).isoformat(),
+        )
+
     def _matches_pattern(self, filename: str, pattern: str) -> bool:
         """Check if filename matches the pattern."""
         import fnmatch
@@ -422,7 +422,8 @@ class LocalFileAdapter(FileSystemAdapter):
 
         start_time = time.time()
         try:
-            result = self._conn.execute(sql)
+            bound_sql, args = bind_params(sql, params, "qmark")
+            result = self._conn.execute(bound_sql, args or None)
             columns_info = result.description
             rows = result.fetchall()
 
@@ -488,24 +489,8 @@ class LocalFileAdapter(FileSystemAdapter):
             if filter and filter.max_tables:
                 all_files = all_files[: filter.max_tables]
 
-            tables: list[Table] = []
-            for file_info in all_files:
-                try:
-                    table_def = await self.infer_schema(file_info.path)
-                    tables.append(table_def)
-                except Exception:
-                    tables.append(
-                        Table(
-                            name=file_info.name.rsplit(".", 1)[0],
-                            table_type="file",
-                            native_type="LOCAL_FILE",
-                            native_path=file_info.path,
-                            columns=[],
-                            size_bytes=file_info.size_bytes,
-                        )
-                    )
-
             base_path = self._get_base_path()
+            tables = await self._infer_tables(self._conn, all_files, base_path, "LOCAL")
             dir_name = os.path.basename(base_path) or "root"
 
             catalogs = [
@@ -6,6 +6,7 @@ data source interface using DuckDB for file querying.
 
 from __future__ import annotations
 
+import fnmatch
 import time
 from datetime import datetime
 from typing import Any
@@ -16,8 +17,15 @@ from dataing.adapters.datasource.errors import (
     ConnectionFailedError,
     SchemaFetchFailedError,
 )
-from dataing.adapters.datasource.filesystem.base import FileInfo, FileSystemAdapter
+from dataing.adapters.datasource.filesystem.base import (
+    SCHEMA_INFERENCE_FIELDS,
+    FileInfo,
+    FileSystemAdapter,
+    detect_file_format,
+)
+from dataing.adapters.datasource.filesystem.listing import LISTING_FIELDS, build_lister
 from dataing.adapters.datasource.registry import register_adapter
+from dataing.adapters.datasource.sql.base import bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -106,6 +114,8 @@ S3_CONFIG_SCHEMA = ConfigSchema(
                 {"value": "json", "label": "JSON/JSONL"},
             ],
         ),
+        *SCHEMA_INFERENCE_FIELDS,
+        *LISTING_FIELDS,
     ],
 )
 
@@ -268,54 +278,84 @@ class S3Adapter(FileSystemAdapter):
         self,
         pattern: str = "*",
         recursive: bool = True,
+        partition_filter: dict[str, Any] | None = None,
     ) -> list[FileInfo]:
-        """List files in S3 bucket."""
+        """List files in S3 bucket.
+
+        The prefix is split into shards with delimiter listings and the
+        shards are paginated in parallel. Shard contents are cached in a
+        local manifest for ``listing_manifest_ttl_seconds``.
+
+        Args:
+            pattern: Glob pattern matched against file names.
+            recursive: Unused; S3 listings always include nested keys.
+            partition_filter: Hive partition values to keep; prefixes for
+                other partition values are never listed.
+
+        Returns:
+            List of FileInfo objects.
+        """
         if not self._connected or not self._s3_client:
             raise ConnectionFailedError(message="Not connected to S3")
 
         bucket = self._config.get("bucket", "")
         prefix = self._config.get("prefix", "")
+        root = f"{prefix.rstrip('/')}/" if prefix else ""
 
-        files = []
-        paginator = self._s3_client.get_paginator("list_objects_v2")
+        lister = build_lister(
+            self._config,
+            root=f"s3://{bucket}/{root}",
+            list_tree=self._list_tree,
+            list_level=self._list_level,
+        )
+        files = await lister.list(root, partition_filter)
+
+        if pattern != "*":
+            files = [f for f in files if fnmatch.fnmatch(f.name, pattern)]
+        return sorted(files, key=lambda f: f.path)
 
+    def _list_level(self, prefix: str) -> tuple[list[FileInfo], list[str]]:
+        """List the files and child prefixes directly under a prefix."""
+        bucket = self._config.get("bucket", "")
+        files: list[FileInfo] = []
+        children: list[str] = []
+        paginator = self._s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/"):
+            for obj in page.get("Contents", []):
+                file_info = self._to_file_info(bucket, obj)
+                if file_info is not None:
+                    files.append(file_info)
+            children.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+        return files, children
+
+    def _list_tree(self, prefix: str) -> list[FileInfo]:
+        """List every file under a prefix."""
+        bucket = self._config.get("bucket", "")
+        files: list[FileInfo] = []
+        paginator = self._s3_client.get_paginator("list_objects_v2")
         for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
             for obj in page.get("Contents", []):
-                key = obj["Key"]
-                name = key.split("/")[-1]
-
-                # Skip directories
-                if key.endswith("/"):
-                    continue
-
-                # Match pattern
-                if pattern != "*":
-                    import fnmatch
-
-                    if not fnmatch.fnmatch(name, pattern):
-                        continue
-
-                # Detect file format
-                file_format = None
-                if name.endswith(".parquet"):
-                    file_format = "parquet"
-                elif name.endswith(".csv"):
-                    file_format = "csv"
-                elif name.endswith(".json") or name.endswith(".jsonl"):
-                    file_format = "json"
-
-                files.append(
-                    FileInfo(
-                        path=f"s3://{bucket}/{key}",
-                        name=name,
-                        size_bytes=obj.get("Size", 0),
-                        last_modified=obj.get("LastModified", datetime.now()).isoformat(),
-                        file_format=file_format,
-                    )
-                )
-
+                file_info = self._to_file_info(bucket, obj)
+                if file_info is not None:
+                    files.append(file_info)
         return files
 
+    @staticmethod
+    def _to_file_info(bucket: str, obj: dict[str, Any]) -> FileInfo | None:
+        """Convert a list_objects_v2 entry to FileInfo, skipping directory markers."""
+        key = obj["Key"]
+        if key.endswith("/"):
+            return None
+        name = key.split("/")[-1]
+        return FileInfo(
+            path=f"s3://{bucket}/{key}",
+            name=name,
+            size_bytes=obj.get("Size", 0),
+            last_modified=obj.get("LastModified", datetime.now()).isoformat(),
+            file_format=detect_file_format(name),
+            etag=obj.get("ETag"),
+        )
+
     async def read_file(
         self,
         path: str,
@@ -452,12 +492,12 @@ class S3Adapter(FileSystemAdapter):
 
         try:
             # List files
-            files = await self.list_files()
+            files = await self.list_files(
+                partition_filter=filter.partition_filter if filter else None
+            )
 
             # Apply filter if provided
             if filter and filter.table_pattern:
-                import fnmatch
-
                 pattern = filter.table_pattern.replace("%", "*")
                 files = [f for f in files if fnmatch.fnmatch(f.name, pattern)]
 
@@ -465,39 +505,13 @@ class S3Adapter(FileSystemAdapter):
             max_tables = filter.max_tables if filter else 100
             files = files[:max_tables]
 
-            # Infer schema for each file
-            tables = []
-            for file_info in files:
-                try:
-                    table = await self.infer_schema(file_info.path, file_info.file_format)
-                    tables.append(
-                        {
-                            "name": table.name,
-                            "table_type": table.table_type,
-                            "native_type": table.native_type,
-                            "native_path": table.native_path,
-                            "columns": [
-                                {
-                                    "name": col.name,
-                                    "data_type": col.data_type,
-                                    "native_type": col.native_type,
-                                    "nullable": col.nullable,
-                                    "is_primary_key": col.is_primary_key,
-                                    "is_partition_key": col.is_partition_key,
-                                }
-                                for col in table.columns
-                            ],
-                            "size_bytes": file_info.size_bytes,
-                            "last_modified": file_info.last_modified,
-                        }
-                    )
-                except Exception:
-                    # Skip files we can't read
-                    continue
-
             bucket = self._config.get("bucket", "")
             prefix = self._config.get("prefix", "")
 
+            # Infer schemas concurrently, collapsing partitioned datasets
+            root = f"s3://{bucket}/{prefix}".rstrip("/")
+            tables = await self._infer_tables(self._duckdb_conn, files, root, "S3")
+
             # Build catalog structure
             catalogs = [
                 {
@@ -535,7 +549,8 @@ class S3Adapter(FileSystemAdapter):
 
         start_time = time.time()
 
-        result = self._duckdb_conn.execute(sql)
+        bound_sql, args = bind_params(sql, params, "qmark")
+        result = self._duckdb_conn.execute(bound_sql, args or None)
         columns_info = result.description
         rows = result.fetchall()
 
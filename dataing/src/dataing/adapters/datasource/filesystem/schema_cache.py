@@ -0,0 +1,115 @@
+"""On-disk cache for schemas inferred from data files.
+
+Inferring a file's schema means a round trip to storage for every file. The
+result only changes when the file does, so it is cached on disk keyed by the
+file's path, size and version marker (mtime or ETag) and reused across
+investigations and process restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from dataing.adapters.datasource.filesystem.base import FileInfo
+
+logger = structlog.get_logger()
+
+
+def default_schema_cache_dir() -> Path:
+    """Get the default cache directory, honouring ``XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "dataing" / "schemas"
+
+
+class SchemaCache:
+    """Persistent cache of file schemas.
+
+    Entries are stored as ``(column_name, native_type)`` pairs in a single
+    JSON file per namespace. Files without a version marker (no mtime and no
+    ETag) are never cached, since a stale entry could not be detected.
+
+    Attributes:
+        path: Location of the JSON cache file.
+    """
+
+    def __init__(self, directory: str | Path, namespace: str = "default") -> None:
+        """Initialize the cache, loading any existing entries.
+
+        Args:
+            directory: Directory holding cache files.
+            namespace: Name of the cache file, typically the source type.
+        """
+        self.path = Path(directory) / f"{namespace}.json"
+        self._entries: dict[str, list[list[str]]] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def _key(file: FileInfo) -> str | None:
+        """Build the cache key for a file, or None if it is not cacheable."""
+        version = file.etag or file.last_modified
+        if not version:
+            return None
+        raw = f"{file.path}\0{file.size_bytes}\0{version}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _load(self) -> None:
+        """Load entries from disk, ignoring missing or corrupt files."""
+        try:
+            with self.path.open() as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("schema_cache_load_failed", path=str(self.path), error=str(e))
+
+    def get(self, file: FileInfo) -> list[tuple[str, str]] | None:
+        """Get cached columns for a file.
+
+        Args:
+            file: File to look up.
+
+        Returns:
+            List of ``(column_name, native_type)`` pairs, or None on a miss.
+        """
+        key = self._key(file)
+        if key is None or key not in self._entries:
+            return None
+        return [(name, native_type) for name, native_type in self._entries[key]]
+
+    def put(self, file: FileInfo, columns: list[tuple[str, str]]) -> None:
+        """Store columns for a file.
+
+        Args:
+            file: File the columns were inferred from.
+            columns: List of ``(column_name, native_type)`` pairs.
+        """
+        key = self._key(file)
+        if key is None:
+            return
+        self._entries[key] = [[name, native_type] for name, native_type in columns]
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write pending entries to disk atomically."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning("schema_cache_save_failed", path=str(self.path), error=str(e))
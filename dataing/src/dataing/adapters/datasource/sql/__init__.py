@@ -12,6 +12,7 @@ This module provides adapters for SQL-speaking data sources:
 """
 
 from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.result_batches import ArrowQueryResult, ResultBudget
 from dataing.adapters.datasource.sql.sqlite import SQLiteAdapter
 
-__all__ = ["SQLAdapter", "SQLiteAdapter"]
+__all__ = ["ArrowQueryResult", "ResultBudget", "SQLAdapter", "SQLiteAdapter"]
@@ -6,16 +6,99 @@ data source adapters, adding query execution capabilities.
 
 from __future__ import annotations
 
+import re
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Literal
+
+import sqlglot
+from sqlglot import exp
 
 from dataing.adapters.datasource.base import BaseAdapter
+from dataing.adapters.datasource.sql.result_batches import ArrowQueryResult, require_pyarrow
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
+    QueryCostEstimate,
     QueryLanguage,
     QueryResult,
 )
 
+ParamStyle = Literal["numeric", "format", "qmark", "named"]
+
+# Matches, in priority order: string literals, quoted identifiers, comments,
+# Postgres casts, literal percent signs and finally ``:name`` placeholders.
+# Everything except the last alternative is passed through untouched so that
+# placeholders inside literals or after ``::`` are never rewritten.
+_PLACEHOLDER_PATTERN = re.compile(
+    r"""
+    ('(?:[^']|'')*')
+    |("(?:[^"]|"")*")
+    |(`[^`]*`)
+    |(--[^\n]*)
+    |(/\*.*?\*/)
+    |(::)
+    |(%)
+    |:([A-Za-z_][A-Za-z0-9_]*)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def bind_params(
+    sql: str,
+    params: dict[str, Any] | None,
+    style: ParamStyle,
+) -> tuple[str, list[Any]]:
+    """Rewrite portable ``:name`` placeholders into a driver's native style.
+
+    Queries passed to ``execute_query`` use ``:name`` placeholders regardless
+    of the backend. Binding values instead of splicing them into the SQL text
+    keeps the statement text stable across calls, which lets servers and
+    drivers reuse prepared statements and cached plans.
+
+    Supported styles:
+    - ``numeric``: ``$1, $2`` (asyncpg). Repeated names reuse the same index.
+    - ``format``: ``%s`` (aiomysql). Every literal ``%`` is escaped as ``%%``.
+    - ``qmark``: ``?`` (DuckDB, Snowflake, Trino).
+    - ``named``: ``@name`` (BigQuery). Values are returned as ``(name, value)``
+      pairs in first-seen order.
+
+    Args:
+        sql: SQL text with ``:name`` placeholders.
+        params: Mapping of placeholder names to values.
+        style: Target placeholder style.
+
+    Returns:
+        Tuple of the rewritten SQL and the positional values to bind. When
+        ``params`` is empty the SQL is returned unchanged.
+
+    Raises:
+        ValueError: If the SQL references a placeholder missing from ``params``.
+    """
+    if not params:
+        return sql, []
+
+    values: list[Any] = []
+    positions: dict[str, int] = {}
+
+    def _replace(match: re.Match[str]) -> str:
+        name = match.group(8)
+        if name is None:
+            text = match.group(0)
+            return text.replace("%", "%%") if style == "format" else text
+        if name not in params:
+            raise ValueError(f"Missing value for query parameter: {name}")
+
+        if style in ("numeric", "named"):
+            if name not in positions:
+                values.append((name, params[name]) if style == "named" else params[name])
+                positions[name] = len(values)
+            return f"${positions[name]}" if style == "numeric" else f"@{name}"
+
+        values.append(params[name])
+        return "%s" if style == "format" else "?"
+
+    return _PLACEHOLDER_PATTERN.sub(_replace, sql), values
+
 
 class SQLAdapter(BaseAdapter):
     """Abstract base class for SQL database adapters.
@@ -25,8 +108,18 @@ class SQLAdapter(BaseAdapter):
     - execute_query: Execute arbitrary SQL
     - _get_schema_query: Return SQL to fetch schema metadata
     - _get_tables_query: Return SQL to list tables
+
+    ``execute_query_arrow`` returns results as an Arrow table; warehouses
+    that return Arrow natively override it.
+
+    Adapters that can estimate a query's cost before running it override
+    ``estimate_query_cost``; setting ``SQL_DIALECT`` enables
+    ``build_sampled_query``.
     """
 
+    # sqlglot dialect used to rewrite queries; None disables rewriting
+    SQL_DIALECT: str | None = None
+
     @property
     def capabilities(self) -> AdapterCapabilities:
         """SQL adapters support SQL queries by default."""
@@ -52,8 +145,10 @@ class SQLAdapter(BaseAdapter):
         """Execute a SQL query against the data source.
 
         Args:
-            sql: The SQL query to execute.
-            params: Optional query parameters.
+            sql: The SQL query to execute. Values should be referenced with
+                portable ``:name`` placeholders; see ``bind_params``.
+            params: Optional mapping of placeholder names to values. Values
+                are bound by the driver, never interpolated into the SQL.
             timeout_seconds: Query timeout in seconds.
             limit: Optional row limit (may be applied via LIMIT clause).
 
@@ -67,6 +162,102 @@ class SQLAdapter(BaseAdapter):
         """
         ...
 
+    async def execute_query_arrow(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+        timeout_seconds: int = 30,
+        limit: int | None = None,
+    ) -> ArrowQueryResult:
+        """Execute a SQL query and return the result as an Arrow table.
+
+        The default converts the rows from ``execute_query``. Warehouses that
+        return Arrow natively override this to skip per-row decoding.
+
+        Args:
+            sql: The SQL query to execute, with ``:name`` placeholders.
+            params: Optional mapping of placeholder names to values.
+            timeout_seconds: Query timeout in seconds.
+            limit: Optional maximum number of rows to return.
+
+        Returns:
+            ArrowQueryResult with the same rows and metadata.
+
+        Raises:
+            FeatureNotImplementedError: If pyarrow is not installed.
+        """
+        pa = require_pyarrow(self.source_type.value)
+        result = await self.execute_query(sql, params, timeout_seconds, limit)
+        return ArrowQueryResult(
+            table=pa.Table.from_pylist(result.rows),
+            columns=result.columns,
+            truncated=result.truncated,
+            execution_time_ms=result.execution_time_ms,
+        )
+
+    async def estimate_query_cost(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> QueryCostEstimate | None:
+        """Estimate what a query would scan without running it.
+
+        Implementations use the source's dry run or EXPLAIN facility, which
+        plans the query but reads no table data.
+
+        Args:
+            sql: The SQL query to estimate.
+            params: Optional mapping of placeholder names to values.
+
+        Returns:
+            The estimate, or None if this source cannot estimate queries.
+        """
+        return None
+
+    def build_sampled_query(self, sql: str, percent: float) -> str | None:
+        """Rewrite a query to read a sample of every table it references.
+
+        Each base table gets a ``TABLESAMPLE SYSTEM`` clause, which samples
+        storage blocks or partitions so the scan itself shrinks. References
+        to CTEs are left alone since the tables inside them are sampled.
+
+        Args:
+            sql: The SQL query to rewrite.
+            percent: Percentage of each table to read, between 0 and 100.
+
+        Returns:
+            The rewritten SQL, or None if this source does not support the
+            rewrite or the query could not be parsed.
+        """
+        if self.SQL_DIALECT is None:
+            return None
+        try:
+            tree = sqlglot.parse_one(sql, dialect=self.SQL_DIALECT)
+        except sqlglot.errors.ParseError:
+            return None
+
+        cte_names = {cte.alias_or_name for cte in tree.find_all(exp.CTE)}
+        tables = [
+            table
+            for table in tree.find_all(exp.Table)
+            if table.name not in cte_names and not table.args.get("sample")
+        ]
+        if not tables:
+            return None
+        # Keep portable :name placeholders; dialects would render them natively
+        for placeholder in list(tree.find_all(exp.Placeholder)):
+            if placeholder.name and placeholder.name != "?":
+                placeholder.replace(exp.var(f":{placeholder.name}"))
+        for table in tables:
+            table.set(
+                "sample",
+                exp.TableSample(
+                    method=exp.var("SYSTEM"),
+                    percent=exp.Literal.number(round(percent, 4)),
+                ),
+            )
+        return tree.sql(dialect=self.SQL_DIALECT)
+
     async def sample(
         self,
         table: str,
@@ -6,7 +6,12 @@ data source interface with full schema discovery and query capabilities.
 
 from __future__ import annotations
 
+import asyncio
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
 from typing import Any
 
 from dataing.adapters.datasource.errors import (
@@ -18,7 +23,16 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
+from dataing.adapters.datasource.sql.result_batches import (
+    DEFAULT_MAX_RESULT_BYTES,
+    ArrowQueryResult,
+    ResultBudget,
+    concat_record_batches,
+    pyarrow_available,
+    record_batch_size,
+    require_pyarrow,
+)
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -26,6 +40,7 @@ from dataing.adapters.datasource.types import (
     ConfigSchema,
     ConnectionTestResult,
     FieldGroup,
+    QueryCostEstimate,
     QueryLanguage,
     QueryResult,
     SchemaFilter,
@@ -123,6 +138,8 @@ class BigQueryAdapter(SQLAdapter):
     Provides full schema discovery and query execution for BigQuery.
     """
 
+    SQL_DIALECT = "bigquery"
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize BigQuery adapter.
 
@@ -136,6 +153,7 @@ class BigQueryAdapter(SQLAdapter):
         """
         super().__init__(config)
         self._client: Any = None
+        self._bqstorage_client: Any = None
         self._source_id: str = ""
 
     @property
@@ -181,6 +199,7 @@ class BigQueryAdapter(SQLAdapter):
                 credentials=credentials,
                 location=location,
             )
+            self._bqstorage_client = self._create_bqstorage_client(credentials)
             self._connected = True
         except json.JSONDecodeError as e:
             raise AuthenticationFailedError(
@@ -206,11 +225,26 @@ class BigQueryAdapter(SQLAdapter):
 
     async def disconnect(self) -> None:
         """Close BigQuery client."""
+        if self._bqstorage_client:
+            self._bqstorage_client.transport.close()
+            self._bqstorage_client = None
         if self._client:
             self._client.close()
             self._client = None
         self._connected = False
 
+    @staticmethod
+    def _create_bqstorage_client(credentials: Any) -> Any:
+        """Create a Storage Read API client, or None if it is not installed.
+
+        Without it, Arrow results are read page by page over the REST API.
+        """
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            return None
+        return bigquery_storage.BigQueryReadClient(credentials=credentials)
+
     async def test_connection(self) -> ConnectionTestResult:
         """Test BigQuery connectivity."""
         start_time = time.time()
@@ -246,27 +280,20 @@ class BigQueryAdapter(SQLAdapter):
         timeout_seconds: int = 30,
         limit: int | None = None,
     ) -> QueryResult:
-        """Execute a SQL query against BigQuery."""
-        if not self._connected or not self._client:
-            raise ConnectionFailedError(message="Not connected to BigQuery")
-
-        start_time = time.time()
-        try:
-            from google.cloud import bigquery
+        """Execute a SQL query against BigQuery.
 
-            job_config = bigquery.QueryJobConfig()
-            job_config.timeout_ms = timeout_seconds * 1000
-
-            # Set default dataset if configured
-            dataset = self._config.get("dataset")
-            if dataset:
-                project_id = self._config.get("project_id", "")
-                job_config.default_dataset = f"{project_id}.{dataset}"
-
-            query_job = self._client.query(sql, job_config=job_config)
-            results = query_job.result(timeout=timeout_seconds)
+        With pyarrow installed the result is read as Arrow record batches,
+        through the Storage Read API when google-cloud-bigquery-storage is
+        available. Otherwise rows are iterated over the REST API. Either way
+        reading stops at ``limit`` rows or the configured byte budget.
+        """
+        if pyarrow_available():
+            arrow_result = await self.execute_query_arrow(sql, params, timeout_seconds, limit)
+            return arrow_result.to_query_result(self._to_json_value)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+        start_time = time.time()
+        with self._translate_query_errors(sql, timeout_seconds):
+            results = self._run_query(sql, params, timeout_seconds)
 
             # Get schema from result
             schema = results.schema
@@ -275,43 +302,120 @@ class BigQueryAdapter(SQLAdapter):
                     columns=[],
                     rows=[],
                     row_count=0,
-                    execution_time_ms=execution_time_ms,
+                    execution_time_ms=int((time.time() - start_time) * 1000),
                 )
 
-            columns = [
-                {"name": field.name, "data_type": self._map_bq_type(field.field_type)}
-                for field in schema
-            ]
+            columns = self._result_columns(schema)
             column_names = [field.name for field in schema]
 
-            # Convert rows to dicts
-            row_dicts = []
-            for row in results:
-                row_dict = {}
-                for name in column_names:
-                    value = row[name]
-                    # Convert non-serializable types to strings
-                    if hasattr(value, "isoformat"):
-                        value = value.isoformat()
-                    elif hasattr(value, "__iter__") and not isinstance(value, str | dict | list):
-                        value = list(value)
-                    row_dict[name] = value
-                row_dicts.append(row_dict)
-
-            # Apply limit if needed
+            # Convert rows to dicts, stopping at the limit
+            row_dicts: list[dict[str, Any]] = []
             truncated = False
-            if limit and len(row_dicts) > limit:
-                row_dicts = row_dicts[:limit]
-                truncated = True
+            for row in results:
+                if limit and len(row_dicts) >= limit:
+                    truncated = True
+                    break
+                row_dicts.append({name: self._to_json_value(row[name]) for name in column_names})
 
             return QueryResult(
                 columns=columns,
                 rows=row_dicts,
                 row_count=len(row_dicts),
                 truncated=truncated,
-                execution_time_ms=execution_time_ms,
+                execution_time_ms=int((time.time() - start_time) * 1000),
             )
 
+    async def execute_query_arrow(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+        timeout_seconds: int = 30,
+        limit: int | None = None,
+    ) -> ArrowQueryResult:
+        """Execute a SQL query and return the result as an Arrow table.
+
+        The Storage Read API splits the result into streams that the client
+        library downloads in parallel. Record batches are consumed until the
+        row or byte budget is spent, after which the remaining downloads are
+        cancelled.
+
+        Args:
+            sql: The SQL query to execute, with ``:name`` placeholders.
+            params: Optional mapping of placeholder names to values.
+            timeout_seconds: Query timeout in seconds.
+            limit: Optional maximum number of rows to return.
+
+        Returns:
+            ArrowQueryResult holding the record batches read as one table.
+
+        Raises:
+            FeatureNotImplementedError: If pyarrow is not installed.
+        """
+        pa = require_pyarrow("bigquery")
+        start_time = time.time()
+        with self._translate_query_errors(sql, timeout_seconds):
+            results = self._run_query(sql, params, timeout_seconds)
+            if not results.schema:
+                return ArrowQueryResult(
+                    table=concat_record_batches(pa, []),
+                    columns=[],
+                    execution_time_ms=int((time.time() - start_time) * 1000),
+                )
+
+            budget = ResultBudget(
+                max_rows=limit or None,
+                max_bytes=self._config.get("max_result_bytes", DEFAULT_MAX_RESULT_BYTES),
+            )
+            record_batches, truncated = await asyncio.to_thread(
+                budget.take,
+                results.to_arrow_iterable(bqstorage_client=self._bqstorage_client),
+                record_batch_size,
+            )
+
+        table = concat_record_batches(pa, record_batches)
+        if limit and table.num_rows > limit:
+            table = table.slice(0, limit)
+            truncated = True
+
+        return ArrowQueryResult(
+            table=table,
+            columns=self._result_columns(results.schema),
+            truncated=truncated,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    def _run_query(self, sql: str, params: dict[str, Any] | None, timeout_seconds: int) -> Any:
+        """Run a query job and wait for it, returning its row iterator."""
+        if not self._connected or not self._client:
+            raise ConnectionFailedError(message="Not connected to BigQuery")
+
+        bound_sql, job_config = self._build_job_config(sql, params)
+        job_config.timeout_ms = timeout_seconds * 1000
+
+        query_job = self._client.query(bound_sql, job_config=job_config)
+        return query_job.result(timeout=timeout_seconds)
+
+    def _result_columns(self, schema: Any) -> list[dict[str, Any]]:
+        """Describe result columns with normalized types."""
+        return [
+            {"name": field.name, "data_type": self._map_bq_type(field.field_type)}
+            for field in schema
+        ]
+
+    @staticmethod
+    def _to_json_value(value: Any) -> Any:
+        """Convert non-serializable result values to strings and lists."""
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        if hasattr(value, "__iter__") and not isinstance(value, str | dict | list):
+            return list(value)
+        return value
+
+    @contextmanager
+    def _translate_query_errors(self, sql: str, timeout_seconds: int) -> Iterator[None]:
+        """Map BigQuery client errors to adapter errors."""
+        try:
+            yield
         except Exception as e:
             error_str = str(e).lower()
             if "syntax error" in error_str or "400" in error_str:
@@ -331,6 +435,78 @@ class BigQueryAdapter(SQLAdapter):
             else:
                 raise
 
+    async def estimate_query_cost(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> QueryCostEstimate | None:
+        """Estimate the bytes a query would bill with a dry run.
+
+        Dry runs are free and return the same byte count the query would
+        be billed for, before any clustering or LIMIT savings.
+        """
+        if not self._connected or not self._client:
+            raise ConnectionFailedError(message="Not connected to BigQuery")
+
+        bound_sql, job_config = self._build_job_config(sql, params)
+        job_config.dry_run = True
+        job_config.use_query_cache = False
+        try:
+            query_job = self._client.query(bound_sql, job_config=job_config)
+        except Exception as e:
+            raise QuerySyntaxError(message=str(e), query=sql[:200]) from e
+
+        return QueryCostEstimate(
+            method="dry_run",
+            bytes_scanned=int(query_job.total_bytes_processed or 0),
+        )
+
+    def _build_job_config(self, sql: str, params: dict[str, Any] | None) -> tuple[str, Any]:
+        """Bind parameters and build the job config shared by runs and dry runs."""
+        from google.cloud import bigquery
+
+        job_config = bigquery.QueryJobConfig()
+
+        # Set default dataset if configured
+        dataset = self._config.get("dataset")
+        if dataset:
+            project_id = self._config.get("project_id", "")
+            job_config.default_dataset = f"{project_id}.{dataset}"
+
+        bound_sql, named_args = bind_params(sql, params, "named")
+        if named_args:
+            job_config.query_parameters = [
+                self._build_query_parameter(bigquery, name, value) for name, value in named_args
+            ]
+        return bound_sql, job_config
+
+    @staticmethod
+    def _build_query_parameter(bigquery: Any, name: str, value: Any) -> Any:
+        """Build a BigQuery query parameter, inferring its type from the value."""
+        if isinstance(value, list | tuple):
+            element_type = BigQueryAdapter._infer_param_type(value[0]) if value else "STRING"
+            return bigquery.ArrayQueryParameter(name, element_type, list(value))
+        return bigquery.ScalarQueryParameter(name, BigQueryAdapter._infer_param_type(value), value)
+
+    @staticmethod
+    def _infer_param_type(value: Any) -> str:
+        """Map a Python value to a BigQuery standard SQL type name."""
+        if isinstance(value, bool):
+            return "BOOL"
+        if isinstance(value, int):
+            return "INT64"
+        if isinstance(value, float):
+            return "FLOAT64"
+        if isinstance(value, Decimal):
+            return "NUMERIC"
+        if isinstance(value, datetime):
+            return "TIMESTAMP"
+        if isinstance(value, date):
+            return "DATE"
+        if isinstance(value, bytes):
+            return "BYTES"
+        return "STRING"
+
     def _map_bq_type(self, bq_type: str) -> str:
         """Map BigQuery type to normalized type."""
         result: str = normalize_type(bq_type, SourceType.BIGQUERY).value
@@ -7,7 +7,11 @@ DuckDB can also be used to query parquet files and other file formats.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import math
 import os
+import re
 import time
 from typing import Any
 
@@ -18,7 +22,7 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -26,6 +30,7 @@ from dataing.adapters.datasource.types import (
     ConfigSchema,
     ConnectionTestResult,
     FieldGroup,
+    QueryCostEstimate,
     QueryLanguage,
     QueryResult,
     SchemaFilter,
@@ -37,6 +42,7 @@ from dataing.adapters.datasource.types import (
 DUCKDB_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="source", label="Data Source", collapsed_by_default=False),
+        FieldGroup(id="advanced", label="Advanced", collapsed_by_default=True),
     ],
     fields=[
         ConfigField(
@@ -69,9 +75,52 @@ DUCKDB_CONFIG_SCHEMA = ConfigSchema(
             default_value=True,
             description="Open database in read-only mode",
         ),
+        ConfigField(
+            name="threads",
+            label="Threads",
+            type="integer",
+            required=False,
+            group="advanced",
+            min_value=1,
+            max_value=256,
+            description="Worker threads used by DuckDB (default: number of CPU cores)",
+        ),
+        ConfigField(
+            name="memory_limit",
+            label="Memory Limit",
+            type="string",
+            required=False,
+            group="advanced",
+            placeholder="4GB",
+            description="Maximum memory DuckDB may use (default: 80% of RAM)",
+        ),
+        ConfigField(
+            name="materialize",
+            label="Materialize Datasets",
+            type="string",
+            required=False,
+            group="advanced",
+            placeholder="events,orders",
+            description=(
+                "Comma-separated datasets to load into native tables instead of views. "
+                "Speeds up repeated investigations on hot files at the cost of memory."
+            ),
+            show_if={"source_type": "directory"},
+        ),
     ],
 )
 
+# File extensions readable in directory mode, mapped to DuckDB table functions
+_FILE_READERS = {
+    ".parquet": "read_parquet",
+    ".csv": "read_csv_auto",
+    ".json": "read_json_auto",
+    ".jsonl": "read_json_auto",
+}
+
+# Hive-style partition directory, e.g. ``date=2026-01-10``
+_HIVE_PARTITION_PATTERN = re.compile(r"^[^=/]+=[^/]*$")
+
 DUCKDB_CAPABILITIES = AdapterCapabilities(
     supports_sql=True,
     supports_sampling=True,
@@ -84,6 +133,29 @@ DUCKDB_CAPABILITIES = AdapterCapabilities(
 )
 
 
+def _plan_cardinality(node: dict[str, Any], totals: dict[str, int]) -> int:
+    """Return a DuckDB plan node's estimated output rows, adding to totals.
+
+    Operators without an estimate (such as CROSS_PRODUCT) are assumed to
+    output the product of their inputs for cross products and the largest
+    input otherwise.
+    """
+    child_rows = [_plan_cardinality(child, totals) for child in node.get("children", [])]
+    estimate = node.get("extra_info", {}).get("Estimated Cardinality")
+    name = node.get("name", "")
+    if estimate is not None:
+        rows = int(estimate)
+    elif name == "CROSS_PRODUCT":
+        rows = math.prod(child_rows)
+    else:
+        rows = max(child_rows, default=0)
+
+    totals["processed"] += rows
+    if "SCAN" in name:
+        totals["scanned"] += rows
+    return rows
+
+
 @register_adapter(
     source_type=SourceType.DUCKDB,
     display_name="DuckDB",
@@ -100,6 +172,8 @@ class DuckDBAdapter(SQLAdapter):
     and direct file querying (parquet, CSV, etc.).
     """
 
+    SQL_DIALECT = "duckdb"
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize DuckDB adapter.
 
@@ -108,6 +182,10 @@ class DuckDBAdapter(SQLAdapter):
                 - path: Path to database file or directory
                 - source_type: "database" or "directory"
                 - read_only: Whether to open read-only (default: True)
+                - threads: DuckDB worker threads (optional)
+                - memory_limit: DuckDB memory limit, e.g. "4GB" (optional)
+                - materialize: Comma-separated datasets to load as native
+                  tables in directory mode (optional)
         """
         super().__init__(config)
         self._conn: Any = None
@@ -141,7 +219,8 @@ class DuckDBAdapter(SQLAdapter):
             if self._is_directory_mode:
                 # In directory mode, use in-memory database
                 self._conn = duckdb.connect(":memory:")
-                # Register parquet files as views
+                self._configure_connection()
+                # Register files and dataset directories as views
                 await self._register_directory_files()
             elif path == ":memory:":
                 # In-memory mode - cannot be read-only
@@ -155,6 +234,8 @@ class DuckDBAdapter(SQLAdapter):
                     )
                 self._conn = duckdb.connect(path, read_only=read_only)
 
+            if not self._is_directory_mode:
+                self._configure_connection()
             self._connected = True
         except Exception as e:
             if "ConnectionFailedError" in type(e).__name__:
@@ -164,35 +245,125 @@ class DuckDBAdapter(SQLAdapter):
                 details={"error": str(e), "path": path},
             ) from e
 
+    def _configure_connection(self) -> None:
+        """Apply resource limits and enable the Parquet metadata cache."""
+        threads = self._config.get("threads")
+        if threads:
+            self._conn.execute(f"SET threads = {int(threads)}")
+        memory_limit = self._config.get("memory_limit")
+        if memory_limit:
+            self._conn.execute("SET memory_limit = ?", [str(memory_limit)])
+
+        # Cache Parquet footers so repeated scans skip re-reading metadata.
+        # Older DuckDB releases only expose the generic object cache.
+        try:
+            self._conn.execute("SET parquet_metadata_cache = true")
+        except Exception:
+            self._conn.execute("SET enable_object_cache = true")
+
     async def _register_directory_files(self) -> None:
-        """Register files in directory as DuckDB views."""
+        """Register files in directory as DuckDB views.
+
+        Top-level files become one view each. Top-level subdirectories are
+        treated as datasets: every file of the dominant format underneath
+        them (at any depth) is exposed through a single glob view, with
+        ``hive_partitioning`` enabled for ``key=value`` layouts and
+        ``union_by_name`` to tolerate schema drift between files.
+        """
         path = self._config.get("path", "")
         if not path or not os.path.isdir(path):
             return
 
-        # Find all parquet and CSV files
-        for filename in os.listdir(path):
-            filepath = os.path.join(path, filename)
-            if not os.path.isfile(filepath):
+        materialize = {
+            name.strip()
+            for name in str(self._config.get("materialize") or "").split(",")
+            if name.strip()
+        }
+        self._register_directory(path, materialize=materialize)
+
+    def _register_directory(
+        self,
+        path: str,
+        schema: str | None = None,
+        materialize: set[str] | None = None,
+    ) -> list[str]:
+        """Create a view for each file and dataset directory under a path.
+
+        Args:
+            path: Directory to scan.
+            schema: Schema to create the views in. Defaults to the current
+                schema.
+            materialize: View names to load as native tables instead.
+
+        Returns:
+            Names of the views and tables created.
+        """
+        qualifier = f"{schema}." if schema else ""
+        created: list[str] = []
+        for entry in sorted(os.listdir(path)):
+            entry_path = os.path.join(path, entry)
+
+            if os.path.isfile(entry_path):
+                name, ext = os.path.splitext(entry)
+                reader = _FILE_READERS.get(ext)
+                if not reader:
+                    continue
+                source = f"{reader}('{self._escape_literal(entry_path)}')"
+            elif os.path.isdir(entry_path) and not entry.startswith((".", "_")):
+                name = entry
+                dataset_source = self._build_dataset_source(entry_path)
+                if not dataset_source:
+                    continue
+                source = dataset_source
+            else:
                 continue
 
-            # Create view name from filename (without extension)
-            view_name = os.path.splitext(filename)[0]
             # Clean up view name to be valid SQL identifier
-            view_name = view_name.replace("-", "_").replace(" ", "_")
-
-            if filename.endswith(".parquet"):
-                sql = f"CREATE VIEW IF NOT EXISTS {view_name} AS "
-                sql += f"SELECT * FROM read_parquet('{filepath}')"
-                self._conn.execute(sql)
-            elif filename.endswith(".csv"):
-                sql = f"CREATE VIEW IF NOT EXISTS {view_name} AS "
-                sql += f"SELECT * FROM read_csv_auto('{filepath}')"
-                self._conn.execute(sql)
-            elif filename.endswith(".json") or filename.endswith(".jsonl"):
-                sql = f"CREATE VIEW IF NOT EXISTS {view_name} AS "
-                sql += f"SELECT * FROM read_json_auto('{filepath}')"
-                self._conn.execute(sql)
+            view_name = name.replace("-", "_").replace(" ", "_").replace(".", "_")
+            target = f"{qualifier}{view_name}"
+            if materialize and view_name in materialize:
+                sql = f"CREATE TABLE IF NOT EXISTS {target} AS SELECT * FROM {source}"
+            else:
+                sql = f"CREATE VIEW IF NOT EXISTS {target} AS SELECT * FROM {source}"
+            self._conn.execute(sql)
+            created.append(view_name)
+        return created
+
+    def _build_dataset_source(self, directory: str) -> str | None:
+        """Build a glob table function call covering a dataset directory.
+
+        Args:
+            directory: Directory containing the dataset's files.
+
+        Returns:
+            Table function expression, or None if no readable files exist.
+        """
+        extension_counts: dict[str, int] = {}
+        hive_partitioned = False
+        for _root, dirs, files in os.walk(directory):
+            # Skip hidden/bookkeeping directories such as _delta_log or .spark
+            dirs[:] = [d for d in dirs if not d.startswith((".", "_"))]
+            if any(_HIVE_PARTITION_PATTERN.match(d) for d in dirs):
+                hive_partitioned = True
+            for filename in files:
+                ext = os.path.splitext(filename)[1]
+                if ext in _FILE_READERS:
+                    extension_counts[ext] = extension_counts.get(ext, 0) + 1
+
+        if not extension_counts:
+            return None
+
+        ext = max(extension_counts, key=lambda e: extension_counts[e])
+        pattern = self._escape_literal(os.path.join(directory, "**", f"*{ext}"))
+        options = ["union_by_name = true"]
+        if hive_partitioned:
+            options.append("hive_partitioning = true")
+        return f"{_FILE_READERS[ext]}('{pattern}', {', '.join(options)})"
+
+    @staticmethod
+    def _escape_literal(value: str) -> str:
+        """Escape a value for use inside a single-quoted SQL string literal."""
+        return value.replace("'", "''")
 
     async def disconnect(self) -> None:
         """Close DuckDB connection."""
@@ -240,9 +411,17 @@ class DuckDBAdapter(SQLAdapter):
 
         start_time = time.time()
         try:
-            result = self._conn.execute(sql)
-            columns_info = result.description
-            rows = result.fetchall()
+            bound_sql, args = bind_params(sql, params, "qmark")
+            cursor = self._conn.cursor()
+            try:
+                columns_info, rows = await asyncio.wait_for(
+                    asyncio.to_thread(self._run_on_cursor, cursor, bound_sql, args),
+                    timeout=timeout_seconds,
+                )
+            except TimeoutError:
+                # Stop the worker thread's query; it closes the cursor itself
+                cursor.interrupt()
+                raise
 
             execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -277,6 +456,11 @@ class DuckDBAdapter(SQLAdapter):
                 execution_time_ms=execution_time_ms,
             )
 
+        except TimeoutError as e:
+            raise QueryTimeoutError(
+                message=f"DuckDB query exceeded {timeout_seconds}s",
+                timeout_seconds=timeout_seconds,
+            ) from e
         except Exception as e:
             error_str = str(e).lower()
             if "syntax error" in error_str or "parser error" in error_str:
@@ -292,6 +476,44 @@ class DuckDBAdapter(SQLAdapter):
             else:
                 raise
 
+    async def estimate_query_cost(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> QueryCostEstimate | None:
+        """Estimate a query from the cardinalities in its EXPLAIN plan.
+
+        ``rows_scanned`` adds up the estimated cardinality of scan operators.
+        ``cost`` adds up the cardinality of every operator, so exploding
+        joins show up even when the scans themselves are small. DuckDB does
+        not estimate bytes.
+        """
+        result = await self.execute_query(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        if not result.rows:
+            return None
+
+        totals = {"scanned": 0, "processed": 0}
+        for root in json.loads(result.rows[0]["explain_value"]):
+            _plan_cardinality(root, totals)
+
+        return QueryCostEstimate(
+            method="explain",
+            rows_scanned=totals["scanned"],
+            cost=float(totals["processed"]),
+        )
+
+    def _run_on_cursor(self, cursor: Any, sql: str, args: list[Any]) -> tuple[Any, list[Any]]:
+        """Run a query on a dedicated cursor of the shared database.
+
+        Each cursor is its own DuckDB connection to the same database, so
+        concurrent hypotheses no longer serialize on ``self._conn``.
+        """
+        try:
+            result = cursor.execute(sql, args or None)
+            return result.description, result.fetchall()
+        finally:
+            cursor.close()
+
     def _map_duckdb_type(self, type_code: Any) -> str:
         """Map DuckDB type code to string representation."""
         if type_code is None:
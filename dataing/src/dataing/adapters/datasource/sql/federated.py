@@ -0,0 +1,452 @@
+"""Federated query engine spanning several data sources.
+
+Investigations regularly need to join data that lives in different systems,
+for example orders in PostgreSQL against events landed as Parquet files. The
+federated adapter opens an in-memory DuckDB database and attaches every
+member source under its own alias:
+
+- PostgreSQL, MySQL and SQLite databases are attached read-only through
+  DuckDB's scanner extensions. The scanners push column projections and
+  filters down to the source, so only the rows and columns a query needs
+  cross the network, and nothing is bulk-copied up front.
+- DuckDB database files are attached read-only.
+- Directories of Parquet, CSV and JSON files (local files, or DuckDB in
+  directory mode) are exposed as views in a schema named after the alias.
+
+Tables are addressed as ``alias.schema.table``, or ``alias.table`` for file
+views, and a single query may reference any number of aliases.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from dataing.adapters.datasource.errors import (
+    ConnectionFailedError,
+    SchemaFetchFailedError,
+)
+from dataing.adapters.datasource.sql.duckdb import DuckDBAdapter
+from dataing.adapters.datasource.type_mapping import normalize_type
+from dataing.adapters.datasource.types import (
+    SchemaFilter,
+    SchemaResponse,
+    SourceType,
+)
+
+logger = structlog.get_logger()
+
+# Member source types, mapped to the DuckDB extension needed to attach them
+FEDERATED_EXTENSIONS: dict[SourceType, str | None] = {
+    SourceType.POSTGRESQL: "postgres",
+    SourceType.MYSQL: "mysql",
+    SourceType.SQLITE: "sqlite",
+    SourceType.DUCKDB: None,
+    SourceType.LOCAL_FILE: None,
+}
+
+# Source types that can take part in a federated query
+FEDERATED_SOURCE_TYPES = frozenset(FEDERATED_EXTENSIONS)
+
+# Extension settings that push WHERE clauses down to the attached database
+_FILTER_PUSHDOWN_SETTINGS = {
+    "postgres": "pg_experimental_filter_pushdown",
+    "mysql": "mysql_experimental_filter_pushdown",
+}
+
+# Catalogs DuckDB always has that never belong to a member source
+_INTERNAL_CATALOGS = "'system', 'temp'"
+
+# Schemas of attached databases that hold engine metadata only
+_INTERNAL_SCHEMAS = "'pg_catalog', 'information_schema'"
+
+# A table's member source: its catalog, or its schema for file views
+_SOURCE_ALIAS_SQL = (
+    "CASE WHEN table_catalog = current_database() THEN table_schema ELSE table_catalog END"
+)
+
+_ALIAS_PATTERN = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Database and schema names DuckDB reserves, which an alias would shadow
+_RESERVED_ALIASES = frozenset({"main", "memory", "temp", "system"})
+
+
+@dataclass(frozen=True)
+class FederatedSource:
+    """A data source attached to the federated engine.
+
+    Attributes:
+        alias: SQL name the source is addressed by.
+        source_type: Type of the member source.
+        config: The member source's own connection configuration.
+    """
+
+    alias: str
+    source_type: SourceType
+    config: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def attaches_database(self) -> bool:
+        """Whether the source is attached as a catalog rather than as views."""
+        if self.source_type == SourceType.DUCKDB:
+            return bool(self.config.get("source_type", "directory") == "database")
+        return self.source_type != SourceType.LOCAL_FILE
+
+
+def federation_alias(name: str, taken: Iterable[str] = ()) -> str:
+    """Derive a unique SQL alias from a data source's display name.
+
+    Args:
+        name: Display name, e.g. "Orders DB (prod)".
+        taken: Aliases already in use.
+
+    Returns:
+        A lowercase identifier such as ``orders_db_prod``, suffixed with a
+        counter if it would collide with an alias in ``taken`` or with a
+        name DuckDB reserves.
+    """
+    alias = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") or "source"
+    if alias[0].isdigit():
+        alias = f"s_{alias}"
+    used = set(taken) | _RESERVED_ALIASES
+    candidate, counter = alias, 2
+    while candidate in used:
+        candidate = f"{alias}_{counter}"
+        counter += 1
+    return candidate
+
+
+def _literal(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _connection_string(pairs: Mapping[str, Any]) -> str:
+    """Build a libpq-style ``key=value`` connection string.
+
+    Values are single-quoted with backslash escapes, so passwords may contain
+    spaces and quotes. Empty values are left out.
+    """
+    parts = []
+    for key, value in pairs.items():
+        if value in (None, ""):
+            continue
+        escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+        parts.append(f"{key}='{escaped}'")
+    return " ".join(parts)
+
+
+def build_attach_sql(source: FederatedSource) -> str:
+    """Build the ATTACH statement for a database-backed member source.
+
+    Args:
+        source: Member source whose ``attaches_database`` is true.
+
+    Returns:
+        ATTACH statement opening the source read-only under its alias.
+
+    Raises:
+        ValueError: If the source is exposed as file views instead.
+    """
+    config = source.config
+    if source.source_type == SourceType.POSTGRESQL:
+        dsn = _connection_string(
+            {
+                "host": config.get("host", "localhost"),
+                "port": config.get("port", 5432),
+                "dbname": config.get("database", "postgres"),
+                "user": config.get("username"),
+                "password": config.get("password"),
+                "sslmode": config.get("ssl_mode"),
+                "connect_timeout": config.get("connection_timeout"),
+            }
+        )
+        return f"ATTACH {_literal(dsn)} AS {source.alias} (TYPE postgres, READ_ONLY)"
+    if source.source_type == SourceType.MYSQL:
+        dsn = _connection_string(
+            {
+                "host": config.get("host", "localhost"),
+                "port": config.get("port", 3306),
+                "database": config.get("database"),
+                "user": config.get("username"),
+                "password": config.get("password"),
+            }
+        )
+        return f"ATTACH {_literal(dsn)} AS {source.alias} (TYPE mysql, READ_ONLY)"
+    if source.source_type == SourceType.SQLITE:
+        path = str(config.get("path", ""))
+        return f"ATTACH {_literal(path)} AS {source.alias} (TYPE sqlite, READ_ONLY)"
+    if source.attaches_database:
+        path = str(config.get("path", ""))
+        return f"ATTACH {_literal(path)} AS {source.alias} (READ_ONLY)"
+    raise ValueError(f"Source {source.alias} is not a database and cannot be attached")
+
+
+class FederatedAdapter(DuckDBAdapter):
+    """Query several of a tenant's data sources as one SQL database.
+
+    The adapter is not listed in the registry: it has no configuration form
+    of its own and is built from the tenant's existing data sources.
+    Execution, cost estimates and sampling are DuckDB's.
+
+    Member sources that cannot be attached (unreachable host, missing
+    extension) are logged and left out, so one broken source does not stop
+    an investigation across the others. They are listed in
+    ``unavailable_sources``.
+    """
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the federated adapter.
+
+        Args:
+            config: Configuration dictionary with:
+                - sources: List of member sources, each a dictionary with
+                  ``alias``, ``type`` (a SourceType value) and ``config``
+                  (the member's own connection configuration)
+                - threads: DuckDB worker threads (optional)
+                - memory_limit: DuckDB memory limit, e.g. "4GB" (optional)
+
+        Raises:
+            ValueError: If a member has an unsupported type, or an alias is
+                not a lowercase identifier or is used twice.
+        """
+        super().__init__(config)
+        self._sources: list[FederatedSource] = []
+        for entry in config.get("sources", []):
+            source = FederatedSource(
+                alias=entry["alias"],
+                source_type=SourceType(entry["type"]),
+                config=entry.get("config", {}),
+            )
+            if source.source_type not in FEDERATED_SOURCE_TYPES:
+                raise ValueError(f"Source type {source.source_type.value} cannot be federated")
+            if not _ALIAS_PATTERN.match(source.alias) or source.alias in _RESERVED_ALIASES:
+                raise ValueError(f"Invalid federation alias: {source.alias!r}")
+            if any(s.alias == source.alias for s in self._sources):
+                raise ValueError(f"Duplicate federation alias: {source.alias}")
+            self._sources.append(source)
+        self._attached: list[str] = []
+        self.unavailable_sources: dict[str, str] = {}
+
+    @property
+    def sources(self) -> list[FederatedSource]:
+        """Member sources, in configuration order."""
+        return list(self._sources)
+
+    @property
+    def attached_aliases(self) -> list[str]:
+        """Aliases of the member sources that are queryable."""
+        return list(self._attached)
+
+    async def connect(self) -> None:
+        """Open the engine and attach every member source."""
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ConnectionFailedError(
+                message="duckdb is not installed. Install with: pip install duckdb",
+                details={"error": str(e)},
+            ) from e
+
+        self._conn = duckdb.connect(":memory:")
+        self._configure_connection()
+        self._attached = []
+        self.unavailable_sources = {}
+        loaded_extensions: set[str] = set()
+
+        for source in self._sources:
+            try:
+                # Attaching a remote database opens a network connection
+                await asyncio.to_thread(self._attach, source, loaded_extensions)
+            except Exception as e:
+                logger.warning(
+                    "federated_source_unavailable",
+                    alias=source.alias,
+                    source_type=source.source_type.value,
+                    error=str(e),
+                )
+                self.unavailable_sources[source.alias] = str(e)
+                continue
+            self._attached.append(source.alias)
+
+        if self._sources and not self._attached:
+            self._conn.close()
+            self._conn = None
+            raise ConnectionFailedError(
+                message="None of the federated data sources could be attached",
+                details={"errors": self.unavailable_sources},
+            )
+        self._connected = True
+
+    def _attach(self, source: FederatedSource, loaded_extensions: set[str]) -> None:
+        """Attach one member source under its alias."""
+        extension = FEDERATED_EXTENSIONS[source.source_type]
+        if extension and extension not in loaded_extensions:
+            self._load_extension(extension)
+            loaded_extensions.add(extension)
+
+        if source.attaches_database:
+            self._conn.execute(build_attach_sql(source))
+            return
+
+        path = os.path.abspath(os.path.expanduser(str(source.config.get("path", "."))))
+        if not os.path.isdir(path):
+            raise ConnectionFailedError(
+                message=f"Directory does not exist: {path}",
+                details={"path": path},
+            )
+        self._conn.execute(f"CREATE SCHEMA {source.alias}")
+        self._register_directory(path, schema=source.alias)
+
+    def _load_extension(self, extension: str) -> None:
+        """Install and load a scanner extension and enable filter pushdown."""
+        self._conn.execute(f"INSTALL {extension}")
+        self._conn.execute(f"LOAD {extension}")
+        setting = _FILTER_PUSHDOWN_SETTINGS.get(extension)
+        if setting:
+            try:
+                self._conn.execute(f"SET {setting} = true")
+            except Exception:
+                # Releases where pushdown is always on drop the setting
+                logger.debug("federated_pushdown_setting_missing", setting=setting)
+
+    async def disconnect(self) -> None:
+        """Detach every member source and close the engine."""
+        await super().disconnect()
+        self._attached = []
+
+    async def get_schema(
+        self,
+        filter: SchemaFilter | None = None,
+    ) -> SchemaResponse:
+        """Get the combined schema of every attached source.
+
+        Each member source is one catalog named after its alias. Table
+        ``native_path`` values are fully qualified so they can be used in a
+        query as-is.
+        """
+        if not self._connected or not self._conn:
+            raise ConnectionFailedError(message="Not connected to federated engine")
+
+        source_expr = _SOURCE_ALIAS_SQL
+        conditions = [
+            f"table_catalog NOT IN ({_INTERNAL_CATALOGS})",
+            f"table_schema NOT IN ({_INTERNAL_SCHEMAS})",
+            f"{source_expr} IN ({', '.join(_literal(a) for a in self._attached) or 'NULL'})",
+        ]
+        params: dict[str, Any] = {}
+        if filter:
+            if filter.table_pattern:
+                conditions.append("table_name LIKE :table_pattern")
+                params["table_pattern"] = filter.table_pattern
+            if filter.schema_pattern:
+                conditions.append("table_schema LIKE :schema_pattern")
+                params["schema_pattern"] = filter.schema_pattern
+            if filter.catalog_pattern:
+                conditions.append(f"{source_expr} LIKE :catalog_pattern")
+                params["catalog_pattern"] = filter.catalog_pattern
+        where_clause = " AND ".join(conditions)
+        table_conditions = where_clause
+        if filter and not filter.include_views:
+            table_conditions += " AND table_type = 'BASE TABLE'"
+        max_tables = filter.max_tables if filter else 1000
+
+        try:
+            tables_result = await self.execute_query(
+                f"""
+                SELECT
+                    {source_expr} AS source_alias,
+                    table_catalog = current_database() AS is_view_source,
+                    table_schema,
+                    table_name,
+                    table_type
+                FROM information_schema.tables
+                WHERE {table_conditions}
+                ORDER BY source_alias, table_schema, table_name
+                LIMIT {int(max_tables)}
+                """,
+                params,
+            )
+            columns_result = await self.execute_query(
+                f"""
+                SELECT
+                    {source_expr} AS source_alias,
+                    table_schema,
+                    table_name,
+                    column_name,
+                    data_type,
+                    is_nullable,
+                    column_default
+                FROM information_schema.columns
+                WHERE {where_clause}
+                ORDER BY source_alias, table_schema, table_name, ordinal_position
+                """,
+                params,
+            )
+        except Exception as e:
+            raise SchemaFetchFailedError(
+                message=f"Failed to fetch federated schema: {str(e)}",
+                details={"error": str(e)},
+            ) from e
+
+        source_map: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        for row in tables_result.rows:
+            alias, schema_name, table_name = (
+                row["source_alias"],
+                row["table_schema"],
+                row["table_name"],
+            )
+            native_path = (
+                f"{alias}.{table_name}"
+                if row["is_view_source"]
+                else f"{alias}.{schema_name}.{table_name}"
+            )
+            table_type_raw = row["table_type"]
+            source_map.setdefault(alias, {}).setdefault(schema_name, {})[table_name] = {
+                "name": table_name,
+                "table_type": "view" if "view" in table_type_raw.lower() else "table",
+                "native_type": table_type_raw,
+                "native_path": native_path,
+                "columns": [],
+            }
+
+        for row in columns_result.rows:
+            table = (
+                source_map.get(row["source_alias"], {})
+                .get(row["table_schema"], {})
+                .get(row["table_name"])
+            )
+            if table is None:
+                continue
+            table["columns"].append(
+                {
+                    "name": row["column_name"],
+                    "data_type": normalize_type(row["data_type"], SourceType.DUCKDB),
+                    "native_type": row["data_type"],
+                    "nullable": row["is_nullable"] == "YES",
+                    "is_primary_key": False,
+                    "is_partition_key": False,
+                    "default_value": row["column_default"],
+                }
+            )
+
+        catalogs = [
+            {
+                "name": alias,
+                "schemas": [
+                    {"name": schema_name, "tables": list(tables.values())}
+                    for schema_name, tables in schemas.items()
+                ],
+            }
+            for alias, schemas in source_map.items()
+        ]
+        return self._build_schema_response(
+            source_id=self._source_id or "federated",
+            catalogs=catalogs,
+        )
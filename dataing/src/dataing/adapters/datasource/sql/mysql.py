@@ -9,6 +9,8 @@ from __future__ import annotations
 import time
 from typing import Any
 
+import structlog
+
 from dataing.adapters.datasource.errors import (
     AccessDeniedError,
     AuthenticationFailedError,
@@ -19,7 +21,7 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -35,6 +37,8 @@ from dataing.adapters.datasource.types import (
     SourceType,
 )
 
+logger = structlog.get_logger()
+
 MYSQL_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
@@ -117,6 +121,54 @@ MYSQL_CAPABILITIES = AdapterCapabilities(
     max_concurrent_queries=10,
 )
 
+# Rows read from an unbuffered result per fetch
+MYSQL_FETCH_SIZE = 1000
+
+# Tables, primary key columns and columns in one multi-statement round trip.
+# {tables_where} and {columns_where} are filled with placeholder conditions.
+MYSQL_SCHEMA_SQL = """
+    SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE, TABLE_ROWS, DATA_LENGTH,
+           UPDATE_TIME, TABLE_COMMENT
+    FROM information_schema.TABLES
+    WHERE {tables_where}
+    ORDER BY TABLE_NAME
+    LIMIT {max_tables};
+    SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME
+    FROM information_schema.KEY_COLUMN_USAGE
+    WHERE CONSTRAINT_NAME = 'PRIMARY' AND {columns_where};
+    SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE, COLUMN_TYPE,
+           IS_NULLABLE, COLUMN_DEFAULT, COLUMN_COMMENT
+    FROM information_schema.COLUMNS
+    WHERE {columns_where}
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+
+async def _stream_rows(
+    cursor: Any,
+    column_names: list[str],
+    limit: int | None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Read an unbuffered result until it ends or exceeds the row limit.
+
+    Args:
+        cursor: Cursor holding an unbuffered (SSCursor) result.
+        column_names: Names for the values in each row tuple.
+        limit: Optional maximum number of rows to keep.
+
+    Returns:
+        Tuple of (rows, truncated). When truncated is True the rest of the
+        result is still pending on the connection.
+    """
+    rows: list[dict[str, Any]] = []
+    while True:
+        batch = await cursor.fetchmany(MYSQL_FETCH_SIZE)
+        if not batch:
+            return rows, False
+        rows.extend(dict(zip(column_names, row, strict=False)) for row in batch)
+        if limit and len(rows) > limit:
+            return rows[:limit], True
+
 
 @register_adapter(
     source_type=SourceType.MYSQL,
@@ -148,6 +200,7 @@ class MySQLAdapter(SQLAdapter):
         """
         super().__init__(config)
         self._pool: Any = None
+        self._schema_pool: Any = None
         self._source_id: str = ""
 
     @property
@@ -171,31 +224,10 @@ class MySQLAdapter(SQLAdapter):
             ) from e
 
         try:
-            host = self._config.get("host", "localhost")
-            port = self._config.get("port", 3306)
-            database = self._config.get("database", "")
-            username = self._config.get("username", "")
-            password = self._config.get("password", "")
-            use_ssl = self._config.get("ssl", False)
-            timeout = self._config.get("connection_timeout", 30)
-
-            ssl_context = None
-            if use_ssl:
-                import ssl
-
-                ssl_context = ssl.create_default_context()
-
             self._pool = await aiomysql.create_pool(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                db=database,
-                ssl=ssl_context,
-                connect_timeout=timeout,
                 minsize=1,
                 maxsize=10,
-                autocommit=True,
+                **self._pool_kwargs(),
             )
             self._connected = True
         except Exception as e:
@@ -221,12 +253,52 @@ class MySQLAdapter(SQLAdapter):
                     details={"error": str(e)},
                 ) from e
 
+    def _pool_kwargs(self) -> dict[str, Any]:
+        """Build the connection arguments shared by the adapter's pools."""
+        ssl_context = None
+        if self._config.get("ssl", False):
+            import ssl
+
+            ssl_context = ssl.create_default_context()
+
+        return {
+            "host": self._config.get("host", "localhost"),
+            "port": self._config.get("port", 3306),
+            "user": self._config.get("username", ""),
+            "password": self._config.get("password", ""),
+            "db": self._config.get("database", ""),
+            "ssl": ssl_context,
+            "connect_timeout": self._config.get("connection_timeout", 30),
+            "autocommit": True,
+        }
+
+    async def _get_schema_pool(self) -> Any:
+        """Get the single-connection pool used for schema discovery.
+
+        Its connection allows multiple statements per query so that schema
+        metadata comes back in one round trip. Generated queries never run
+        on it; the main pool keeps multi-statements disabled.
+        """
+        if self._schema_pool is None:
+            import aiomysql
+            from pymysql.constants import CLIENT
+
+            self._schema_pool = await aiomysql.create_pool(
+                minsize=0,
+                maxsize=1,
+                client_flag=CLIENT.MULTI_STATEMENTS,
+                **self._pool_kwargs(),
+            )
+        return self._schema_pool
+
     async def disconnect(self) -> None:
-        """Close MySQL connection pool."""
-        if self._pool:
-            self._pool.close()
-            await self._pool.wait_closed()
-            self._pool = None
+        """Close MySQL connection pools."""
+        for pool in (self._pool, self._schema_pool):
+            if pool:
+                pool.close()
+                await pool.wait_closed()
+        self._pool = None
+        self._schema_pool = None
         self._connected = False
 
     async def test_connection(self) -> ConnectionTestResult:
@@ -265,7 +337,11 @@ class MySQLAdapter(SQLAdapter):
         timeout_seconds: int = 30,
         limit: int | None = None,
     ) -> QueryResult:
-        """Execute a SQL query against MySQL."""
+        """Execute a SQL query against MySQL.
+
+        Rows are streamed from an unbuffered cursor. Once more than ``limit``
+        rows have been read the query is killed rather than read to the end.
+        """
         if not self._connected or not self._pool:
             raise ConnectionFailedError(message="Not connected to MySQL")
 
@@ -274,49 +350,38 @@ class MySQLAdapter(SQLAdapter):
             import aiomysql
 
             async with self._pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cur:
+                # Unbuffered cursor: rows are read from the socket as needed
+                # instead of the whole result being loaded first
+                cur = await conn.cursor(aiomysql.SSCursor)
+                truncated = False
+                try:
                     # Set query timeout
                     await cur.execute(f"SET max_execution_time = {timeout_seconds * 1000}")
 
-                    # Execute query
-                    await cur.execute(sql)
-                    rows = await cur.fetchall()
-
-                    execution_time_ms = int((time.time() - start_time) * 1000)
-
-                    if not rows:
-                        # Get columns from cursor description
-                        columns = []
-                        if cur.description:
-                            columns = [
-                                {"name": col[0], "data_type": "string"} for col in cur.description
-                            ]
-                        return QueryResult(
-                            columns=columns,
-                            rows=[],
-                            row_count=0,
-                            execution_time_ms=execution_time_ms,
-                        )
-
-                    # Get column info
-                    columns = [{"name": col[0], "data_type": "string"} for col in cur.description]
-
-                    # Convert rows to dicts (already dicts with DictCursor)
-                    row_dicts = list(rows)
-
-                    # Apply limit if needed
-                    truncated = False
-                    if limit and len(row_dicts) > limit:
-                        row_dicts = row_dicts[:limit]
-                        truncated = True
-
-                    return QueryResult(
-                        columns=columns,
-                        rows=row_dicts,
-                        row_count=len(row_dicts),
-                        truncated=truncated,
-                        execution_time_ms=execution_time_ms,
+                    # Execute query with values bound by the driver
+                    bound_sql, args = bind_params(sql, params, "format")
+                    await cur.execute(bound_sql, args or None)
+
+                    columns = [
+                        {"name": col[0], "data_type": "string"} for col in cur.description or []
+                    ]
+                    column_names = [col["name"] for col in columns]
+                    row_dicts, truncated = (
+                        await _stream_rows(cur, column_names, limit) if columns else ([], False)
                     )
+                finally:
+                    if truncated:
+                        await self._abort_query(conn)
+                    else:
+                        await cur.close()
+
+                return QueryResult(
+                    columns=columns,
+                    rows=row_dicts,
+                    row_count=len(row_dicts),
+                    truncated=truncated,
+                    execution_time_ms=int((time.time() - start_time) * 1000),
+                )
 
         except Exception as e:
             error_str = str(e).lower()
@@ -337,6 +402,22 @@ class MySQLAdapter(SQLAdapter):
             else:
                 raise
 
+    async def _abort_query(self, conn: Any) -> None:
+        """Stop a streaming query whose remaining rows are not needed.
+
+        Closing an unbuffered cursor normally reads the rest of the result
+        off the socket. Instead the statement is killed from another pooled
+        connection and the streaming connection is closed, so the pool
+        discards it.
+        """
+        try:
+            async with self._pool.acquire() as killer:
+                async with killer.cursor() as cur:
+                    await cur.execute("KILL QUERY %s", (conn.thread_id(),))
+        except Exception as e:
+            logger.warning("mysql_kill_query_failed", error=str(e))
+        conn.close()
+
     async def _fetch_table_metadata(self) -> list[dict[str, Any]]:
         """Fetch table metadata from MySQL."""
         database = self._config.get("database", "")
@@ -364,54 +445,46 @@ class MySQLAdapter(SQLAdapter):
         try:
             database = self._config.get("database", "")
 
-            # Build filter conditions
-            conditions = [f"TABLE_SCHEMA = '{database}'"]
-            if filter:
-                if filter.table_pattern:
-                    conditions.append(f"TABLE_NAME LIKE '{filter.table_pattern}'")
-                if not filter.include_views:
-                    conditions.append("TABLE_TYPE = 'BASE TABLE'")
-
-            where_clause = " AND ".join(conditions)
-            limit_clause = f"LIMIT {filter.max_tables}" if filter else "LIMIT 1000"
-
-            # Get tables
-            tables_sql = f"""
-                SELECT
-                    TABLE_SCHEMA as table_schema,
-                    TABLE_NAME as table_name,
-                    TABLE_TYPE as table_type
-                FROM information_schema.TABLES
-                WHERE {where_clause}
-                ORDER BY TABLE_NAME
-                {limit_clause}
-            """
-            tables_result = await self.execute_query(tables_sql)
-
-            # Get columns
-            columns_sql = f"""
-                SELECT
-                    TABLE_SCHEMA as table_schema,
-                    TABLE_NAME as table_name,
-                    COLUMN_NAME as column_name,
-                    DATA_TYPE as data_type,
-                    IS_NULLABLE as is_nullable,
-                    COLUMN_DEFAULT as column_default,
-                    ORDINAL_POSITION as ordinal_position,
-                    COLUMN_KEY as column_key
-                FROM information_schema.COLUMNS
-                WHERE {where_clause}
-                ORDER BY TABLE_NAME, ORDINAL_POSITION
-            """
-            columns_result = await self.execute_query(columns_sql)
+            # Build filter conditions, with values bound by the driver
+            conditions = ["TABLE_SCHEMA = %s"]
+            args: list[Any] = [database]
+            if filter and filter.table_pattern:
+                conditions.append("TABLE_NAME LIKE %s")
+                args.append(filter.table_pattern)
+            table_conditions = list(conditions)
+            if filter and not filter.include_views:
+                table_conditions.append("TABLE_TYPE = 'BASE TABLE'")
+
+            schema_sql = MYSQL_SCHEMA_SQL.format(
+                tables_where=" AND ".join(table_conditions),
+                columns_where=" AND ".join(conditions),
+                max_tables=int(filter.max_tables) if filter else 1000,
+            )
+
+            # Tables, primary keys and columns in one round trip
+            pool = await self._get_schema_pool()
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(schema_sql, args * 3)
+                    table_rows = await cur.fetchall()
+                    await cur.nextset()
+                    key_rows = await cur.fetchall()
+                    await cur.nextset()
+                    column_rows = await cur.fetchall()
+
+            primary_keys = {tuple(row) for row in key_rows}
 
             # Organize into schema response
             schema_map: dict[str, dict[str, dict[str, Any]]] = {}
-            for row in tables_result.rows:
-                schema_name = row["table_schema"]
-                table_name = row["table_name"]
-                table_type_raw = row["table_type"]
-
+            for (
+                schema_name,
+                table_name,
+                table_type_raw,
+                table_rows_estimate,
+                data_length,
+                update_time,
+                table_comment,
+            ) in table_rows:
                 table_type = "view" if "view" in table_type_raw.lower() else "table"
 
                 if schema_name not in schema_map:
@@ -422,22 +495,33 @@ class MySQLAdapter(SQLAdapter):
                     "native_type": table_type_raw,
                     "native_path": f"{schema_name}.{table_name}",
                     "columns": [],
+                    "row_count": table_rows_estimate,
+                    "size_bytes": data_length,
+                    "last_modified": update_time,
+                    "description": table_comment or None,
                 }
 
             # Add columns
-            for row in columns_result.rows:
-                schema_name = row["table_schema"]
-                table_name = row["table_name"]
+            for (
+                schema_name,
+                table_name,
+                column_name,
+                data_type,
+                column_type,
+                is_nullable,
+                column_default,
+                column_comment,
+            ) in column_rows:
                 if schema_name in schema_map and table_name in schema_map[schema_name]:
-                    is_pk = row.get("column_key") == "PRI"
                     col_data = {
-                        "name": row["column_name"],
-                        "data_type": normalize_type(row["data_type"], SourceType.MYSQL),
-                        "native_type": row["data_type"],
-                        "nullable": row["is_nullable"] == "YES",
-                        "is_primary_key": is_pk,
+                        "name": column_name,
+                        "data_type": normalize_type(data_type, SourceType.MYSQL),
+                        "native_type": column_type,
+                        "nullable": is_nullable == "YES",
+                        "is_primary_key": (schema_name, table_name, column_name) in primary_keys,
                         "is_partition_key": False,
-                        "default_value": row["column_default"],
+                        "default_value": column_default,
+                        "description": column_comment or None,
                     }
                     schema_map[schema_name][table_name]["columns"].append(col_data)
 
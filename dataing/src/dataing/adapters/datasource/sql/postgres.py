@@ -6,7 +6,9 @@ data source interface with full schema discovery and query capabilities.
 
 from __future__ import annotations
 
+import json
 import time
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import quote_plus
 
@@ -20,7 +22,7 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -28,6 +30,7 @@ from dataing.adapters.datasource.types import (
     ConfigSchema,
     ConnectionTestResult,
     FieldGroup,
+    QueryCostEstimate,
     QueryLanguage,
     QueryResult,
     SchemaFilter,
@@ -121,6 +124,17 @@ POSTGRES_CONFIG_SCHEMA = ConfigSchema(
             placeholder="public,analytics",
             description="Comma-separated list of schemas to include (default: all)",
         ),
+        ConfigField(
+            name="statement_cache_size",
+            label="Prepared Statement Cache Size",
+            type="integer",
+            required=False,
+            group="advanced",
+            default_value=100,
+            min_value=0,
+            max_value=10000,
+            description="Prepared statements cached per connection (0 disables caching)",
+        ),
     ],
 )
 
@@ -136,6 +150,13 @@ POSTGRES_CAPABILITIES = AdapterCapabilities(
 )
 
 
+def _iter_plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield a Postgres EXPLAIN plan node and all of its descendants."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from _iter_plan_nodes(child)
+
+
 @register_adapter(
     source_type=SourceType.POSTGRESQL,
     display_name="PostgreSQL",
@@ -151,6 +172,8 @@ class PostgresAdapter(SQLAdapter):
     Provides full schema discovery and query execution for PostgreSQL databases.
     """
 
+    SQL_DIALECT = "postgres"
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize PostgreSQL adapter.
 
@@ -164,6 +187,8 @@ class PostgresAdapter(SQLAdapter):
                 - ssl_mode: SSL mode (optional)
                 - connection_timeout: Timeout in seconds (optional)
                 - schemas: Comma-separated schemas to include (optional)
+                - statement_cache_size: Prepared statements cached per
+                  connection (optional)
         """
         super().__init__(config)
         self._pool: Any = None
@@ -211,6 +236,7 @@ class PostgresAdapter(SQLAdapter):
                 min_size=1,
                 max_size=10,
                 command_timeout=timeout,
+                statement_cache_size=int(self._config.get("statement_cache_size", 100)),
             )
             self._connected = True
         except asyncpg.InvalidPasswordError as e:
@@ -290,8 +316,10 @@ class PostgresAdapter(SQLAdapter):
                 # Set statement timeout
                 await conn.execute(f"SET statement_timeout = {timeout_seconds * 1000}")
 
-                # Execute query
-                rows = await conn.fetch(sql)
+                # Bind parameters so asyncpg's per-connection statement cache
+                # can reuse the prepared statement for repeated queries
+                bound_sql, args = bind_params(sql, params, "numeric")
+                rows = await conn.fetch(bound_sql, *args)
 
                 execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -342,6 +370,39 @@ class PostgresAdapter(SQLAdapter):
             else:
                 raise
 
+    async def estimate_query_cost(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> QueryCostEstimate | None:
+        """Estimate a query from its EXPLAIN plan.
+
+        ``cost`` is the planner's total cost. Scanned rows and bytes add up
+        the estimated output of every scan node, so they undercount scans
+        whose filters discard most rows.
+        """
+        result = await self.execute_query(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        if not result.rows:
+            return None
+        raw = next(iter(result.rows[0].values()))
+        plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+        rows_scanned = 0
+        bytes_scanned = 0
+        for node in _iter_plan_nodes(plan):
+            if node.get("Node Type", "").endswith("Scan"):
+                rows = int(node.get("Plan Rows", 0))
+                rows_scanned += rows
+                bytes_scanned += rows * int(node.get("Plan Width", 0))
+
+        return QueryCostEstimate(
+            method="explain",
+            bytes_scanned=bytes_scanned,
+            rows_scanned=rows_scanned,
+            cost=float(plan.get("Total Cost", 0.0)),
+            details={"output_rows": plan.get("Plan Rows")},
+        )
+
     async def _fetch_table_metadata(self) -> list[dict[str, Any]]:
         """Fetch table metadata from PostgreSQL."""
         schemas_filter = self._config.get("schemas", "")
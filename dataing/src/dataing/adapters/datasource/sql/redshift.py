@@ -19,7 +19,7 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -274,7 +274,8 @@ class RedshiftAdapter(SQLAdapter):
         try:
             async with self._pool.acquire() as conn:
                 await conn.execute(f"SET statement_timeout = {timeout_seconds * 1000}")
-                rows = await conn.fetch(sql)
+                bound_sql, args = bind_params(sql, params, "numeric")
+                rows = await conn.fetch(bound_sql, *args)
                 execution_time_ms = int((time.time() - start_time) * 1000)
 
                 if not rows:
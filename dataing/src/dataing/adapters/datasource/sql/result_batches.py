@@ -0,0 +1,249 @@
+"""Budgeted, batched result fetching for warehouse adapters.
+
+Snowflake and BigQuery can hand back query results as a sequence of Arrow
+record batches instead of one row stream. This module holds the pieces the
+adapters share: the row and byte budget that decides how much of a result is
+kept, parallel download of batches whose sizes are known upfront, and the
+Arrow-native result type.
+
+pyarrow is optional. Without it the adapters fall back to plain row batches,
+and ``execute_query_arrow`` is unavailable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from dataing.adapters.datasource.errors import (
+    NotImplementedError as FeatureNotImplementedError,
+)
+from dataing.adapters.datasource.types import QueryResult
+
+T = TypeVar("T")
+B = TypeVar("B")
+
+# Default cap on result bytes held in memory for a single query (256 MiB)
+DEFAULT_MAX_RESULT_BYTES = 256 * 1024**2
+
+# Result batches downloaded at the same time for a single query
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+
+
+def pyarrow_available() -> bool:
+    """Check whether pyarrow can be imported."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def require_pyarrow(adapter_type: str) -> Any:
+    """Import pyarrow for an Arrow-native code path.
+
+    Args:
+        adapter_type: Adapter name reported if pyarrow is missing.
+
+    Returns:
+        The pyarrow module.
+
+    Raises:
+        FeatureNotImplementedError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise FeatureNotImplementedError(
+            feature="Arrow results (pip install pyarrow)",
+            adapter_type=adapter_type,
+        ) from e
+    return pyarrow
+
+
+@dataclass(frozen=True)
+class ResultBudget:
+    """Limits on how much of a query result is fetched.
+
+    A limit set to None is not enforced. The byte budget is approximate: it
+    counts whole batches, and the first batch is always kept so that a query
+    never returns nothing just because a single batch is large.
+
+    Attributes:
+        max_rows: Maximum rows to return.
+        max_bytes: Maximum uncompressed bytes to hold in memory.
+    """
+
+    max_rows: int | None = None
+    max_bytes: int | None = DEFAULT_MAX_RESULT_BYTES
+
+    def _exhausted(self, rows: int, num_bytes: int) -> bool:
+        """Check whether rows and bytes already taken use up the budget."""
+        return (self.max_rows is not None and rows >= self.max_rows) or (
+            self.max_bytes is not None and num_bytes >= self.max_bytes
+        )
+
+    def _would_exceed_bytes(self, num_bytes: int, batch_bytes: int) -> bool:
+        """Check whether taking another batch would go over the byte budget."""
+        return (
+            self.max_bytes is not None
+            and num_bytes > 0
+            and num_bytes + batch_bytes > self.max_bytes
+        )
+
+    def select(
+        self,
+        batches: Sequence[B],
+        size: Callable[[B], tuple[int, int]],
+    ) -> tuple[list[B], bool]:
+        """Pick the leading batches that fit, before downloading any of them.
+
+        Args:
+            batches: Batches in result order.
+            size: Returns a batch's ``(rows, bytes)`` from its metadata.
+
+        Returns:
+            Tuple of the batches to download and whether any were left out.
+        """
+        rows = num_bytes = 0
+        for index, batch in enumerate(batches):
+            batch_rows, batch_bytes = size(batch)
+            if self._exhausted(rows, num_bytes) or self._would_exceed_bytes(num_bytes, batch_bytes):
+                return list(batches[:index]), True
+            rows += batch_rows
+            num_bytes += batch_bytes
+        return list(batches), False
+
+    def take(
+        self,
+        batches: Iterable[B],
+        size: Callable[[B], tuple[int, int]],
+    ) -> tuple[list[B], bool]:
+        """Consume a batch stream until the budget is spent.
+
+        Unlike ``select`` the sizes are only known once a batch has arrived,
+        so the batch that crosses the byte budget is kept.
+
+        Args:
+            batches: Batch stream in result order. Generators are closed when
+                the budget runs out so that background downloads stop.
+            size: Returns a downloaded batch's ``(rows, bytes)``.
+
+        Returns:
+            Tuple of the batches taken and whether the stream was cut short.
+        """
+        taken: list[B] = []
+        rows = num_bytes = 0
+        iterator: Iterator[B] = iter(batches)
+        try:
+            for batch in iterator:
+                if self._exhausted(rows, num_bytes):
+                    return taken, True
+                taken.append(batch)
+                batch_rows, batch_bytes = size(batch)
+                rows += batch_rows
+                num_bytes += batch_bytes
+            return taken, False
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+
+def record_batch_size(batch: Any) -> tuple[int, int]:
+    """Return an Arrow record batch's rows and in-memory bytes."""
+    return batch.num_rows, batch.nbytes
+
+
+async def download_batches(
+    batches: Sequence[B],
+    fetch: Callable[[B], T],
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+) -> list[T]:
+    """Download result batches in parallel, keeping their order.
+
+    Each ``fetch`` call runs in a worker thread, since warehouse drivers
+    download batches with blocking HTTP clients.
+
+    Args:
+        batches: Batches to download.
+        fetch: Downloads and decodes one batch.
+        concurrency: Maximum downloads in flight at once.
+
+    Returns:
+        The downloaded batches in the same order as ``batches``.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch(batch: B) -> T:
+        async with semaphore:
+            return await asyncio.to_thread(fetch, batch)
+
+    return list(await asyncio.gather(*(_fetch(batch) for batch in batches)))
+
+
+@dataclass(frozen=True)
+class ArrowQueryResult:
+    """Query result held as an Arrow table.
+
+    Attributes:
+        table: The result as a ``pyarrow.Table``.
+        columns: Column descriptions in the same shape as ``QueryResult``.
+        truncated: Whether rows were dropped to stay within the budget.
+        execution_time_ms: Time to run the query and fetch the result.
+    """
+
+    table: Any
+    columns: list[dict[str, Any]]
+    truncated: bool = False
+    execution_time_ms: int | None = None
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the table."""
+        return int(self.table.num_rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the table's buffers."""
+        return int(self.table.nbytes)
+
+    def to_query_result(
+        self,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> QueryResult:
+        """Convert to a row-oriented QueryResult.
+
+        Args:
+            convert: Optional function applied to every value, e.g. to make
+                timestamps JSON-serializable.
+
+        Returns:
+            QueryResult with the same rows and metadata.
+        """
+        rows = self.table.to_pylist()
+        if convert is not None:
+            rows = [{name: convert(value) for name, value in row.items()} for row in rows]
+        return QueryResult(
+            columns=self.columns,
+            rows=rows,
+            row_count=len(rows),
+            truncated=self.truncated,
+            execution_time_ms=self.execution_time_ms,
+        )
+
+
+def concat_record_batches(pa: Any, batches: Sequence[Any], schema: Any = None) -> Any:
+    """Combine Arrow record batches or tables into a single table.
+
+    Args:
+        pa: The pyarrow module.
+        batches: Record batches or tables in result order.
+        schema: Schema to use when there are no batches.
+
+    Returns:
+        A ``pyarrow.Table``.
+    """
+    tables = [pa.Table.from_batches([b]) if isinstance(b, pa.RecordBatch) else b for b in batches]
+    if not tables:
+        return pa.Table.from_batches([], schema=schema) if schema is not None else pa.table({})
+    return pa.concat_tables(tables)
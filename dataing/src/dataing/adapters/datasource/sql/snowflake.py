@@ -6,8 +6,10 @@ data source interface with full schema discovery and query capabilities.
 
 from __future__ import annotations
 
+import json
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 from dataing.adapters.datasource.errors import (
     AccessDeniedError,
@@ -19,7 +21,17 @@ from dataing.adapters.datasource.errors import (
     SchemaFetchFailedError,
 )
 from dataing.adapters.datasource.registry import register_adapter
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
+from dataing.adapters.datasource.sql.result_batches import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_MAX_RESULT_BYTES,
+    ArrowQueryResult,
+    ResultBudget,
+    concat_record_batches,
+    download_batches,
+    pyarrow_available,
+    require_pyarrow,
+)
 from dataing.adapters.datasource.type_mapping import normalize_type
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
@@ -27,6 +39,7 @@ from dataing.adapters.datasource.types import (
     ConfigSchema,
     ConnectionTestResult,
     FieldGroup,
+    QueryCostEstimate,
     QueryLanguage,
     QueryResult,
     SchemaFilter,
@@ -35,6 +48,8 @@ from dataing.adapters.datasource.types import (
     SourceType,
 )
 
+T = TypeVar("T")
+
 SNOWFLAKE_CONFIG_SCHEMA = ConfigSchema(
     field_groups=[
         FieldGroup(id="connection", label="Connection", collapsed_by_default=False),
@@ -125,6 +140,11 @@ SNOWFLAKE_CAPABILITIES = AdapterCapabilities(
 )
 
 
+def _batch_size(batch: Any) -> tuple[int, int]:
+    """Return a result batch's rows and uncompressed bytes from its metadata."""
+    return batch.rowcount, batch.uncompressed_size or 0
+
+
 @register_adapter(
     source_type=SourceType.SNOWFLAKE,
     display_name="Snowflake",
@@ -140,6 +160,8 @@ class SnowflakeAdapter(SQLAdapter):
     Provides full schema discovery and query execution for Snowflake.
     """
 
+    SQL_DIALECT = "snowflake"
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize Snowflake adapter.
 
@@ -196,6 +218,8 @@ class SnowflakeAdapter(SQLAdapter):
                 "database": database,
                 "schema": schema,
                 "login_timeout": login_timeout,
+                # Bind parameters server-side so Snowflake can reuse compiled plans
+                "paramstyle": "qmark",
             }
 
             if role:
@@ -264,11 +288,96 @@ class SnowflakeAdapter(SQLAdapter):
         timeout_seconds: int = 30,
         limit: int | None = None,
     ) -> QueryResult:
-        """Execute a SQL query against Snowflake."""
+        """Execute a SQL query against Snowflake.
+
+        Results are fetched as result batches downloaded in parallel, up to
+        ``limit`` rows and the configured byte budget. Batches are decoded
+        with Arrow when pyarrow is installed.
+        """
+        if pyarrow_available():
+            arrow_result = await self.execute_query_arrow(sql, params, timeout_seconds, limit)
+            return arrow_result.to_query_result()
+
+        start_time = time.time()
+        columns, batches, truncated = await self._fetch_result_batches(
+            sql, params, timeout_seconds, limit, list
+        )
+        column_names = [col["name"] for col in columns]
+        row_dicts = [
+            dict(zip(column_names, row, strict=False)) for batch in batches for row in batch
+        ]
+
+        # Apply limit if needed
+        if limit and len(row_dicts) > limit:
+            row_dicts = row_dicts[:limit]
+            truncated = True
+
+        return QueryResult(
+            columns=columns,
+            rows=row_dicts,
+            row_count=len(row_dicts),
+            truncated=truncated,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    async def execute_query_arrow(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+        timeout_seconds: int = 30,
+        limit: int | None = None,
+    ) -> ArrowQueryResult:
+        """Execute a SQL query and return the result as an Arrow table.
+
+        Args:
+            sql: The SQL query to execute, with ``:name`` placeholders.
+            params: Optional mapping of placeholder names to values.
+            timeout_seconds: Query timeout in seconds.
+            limit: Optional maximum number of rows to return.
+
+        Returns:
+            ArrowQueryResult holding the downloaded batches as one table.
+
+        Raises:
+            FeatureNotImplementedError: If pyarrow is not installed.
+        """
+        pa = require_pyarrow("snowflake")
+        start_time = time.time()
+        columns, tables, truncated = await self._fetch_result_batches(
+            sql, params, timeout_seconds, limit, lambda batch: batch.to_arrow()
+        )
+        table = concat_record_batches(pa, tables)
+        if limit and table.num_rows > limit:
+            table = table.slice(0, limit)
+            truncated = True
+
+        return ArrowQueryResult(
+            table=table,
+            columns=columns,
+            truncated=truncated,
+            execution_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    async def _fetch_result_batches(
+        self,
+        sql: str,
+        params: dict[str, Any] | None,
+        timeout_seconds: int,
+        limit: int | None,
+        fetch: Callable[[Any], T],
+    ) -> tuple[list[dict[str, Any]], list[T], bool]:
+        """Run a query and download the result batches that fit the budget.
+
+        Snowflake reports every batch's row count and size before any is
+        downloaded, so batches beyond the budget are never fetched.
+
+        Returns:
+            Tuple of column descriptions, downloaded batches in result order,
+            and whether batches were left out to stay within the budget.
+        """
         if not self._connected or not self._conn:
             raise ConnectionFailedError(message="Not connected to Snowflake")
 
-        start_time = time.time()
         cursor = None
         try:
             cursor = self._conn.cursor()
@@ -276,42 +385,28 @@ class SnowflakeAdapter(SQLAdapter):
             # Set query timeout
             cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {timeout_seconds}")
 
-            # Execute query
-            cursor.execute(sql)
+            # Execute query with server-side (qmark) binding
+            bound_sql, args = bind_params(sql, params, "qmark")
+            cursor.execute(bound_sql, args or None)
 
             # Get column info
             columns_info = cursor.description
-            rows = cursor.fetchall()
-
-            execution_time_ms = int((time.time() - start_time) * 1000)
-
             if not columns_info:
-                return QueryResult(
-                    columns=[],
-                    rows=[],
-                    row_count=0,
-                    execution_time_ms=execution_time_ms,
-                )
+                return [], [], False
 
-            columns = [{"name": col[0], "data_type": "string"} for col in columns_info]
-            column_names = [col[0] for col in columns_info]
-
-            # Convert rows to dicts
-            row_dicts = [dict(zip(column_names, row, strict=False)) for row in rows]
-
-            # Apply limit if needed
-            truncated = False
-            if limit and len(row_dicts) > limit:
-                row_dicts = row_dicts[:limit]
-                truncated = True
-
-            return QueryResult(
-                columns=columns,
-                rows=row_dicts,
-                row_count=len(row_dicts),
-                truncated=truncated,
-                execution_time_ms=execution_time_ms,
+            budget = ResultBudget(
+                max_rows=limit or None,
+                max_bytes=self._config.get("max_result_bytes", DEFAULT_MAX_RESULT_BYTES),
             )
+            selected, truncated = budget.select(cursor.get_result_batches() or [], _batch_size)
+            batches = await download_batches(
+                selected,
+                fetch,
+                concurrency=self._config.get("download_concurrency", DEFAULT_DOWNLOAD_CONCURRENCY),
+            )
+
+            columns = [{"name": col[0], "data_type": "string"} for col in columns_info]
+            return columns, batches, truncated
 
         except Exception as e:
             error_str = str(e).lower()
@@ -335,6 +430,32 @@ class SnowflakeAdapter(SQLAdapter):
             if cursor:
                 cursor.close()
 
+    async def estimate_query_cost(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> QueryCostEstimate | None:
+        """Estimate the bytes a query would scan from its compiled plan.
+
+        ``EXPLAIN USING JSON`` compiles the query and reports how many
+        micro-partitions and bytes survive partition pruning, without using
+        the warehouse.
+        """
+        result = await self.execute_query(f"EXPLAIN USING JSON {sql}", params)
+        if not result.rows:
+            return None
+        plan = json.loads(next(iter(result.rows[0].values())))
+        stats = plan.get("GlobalStats", {})
+
+        return QueryCostEstimate(
+            method="explain",
+            bytes_scanned=int(stats.get("bytesAssigned", 0)),
+            details={
+                "partitions_total": stats.get("partitionsTotal"),
+                "partitions_assigned": stats.get("partitionsAssigned"),
+            },
+        )
+
     async def _fetch_table_metadata(self) -> list[dict[str, Any]]:
         """Fetch table metadata from Snowflake."""
         database = self._config.get("database", "")
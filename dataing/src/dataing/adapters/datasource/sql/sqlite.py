@@ -208,7 +208,8 @@ class SQLiteAdapter(SQLAdapter):
             # execution time. SQLite does not support query-level timeouts natively.
             self._conn.execute(f"PRAGMA busy_timeout = {timeout_seconds * 1000}")
 
-            cursor = self._conn.execute(sql)
+            # sqlite3 understands :name placeholders natively
+            cursor = self._conn.execute(sql, params or {})
             rows = cursor.fetchall()
 
             execution_time_ms = int((time.time() - start_time) * 1000)
@@ -7,6 +7,7 @@ ensuring consistent type representation across all source types.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from dataing.adapters.datasource.types import NormalizedType, SourceType
 
@@ -483,12 +484,24 @@ SOURCE_TYPE_MAPS: dict[SourceType, dict[str, NormalizedType]] = {
 }
 
 
+# Distinct (native type, source type) pairs remembered by normalize_type
+NORMALIZE_TYPE_CACHE_SIZE = 4096
+
+# Type parameters such as "(255)" or "(10,2)"
+_TYPE_PARAMS_RE = re.compile(r"\(.*\)")
+
+
+@lru_cache(maxsize=NORMALIZE_TYPE_CACHE_SIZE)
 def normalize_type(
     native_type: str,
     source_type: SourceType,
 ) -> NormalizedType:
     """Normalize a native type to the standard type system.
 
+    Results are memoized: a large schema repeats a few hundred distinct
+    native types across its columns, so the partial-match scan over the
+    type map runs once per distinct type rather than once per column.
+
     Args:
         native_type: The native type string from the data source.
         source_type: The source type to use for mapping.
@@ -510,7 +523,7 @@ def normalize_type(
         return NormalizedType.ARRAY
 
     # Handle parameterized types (e.g., "varchar(255)", "decimal(10,2)")
-    base_type = re.sub(r"\(.*\)", "", clean_type).strip()
+    base_type = _TYPE_PARAMS_RE.sub("", clean_type).strip()
 
     # Try exact match first
     if base_type in type_map:
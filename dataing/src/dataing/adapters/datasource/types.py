@@ -216,6 +216,24 @@ class SchemaFilter(BaseModel):
     catalog_pattern: str | None = None
     include_views: bool = True
     max_tables: int = 1000
+    partition_filter: dict[str, Any] | None = None
+
+
+class QueryCostEstimate(BaseModel):
+    """Estimate of what a query would scan, obtained without running it.
+
+    ``bytes_scanned`` and ``rows_scanned`` are comparable across sources.
+    ``cost`` is in the planner's own units and is only comparable between
+    queries against the same source type.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    method: Literal["dry_run", "explain"]
+    bytes_scanned: int | None = None
+    rows_scanned: int | None = None
+    cost: float | None = None
+    details: dict[str, Any] = Field(default_factory=dict)
 
 
 class QueryResult(BaseModel):
@@ -228,6 +246,8 @@ class QueryResult(BaseModel):
     row_count: int
     truncated: bool = False
     execution_time_ms: int | None = None
+    # Source-reported execution details, e.g. bytes processed
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
     def to_summary(self, max_rows: int = 5) -> str:
         """Create a summary of the query results for LLM interpretation.
@@ -19,6 +19,49 @@ MAX_RETRIES = 10
 INITIAL_BACKOFF = 1.0  # seconds
 MAX_BACKOFF = 30.0  # seconds
 
+# Dataset columns written by schema sync, in COPY order
+DATASET_SYNC_COLUMNS = (
+    "native_path",
+    "name",
+    "table_type",
+    "schema_name",
+    "catalog_name",
+    "row_count",
+    "size_bytes",
+    "column_count",
+    "description",
+)
+
+# Schema sync job columns that may be updated while a job runs
+SCHEMA_SYNC_JOB_FIELDS = frozenset(
+    {
+        "status",
+        "phase",
+        "tables_discovered",
+        "tables_processed",
+        "datasets_changed",
+        "datasets_removed",
+        "error",
+        "started_at",
+        "completed_at",
+    }
+)
+
+
+def tenant_settings(tenant: dict[str, Any] | None) -> dict[str, Any]:
+    """Read the settings of a tenants row, which may hold them as JSON text.
+
+    Args:
+        tenant: A tenants row, or None if the tenant was not found.
+
+    Returns:
+        The settings, empty if the tenant or its settings are missing.
+    """
+    settings = tenant.get("settings") if tenant else None
+    if isinstance(settings, str):
+        settings = json.loads(settings or "{}")
+    return settings if isinstance(settings, dict) else {}
+
 
 class AppDatabase:
     """Application database for storing tenants, users, investigations, etc."""
@@ -281,69 +324,6 @@ class AppDatabase:
         return "UPDATE 1" in result
 
     # Dataset operations
-    async def upsert_datasets(
-        self,
-        tenant_id: UUID,
-        datasource_id: UUID,
-        datasets: list[dict[str, Any]],
-    ) -> int:
-        """Upsert datasets during schema sync.
-
-        Args:
-            tenant_id: The tenant ID.
-            datasource_id: The datasource ID.
-            datasets: List of dataset dictionaries containing native_path, name, etc.
-
-        Returns:
-            Number of datasets upserted.
-        """
-        if not datasets:
-            return 0
-
-        query = """
-            INSERT INTO datasets (
-                tenant_id, datasource_id, native_path, name, table_type,
-                schema_name, catalog_name, row_count, size_bytes, column_count,
-                description, is_active, last_synced_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, true, NOW())
-            ON CONFLICT (datasource_id, native_path)
-            DO UPDATE SET
-                name = EXCLUDED.name,
-                table_type = EXCLUDED.table_type,
-                schema_name = EXCLUDED.schema_name,
-                catalog_name = EXCLUDED.catalog_name,
-                row_count = EXCLUDED.row_count,
-                size_bytes = EXCLUDED.size_bytes,
-                column_count = EXCLUDED.column_count,
-                description = EXCLUDED.description,
-                is_active = true,
-                last_synced_at = NOW(),
-                updated_at = NOW()
-        """
-
-        async with self.acquire() as conn:
-            await conn.executemany(
-                query,
-                [
-                    (
-                        tenant_id,
-                        datasource_id,
-                        dataset["native_path"],
-                        dataset["name"],
-                        dataset.get("table_type", "table"),
-                        dataset.get("schema_name"),
-                        dataset.get("catalog_name"),
-                        dataset.get("row_count"),
-                        dataset.get("size_bytes"),
-                        dataset.get("column_count"),
-                        dataset.get("description"),
-                    )
-                    for dataset in datasets
-                ],
-            )
-
-        return len(datasets)
-
     async def get_datasets_by_datasource(
         self,
         tenant_id: UUID,
@@ -393,46 +373,132 @@ class AppDatabase:
         """
         return await self.fetch_one(query, tenant_id, dataset_id)
 
-    async def deactivate_stale_datasets(
+    async def get_dataset_sync_state(
         self,
         tenant_id: UUID,
         datasource_id: UUID,
-        active_paths: set[str],
+    ) -> list[dict[str, Any]]:
+        """Get the stored sync columns of every dataset for a datasource.
+
+        Includes inactive datasets so a table that reappears is reactivated
+        rather than treated as unchanged.
+
+        Args:
+            tenant_id: The tenant ID.
+            datasource_id: The datasource ID.
+
+        Returns:
+            List of dicts with the sync columns and is_active.
+        """
+        query = f"""
+            SELECT {", ".join(DATASET_SYNC_COLUMNS)}, is_active
+            FROM datasets
+            WHERE tenant_id = $1 AND datasource_id = $2
+        """
+        return await self.fetch_all(query, tenant_id, datasource_id)
+
+    async def merge_datasets(
+        self,
+        tenant_id: UUID,
+        datasource_id: UUID,
+        datasets: list[dict[str, Any]],
     ) -> int:
-        """Mark datasets as inactive if they no longer exist in the datasource.
+        """Bulk upsert datasets with COPY into a staging table and one merge.
 
         Args:
             tenant_id: The tenant ID.
             datasource_id: The datasource ID.
-            active_paths: Set of native paths that are still active.
+            datasets: Dataset dictionaries keyed by DATASET_SYNC_COLUMNS.
 
         Returns:
-            Number of datasets deactivated.
+            Number of datasets inserted or updated.
         """
-        if not active_paths:
-            # Deactivate all datasets for this datasource
-            query = """
-                WITH updated AS (
-                    UPDATE datasets SET is_active = false, updated_at = NOW()
-                    WHERE tenant_id = $1 AND datasource_id = $2 AND is_active = true
-                    RETURNING 1
+        if not datasets:
+            return 0
+
+        async with self.acquire() as conn, conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE dataset_sync_stage (
+                    native_path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    table_type TEXT,
+                    schema_name TEXT,
+                    catalog_name TEXT,
+                    row_count BIGINT,
+                    size_bytes BIGINT,
+                    column_count INTEGER,
+                    description TEXT
+                ) ON COMMIT DROP
+                """
+            )
+            await conn.copy_records_to_table(
+                "dataset_sync_stage",
+                records=[
+                    tuple(dataset.get(column) for column in DATASET_SYNC_COLUMNS)
+                    for dataset in datasets
+                ],
+                columns=list(DATASET_SYNC_COLUMNS),
+            )
+            result: str = await conn.execute(
+                """
+                INSERT INTO datasets (
+                    tenant_id, datasource_id, native_path, name, table_type,
+                    schema_name, catalog_name, row_count, size_bytes, column_count,
+                    description, is_active, last_synced_at
                 )
-                SELECT COUNT(*)::int as count FROM updated
-            """
-            result = await self.fetch_one(query, tenant_id, datasource_id)
-            return result["count"] if result else 0
+                SELECT $1, $2, native_path, name, COALESCE(table_type, 'table'),
+                       schema_name, catalog_name, row_count, size_bytes, column_count,
+                       description, true, NOW()
+                FROM dataset_sync_stage
+                ON CONFLICT (datasource_id, native_path)
+                DO UPDATE SET
+                    name = EXCLUDED.name,
+                    table_type = EXCLUDED.table_type,
+                    schema_name = EXCLUDED.schema_name,
+                    catalog_name = EXCLUDED.catalog_name,
+                    row_count = EXCLUDED.row_count,
+                    size_bytes = EXCLUDED.size_bytes,
+                    column_count = EXCLUDED.column_count,
+                    description = EXCLUDED.description,
+                    is_active = true,
+                    last_synced_at = NOW()
+                """,
+                tenant_id,
+                datasource_id,
+            )
+
+        return int(result.split()[-1])
+
+    async def deactivate_datasets(
+        self,
+        tenant_id: UUID,
+        datasource_id: UUID,
+        native_paths: list[str],
+    ) -> int:
+        """Mark specific datasets as inactive.
+
+        Args:
+            tenant_id: The tenant ID.
+            datasource_id: The datasource ID.
+            native_paths: Native paths of the datasets to deactivate.
+
+        Returns:
+            Number of datasets deactivated.
+        """
+        if not native_paths:
+            return 0
 
-        # Deactivate datasets not in active_paths
         query = """
             WITH updated AS (
-                UPDATE datasets SET is_active = false, updated_at = NOW()
+                UPDATE datasets SET is_active = false
                 WHERE tenant_id = $1 AND datasource_id = $2
-                AND is_active = true AND native_path != ALL($3::text[])
+                AND is_active = true AND native_path = ANY($3::text[])
                 RETURNING 1
             )
             SELECT COUNT(*)::int as count FROM updated
         """
-        result = await self.fetch_one(query, tenant_id, datasource_id, list(active_paths))
+        result = await self.fetch_one(query, tenant_id, datasource_id, native_paths)
         return result["count"] if result else 0
 
     async def list_datasets(
@@ -667,6 +733,138 @@ class AppDatabase:
 
         return await self.execute_returning(query, *args)
 
+    # Schema sync job operations
+    async def create_schema_sync_job(
+        self,
+        tenant_id: UUID,
+        datasource_id: UUID,
+    ) -> dict[str, Any] | None:
+        """Create a pending schema sync job.
+
+        Args:
+            tenant_id: The tenant ID.
+            datasource_id: The datasource ID.
+
+        Returns:
+            The created job, or None if the datasource already has a pending
+            or running job.
+        """
+        return await self.execute_returning(
+            """INSERT INTO schema_sync_jobs (tenant_id, datasource_id)
+               VALUES ($1, $2)
+               ON CONFLICT (datasource_id) WHERE status IN ('pending', 'running')
+               DO NOTHING
+               RETURNING *""",
+            tenant_id,
+            datasource_id,
+        )
+
+    async def claim_schema_sync_job(
+        self,
+        job_id: UUID,
+        stale_seconds: float,
+    ) -> dict[str, Any] | None:
+        """Reset a failed or abandoned schema sync job to pending.
+
+        The check and the reset are one statement, so of several requests
+        resuming the same job only one gets it back.
+
+        Args:
+            job_id: The job ID.
+            stale_seconds: Seconds without an update after which a pending or
+                running job is abandoned.
+
+        Returns:
+            The reset job, or None if it is making progress or was already
+            claimed.
+        """
+        return await self.execute_returning(
+            """UPDATE schema_sync_jobs SET status = 'pending', error = NULL
+               WHERE id = $1
+                 AND (status = 'failed'
+                      OR (status IN ('pending', 'running')
+                          AND updated_at < NOW() - make_interval(secs => $2)))
+               RETURNING *""",
+            job_id,
+            stale_seconds,
+        )
+
+    async def touch_schema_sync_job(self, job_id: UUID) -> None:
+        """Record that a schema sync job is still alive.
+
+        Args:
+            job_id: The job ID.
+        """
+        await self.execute(
+            "UPDATE schema_sync_jobs SET updated_at = NOW() WHERE id = $1",
+            job_id,
+        )
+
+    async def get_schema_sync_job(
+        self,
+        job_id: UUID,
+        tenant_id: UUID,
+    ) -> dict[str, Any] | None:
+        """Get a schema sync job by ID.
+
+        Args:
+            job_id: The job ID.
+            tenant_id: The tenant ID.
+
+        Returns:
+            The job, or None if not found.
+        """
+        return await self.fetch_one(
+            "SELECT * FROM schema_sync_jobs WHERE id = $1 AND tenant_id = $2",
+            job_id,
+            tenant_id,
+        )
+
+    async def get_latest_schema_sync_job(
+        self,
+        tenant_id: UUID,
+        datasource_id: UUID,
+    ) -> dict[str, Any] | None:
+        """Get the most recent schema sync job for a datasource.
+
+        Args:
+            tenant_id: The tenant ID.
+            datasource_id: The datasource ID.
+
+        Returns:
+            The latest job, or None if the datasource was never synced.
+        """
+        return await self.fetch_one(
+            """SELECT * FROM schema_sync_jobs
+               WHERE tenant_id = $1 AND datasource_id = $2
+               ORDER BY created_at DESC LIMIT 1""",
+            tenant_id,
+            datasource_id,
+        )
+
+    async def update_schema_sync_job(
+        self,
+        job_id: UUID,
+        **fields: Any,
+    ) -> dict[str, Any] | None:
+        """Update progress fields of a schema sync job.
+
+        Args:
+            job_id: The job ID.
+            **fields: Columns to set, limited to SCHEMA_SYNC_JOB_FIELDS.
+
+        Returns:
+            The updated job, or None if not found.
+        """
+        unknown = set(fields) - SCHEMA_SYNC_JOB_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown schema sync job fields: {sorted(unknown)}")
+
+        updates = [f"{name} = ${idx}" for idx, name in enumerate(fields, start=2)]
+        query = f"""UPDATE schema_sync_jobs SET {", ".join(updates)}
+                    WHERE id = $1 RETURNING *"""
+        return await self.execute_returning(query, job_id, *fields.values())
+
     # Audit log operations
     async def create_audit_log(
         self,
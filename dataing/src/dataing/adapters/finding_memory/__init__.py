@@ -0,0 +1,5 @@
+"""Memory of past findings, used to warm-start investigations."""
+
+from .store import FindingMemory, describe_alert
+
+__all__ = ["FindingMemory", "describe_alert"]
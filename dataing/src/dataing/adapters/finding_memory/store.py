@@ -0,0 +1,252 @@
+"""Finding memory backed by the bond memory store.
+
+Completed findings are embedded into a bond memory backend (pgvector or
+Qdrant) together with the queries that confirmed them. When a similar
+alert fires on the same dataset, the past root causes are recalled so an
+investigation can re-run the decisive queries before generating new ones.
+
+Memory is an optimization: every backend failure is logged and treated
+as "nothing remembered", never as an investigation failure. What is read
+back is not trusted: recalled queries must pass the same safety checks
+as generated ones before they are re-run.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import structlog
+
+from bond.tools.memory import Error
+from dataing.agents.models import HypothesisResponse, QueryResponse
+from dataing.core.domain_types import PriorFinding
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from bond.tools.memory import AgentMemoryProtocol
+    from dataing.core.domain_types import AnomalyAlert, Finding, Hypothesis
+
+logger = structlog.get_logger()
+
+# Agent ID that findings are stored and searched under
+FINDING_AGENT_ID = "dataing-investigator"
+
+# Tag on every remembered finding, separating them from other memories
+FINDING_TAG = "investigation_finding"
+
+# Most decisive queries remembered per finding
+MAX_DECISIVE_QUERIES = 3
+
+# Minimum evidence confidence for a query to count as decisive
+DEFAULT_MIN_QUERY_CONFIDENCE = 0.85
+
+
+def describe_alert(alert: AnomalyAlert) -> str:
+    """Describe an alert for similarity search.
+
+    The description leaves out the date and values, so a recurrence of
+    the same problem reads the same as the first occurrence.
+
+    Args:
+        alert: The alert to describe.
+
+    Returns:
+        One-line description of the alert.
+    """
+    direction = "increased" if alert.actual_value >= alert.expected_value else "decreased"
+    spec = alert.metric_spec
+    return (
+        f"{alert.anomaly_type} anomaly in {alert.dataset_id}: {spec.display_name} "
+        f"({spec.metric_type} {spec.expression}) {direction}"
+    )
+
+
+def _dataset_tag(dataset_id: str) -> str:
+    return f"dataset:{dataset_id}"
+
+
+def _safe_queries(queries: Sequence[str]) -> list[str]:
+    """Keep the queries that pass the checks a generated query must pass.
+
+    A query must be a SELECT with a LIMIT and free of mutating statements.
+
+    Args:
+        queries: Queries read back from memory.
+
+    Returns:
+        The queries that passed, normalized as generated queries are.
+    """
+    safe: list[str] = []
+    for query in queries:
+        try:
+            validated = QueryResponse.model_validate({"query": query}).query
+            safe.append(HypothesisResponse.validate_query_safety(validated))
+        except ValueError as e:
+            logger.warning("finding_memory_query_rejected", error=str(e))
+    return safe
+
+
+class FindingMemory:
+    """Remembers confirmed root causes and recalls them for similar alerts.
+
+    Attributes:
+        memory: Bond memory backend the findings are stored in.
+        min_query_confidence: Minimum evidence confidence for a query to
+            be remembered as decisive.
+    """
+
+    def __init__(
+        self,
+        memory: AgentMemoryProtocol,
+        *,
+        min_query_confidence: float = DEFAULT_MIN_QUERY_CONFIDENCE,
+    ) -> None:
+        """Initialize the finding memory.
+
+        Args:
+            memory: Bond memory backend, e.g. from ``create_memory_backend``.
+            min_query_confidence: Minimum evidence confidence for a query to
+                be remembered as decisive.
+        """
+        self.memory = memory
+        self.min_query_confidence = min_query_confidence
+
+    async def remember(
+        self,
+        tenant_id: UUID,
+        alert: AnomalyAlert,
+        finding: Finding,
+        hypotheses: Sequence[Hypothesis],
+    ) -> bool:
+        """Store a completed finding with the queries that confirmed it.
+
+        Findings without a root cause or without a confident, supporting
+        query are not stored: there would be nothing to re-run.
+
+        Args:
+            tenant_id: Tenant the investigation belongs to.
+            alert: The alert that was investigated.
+            finding: The investigation's finding.
+            hypotheses: Hypotheses the evidence was collected for.
+
+        Returns:
+            True if the finding was stored.
+        """
+        if finding.status != "completed" or not finding.root_cause:
+            return False
+
+        decisive = sorted(
+            (
+                ev
+                for ev in finding.evidence
+                if ev.supports_hypothesis and ev.confidence >= self.min_query_confidence
+            ),
+            key=lambda ev: ev.confidence,
+            reverse=True,
+        )
+        categories = {h.id: h.category for h in hypotheses}
+        decisive = [ev for ev in decisive if ev.hypothesis_id in categories]
+        if not decisive:
+            return False
+
+        queries = list(dict.fromkeys(ev.query for ev in decisive))[:MAX_DECISIVE_QUERIES]
+        prior = PriorFinding(
+            investigation_id=finding.investigation_id,
+            root_cause=finding.root_cause,
+            confidence=finding.confidence,
+            category=categories[decisive[0].hypothesis_id],
+            decisive_queries=queries,
+            recommendations=finding.recommendations,
+        )
+        # The alert description leads the content, so it dominates the embedding
+        content = json.dumps(
+            {
+                "alert": describe_alert(alert),
+                **prior.model_dump(mode="json", exclude={"similarity"}),
+            }
+        )
+
+        try:
+            result = await self.memory.store(
+                content,
+                FINDING_AGENT_ID,
+                tenant_id=tenant_id,
+                conversation_id=finding.investigation_id,
+                tags=[FINDING_TAG, _dataset_tag(alert.dataset_id)],
+            )
+        except Exception as e:
+            logger.warning("finding_memory_store_failed", error=str(e))
+            return False
+        if isinstance(result, Error):
+            logger.warning("finding_memory_store_failed", error=result.description)
+            return False
+
+        logger.info(
+            "finding_remembered",
+            investigation_id=finding.investigation_id,
+            dataset_id=alert.dataset_id,
+            decisive_queries=len(queries),
+        )
+        return True
+
+    async def recall(
+        self,
+        tenant_id: UUID,
+        alert: AnomalyAlert,
+        *,
+        top_k: int = 3,
+        min_similarity: float | None = None,
+    ) -> list[PriorFinding]:
+        """Recall past findings for alerts similar to this one.
+
+        Only findings on the same dataset are recalled, since their
+        queries reference its tables. Queries failing the safety checks
+        are dropped, and so are findings left without any.
+
+        Args:
+            tenant_id: Tenant the investigation belongs to.
+            alert: The alert about to be investigated.
+            top_k: Most findings to recall.
+            min_similarity: Minimum similarity of the past alert.
+
+        Returns:
+            Past findings, most similar first.
+        """
+        try:
+            results = await self.memory.search(
+                describe_alert(alert),
+                tenant_id=tenant_id,
+                top_k=top_k,
+                score_threshold=min_similarity,
+                tags=[FINDING_TAG, _dataset_tag(alert.dataset_id)],
+                agent_id=FINDING_AGENT_ID,
+            )
+        except Exception as e:
+            logger.warning("finding_memory_search_failed", error=str(e))
+            return []
+        if isinstance(results, Error):
+            logger.warning("finding_memory_search_failed", error=results.description)
+            return []
+
+        priors: list[PriorFinding] = []
+        for result in results:
+            try:
+                data = json.loads(result.memory.content)
+                data.pop("alert", None)
+                prior = PriorFinding.model_validate({**data, "similarity": result.score})
+            except ValueError as e:
+                logger.warning(
+                    "finding_memory_entry_invalid", memory_id=str(result.memory.id), error=str(e)
+                )
+                continue
+
+            queries = _safe_queries(prior.decisive_queries)
+            if not queries:
+                logger.warning("finding_memory_entry_unsafe", memory_id=str(result.memory.id))
+                continue
+            priors.append(prior.model_copy(update={"decisive_queries": queries}))
+
+        return sorted(priors, key=lambda p: p.similarity, reverse=True)
@@ -0,0 +1,12 @@
+"""Stores for recorded LLM responses, used by the agent response cache."""
+
+from .app_db import AppDatabaseResponseStore
+from .base import LLMResponseStore
+from .sqlite import SQLiteResponseStore, default_llm_cache_path
+
+__all__ = [
+    "AppDatabaseResponseStore",
+    "LLMResponseStore",
+    "SQLiteResponseStore",
+    "default_llm_cache_path",
+]
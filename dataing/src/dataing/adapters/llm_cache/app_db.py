@@ -0,0 +1,122 @@
+"""LLM response store in the application database.
+
+Shared by every API process, so a response recorded by one worker is
+served to all of them.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .base import EXPIRED_RETENTION_SECONDS, PURGE_INTERVAL_SECONDS
+
+if TYPE_CHECKING:
+    from dataing.adapters.db.app_db import AppDatabase
+
+
+class AppDatabaseResponseStore:
+    """LLM response store backed by the ``llm_response_cache`` table.
+
+    Writes purge long-expired entries at most once per
+    ``PURGE_INTERVAL_SECONDS`` per process.
+
+    Attributes:
+        db: Application database.
+    """
+
+    def __init__(self, db: AppDatabase) -> None:
+        """Initialize the store.
+
+        Args:
+            db: Application database connection.
+        """
+        self.db = db
+        self._next_purge = 0.0
+
+    async def get(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        include_expired: bool = False,
+    ) -> str | None:
+        """Get a recorded response.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            include_expired: Return the entry even if its TTL has passed.
+
+        Returns:
+            The response JSON, or None if there is no usable entry.
+        """
+        row = await self.db.fetch_one(
+            """
+            SELECT response FROM llm_response_cache
+            WHERE namespace = $1 AND cache_key = $2
+              AND ($3 OR expires_at IS NULL OR expires_at > NOW())
+            """,
+            namespace,
+            key,
+            include_expired,
+        )
+        return row["response"] if row else None
+
+    async def put(
+        self,
+        namespace: str,
+        key: str,
+        response: str,
+        *,
+        agent_name: str,
+        model: str,
+        ttl_seconds: int | None,
+    ) -> None:
+        """Record a response, replacing any entry with the same key.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            response: The response JSON.
+            agent_name: Agent that produced the response.
+            model: Model that produced the response.
+            ttl_seconds: Seconds until the entry expires. None never expires.
+        """
+        await self.db.execute(
+            """
+            INSERT INTO llm_response_cache
+                (namespace, cache_key, agent_name, model, response, expires_at)
+            VALUES ($1, $2, $3, $4, $5, NOW() + make_interval(secs => $6))
+            ON CONFLICT (namespace, cache_key) DO UPDATE SET
+                agent_name = EXCLUDED.agent_name,
+                model = EXCLUDED.model,
+                response = EXCLUDED.response,
+                created_at = NOW(),
+                expires_at = EXCLUDED.expires_at
+            """,
+            namespace,
+            key,
+            agent_name,
+            model,
+            response,
+            float(ttl_seconds) if ttl_seconds is not None else None,
+        )
+        if time.monotonic() >= self._next_purge:
+            self._next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+            await self.purge_expired()
+
+    async def purge_expired(self) -> int:
+        """Delete entries that expired more than the retention period ago.
+
+        Returns:
+            Number of entries deleted.
+        """
+        result = await self.db.execute(
+            """
+            DELETE FROM llm_response_cache
+            WHERE expires_at < NOW() - make_interval(secs => $1)
+            """,
+            float(EXPIRED_RETENTION_SECONDS),
+        )
+        return int(result.split()[-1])
@@ -0,0 +1,62 @@
+"""Storage interface for recorded LLM responses."""
+
+from __future__ import annotations
+
+from typing import Protocol, runtime_checkable
+
+# How long an entry is kept after it expires, so replay can still serve it
+EXPIRED_RETENTION_SECONDS = 30 * 24 * 3600
+
+# Minimum seconds between the purges of expired entries that writes trigger
+PURGE_INTERVAL_SECONDS = 3600
+
+
+@runtime_checkable
+class LLMResponseStore(Protocol):
+    """Persistent key-value store of validated LLM outputs.
+
+    Entries are partitioned by namespace (a tenant, or ``global``) and
+    hold the JSON of an agent's validated output. Stores delete entries
+    ``EXPIRED_RETENTION_SECONDS`` after they expire.
+    """
+
+    async def get(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        include_expired: bool = False,
+    ) -> str | None:
+        """Get a recorded response.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            include_expired: Return the entry even if its TTL has passed.
+
+        Returns:
+            The response JSON, or None if there is no usable entry.
+        """
+        ...
+
+    async def put(
+        self,
+        namespace: str,
+        key: str,
+        response: str,
+        *,
+        agent_name: str,
+        model: str,
+        ttl_seconds: int | None,
+    ) -> None:
+        """Record a response, replacing any entry with the same key.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            response: The response JSON.
+            agent_name: Agent that produced the response.
+            model: Model that produced the response.
+            ttl_seconds: Seconds until the entry expires. None never expires.
+        """
+        ...
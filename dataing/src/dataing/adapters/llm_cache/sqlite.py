@@ -0,0 +1,167 @@
+"""Local SQLite store for recorded LLM responses.
+
+Suited to a single process, development, and recording a regression run
+whose responses are replayed later from the same file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .base import EXPIRED_RETENTION_SECONDS, PURGE_INTERVAL_SECONDS
+
+# Table holding recorded responses
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    namespace TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, cache_key)
+)
+"""
+
+# Index for purging expired entries
+_CREATE_EXPIRES_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires
+    ON llm_response_cache(expires_at) WHERE expires_at IS NOT NULL
+"""
+
+
+def default_llm_cache_path() -> Path:
+    """Get the default database file, honouring ``XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "dataing" / "llm_responses.sqlite"
+
+
+class SQLiteResponseStore:
+    """LLM response store in a local SQLite file.
+
+    Calls run in a worker thread so the event loop never blocks on disk.
+    Writes purge long-expired entries at most once per
+    ``PURGE_INTERVAL_SECONDS``.
+
+    Attributes:
+        path: Database file, or ``:memory:``.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Open the store, creating the file and table if needed.
+
+        Args:
+            path: Database file. Defaults to ``default_llm_cache_path()``.
+        """
+        self.path = str(path or default_llm_cache_path())
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+        with self._lock, self._conn:
+            self._conn.execute(_CREATE_TABLE)
+            self._conn.execute(_CREATE_EXPIRES_INDEX)
+
+    def _get(self, namespace: str, key: str, include_expired: bool) -> str | None:
+        """Read an entry on the calling thread."""
+        sql = "SELECT response FROM llm_response_cache WHERE namespace = ? AND cache_key = ?"
+        params: tuple[object, ...] = (namespace, key)
+        if not include_expired:
+            sql += " AND (expires_at IS NULL OR expires_at > ?)"
+            params += (time.time(),)
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    def _put(
+        self,
+        namespace: str,
+        key: str,
+        response: str,
+        agent_name: str,
+        model: str,
+        ttl_seconds: int | None,
+    ) -> None:
+        """Write an entry on the calling thread."""
+        now = time.time()
+        expires_at = now + ttl_seconds if ttl_seconds is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(namespace, cache_key, agent_name, model, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (namespace, key, agent_name, model, response, now, expires_at),
+            )
+        if time.monotonic() >= self._next_purge:
+            self._next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+            self._purge_expired()
+
+    def _purge_expired(self) -> int:
+        """Delete long-expired entries on the calling thread."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE expires_at < ?",
+                (time.time() - EXPIRED_RETENTION_SECONDS,),
+            )
+        return cursor.rowcount
+
+    async def get(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        include_expired: bool = False,
+    ) -> str | None:
+        """Get a recorded response.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            include_expired: Return the entry even if its TTL has passed.
+
+        Returns:
+            The response JSON, or None if there is no usable entry.
+        """
+        return await asyncio.to_thread(self._get, namespace, key, include_expired)
+
+    async def put(
+        self,
+        namespace: str,
+        key: str,
+        response: str,
+        *,
+        agent_name: str,
+        model: str,
+        ttl_seconds: int | None,
+    ) -> None:
+        """Record a response, replacing any entry with the same key.
+
+        Args:
+            namespace: Partition the entry belongs to.
+            key: Cache key of the request.
+            response: The response JSON.
+            agent_name: Agent that produced the response.
+            model: Model that produced the response.
+            ttl_seconds: Seconds until the entry expires. None never expires.
+        """
+        await asyncio.to_thread(self._put, namespace, key, response, agent_name, model, ttl_seconds)
+
+    async def purge_expired(self) -> int:
+        """Delete entries that expired more than the retention period ago.
+
+        Returns:
+            Number of entries deleted.
+        """
+        return await asyncio.to_thread(self._purge_expired)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
@@ -11,6 +11,8 @@ import structlog
 from .types import TrainingSignal
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from dataing.adapters.db.app_db import AppDatabase
 
 logger = structlog.get_logger()
@@ -18,6 +20,16 @@ logger = structlog.get_logger()
 # Keep TrainingSignal imported for external use
 __all__ = ["TrainingSignalRepository", "TrainingSignal"]
 
+# Insert of one training signal; shared by single and bulk writes
+INSERT_SIGNAL_QUERY = """
+    INSERT INTO rl_training_signals (
+        id, signal_type, tenant_id, investigation_id,
+        input_context, output_response,
+        automated_score, automated_dimensions,
+        model_version, source_event_id
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+"""
+
 
 class TrainingSignalRepository:
     """Repository for persisting training signals.
@@ -64,17 +76,8 @@ class TrainingSignalRepository:
         """
         signal_id = uuid4()
 
-        query = """
-            INSERT INTO rl_training_signals (
-                id, signal_type, tenant_id, investigation_id,
-                input_context, output_response,
-                automated_score, automated_dimensions,
-                model_version, source_event_id
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-        """
-
         await self.db.execute(
-            query,
+            INSERT_SIGNAL_QUERY,
             signal_id,
             signal_type,
             tenant_id,
@@ -94,6 +97,46 @@ class TrainingSignalRepository:
 
         return signal_id
 
+    async def record_signals(self, signals: Sequence[TrainingSignal]) -> int:
+        """Record several training signals in one round trip.
+
+        Args:
+            signals: Signals to insert.
+
+        Returns:
+            Number of signals recorded.
+        """
+        if not signals:
+            return 0
+
+        async with self.db.acquire() as conn:
+            await conn.executemany(
+                INSERT_SIGNAL_QUERY,
+                [
+                    (
+                        signal.id,
+                        signal.signal_type,
+                        signal.tenant_id,
+                        signal.investigation_id,
+                        json.dumps(signal.input_context),
+                        json.dumps(signal.output_response),
+                        signal.automated_score,
+                        (
+                            json.dumps(signal.automated_dimensions)
+                            if signal.automated_dimensions
+                            else None
+                        ),
+                        signal.model_version,
+                        signal.source_event_id,
+                    )
+                    for signal in signals
+                ],
+            )
+
+        logger.debug(f"training_signals_recorded count={len(signals)}")
+
+        return len(signals)
+
     async def update_human_feedback(
         self,
         investigation_id: UUID,
@@ -14,10 +14,21 @@ from .models import (
     QueryResponse,
     SynthesisResponse,
 )
+from .response_cache import CacheMode, LLMResponseCache, llm_cache_scope
+from .streaming import TokenStream, TokenSubscription
+from .telemetry import AgentRole, LLMTelemetry, llm_usage_scope
 
 __all__ = [
     "AgentClient",
+    "AgentRole",
+    "LLMTelemetry",
+    "llm_usage_scope",
+    "CacheMode",
+    "LLMResponseCache",
+    "llm_cache_scope",
     "StreamHandlers",
+    "TokenStream",
+    "TokenSubscription",
     "HypothesesResponse",
     "HypothesisResponse",
     "InterpretationResponse",
@@ -5,39 +5,83 @@ Uses BondAgent for type-safe, validated LLM responses with optional streaming.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from pydantic_ai.models.anthropic import AnthropicModel
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import structlog
+from anthropic import AsyncAnthropic
+from pydantic import BaseModel, ValidationError
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.models.anthropic import AnthropicModel, AnthropicModelSettings
 from pydantic_ai.output import PromptedOutput
 from pydantic_ai.providers.anthropic import AnthropicProvider
+from pydantic_ai.usage import RunUsage
 
-from bond import BondAgent, StreamHandlers
+from bond import AgentSession, BondAgent, LLMGovernor, Priority, StreamHandlers
 from dataing.core.domain_types import (
     AnomalyAlert,
     Evidence,
     Finding,
     Hypothesis,
     InvestigationContext,
+    PriorFinding,
 )
 from dataing.core.exceptions import LLMError
 
 from .models import (
+    BatchQueryResponse,
     HypothesesResponse,
     InterpretationResponse,
     QueryResponse,
     SynthesisResponse,
 )
 from .prompts import hypothesis, interpretation, query, reflexion, synthesis
+from .response_cache import LLMResponseCache, response_cache_key
+from .telemetry import AgentRole, LLMTelemetry, current_usage_ledger
 
 if TYPE_CHECKING:
     from dataing.adapters.datasource.types import QueryResult, SchemaResponse
 
+logger = structlog.get_logger()
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+# Cache breakpoint on the system prompt, the stable prefix of every call
+PROMPT_CACHE_SETTINGS = AnthropicModelSettings(anthropic_cache_instructions=True)
+
+# Admission priority per role: the finding a user waits for goes first, and
+# per-hypothesis SQL, much of which is discarded, goes last
+ROLE_PRIORITIES = {
+    AgentRole.SYNTHESIS: Priority.CRITICAL,
+    AgentRole.HYPOTHESIS: Priority.NORMAL,
+    AgentRole.INTERPRETATION: Priority.NORMAL,
+    AgentRole.QUERY: Priority.SPECULATIVE,
+}
+
+# Fast-model failures the default model may fix: output that failed
+# validation, live or when a cached response was re-validated
+_ESCALATION_ERRORS = (UnexpectedModelBehavior, ValidationError)
+
 
 class AgentClient:
     """LLM client facade for investigation agents.
 
     Uses BondAgent for type-safe, validated LLM responses with optional streaming.
     Prompts are modular and live in the prompts/ package.
+
+    System prompts carry a prompt-cache breakpoint, so repeated calls with
+    the same rules and schema read them from the provider's cache. Token
+    usage, including cache reads and writes, is logged per call and totalled
+    per agent in ``usage``.
+
+    Each agent runs on the model of its role, so mechanical roles such as
+    SQL generation can use a fast model. Latency, tokens and estimated cost
+    are totalled per role and model in ``telemetry``.
+
+    With a response cache, repeated calls with the same agent, model,
+    prompts, output schema, and history are answered from recorded
+    responses, or only from them in replay mode.
     """
 
     def __init__(
@@ -45,54 +89,230 @@ class AgentClient:
         api_key: str,
         model: str = "claude-sonnet-4-20250514",
         max_retries: int = 3,
+        response_cache: LLMResponseCache | None = None,
+        role_models: Mapping[str, str] | None = None,
+        governor: LLMGovernor | None = None,
     ) -> None:
         """Initialize the agent client.
 
         Args:
             api_key: Anthropic API key.
-            model: Model to use.
+            model: Default model, used by every role without a model of its
+                own and for escalated SQL generation.
             max_retries: Max retries on validation failure.
+            response_cache: Optional cache of recorded responses.
+            role_models: Model per agent role (see ``AgentRole``), e.g. a
+                fast model for ``query``.
+            governor: Shared admission control for every agent's calls. It
+                retries rate-limited calls itself, so the SDK's own retries
+                are turned off to avoid a retry storm.
         """
-        provider = AnthropicProvider(api_key=api_key)
-        self._model = AnthropicModel(model, provider=provider)
+        self.response_cache = response_cache
+        self.governor = governor
+        if governor is not None:
+            client = AsyncAnthropic(api_key=api_key, max_retries=0)
+            self._provider = AnthropicProvider(anthropic_client=client)
+        else:
+            self._provider = AnthropicProvider(api_key=api_key)
+        self._models: dict[str, AnthropicModel] = {}
+        self._max_retries = max_retries
+        self.role_models = {role: (role_models or {}).get(role, model) for role in AgentRole}
+        self.escalation_model = model
+        # Agent name -> (role, model name), for routing telemetry and cache keys
+        self._routes: dict[str, tuple[AgentRole, str]] = {}
 
         # Empty base instructions: all prompting via dynamic_instructions at runtime.
         # This ensures PromptedOutput gets the full detailed prompt without conflicts.
-        self._hypothesis_agent: BondAgent[HypothesesResponse, None] = BondAgent(
-            name="hypothesis-generator",
-            instructions="",
-            model=self._model,
-            output_type=PromptedOutput(HypothesesResponse),
-            max_retries=max_retries,
+        self._hypothesis_agent = self._build_agent(
+            "hypothesis-generator", AgentRole.HYPOTHESIS, HypothesesResponse
         )
-        self._interpretation_agent: BondAgent[InterpretationResponse, None] = BondAgent(
-            name="evidence-interpreter",
-            instructions="",
-            model=self._model,
-            output_type=PromptedOutput(InterpretationResponse),
-            max_retries=max_retries,
+        self._interpretation_agent = self._build_agent(
+            "evidence-interpreter", AgentRole.INTERPRETATION, InterpretationResponse
         )
-        self._synthesis_agent: BondAgent[SynthesisResponse, None] = BondAgent(
-            name="finding-synthesizer",
-            instructions="",
-            model=self._model,
-            output_type=PromptedOutput(SynthesisResponse),
-            max_retries=max_retries,
+        self._synthesis_agent = self._build_agent(
+            "finding-synthesizer", AgentRole.SYNTHESIS, SynthesisResponse
+        )
+        self._query_agent = self._build_agent("sql-generator", AgentRole.QUERY, QueryResponse)
+        self._batch_query_agent = self._build_agent(
+            "sql-batch-generator", AgentRole.QUERY, BatchQueryResponse
         )
-        self._query_agent: BondAgent[QueryResponse, None] = BondAgent(
-            name="sql-generator",
+        # SQL generation escalates to the default model when the fast one fails
+        self._escalated_query_agent: BondAgent[QueryResponse, None] | None = None
+        if self.role_models[AgentRole.QUERY] != self.escalation_model:
+            self._escalated_query_agent = self._build_agent(
+                "sql-generator-escalated", AgentRole.QUERY, QueryResponse, self.escalation_model
+            )
+        self.usage: dict[str, RunUsage] = {}
+        self.telemetry = LLMTelemetry()
+
+    def _build_agent(
+        self,
+        name: str,
+        role: AgentRole,
+        output_model: type[OutputT],
+        model: str | None = None,
+    ) -> BondAgent[OutputT, None]:
+        """Create an agent on its role's model.
+
+        Args:
+            name: Agent name.
+            role: Role whose model the agent runs on.
+            output_model: Model of the agent's validated output.
+            model: Model to use instead of the role's.
+
+        Returns:
+            The agent.
+        """
+        model_name = model or self.role_models[role]
+        if model_name not in self._models:
+            self._models[model_name] = AnthropicModel(model_name, provider=self._provider)
+        self._routes[name] = (role, model_name)
+        return BondAgent(
+            name=name,
             instructions="",
-            model=self._model,
-            output_type=PromptedOutput(QueryResponse),
-            max_retries=max_retries,
+            model=self._models[model_name],
+            output_type=PromptedOutput(output_model),
+            max_retries=self._max_retries,
+            model_settings=PROMPT_CACHE_SETTINGS,
+            governor=self.governor,
+            priority=ROLE_PRIORITIES[role],
         )
 
+    async def _ask(
+        self,
+        agent: BondAgent[OutputT, None],
+        prompt: str,
+        system: str,
+        handlers: StreamHandlers | None,
+        session: AgentSession | None = None,
+    ) -> OutputT:
+        """Run one agent call and record its token usage.
+
+        Args:
+            agent: Agent to call.
+            prompt: User prompt, the volatile part of the request.
+            system: System prompt, the cacheable prefix.
+            handlers: Optional streaming handlers.
+            session: Conversation the call belongs to. None makes the call
+                stateless.
+
+        Returns:
+            The agent's validated output.
+
+        Raises:
+            LLMError: In replay mode, if no response was recorded for the call.
+        """
+        cache = self.response_cache
+        if cache is None or not cache.active:
+            return await self._call(agent, prompt, system, handlers, session)
+
+        output_model = _output_model(agent)
+        _, model = self._routes[agent.name]
+        key = response_cache_key(
+            agent_name=agent.name,
+            model=model,
+            system=system,
+            prompt=prompt,
+            output_schema=output_model.model_json_schema(),
+            history=session.window(system) if session is not None else (),
+        )
+        cached = await cache.lookup(key, agent.name)
+        if cached is not None:
+            output: OutputT = output_model.model_validate_json(cached)
+            if handlers and handlers.on_complete:
+                handlers.on_complete(output)
+        else:
+            output = await self._call(agent, prompt, system, handlers, session, record=False)
+            await cache.record(key, agent.name, model, output.model_dump_json())
+
+        # Live and cached turns are recorded alike, so later keys in the
+        # session match on replay.
+        if session is not None:
+            await session.record_exchange(prompt, output.model_dump_json())
+        return output
+
+    async def _call(
+        self,
+        agent: BondAgent[OutputT, None],
+        prompt: str,
+        system: str,
+        handlers: StreamHandlers | None,
+        session: AgentSession | None,
+        record: bool = True,
+    ) -> OutputT:
+        """Call the model and record the call's token usage and latency."""
+        usage = RunUsage()
+        start = time.perf_counter()
+        try:
+            return await agent.ask(
+                prompt,
+                dynamic_instructions=system,
+                handlers=handlers,
+                usage=usage,
+                session=session,
+                record=record,
+            )
+        finally:
+            self._record_usage(agent.name, usage, (time.perf_counter() - start) * 1000)
+
+    def _record_usage(self, agent_name: str, usage: RunUsage, latency_ms: float = 0.0) -> None:
+        """Log a call's usage and add it to the agent's and role's totals.
+
+        The role's totals are kept process-wide in ``telemetry`` and, inside
+        an ``llm_usage_scope``, in the scope's telemetry too.
+        """
+        if not usage.requests:
+            return
+        role, model = self._routes[agent_name]
+        self.usage.setdefault(agent_name, RunUsage()).incr(usage)
+        self.telemetry.record(role, model, usage, latency_ms)
+        ledger = current_usage_ledger()
+        if ledger is not None:
+            ledger.record(role, model, usage, latency_ms)
+        logger.info(
+            "llm_usage",
+            agent=agent_name,
+            role=role,
+            model=model,
+            latency_ms=round(latency_ms, 1),
+            requests=usage.requests,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Summarize prompt-cache effectiveness per agent.
+
+        Returns:
+            Mapping of agent name to cache read (hit) and write (miss) token
+            counts, uncached input tokens, and the share of input tokens
+            served from the cache.
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for name, usage in self.usage.items():
+            # input_tokens includes the tokens read from and written to the cache
+            uncached = usage.input_tokens - usage.cache_read_tokens - usage.cache_write_tokens
+            stats[name] = {
+                "requests": usage.requests,
+                "input_tokens": usage.input_tokens,
+                "cache_read_tokens": usage.cache_read_tokens,
+                "cache_write_tokens": usage.cache_write_tokens,
+                "uncached_input_tokens": max(uncached, 0),
+                "cache_hit_ratio": (
+                    usage.cache_read_tokens / usage.input_tokens if usage.input_tokens else 0.0
+                ),
+            }
+        return stats
+
     async def generate_hypotheses(
         self,
         alert: AnomalyAlert,
         context: InvestigationContext,
         num_hypotheses: int = 5,
         handlers: StreamHandlers | None = None,
+        prior_findings: list[PriorFinding] | None = None,
     ) -> list[Hypothesis]:
         """Generate hypotheses for an anomaly.
 
@@ -101,6 +321,8 @@ class AgentClient:
             context: Available schema and lineage context.
             num_hypotheses: Target number of hypotheses.
             handlers: Optional streaming handlers for real-time updates.
+            prior_findings: Root causes of similar past alerts, shown to the
+                model so a recurrence is among the hypotheses.
 
         Returns:
             List of validated Hypothesis objects.
@@ -109,14 +331,12 @@ class AgentClient:
             LLMError: If LLM call fails after retries.
         """
         system_prompt = hypothesis.build_system(num_hypotheses=num_hypotheses)
-        user_prompt = hypothesis.build_user(alert=alert, context=context)
+        user_prompt = hypothesis.build_user(
+            alert=alert, context=context, prior_findings=prior_findings
+        )
 
         try:
-            result = await self._hypothesis_agent.ask(
-                user_prompt,
-                dynamic_instructions=system_prompt,
-                handlers=handlers,
-            )
+            result = await self._ask(self._hypothesis_agent, user_prompt, system_prompt, handlers)
 
             return [
                 Hypothesis(
@@ -141,14 +361,25 @@ class AgentClient:
         schema: SchemaResponse,
         previous_error: str | None = None,
         handlers: StreamHandlers | None = None,
+        session: AgentSession | None = None,
+        escalate: bool = False,
     ) -> str:
         """Generate SQL query to test a hypothesis.
 
+        Queries come from the ``query`` role's model. If that is a fast model,
+        generation escalates to the default model when asked to, e.g. after
+        the fast model's queries failed twice, and when the fast model's
+        output fails validation. Other failures, such as rate limits or
+        transport errors, are not retried on the default model.
+
         Args:
             hypothesis: The hypothesis to test.
             schema: Available database schema.
             previous_error: Error from previous attempt (for reflexion).
             handlers: Optional streaming handlers for real-time updates.
+            session: Conversation scoped to this hypothesis, so a reflexion
+                retry sees the attempts before it.
+            escalate: Generate with the default model instead of the fast one.
 
         Returns:
             Validated SQL query string.
@@ -163,12 +394,16 @@ class AgentClient:
             prompt = query.build_user(hypothesis=hypothesis)
             system = query.build_system(schema=schema)
 
+        escalated = self._escalated_query_agent
+        agent = escalated if escalate and escalated is not None else self._query_agent
         try:
-            result = await self._query_agent.ask(
-                prompt,
-                dynamic_instructions=system,
-                handlers=handlers,
-            )
+            try:
+                result = await self._ask(agent, prompt, system, handlers, session)
+            except _ESCALATION_ERRORS as e:
+                if escalated is None or agent is escalated:
+                    raise
+                logger.info("query_escalated", hypothesis_id=hypothesis.id, error=str(e))
+                result = await self._ask(escalated, prompt, system, handlers, session)
             sql_query: str = result.query
             return sql_query
 
@@ -178,6 +413,68 @@ class AgentClient:
                 retryable=True,
             ) from e
 
+    async def generate_queries_batch(
+        self,
+        hypotheses: list[Hypothesis],
+        schema: SchemaResponse,
+        handlers: StreamHandlers | None = None,
+        sessions: dict[str, AgentSession] | None = None,
+    ) -> dict[str, QueryResponse]:
+        """Generate the first query for several hypotheses in one call.
+
+        The schema is sent once for the whole batch instead of once per
+        hypothesis. Each query is validated like a single generated query.
+
+        Args:
+            hypotheses: The hypotheses to test.
+            schema: Available database schema.
+            handlers: Optional streaming handlers for real-time updates.
+            sessions: Optional per-hypothesis sessions, keyed by hypothesis ID.
+                Each generated query is recorded in its hypothesis's session
+                as if it had been generated there, so reflexion retries see it.
+
+        Returns:
+            Generated queries keyed by hypothesis ID. Hypotheses the model
+            skipped are missing; generate those with ``generate_query``.
+
+        Raises:
+            LLMError: If batch generation fails.
+        """
+        if not hypotheses:
+            return {}
+
+        prompt = query.build_batch_user(hypotheses)
+        system = query.build_system(schema=schema)
+
+        try:
+            result = await self._ask(self._batch_query_agent, prompt, system, handlers)
+        except Exception as e:
+            raise LLMError(
+                f"Batch query generation failed: {e}",
+                retryable=True,
+            ) from e
+
+        by_id = {h.id: h for h in hypotheses}
+        queries: dict[str, QueryResponse] = {}
+        for item in result.queries:
+            if item.hypothesis_id in by_id and item.hypothesis_id not in queries:
+                queries[item.hypothesis_id] = QueryResponse(
+                    query=item.query, explanation=item.explanation
+                )
+
+        missing = [h_id for h_id in by_id if h_id not in queries]
+        if missing:
+            logger.info("batch_queries_missing", missing=missing, requested=len(by_id))
+
+        for h_id, response in queries.items():
+            session = (sessions or {}).get(h_id)
+            if session is not None:
+                await session.record_exchange(
+                    query.build_user(hypothesis=by_id[h_id]), response.model_dump_json()
+                )
+
+        return queries
+
     async def interpret_evidence(
         self,
         hypothesis: Hypothesis,
@@ -200,11 +497,7 @@ class AgentClient:
         system = interpretation.build_system()
 
         try:
-            result = await self._interpretation_agent.ask(
-                prompt,
-                dynamic_instructions=system,
-                handlers=handlers,
-            )
+            result = await self._ask(self._interpretation_agent, prompt, system, handlers)
 
             return Evidence(
                 hypothesis_id=hypothesis.id,
@@ -251,11 +544,7 @@ class AgentClient:
         system = synthesis.build_system()
 
         try:
-            result = await self._synthesis_agent.ask(
-                prompt,
-                dynamic_instructions=system,
-                handlers=handlers,
-            )
+            result = await self._ask(self._synthesis_agent, prompt, system, handlers)
 
             return Finding(
                 investigation_id="",  # Set by orchestrator
@@ -272,3 +561,10 @@ class AgentClient:
                 f"Synthesis failed: {e}",
                 retryable=False,
             ) from e
+
+
+def _output_model(agent: BondAgent[OutputT, None]) -> type[OutputT]:
+    """Get the output model of an agent, unwrapping PromptedOutput."""
+    output_type: Any = agent.output_type
+    model: type[OutputT] = getattr(output_type, "outputs", output_type)
+    return model
@@ -118,6 +118,21 @@ class QueryResponse(BaseModel):
         return v.strip()
 
 
+class HypothesisQueryResponse(QueryResponse):
+    """SQL query generated for one hypothesis of a batch."""
+
+    hypothesis_id: str = Field(description="ID of the hypothesis this query tests, e.g. 'h1'")
+
+
+class BatchQueryResponse(BaseModel):
+    """Queries for several hypotheses, generated in one call."""
+
+    queries: list[HypothesisQueryResponse] = Field(
+        description="Exactly one query per hypothesis, in the order given",
+        min_length=1,
+    )
+
+
 class InterpretationResponse(BaseModel):
     """LLM interpretation of query results.
 
@@ -4,6 +4,11 @@ Each prompt module exposes:
 - SYSTEM_PROMPT: Static system prompt template
 - build_system(**kwargs) -> str: Build system prompt with dynamic values
 - build_user(**kwargs) -> str: Build user prompt from context
+
+System prompts are the stable prefix of a request and must not contain
+per-call values (hypothesis, error, results); those belong in the user
+prompt. The provider caches the system prompt between calls, so anything
+volatile placed there invalidates the cache for every call.
 """
 
 from . import hypothesis, interpretation, query, reflexion, synthesis
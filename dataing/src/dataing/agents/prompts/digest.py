@@ -0,0 +1,422 @@
+"""Statistical digests of query results for interpretation prompts.
+
+A raw row dump shows the model whatever happens to come first. In a grouped
+result the anomalous segment can be row 300, and wide rows spend most of
+their tokens on columns that say nothing. A digest instead summarizes the
+whole result, computed column-wise with polars so 10k-row results cost
+milliseconds:
+
+- Segments: groups of the dimension columns ranked by how far their
+  measures (numeric means, row counts and null rates) deviate from the
+  other groups.
+- Before/after: when a date column is present, measures before and after
+  the point where they shift most.
+- Column profiles: nulls, ranges and most common values.
+- Sample rows, if budget remains.
+
+A header with the row count and columns comes first. Sections follow in
+that order until the token budget is spent.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+import structlog
+
+if TYPE_CHECKING:
+    from dataing.adapters.datasource.types import QueryResult
+
+logger = structlog.get_logger()
+
+# Default token budget for a result digest
+DEFAULT_DIGEST_TOKEN_BUDGET = 1000
+
+# Rough characters per token, used to hold a digest to its budget
+CHARS_PER_TOKEN = 4
+
+# Default number of most deviating segments listed
+DEFAULT_TOP_SEGMENTS = 5
+
+# Dimension columns used to form segments, lowest cardinality first
+MAX_SEGMENT_DIMENSIONS = 3
+
+# Measures shown per segment, most deviating first
+MAX_MEASURES_PER_SEGMENT = 3
+
+# Most common values listed per text column
+TOP_VALUES = 3
+
+# Rows shown in the sample section
+SAMPLE_ROWS = 3
+
+# Columns named in the header; wider results are described in profiles only
+MAX_HEADER_COLUMNS = 30
+
+# Longest rendering of a single value
+MAX_VALUE_CHARS = 40
+
+# Time points needed before a before/after split is meaningful
+MIN_SERIES_POINTS = 4
+
+# Distinct timestamps above which the series is bucketed by day
+MAX_SERIES_POINTS = 200
+
+# Name of the implicit row-count measure
+ROWS_MEASURE = "rows"
+
+# Suffix of the implicit null-rate measure of a column with nulls
+NULL_RATE_SUFFIX = " null rate"
+
+# Marks a section cut short by the token budget
+OMITTED_NOTE = "  ... more omitted to fit the token budget"
+
+
+def build_result_digest(
+    results: QueryResult,
+    token_budget: int = DEFAULT_DIGEST_TOKEN_BUDGET,
+    top_k: int = DEFAULT_TOP_SEGMENTS,
+) -> str:
+    """Summarize a query result for an LLM within a token budget.
+
+    Args:
+        results: The query result.
+        token_budget: Approximate tokens the digest may use.
+        top_k: Number of most deviating segments to list.
+
+    Returns:
+        Digest text. Falls back to ``QueryResult.to_summary`` if the rows
+        cannot be loaded into a frame.
+    """
+    if not results.rows:
+        return "No rows returned"
+
+    try:
+        frame = _to_frame(results)
+        header = _header(results, frame)
+        sections = [
+            _segments(frame, top_k),
+            _before_after(frame),
+            _profiles(frame),
+            _sample(frame),
+        ]
+    except Exception as e:
+        logger.debug("result_digest_failed", error=str(e))
+        return results.to_summary()
+
+    return _fit(header, sections, token_budget * CHARS_PER_TOKEN)
+
+
+def _to_frame(results: QueryResult) -> pl.DataFrame:
+    """Load result rows into a frame with usable column types.
+
+    Values polars cannot type become text, and text columns that parse
+    completely as numbers or timestamps are converted.
+    """
+    frame = pl.from_dicts(results.rows, infer_schema_length=None, strict=False)
+    columns: list[pl.Series] = []
+    for series in frame.iter_columns():
+        if series.dtype == pl.Object:
+            series = pl.Series(
+                series.name,
+                [None if v is None else str(v) for v in series.to_list()],
+                dtype=pl.String,
+            )
+        if series.dtype == pl.String:
+            series = _parse_text(series)
+        elif isinstance(series.dtype, pl.Decimal):
+            series = series.cast(pl.Float64)
+        columns.append(series)
+    return pl.DataFrame(columns)
+
+
+def _parse_text(series: pl.Series) -> pl.Series:
+    """Convert a text column to numbers or timestamps if every value parses."""
+    nulls = series.null_count()
+    if nulls == len(series):
+        return series
+    numbers = series.cast(pl.Float64, strict=False)
+    if numbers.null_count() == nulls:
+        return numbers
+    try:
+        timestamps = series.str.to_datetime(strict=False)
+    except pl.exceptions.PolarsError:
+        return series
+    return timestamps if timestamps.null_count() == nulls else series
+
+
+def _is_measure(dtype: pl.DataType) -> bool:
+    """Return whether a column holds numbers to aggregate."""
+    return dtype.is_numeric()
+
+
+def _is_time(dtype: pl.DataType) -> bool:
+    """Return whether a column holds dates or timestamps."""
+    return dtype == pl.Date or isinstance(dtype, pl.Datetime)
+
+
+def _kind(dtype: pl.DataType) -> str:
+    """Name a column's kind for the digest."""
+    if _is_measure(dtype):
+        return "numeric"
+    if _is_time(dtype):
+        return "time"
+    return "text"
+
+
+def _as_float(value: object) -> float | None:
+    """Read a polars aggregate of a measure as a float, or None if null."""
+    if isinstance(value, int | float):
+        return float(value)
+    return None
+
+
+def _header(results: QueryResult, frame: pl.DataFrame) -> list[str]:
+    """Describe the result's size and columns."""
+    rows = f"Rows: {results.row_count}"
+    if results.truncated:
+        rows += f" (truncated; digest covers the first {frame.height})"
+    described = [f"{name} ({_kind(dtype)})" for name, dtype in frame.schema.items()]
+    columns = ", ".join(described[:MAX_HEADER_COLUMNS])
+    if len(described) > MAX_HEADER_COLUMNS:
+        columns += f", ... {len(described) - MAX_HEADER_COLUMNS} more"
+    return [rows, f"Columns: {columns}"]
+
+
+def _measures(frame: pl.DataFrame, exclude: list[str]) -> list[pl.Expr]:
+    """Build the per-group aggregations compared across segments and time.
+
+    Numeric columns are averaged, and every other column with nulls gets
+    its null rate, the usual signal in a data quality investigation.
+    """
+    aggregations: list[pl.Expr] = []
+    for series in frame.iter_columns():
+        if series.name in exclude:
+            continue
+        if _is_measure(series.dtype) and series.name != ROWS_MEASURE:
+            aggregations.append(pl.col(series.name).cast(pl.Float64).mean())
+        if series.null_count():
+            aggregations.append(
+                pl.col(series.name).is_null().mean().alias(series.name + NULL_RATE_SUFFIX)
+            )
+    return aggregations
+
+
+def _segments(frame: pl.DataFrame, top_k: int) -> list[str]:
+    """List the segments whose measures deviate most from the others.
+
+    A segment is one combination of the dimension (text) columns. Each
+    measure is averaged per segment and scored as a z-score across
+    segments; a segment ranks by its largest absolute score.
+    """
+    cardinality = {
+        name: frame[name].n_unique()
+        for name, dtype in frame.schema.items()
+        if _kind(dtype) == "text"
+    }
+    dimensions = sorted(
+        (name for name, distinct in cardinality.items() if distinct > 1),
+        key=cardinality.__getitem__,
+    )[:MAX_SEGMENT_DIMENSIONS]
+    if not dimensions or top_k <= 0:
+        return []
+
+    grouped = frame.group_by(dimensions).agg(
+        pl.len().alias(ROWS_MEASURE), *_measures(frame, exclude=dimensions)
+    )
+    if grouped.height < 2:
+        return []
+
+    candidates = [
+        m
+        for m in grouped.columns
+        if m not in dimensions and (_as_float(grouped[m].std()) or 0.0) > 0
+    ]
+    if not candidates:
+        return []
+
+    scored = grouped.with_columns(
+        [((pl.col(m) - pl.col(m).mean()) / pl.col(m).std()).alias(f"__z_{m}") for m in candidates]
+    ).with_columns(
+        pl.max_horizontal([pl.col(f"__z_{m}").abs() for m in candidates]).alias("__score")
+    )
+    top = scored.sort("__score", descending=True, nulls_last=True).head(top_k)
+    means = {m: grouped[m].mean() for m in candidates}
+
+    lines = [f"Top segments by deviation ({grouped.height} groups of {', '.join(dimensions)}):"]
+    for row in top.iter_rows(named=True):
+        key = ", ".join(f"{d}={_format(row[d])}" for d in dimensions)
+        deviating = sorted(candidates, key=lambda m: abs(row[f"__z_{m}"] or 0.0), reverse=True)[
+            :MAX_MEASURES_PER_SEGMENT
+        ]
+        stats = "; ".join(
+            f"{m} {_format_measure(m, row[m])} "
+            f"(mean {_format_measure(m, means[m])}, z={row[f'__z_{m}']:+.1f})"
+            for m in deviating
+            if row[f"__z_{m}"] is not None
+        )
+        lines.append(f"- {key}: {stats}")
+    return lines
+
+
+def _before_after(frame: pl.DataFrame) -> list[str]:
+    """Compare measures before and after their largest shift in time.
+
+    Measures are averaged per time point (per day when there are many
+    timestamps). For each measure, every split point is scored with a
+    CUSUM-style statistic, the difference of means weighted by
+    ``sqrt(k * (n - k) / n)`` and scaled by the measure's magnitude.
+    The split of the highest-scoring measure is used for all measures.
+    """
+    time_column = next((name for name, dtype in frame.schema.items() if _is_time(dtype)), None)
+    if time_column is None:
+        return []
+
+    bucket = pl.col(time_column)
+    if frame[time_column].n_unique() > MAX_SERIES_POINTS and frame[time_column].dtype != pl.Date:
+        bucket = bucket.dt.truncate("1d")
+    series = (
+        frame.drop_nulls(time_column)
+        .group_by(bucket.alias(time_column))
+        .agg(pl.len().alias(ROWS_MEASURE), *_measures(frame, exclude=[time_column]))
+        .sort(time_column)
+    )
+    measures = [m for m in series.columns if m != time_column]
+    n = series.height
+    if n < MIN_SERIES_POINTS:
+        return []
+
+    best: tuple[float, str, int] | None = None
+    for measure in measures:
+        values = series[measure].cast(pl.Float64)
+        values = values.fill_null(values.mean())
+        std = _as_float(values.std())
+        if not std:
+            continue
+        # Relative to the measure's size, so a near-constant count moving by
+        # one does not outrank a null rate going from 0% to 20%
+        scale = max(abs(_as_float(values.mean()) or 0.0), std)
+        k = pl.Series(range(1, n), dtype=pl.Float64)
+        before_sum = values.cum_sum().head(n - 1)
+        total = values.sum()
+        shift = (before_sum / k - (total - before_sum) / (n - k)).abs()
+        stat = shift * (k * (n - k) / n).sqrt() / scale
+        index = stat.arg_max()
+        if index is not None and (best is None or stat[index] > best[0]):
+            best = (stat[index], measure, index + 1)
+    if best is None:
+        return []
+
+    _, shifted, split = best
+    before, after = series.head(split), series.tail(n - split)
+    lines = [
+        f"Before/after split at {_format(series[time_column][split])} "
+        f"(largest shift in {shifted}; {before.height} time points before, "
+        f"{after.height} from then on):"
+    ]
+    for measure in [shifted, *(m for m in measures if m != shifted)]:
+        old, new = _as_float(before[measure].mean()), _as_float(after[measure].mean())
+        if old is None or new is None or old == new:
+            continue
+        change = f" ({(new - old) / abs(old):+.1%})" if old else ""
+        lines.append(
+            f"- {measure}: mean {_format_measure(measure, old)} before -> "
+            f"{_format_measure(measure, new)} after{change}"
+        )
+    return lines
+
+
+def _profiles(frame: pl.DataFrame) -> list[str]:
+    """Profile every column: nulls, range or common values."""
+    lines = ["Column profiles:"]
+    height = frame.height
+    for series in frame.iter_columns():
+        nulls = f"nulls {series.null_count() / height:.1%}"
+        if _is_measure(series.dtype):
+            values = series.cast(pl.Float64)
+            detail = (
+                f"min {_format(values.min())}, p50 {_format(values.median())}, "
+                f"mean {_format(values.mean())}, max {_format(values.max())}, "
+                f"std {_format(values.std())}"
+            )
+        elif _is_time(series.dtype):
+            detail = (
+                f"{_format(series.min())} .. {_format(series.max())}, {series.n_unique()} distinct"
+            )
+        elif series.n_unique() == len(series):
+            detail = "all values distinct"
+        else:
+            counts = (
+                series.cast(pl.String)
+                .drop_nulls()
+                .value_counts(sort=True)
+                .head(TOP_VALUES)
+                .iter_rows()
+            )
+            top = ", ".join(f"{_format(value)} {count / height:.0%}" for value, count in counts)
+            detail = f"{series.n_unique()} distinct, top: {top}"
+        lines.append(f"- {series.name}: {nulls}, {detail}")
+    return lines
+
+
+def _sample(frame: pl.DataFrame) -> list[str]:
+    """Show the first few rows."""
+    lines = ["Sample rows:"]
+    for row in frame.head(SAMPLE_ROWS).iter_rows(named=True):
+        lines.append("  " + ", ".join(f"{k}={_format(v)}" for k, v in row.items()))
+    return lines
+
+
+def _format_measure(measure: str, value: Any) -> str:
+    """Render a measure value, showing null rates as percentages."""
+    if measure.endswith(NULL_RATE_SUFFIX) and isinstance(value, float):
+        return f"{value:.1%}"
+    return _format(value)
+
+
+def _format(value: Any) -> str:
+    """Render a value compactly."""
+    if value is None:
+        return "null"
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        return f"{value:.4g}"
+    if isinstance(value, datetime) and value.time() == datetime.min.time():
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value)
+    if len(text) > MAX_VALUE_CHARS:
+        return text[: MAX_VALUE_CHARS - 3] + "..."
+    return text
+
+
+def _fit(header: list[str], sections: list[list[str]], max_chars: int) -> str:
+    """Join the header and sections in priority order within a character budget.
+
+    The header is always kept. A section that does not fit entirely is cut
+    short with a note, or dropped if not even one line under its heading
+    fits, and no later section is added.
+    """
+    lines = list(header)
+    used = sum(len(line) + 1 for line in lines)
+    for section in sections:
+        kept: list[str] = []
+        for line in section:
+            if used + len(line) + 1 > max_chars:
+                break
+            kept.append(line)
+            used += len(line) + 1
+        if len(kept) == len(section):
+            lines.extend(kept)
+            continue
+        while kept and used + len(OMITTED_NOTE) + 1 > max_chars:
+            used -= len(kept.pop()) + 1
+        if len(kept) > 1:
+            lines.extend([*kept, OMITTED_NOTE])
+        break
+    return "\n".join(lines)
@@ -8,7 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from dataing.core.domain_types import AnomalyAlert, InvestigationContext
+    from dataing.core.domain_types import AnomalyAlert, InvestigationContext, PriorFinding
 
 SYSTEM_PROMPT = """You are a data quality investigator. Given an anomaly alert and database context,
 generate {num_hypotheses} hypotheses about what could have caused the anomaly.
@@ -102,12 +102,37 @@ from the schema and investigate accordingly.
 Focus on: matching the description to actual schema elements."""
 
 
-def build_user(alert: AnomalyAlert, context: InvestigationContext) -> str:
+def _build_prior_section(prior_findings: list[PriorFinding]) -> str:
+    """Build the section listing root causes of similar past alerts."""
+    lines = [
+        "",
+        "## Similar Past Incidents",
+        "Earlier alerts like this one on the same dataset were traced to these root causes:",
+    ]
+    for prior in prior_findings:
+        lines.append(
+            f"- {prior.root_cause} (category: {prior.category.value}, "
+            f"confidence: {prior.confidence:.2f}, similarity: {prior.similarity:.2f})"
+        )
+    lines.append(
+        "Their queries were re-run and did not confirm a recurrence, so the cause may be "
+        "new or only partly the same. Include a hypothesis for a recurrence only if the "
+        "current alert suggests one, and cover other causes as well."
+    )
+    return "\n".join(lines) + "\n"
+
+
+def build_user(
+    alert: AnomalyAlert,
+    context: InvestigationContext,
+    prior_findings: list[PriorFinding] | None = None,
+) -> str:
     """Build hypothesis user prompt.
 
     Args:
         alert: The anomaly alert to investigate.
         context: Available schema and lineage context.
+        prior_findings: Root causes of similar past alerts, if any.
 
     Returns:
         Formatted user prompt.
@@ -119,6 +144,8 @@ def build_user(alert: AnomalyAlert, context: InvestigationContext) -> str:
 {context.lineage.to_prompt_string()}
 """
 
+    prior_section = _build_prior_section(prior_findings) if prior_findings else ""
+
     metric_context = _build_metric_context(alert)
 
     return f"""## Anomaly Alert
@@ -136,6 +163,6 @@ def build_user(alert: AnomalyAlert, context: InvestigationContext) -> str:
 
 ## Available Schema
 {context.schema.to_prompt_string()}
-{lineage_section}
+{lineage_section}{prior_section}
 Generate hypotheses to investigate why {alert.metric_spec.display_name} deviated
 from {alert.expected_value} to {alert.actual_value} ({alert.deviation_pct}% change)."""
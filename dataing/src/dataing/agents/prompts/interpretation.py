@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .digest import DEFAULT_DIGEST_TOKEN_BUDGET, build_result_digest
+
 if TYPE_CHECKING:
     from dataing.adapters.datasource.types import QueryResult
     from dataing.core.domain_types import Hypothesis
@@ -64,13 +66,22 @@ def build_system() -> str:
     return SYSTEM_PROMPT
 
 
-def build_user(hypothesis: Hypothesis, query: str, results: QueryResult) -> str:
+def build_user(
+    hypothesis: Hypothesis,
+    query: str,
+    results: QueryResult,
+    token_budget: int = DEFAULT_DIGEST_TOKEN_BUDGET,
+) -> str:
     """Build interpretation user prompt.
 
+    Results are sent as a statistical digest of every row rather than the
+    first few rows.
+
     Args:
         hypothesis: The hypothesis being tested.
         query: The query that was executed.
         results: The query results.
+        token_budget: Approximate tokens the results digest may use.
 
     Returns:
         Formatted user prompt.
@@ -82,6 +93,6 @@ QUERY EXECUTED:
 {query}
 
 RESULTS ({results.row_count} rows):
-{results.to_summary()}
+{build_result_digest(results, token_budget=token_budget)}
 
 Analyze whether these results support or refute the hypothesis."""
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .rendering import render_schema
+
 if TYPE_CHECKING:
     from dataing.adapters.datasource.types import SchemaResponse
     from dataing.core.domain_types import Hypothesis
@@ -33,15 +35,19 @@ SCHEMA:
 def build_system(schema: SchemaResponse) -> str:
     """Build query system prompt.
 
+    The result depends only on the schema, so it is the same for every
+    hypothesis and is cached by the provider between calls.
+
     Args:
         schema: Available database schema.
 
     Returns:
         Formatted system prompt.
     """
+    rendered = render_schema(schema)
     return SYSTEM_PROMPT.format(
-        table_names=schema.get_table_names(),
-        schema=schema.to_prompt_string(),
+        table_names=rendered.table_names,
+        schema=rendered.prompt,
     )
 
 
@@ -61,3 +67,30 @@ Category: {hypothesis.category.value}
 Reasoning: {hypothesis.reasoning}
 
 Generate a query that would confirm or refute this hypothesis."""
+
+
+def build_batch_user(hypotheses: list[Hypothesis]) -> str:
+    """Build the user prompt for generating queries for several hypotheses.
+
+    Uses the same system prompt as single queries, so the batch call and any
+    later per-hypothesis calls share the cached prefix.
+
+    Args:
+        hypotheses: The hypotheses to test.
+
+    Returns:
+        Formatted user prompt.
+    """
+    listed = "\n\n".join(
+        f"""[{h.id}]
+Hypothesis: {h.title}
+Category: {h.category.value}
+Reasoning: {h.reasoning}"""
+        for h in hypotheses
+    )
+    return f"""Generate one SQL query for EACH of these {len(hypotheses)} hypotheses.
+
+{listed}
+
+Each query must confirm or refute its own hypothesis independently.
+Return exactly one query per hypothesis, tagged with its ID in brackets."""
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .rendering import render_schema
+
 if TYPE_CHECKING:
     from dataing.adapters.datasource.types import SchemaResponse
     from dataing.core.domain_types import Hypothesis
@@ -21,6 +23,8 @@ COMMON FIXES:
 - "relation does not exist": Use fully qualified name (schema.table)
 - "type mismatch": Cast values appropriately
 - "syntax error": Check SQL syntax for the target database
+- "Query rejected before execution": Scan less data - filter on partition or
+  date columns, select fewer columns, avoid cross joins
 
 CRITICAL: Only use tables and columns from the schema above."""
 
@@ -34,7 +38,7 @@ def build_system(schema: SchemaResponse) -> str:
     Returns:
         Formatted system prompt.
     """
-    return SYSTEM_PROMPT.format(schema=schema.to_prompt_string())
+    return SYSTEM_PROMPT.format(schema=render_schema(schema).prompt)
 
 
 def build_user(hypothesis: Hypothesis, previous_error: str) -> str:
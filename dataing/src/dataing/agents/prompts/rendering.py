@@ -0,0 +1,86 @@
+"""Memoized schema rendering shared by prompt builders.
+
+System prompts are the stable prefix of a request: rules plus the schema,
+identical for every hypothesis and reflexion retry of an investigation. The
+user prompt is the volatile suffix. Rendering the schema is the expensive
+part of building a system prompt, so it happens once per schema version and
+is reused by every builder that embeds it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dataing.adapters.datasource.types import SchemaResponse
+
+# Number of distinct schema versions whose rendering is kept
+SCHEMA_RENDER_CACHE_SIZE = 32
+
+SchemaVersion = tuple[str, datetime, int]
+
+
+@dataclass(frozen=True)
+class RenderedSchema:
+    """Prompt-ready text for one version of a schema.
+
+    Attributes:
+        table_names: Fully qualified table names.
+        prompt: Output of ``SchemaResponse.to_prompt_string``.
+    """
+
+    table_names: list[str]
+    prompt: str
+
+
+_rendered: OrderedDict[SchemaVersion, RenderedSchema] = OrderedDict()
+
+
+def schema_version(schema: SchemaResponse) -> SchemaVersion:
+    """Identify a schema version without rendering it.
+
+    A schema is re-fetched, and gets a new ``fetched_at``, whenever the
+    source changes, so source and fetch time identify its content. The table
+    count guards against differently filtered fetches made at the same
+    instant.
+
+    Args:
+        schema: Schema to identify.
+
+    Returns:
+        Hashable version key.
+    """
+    return (schema.source_id, schema.fetched_at, schema.table_count())
+
+
+def render_schema(schema: SchemaResponse) -> RenderedSchema:
+    """Render a schema for prompts, reusing earlier renders of its version.
+
+    Args:
+        schema: Schema to render.
+
+    Returns:
+        The rendered schema.
+    """
+    version = schema_version(schema)
+    rendered = _rendered.get(version)
+    if rendered is not None:
+        _rendered.move_to_end(version)
+        return rendered
+
+    rendered = RenderedSchema(
+        table_names=schema.get_table_names(),
+        prompt=schema.to_prompt_string(),
+    )
+    _rendered[version] = rendered
+    if len(_rendered) > SCHEMA_RENDER_CACHE_SIZE:
+        _rendered.popitem(last=False)
+    return rendered
+
+
+def clear_schema_render_cache() -> None:
+    """Forget every rendered schema."""
+    _rendered.clear()
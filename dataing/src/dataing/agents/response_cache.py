@@ -0,0 +1,275 @@
+"""Exact-match cache of LLM responses with deterministic replay.
+
+Re-running an alert, whether a retry after a transient failure or a
+regression suite, asks the model the same questions again. Responses are
+recorded under a key that fingerprints everything that determines them:
+agent, model, rendered system and user prompts, output schema, and the
+conversation history sent with the call. Timestamps and message IDs are
+left out of the history fingerprint, so a replayed conversation matches the
+recorded one.
+
+Modes:
+- ``read_write``: serve fresh entries and record new responses.
+- ``replay``: serve only recorded responses, expired or not, and fail on a
+  miss. Investigations re-run offline and deterministically.
+- ``off``: always call the model.
+
+Entries are partitioned by tenant. A tenant that opts out in its settings
+bypasses the cache entirely; see ``llm_cache_scope``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import structlog
+from pydantic_ai.messages import ModelMessage, ToolCallPart
+
+from dataing.core.exceptions import LLMError
+
+if TYPE_CHECKING:
+    from dataing.adapters.llm_cache import LLMResponseStore
+
+logger = structlog.get_logger()
+
+# Default lifetime of a recorded response
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Namespace for calls made outside any tenant, e.g. a regression suite
+GLOBAL_NAMESPACE = "global"
+
+# Key in tenants.settings holding cache preferences, e.g. {"enabled": false}
+TENANT_SETTINGS_KEY = "llm_cache"
+
+
+class CacheMode(StrEnum):
+    """How the response cache is used."""
+
+    OFF = "off"
+    READ_WRITE = "read_write"
+    REPLAY = "replay"
+
+
+@dataclass(frozen=True)
+class CacheScope:
+    """Tenant partition and opt-out applied to cache lookups.
+
+    Attributes:
+        namespace: Partition entries are read from and written to.
+        enabled: False if the tenant opted out of caching.
+    """
+
+    namespace: str = GLOBAL_NAMESPACE
+    enabled: bool = True
+
+
+# Scope used outside any llm_cache_scope block
+_DEFAULT_SCOPE = CacheScope()
+
+_scope: ContextVar[CacheScope | None] = ContextVar("llm_cache_scope", default=None)
+
+
+def current_cache_scope() -> CacheScope:
+    """Get the cache scope of the current context."""
+    return _scope.get() or _DEFAULT_SCOPE
+
+
+@contextmanager
+def llm_cache_scope(tenant_id: UUID | None, enabled: bool = True) -> Iterator[CacheScope]:
+    """Scope LLM calls made in this context to a tenant.
+
+    The scope is context-local, so it applies to every task the block
+    starts, such as the parallel hypothesis investigations.
+
+    Args:
+        tenant_id: Tenant whose partition is used. None uses the global one.
+        enabled: False bypasses the cache, for tenants that opted out.
+
+    Yields:
+        The active scope.
+    """
+    scope = CacheScope(str(tenant_id) if tenant_id else GLOBAL_NAMESPACE, enabled)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def llm_cache_enabled(settings: dict[str, Any]) -> bool:
+    """Read a tenant's cache opt-out from its settings.
+
+    Args:
+        settings: The tenant's settings, as read by ``tenant_settings``.
+            Preferences are read from its ``llm_cache`` key.
+
+    Returns:
+        False if the tenant opted out, True otherwise.
+    """
+    preferences = settings.get(TENANT_SETTINGS_KEY) or {}
+    return bool(preferences.get("enabled", True))
+
+
+def fingerprint_messages(messages: Sequence[ModelMessage]) -> list[list[Any]]:
+    """Reduce a conversation to the content that determines a response.
+
+    Args:
+        messages: Messages sent with a call.
+
+    Returns:
+        JSON-serializable parts, without timestamps or IDs.
+    """
+    fingerprint: list[list[Any]] = []
+    for message in messages:
+        for part in message.parts:
+            if isinstance(part, ToolCallPart):
+                fingerprint.append([part.part_kind, part.tool_name, part.args_as_json_str()])
+            else:
+                fingerprint.append([part.part_kind, getattr(part, "content", None)])
+    return fingerprint
+
+
+def response_cache_key(
+    *,
+    agent_name: str,
+    model: str,
+    system: str,
+    prompt: str,
+    output_schema: dict[str, Any],
+    history: Sequence[ModelMessage] = (),
+) -> str:
+    """Hash everything that determines an agent's response.
+
+    Args:
+        agent_name: Agent making the call.
+        model: Model name.
+        system: Rendered system prompt.
+        prompt: Rendered user prompt.
+        output_schema: JSON schema of the expected output.
+        history: Conversation sent with the call.
+
+    Returns:
+        Hex SHA-256 key.
+    """
+    payload = json.dumps(
+        {
+            "agent": agent_name,
+            "model": model,
+            "system": system,
+            "prompt": prompt,
+            "output_schema": output_schema,
+            "history": fingerprint_messages(history),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Records validated agent outputs and serves them for repeat calls.
+
+    Store failures never fail a call in ``read_write`` mode; the call goes
+    to the model instead. In ``replay`` mode they do, since there is no
+    model to fall back to.
+
+    Attributes:
+        store: Where responses are recorded.
+        mode: How the cache is used.
+        ttl_seconds: Lifetime of new entries. None never expires.
+        hits: Calls served from the cache.
+        misses: Lookups that found no usable entry.
+    """
+
+    def __init__(
+        self,
+        store: LLMResponseStore,
+        mode: CacheMode | str = CacheMode.READ_WRITE,
+        ttl_seconds: int | None = DEFAULT_LLM_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            store: Where responses are recorded.
+            mode: How the cache is used.
+            ttl_seconds: Lifetime of new entries. None never expires.
+        """
+        self.store = store
+        self.mode = CacheMode(mode)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether calls in the current scope use the cache."""
+        return self.mode != CacheMode.OFF and current_cache_scope().enabled
+
+    async def lookup(self, key: str, agent_name: str) -> str | None:
+        """Find the recorded response for a call.
+
+        Args:
+            key: Cache key of the call.
+            agent_name: Agent making the call, for logs and errors.
+
+        Returns:
+            The response JSON, or None if the model must be called.
+
+        Raises:
+            LLMError: In replay mode, if no response was recorded.
+        """
+        scope = current_cache_scope()
+        replay = self.mode == CacheMode.REPLAY
+        try:
+            cached = await self.store.get(scope.namespace, key, include_expired=replay)
+        except Exception as e:
+            if replay:
+                raise LLMError(f"Replay store unavailable: {e}", retryable=False) from e
+            logger.warning("llm_cache_read_failed", agent=agent_name, error=str(e))
+            return None
+
+        if cached is None:
+            self.misses += 1
+            if replay:
+                raise LLMError(
+                    f"No recorded response for {agent_name} (key {key[:12]}) in replay mode",
+                    retryable=False,
+                )
+            return None
+
+        self.hits += 1
+        logger.info("llm_cache_hit", agent=agent_name, namespace=scope.namespace)
+        return cached
+
+    async def record(self, key: str, agent_name: str, model: str, response: str) -> None:
+        """Record a model response for later calls.
+
+        Only ``read_write`` mode records; replay never changes the store.
+
+        Args:
+            key: Cache key of the call.
+            agent_name: Agent that made the call.
+            model: Model that answered.
+            response: The validated output as JSON.
+        """
+        if self.mode != CacheMode.READ_WRITE:
+            return
+        try:
+            await self.store.put(
+                current_cache_scope().namespace,
+                key,
+                response,
+                agent_name=agent_name,
+                model=model,
+                ttl_seconds=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("llm_cache_write_failed", agent=agent_name, error=str(e))
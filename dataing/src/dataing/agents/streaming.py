@@ -0,0 +1,240 @@
+"""Token-level streaming of agent output to investigation subscribers.
+
+Agents report every text delta through ``StreamHandlers``. Sending each
+delta to clients on its own would mean hundreds of tiny SSE writes per
+second, so a ``TokenStream`` coalesces them: deltas arriving within a
+frame interval (about 50 ms) are joined into one frame per output stream.
+An output stream is one agent role, and for per-hypothesis roles one
+hypothesis, so parallel hypotheses do not interleave.
+
+When an agent regenerates its response, e.g. after its output failed
+validation, the output stream restarts: its next frame has ``reset`` set
+and a higher ``attempt``, and clients discard the text shown so far.
+
+Each subscriber, e.g. an SSE connection, reads frames from its own
+bounded queue. When a subscriber falls behind and its queue fills, new
+frames are dropped for it alone and counted, so a slow client never slows
+the investigation or other clients. Dropped text is not lost for good:
+the phase's result still arrives with the investigation's events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from bond import StreamHandlers
+
+from .telemetry import AgentRole
+
+# Deltas arriving within this window are sent as one frame
+DEFAULT_FRAME_INTERVAL_SECONDS = 0.05
+
+# Frames a subscriber may have waiting before new ones are dropped for it
+DEFAULT_MAX_QUEUED_FRAMES = 256
+
+# Event type of a token frame
+FRAME_EVENT_TYPE = "llm_delta"
+
+StreamKey = tuple[str, str | None]
+
+
+@dataclass
+class _PendingText:
+    """Deltas of one output stream since the last frame."""
+
+    parts: list[str] = field(default_factory=list)
+    done: bool = False
+    reset: bool = False
+
+
+class TokenSubscription:
+    """A subscriber's bounded queue of frames.
+
+    Attributes:
+        dropped: Frames dropped because the subscriber fell behind.
+    """
+
+    def __init__(self, max_queued_frames: int) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            max_queued_frames: Frames that may wait before new ones are dropped.
+        """
+        self.dropped = 0
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queued_frames)
+
+    def offer(self, frame: dict[str, Any]) -> bool:
+        """Queue a frame unless the subscriber is too far behind.
+
+        Returns:
+            True if queued, False if dropped.
+        """
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        return True
+
+    async def next_frames(self, timeout: float) -> list[dict[str, Any]]:
+        """Wait up to ``timeout`` seconds for frames, then take all that are queued.
+
+        Returns:
+            The queued frames, oldest first; empty if none arrived in time.
+        """
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return []
+        return [first, *self.drain()]
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Take every queued frame without waiting."""
+        frames: list[dict[str, Any]] = []
+        while not self._queue.empty():
+            frames.append(self._queue.get_nowait())
+        return frames
+
+
+class TokenStream:
+    """Coalesces agent text deltas into frames for any number of subscribers.
+
+    Example:
+        stream = TokenStream()
+        await orchestrator.run_investigation(state, adapter, handlers=stream)
+
+        # In an SSE handler
+        subscription = stream.subscribe()
+        frames = await subscription.next_frames(timeout=0.5)
+
+    Frames have the shape of investigation events::
+
+        {"type": "llm_delta", "timestamp": "...",
+         "data": {"role": "query", "hypothesis_id": "h1", "text": "SELECT",
+                  "done": False, "attempt": 1, "reset": False}}
+
+    ``reset`` marks the first frame of a restarted response: text from
+    earlier frames of the stream belongs to a discarded attempt.
+
+    Attributes:
+        frame_interval: Seconds over which deltas are coalesced.
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_interval: float = DEFAULT_FRAME_INTERVAL_SECONDS,
+        max_queued_frames: int = DEFAULT_MAX_QUEUED_FRAMES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            frame_interval: Seconds over which deltas are coalesced.
+            max_queued_frames: Frames a subscriber may have waiting before
+                new ones are dropped for it.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self.frame_interval = frame_interval
+        self._max_queued_frames = max_queued_frames
+        self._clock = clock
+        self._pending: dict[StreamKey, _PendingText] = {}
+        self._attempts: dict[StreamKey, int] = {}
+        self._subscribers: list[TokenSubscription] = []
+        self._last_flush = -float("inf")
+        self._timer: asyncio.TimerHandle | None = None
+        self._closed = False
+
+    def handlers(self, role: AgentRole, hypothesis_id: str | None = None) -> StreamHandlers:
+        """Create handlers that feed one output stream.
+
+        Args:
+            role: Role of the agent whose output is streamed.
+            hypothesis_id: Hypothesis the output belongs to, if any.
+
+        Returns:
+            Handlers to pass to the agent call.
+        """
+        key: StreamKey = (str(role), hypothesis_id)
+        return StreamHandlers(
+            on_text_delta=lambda text: self._add(key, text),
+            on_complete=lambda _: self._complete(key),
+            on_attempt=lambda attempt: self._restart(key, attempt),
+        )
+
+    def subscribe(self) -> TokenSubscription:
+        """Start receiving frames; earlier frames are not replayed."""
+        subscription = TokenSubscription(self._max_queued_frames)
+        self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TokenSubscription) -> None:
+        """Stop sending frames to a subscriber."""
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+    def flush(self) -> None:
+        """Send the deltas gathered so far as one frame per output stream."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._last_flush = self._clock()
+
+        pending, self._pending = self._pending, {}
+        if not self._subscribers:
+            return
+
+        timestamp = datetime.now(UTC).isoformat()
+        for key, text in pending.items():
+            role, hypothesis_id = key
+            frame = {
+                "type": FRAME_EVENT_TYPE,
+                "timestamp": timestamp,
+                "data": {
+                    "role": role,
+                    "hypothesis_id": hypothesis_id,
+                    "text": "".join(text.parts),
+                    "done": text.done,
+                    "attempt": self._attempts.get(key, 1),
+                    "reset": text.reset,
+                },
+            }
+            for subscription in self._subscribers:
+                subscription.offer(frame)
+
+    def close(self) -> None:
+        """Send what is pending and ignore later deltas."""
+        self.flush()
+        self._closed = True
+
+    def _add(self, key: StreamKey, text: str) -> None:
+        if self._closed or not text:
+            return
+        self._pending.setdefault(key, _PendingText()).parts.append(text)
+        self._schedule_flush()
+
+    def _complete(self, key: StreamKey) -> None:
+        if self._closed:
+            return
+        self._pending.setdefault(key, _PendingText()).done = True
+        self._schedule_flush()
+
+    def _restart(self, key: StreamKey, attempt: int) -> None:
+        if self._closed:
+            return
+        # Unsent text of the discarded attempt is dropped rather than sent
+        self._pending[key] = _PendingText(reset=True)
+        self._attempts[key] = attempt
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush at the end of the current frame, or at once after a pause."""
+        if self._timer is not None:
+            return
+        delay = max(self._last_flush + self.frame_interval - self._clock(), 0.0)
+        self._timer = asyncio.get_running_loop().call_later(delay, self.flush)
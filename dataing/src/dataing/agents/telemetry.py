@@ -0,0 +1,145 @@
+"""Per-role latency, token and cost telemetry for LLM calls.
+
+Each agent has a role, and each role can run on its own model. Usage is
+totalled per (role, model), so the savings of routing a role to a cheaper
+model show up directly in the counters.
+
+AgentClient keeps process-wide totals. Wrap an investigation in
+``llm_usage_scope`` to also collect the usage of just that investigation,
+e.g. to record it with the usage service.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import Any
+
+from pydantic_ai.usage import RunUsage
+
+from dataing.services.usage import estimate_llm_cost
+
+
+class AgentRole(StrEnum):
+    """Role an agent plays in an investigation."""
+
+    HYPOTHESIS = "hypothesis"
+    QUERY = "query"
+    INTERPRETATION = "interpretation"
+    SYNTHESIS = "synthesis"
+
+
+@dataclass
+class RoleUsage:
+    """Usage totals of one role on one model.
+
+    Attributes:
+        role: Agent role.
+        model: Model that served the calls.
+        calls: Agent calls, each of which may take several requests.
+        requests: Model requests, including validation retries.
+        input_tokens: Input tokens, including cache reads and writes.
+        output_tokens: Output tokens.
+        cache_read_tokens: Input tokens read from the prompt cache.
+        latency_ms: Total wall-clock time of the calls.
+        cost: Estimated cost in USD.
+    """
+
+    role: str
+    model: str
+    calls: int = 0
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    latency_ms: float = 0.0
+    cost: float = 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        """Average wall-clock time per call."""
+        return self.latency_ms / self.calls if self.calls else 0.0
+
+    def add(self, usage: RunUsage, latency_ms: float) -> None:
+        """Add one call.
+
+        Args:
+            usage: Token usage of the call.
+            latency_ms: Wall-clock time of the call.
+        """
+        self.calls += 1
+        self.requests += usage.requests
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.cache_read_tokens += usage.cache_read_tokens
+        self.latency_ms += latency_ms
+        self.cost += estimate_llm_cost(self.model, usage.input_tokens, usage.output_tokens)
+
+
+class LLMTelemetry:
+    """Usage totals per (role, model).
+
+    Attributes:
+        roles: Totals keyed by (role, model).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self.roles: dict[tuple[str, str], RoleUsage] = {}
+
+    def record(self, role: str, model: str, usage: RunUsage, latency_ms: float) -> None:
+        """Add one call to the totals of its role and model.
+
+        Args:
+            role: Agent role.
+            model: Model that served the call.
+            usage: Token usage of the call.
+            latency_ms: Wall-clock time of the call.
+        """
+        key = (role, model)
+        if key not in self.roles:
+            self.roles[key] = RoleUsage(role=role, model=model)
+        self.roles[key].add(usage, latency_ms)
+
+    @property
+    def total_cost(self) -> float:
+        """Estimated cost of every call, in USD."""
+        return sum(entry.cost for entry in self.roles.values())
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Summarize the totals, most expensive first.
+
+        Returns:
+            One dict per (role, model) with its counters and mean latency.
+        """
+        entries = sorted(self.roles.values(), key=lambda e: e.cost, reverse=True)
+        return [asdict(e) | {"mean_latency_ms": e.mean_latency_ms} for e in entries]
+
+
+_ledger: ContextVar[LLMTelemetry | None] = ContextVar("llm_usage_ledger", default=None)
+
+
+@contextmanager
+def llm_usage_scope() -> Iterator[LLMTelemetry]:
+    """Collect the usage of LLM calls made in this context.
+
+    The scope is context-local, so it covers every task the block starts,
+    such as the parallel hypothesis investigations.
+
+    Yields:
+        Telemetry receiving the usage of calls made in the block.
+    """
+    ledger = LLMTelemetry()
+    token = _ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _ledger.reset(token)
+
+
+def current_usage_ledger() -> LLMTelemetry | None:
+    """Get the telemetry of the enclosing ``llm_usage_scope``, if any."""
+    return _ledger.get()
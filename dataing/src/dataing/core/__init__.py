@@ -8,6 +8,7 @@ from .domain_types import (
     HypothesisCategory,
     InvestigationContext,
     LineageContext,
+    PriorFinding,
 )
 from .exceptions import (
     CircuitBreakerTripped,
@@ -30,6 +31,7 @@ __all__ = [
     "HypothesisCategory",
     "InvestigationContext",
     "LineageContext",
+    "PriorFinding",
     # Exceptions
     "DataingError",
     "SchemaDiscoveryError",
@@ -176,6 +176,31 @@ class Finding(BaseModel):
     duration_seconds: float
 
 
+class PriorFinding(BaseModel):
+    """Root cause of a past investigation, recalled for a similar alert.
+
+    Attributes:
+        investigation_id: ID of the investigation that found the cause.
+        root_cause: The root cause it found.
+        confidence: Confidence of that finding from 0.0 to 1.0.
+        category: Category of the hypothesis the cause confirmed.
+        decisive_queries: Queries whose results confirmed the cause, most
+            confident first.
+        recommendations: Remediation suggested at the time.
+        similarity: Similarity of the past alert to the current one.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    investigation_id: str
+    root_cause: str
+    confidence: float
+    category: HypothesisCategory
+    decisive_queries: list[str]
+    recommendations: list[str] = []
+    similarity: float = 0.0
+
+
 @dataclass(frozen=True)
 class LineageContext:
     """Upstream and downstream dependencies for a dataset.
@@ -13,10 +13,11 @@ from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from uuid import UUID
 
 if TYPE_CHECKING:
-    from bond import StreamHandlers
+    from bond import AgentSession, StreamHandlers
 
     from dataing.adapters.datasource.base import BaseAdapter
     from dataing.adapters.datasource.types import QueryResult, SchemaFilter, SchemaResponse
+    from dataing.agents.models import QueryResponse
 
     from .domain_types import (
         AnomalyAlert,
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
         Finding,
         Hypothesis,
         InvestigationContext,
+        PriorFinding,
     )
 
 
@@ -94,6 +96,7 @@ class LLMClient(Protocol):
         context: InvestigationContext,
         num_hypotheses: int = 5,
         handlers: StreamHandlers | None = None,
+        prior_findings: list[PriorFinding] | None = None,
     ) -> list[Hypothesis]:
         """Generate hypotheses for an anomaly.
 
@@ -102,6 +105,7 @@ class LLMClient(Protocol):
             context: Available schema and lineage context.
             num_hypotheses: Target number of hypotheses to generate.
             handlers: Optional streaming handlers for real-time updates.
+            prior_findings: Root causes of similar past alerts to consider.
 
         Returns:
             List of generated hypotheses.
@@ -117,6 +121,8 @@ class LLMClient(Protocol):
         schema: SchemaResponse,
         previous_error: str | None = None,
         handlers: StreamHandlers | None = None,
+        session: AgentSession | None = None,
+        escalate: bool = False,
     ) -> str:
         """Generate SQL query to test a hypothesis.
 
@@ -125,6 +131,9 @@ class LLMClient(Protocol):
             schema: Available database schema.
             previous_error: Error from previous query attempt (for reflexion).
             handlers: Optional streaming handlers for real-time updates.
+            session: Conversation shared by the attempts for one hypothesis.
+            escalate: Use the strongest available model, e.g. after repeated
+                failures of a faster one.
 
         Returns:
             SQL query string.
@@ -134,6 +143,31 @@ class LLMClient(Protocol):
         """
         ...
 
+    async def generate_queries_batch(
+        self,
+        hypotheses: list[Hypothesis],
+        schema: SchemaResponse,
+        handlers: StreamHandlers | None = None,
+        sessions: dict[str, AgentSession] | None = None,
+    ) -> dict[str, QueryResponse]:
+        """Generate the first query for several hypotheses in one call.
+
+        Args:
+            hypotheses: The hypotheses to test.
+            schema: Available database schema.
+            handlers: Optional streaming handlers for real-time updates.
+            sessions: Optional per-hypothesis sessions that record the
+                generated queries, keyed by hypothesis ID.
+
+        Returns:
+            Generated queries keyed by hypothesis ID. Skipped hypotheses
+            are missing.
+
+        Raises:
+            LLMError: If LLM call fails.
+        """
+        ...
+
     async def interpret_evidence(
         self,
         hypothesis: Hypothesis,
@@ -2,9 +2,10 @@
 
 This module implements the core investigation workflow:
 1. Gather Context (FAIL FAST if schema is empty)
-2. Generate Hypotheses
-3. Investigate Hypotheses in Parallel (Fan-Out)
-4. Synthesize Findings (Fan-In)
+2. Re-run the decisive queries of similar past findings, if any
+3. Generate Hypotheses (skipped if a past root cause is reconfirmed)
+4. Investigate Hypotheses in Parallel (Fan-Out)
+5. Synthesize Findings (Fan-In)
 
 The orchestrator coordinates all components but contains no
 infrastructure-specific code - it only uses the protocol interfaces.
@@ -14,24 +15,29 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import structlog
 
 from dataing.adapters.investigation_feedback import EventType
 from dataing.agents.models import InterpretationResponse, SynthesisResponse
+from dataing.agents.streaming import TokenStream
+from dataing.agents.telemetry import AgentRole
+from dataing.safety.cost_gate import QueryBudget, QueryCostGate
 
-from bond import StreamHandlers
+from bond import AgentSession, StreamHandlers
 
-from .domain_types import Evidence, Finding, Hypothesis, InvestigationContext
+from .domain_types import Evidence, Finding, Hypothesis, InvestigationContext, PriorFinding
 from .exceptions import CircuitBreakerTripped, SchemaDiscoveryError
+from .quality.validation_queue import InterpretationCheck, SynthesisCheck, ValidationQueue
 from .state import Event, InvestigationState
 
 if TYPE_CHECKING:
     from dataing.adapters.datasource.sql.base import SQLAdapter
+    from dataing.adapters.finding_memory import FindingMemory
     from dataing.adapters.training.repository import TrainingSignalRepository
 
     from ..safety.circuit_breaker import CircuitBreaker
@@ -41,6 +47,26 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
+def _role_handlers(
+    handlers: StreamHandlers | TokenStream | None,
+    role: AgentRole,
+    hypothesis_id: str | None = None,
+) -> StreamHandlers | None:
+    """Get the handlers for one agent call, labelled if they feed a TokenStream."""
+    if isinstance(handlers, TokenStream):
+        return handlers.handlers(role, hypothesis_id)
+    return handlers
+
+
+def _query_stats_data(metadata: dict[str, Any]) -> dict[str, str | int | float | bool | None]:
+    """Flatten a result's scalar query stats into event data, e.g. query_processed_bytes."""
+    return {
+        key if key.startswith("query_") else f"query_{key}": value
+        for key, value in metadata.items()
+        if value is None or isinstance(value, str | int | float | bool)
+    }
+
+
 @dataclass(frozen=True)
 class OrchestratorConfig:
     """Configuration for the investigation orchestrator.
@@ -54,6 +80,16 @@ class OrchestratorConfig:
         validation_enabled: Whether to validate LLM outputs.
         validation_pass_threshold: Minimum score to pass validation.
         validation_max_retries: Maximum retries on validation failure.
+        validation_queue_size: Validations waiting in the background queue
+            before new ones are dropped.
+        validation_batch_size: Most interpretations judged in one request.
+        query_budget: Default scan budget for generated queries, used when
+            no tenant budget is passed to run_investigation.
+        query_escalation_failures: Failed queries for a hypothesis after
+            which its queries are generated by the strongest model.
+        warm_start_top_k: Most past findings recalled for a new alert.
+        warm_start_min_similarity: Minimum similarity of a past alert for
+            its finding to be recalled.
     """
 
     max_hypotheses: int = 5
@@ -64,6 +100,12 @@ class OrchestratorConfig:
     validation_enabled: bool = True
     validation_pass_threshold: float = 0.6
     validation_max_retries: int = 2
+    validation_queue_size: int = 256
+    validation_batch_size: int = 8
+    query_budget: QueryBudget = field(default_factory=QueryBudget)
+    query_escalation_failures: int = 2
+    warm_start_top_k: int = 3
+    warm_start_min_similarity: float = 0.8
 
 
 class InvestigationOrchestrator:
@@ -85,6 +127,7 @@ class InvestigationOrchestrator:
         feedback: InvestigationFeedbackEmitter | None = None,
         validator: QualityValidator | None = None,
         training_repo: TrainingSignalRepository | None = None,
+        finding_memory: FindingMemory | None = None,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -98,6 +141,9 @@ class InvestigationOrchestrator:
             feedback: Optional feedback emitter for event logging.
             validator: Optional quality validator for LLM outputs.
             training_repo: Optional repository for training signal capture.
+            finding_memory: Optional memory of past findings. Investigations
+                re-run the decisive queries of similar past findings first
+                and remember their own findings.
         """
         self.db = db
         self.llm = llm
@@ -107,6 +153,20 @@ class InvestigationOrchestrator:
         self.feedback = feedback
         self.validator = validator
         self.training_repo = training_repo
+        # Validation runs in the background, off the investigation's critical path
+        self.validation_queue = (
+            ValidationQueue(
+                validator,
+                training_repo,
+                max_pending=self.config.validation_queue_size,
+                batch_size=self.config.validation_batch_size,
+            )
+            if validator is not None
+            else None
+        )
+        self.finding_memory = finding_memory
+        # Findings are remembered in the background, like validation
+        self._memory_tasks: set[asyncio.Task[bool]] = set()
         # Will be set per-investigation when using tenant data source
         self._current_adapter: SQLAdapter | None = None
 
@@ -114,7 +174,8 @@ class InvestigationOrchestrator:
         self,
         state: InvestigationState,
         data_adapter: SQLAdapter | None = None,
-        handlers: StreamHandlers | None = None,
+        handlers: StreamHandlers | TokenStream | None = None,
+        query_budget: QueryBudget | None = None,
     ) -> Finding:
         """Execute a complete investigation.
 
@@ -123,7 +184,11 @@ class InvestigationOrchestrator:
             data_adapter: Optional adapter for tenant's data source.
                          If provided, queries run against this adapter
                          instead of the default self.db.
-            handlers: Optional streaming handlers for real-time updates.
+            handlers: Optional streaming handlers for real-time updates. A
+                TokenStream gets each agent's output labelled with its role
+                and hypothesis.
+            query_budget: Optional tenant scan budget for generated queries.
+                         Defaults to the configured budget.
 
         Returns:
             Finding with root cause and recommendations.
@@ -136,6 +201,8 @@ class InvestigationOrchestrator:
 
         # Use provided adapter or fall back to default
         self._current_adapter = data_adapter or self.db
+        # Local to this run: the orchestrator is shared by concurrent tenants
+        cost_gate = QueryCostGate(query_budget or self.config.query_budget)
 
         log = logger.bind(
             investigation_id=state.id,
@@ -181,15 +248,25 @@ class InvestigationOrchestrator:
                     investigation_id=UUID(state.id),
                 )
 
-            # 2. Generate Hypotheses
-            state, hypotheses = await self._generate_hypotheses(state, handlers)
-            log.info("Hypotheses generated", count=len(hypotheses))
-
-            # 3. Investigate Hypotheses (Parallel Fan-Out)
-            evidence = await self._investigate_parallel(state, hypotheses, handlers)
+            # 2. Re-run what confirmed the causes of similar past alerts
+            state, priors = await self._recall_prior_findings(state)
+            evidence = await self._reconfirm_prior_findings(state, priors, handlers, cost_gate)
+            reconfirmed = self._is_reconfirmed(evidence)
+
+            if reconfirmed:
+                # The old cause holds; there is nothing new to hypothesize
+                log.info("Prior root cause reconfirmed - skipping hypotheses")
+                hypotheses: list[Hypothesis] = []
+            else:
+                # 3. Generate Hypotheses
+                state, hypotheses = await self._generate_hypotheses(state, handlers, priors)
+                log.info("Hypotheses generated", count=len(hypotheses))
+
+                # 4. Investigate Hypotheses (Parallel Fan-Out)
+                evidence += await self._investigate_parallel(state, hypotheses, handlers, cost_gate)
             log.info("Investigation complete", evidence_count=len(evidence))
 
-            # 4. Synthesize Findings (Fan-In)
+            # 5. Synthesize Findings (Fan-In)
             finding = await self._synthesize(state, evidence, start_time, handlers)
             log.info(
                 "Synthesis complete",
@@ -197,6 +274,10 @@ class InvestigationOrchestrator:
                 confidence=finding.confidence,
             )
 
+            # A reconfirmed cause is already remembered
+            if not reconfirmed:
+                self._remember_finding(state, hypotheses, finding)
+
             if self.feedback:
                 await self.feedback.emit(
                     tenant_id=state.tenant_id,
@@ -301,16 +382,126 @@ class InvestigationOrchestrator:
 
         return state
 
+    async def _recall_prior_findings(
+        self, state: InvestigationState
+    ) -> tuple[InvestigationState, list[PriorFinding]]:
+        """Recall findings of similar past alerts on the same dataset.
+
+        Args:
+            state: Current investigation state.
+
+        Returns:
+            Tuple of updated state and the recalled findings, most similar first.
+        """
+        if self.finding_memory is None:
+            return state, []
+
+        priors = await self.finding_memory.recall(
+            state.tenant_id,
+            state.alert,
+            top_k=self.config.warm_start_top_k,
+            min_similarity=self.config.warm_start_min_similarity,
+        )
+        if priors:
+            state = state.append_event(
+                Event(
+                    type="prior_findings_recalled",
+                    timestamp=datetime.now(UTC),
+                    data={
+                        "investigation_ids": [p.investigation_id for p in priors],
+                        "root_causes": [p.root_cause for p in priors],
+                    },
+                )
+            )
+            logger.info("Prior findings recalled", count=len(priors))
+        return state, priors
+
+    async def _reconfirm_prior_findings(
+        self,
+        state: InvestigationState,
+        priors: list[PriorFinding],
+        handlers: StreamHandlers | TokenStream | None = None,
+        cost_gate: QueryCostGate | None = None,
+    ) -> list[Evidence]:
+        """Re-run the decisive queries of past findings, in parallel.
+
+        Each past root cause is tested as a hypothesis whose queries are
+        the ones that confirmed it. No query is generated, so this costs
+        one interpretation per query. A cause's remaining queries are
+        skipped once one reconfirms it.
+
+        Args:
+            state: Current investigation state.
+            priors: Recalled past findings.
+            handlers: Optional streaming handlers for real-time updates.
+            cost_gate: Cost gate of this investigation.
+
+        Returns:
+            Evidence from the re-run queries.
+        """
+
+        async def reconfirm(index: int, prior: PriorFinding) -> list[Evidence]:
+            hypothesis = Hypothesis(
+                id=f"prior-{index}",
+                title=prior.root_cause,
+                category=prior.category,
+                reasoning=(
+                    f"Root cause of a similar past alert (investigation "
+                    f"{prior.investigation_id}, similarity {prior.similarity:.2f})"
+                ),
+                suggested_query=prior.decisive_queries[0],
+            )
+            evidence: list[Evidence] = []
+            for query in prior.decisive_queries:
+                evidence += await self._investigate_hypothesis(
+                    state,
+                    hypothesis,
+                    handlers,
+                    first_query=query,
+                    max_queries=1,
+                    cost_gate=cost_gate,
+                )
+                if self._is_reconfirmed(evidence):
+                    break
+            return evidence
+
+        results = await asyncio.gather(
+            *(
+                reconfirm(i, prior)
+                for i, prior in enumerate(priors, start=1)
+                if prior.decisive_queries
+            ),
+            return_exceptions=True,
+        )
+
+        evidence: list[Evidence] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("Prior finding reconfirmation failed", error=str(result))
+                continue
+            evidence.extend(result)
+        return evidence
+
+    def _is_reconfirmed(self, evidence: list[Evidence]) -> bool:
+        """Check whether any evidence confirms its hypothesis with high confidence."""
+        return any(
+            ev.supports_hypothesis and ev.confidence > self.config.high_confidence_threshold
+            for ev in evidence
+        )
+
     async def _generate_hypotheses(
         self,
         state: InvestigationState,
-        handlers: StreamHandlers | None = None,
+        handlers: StreamHandlers | TokenStream | None = None,
+        prior_findings: list[PriorFinding] | None = None,
     ) -> tuple[InvestigationState, list[Hypothesis]]:
         """Generate hypotheses using LLM.
 
         Args:
             state: Current investigation state with context.
             handlers: Optional streaming handlers for real-time updates.
+            prior_findings: Root causes of similar past alerts to seed the
+                hypotheses with.
 
         Returns:
             Tuple of updated state and list of hypotheses.
@@ -326,7 +517,8 @@ class InvestigationOrchestrator:
             alert=state.alert,
             context=context,
             num_hypotheses=self.config.max_hypotheses,
-            handlers=handlers,
+            handlers=_role_handlers(handlers, AgentRole.HYPOTHESIS),
+            prior_findings=prior_findings or None,
         )
 
         for h in hypotheses:
@@ -348,7 +540,8 @@ class InvestigationOrchestrator:
         self,
         state: InvestigationState,
         hypotheses: list[Hypothesis],
-        handlers: StreamHandlers | None = None,
+        handlers: StreamHandlers | TokenStream | None = None,
+        cost_gate: QueryCostGate | None = None,
     ) -> list[Evidence]:
         """Fan-out: Investigate all hypotheses in parallel.
 
@@ -356,11 +549,25 @@ class InvestigationOrchestrator:
             state: Current investigation state.
             hypotheses: List of hypotheses to investigate.
             handlers: Optional streaming handlers for real-time updates.
+            cost_gate: Cost gate of this investigation.
 
         Returns:
             List of all evidence collected.
         """
-        tasks = [self._investigate_hypothesis(state, h, handlers) for h in hypotheses]
+        sessions = {h.id: AgentSession(key=f"{state.id}:{h.id}") for h in hypotheses}
+        first_queries = await self._generate_first_queries(state, hypotheses, sessions, handlers)
+
+        tasks = [
+            self._investigate_hypothesis(
+                state,
+                h,
+                handlers,
+                session=sessions[h.id],
+                first_query=first_queries.get(h.id),
+                cost_gate=cost_gate,
+            )
+            for h in hypotheses
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         evidence: list[Evidence] = []
@@ -373,11 +580,58 @@ class InvestigationOrchestrator:
 
         return evidence
 
+    async def _generate_first_queries(
+        self,
+        state: InvestigationState,
+        hypotheses: list[Hypothesis],
+        sessions: dict[str, AgentSession],
+        handlers: StreamHandlers | TokenStream | None = None,
+    ) -> dict[str, str]:
+        """Generate the first query of every hypothesis in one LLM call.
+
+        A failed batch is not fatal: hypotheses without a first query
+        generate their own, as they would without batching.
+
+        Args:
+            state: Current investigation state.
+            hypotheses: Hypotheses about to be investigated.
+            sessions: Per-hypothesis sessions that record the batch's queries.
+            handlers: Optional streaming handlers for real-time updates.
+
+        Returns:
+            SQL keyed by hypothesis ID.
+        """
+        assert state.schema_context is not None
+
+        # A single hypothesis gains nothing from batching
+        if len(hypotheses) < 2:
+            return {}
+
+        try:
+            responses = await self.llm.generate_queries_batch(
+                hypotheses=hypotheses,
+                schema=state.schema_context,
+                handlers=_role_handlers(handlers, AgentRole.QUERY),
+                sessions=sessions,
+            )
+        except Exception as e:
+            logger.warning(
+                "Batch query generation failed - generating per hypothesis", error=str(e)
+            )
+            return {}
+
+        logger.info("Batch queries generated", generated=len(responses), requested=len(hypotheses))
+        return {h_id: response.query for h_id, response in responses.items()}
+
     async def _investigate_hypothesis(
         self,
         state: InvestigationState,
         hypothesis: Hypothesis,
-        handlers: StreamHandlers | None = None,
+        handlers: StreamHandlers | TokenStream | None = None,
+        session: AgentSession | None = None,
+        first_query: str | None = None,
+        max_queries: int | None = None,
+        cost_gate: QueryCostGate | None = None,
     ) -> list[Evidence]:
         """Investigate a single hypothesis with retry/reflexion loop.
 
@@ -385,6 +639,14 @@ class InvestigationOrchestrator:
             state: Current investigation state.
             hypothesis: The hypothesis to investigate.
             handlers: Optional streaming handlers for real-time updates.
+            session: LLM conversation for this hypothesis. A new one is
+                opened if not given.
+            first_query: Query already generated for the first attempt, e.g.
+                by a batch call. Later attempts generate their own.
+            max_queries: Most queries to run. Defaults to the configured
+                maximum per hypothesis.
+            cost_gate: Cost gate of this investigation. Defaults to one
+                with the configured budget.
 
         Returns:
             List of evidence collected for this hypothesis.
@@ -394,10 +656,18 @@ class InvestigationOrchestrator:
         assert self._current_adapter is not None
 
         evidence: list[Evidence] = []
-        max_queries = self.config.max_queries_per_hypothesis
+        if max_queries is None:
+            max_queries = self.config.max_queries_per_hypothesis
+        if cost_gate is None:
+            cost_gate = QueryCostGate(self.config.query_budget)
 
         log = logger.bind(hypothesis_id=hypothesis.id, title=hypothesis.title)
 
+        # Attempts for this hypothesis share a bounded conversation; nothing
+        # leaks into other hypotheses or investigations
+        if session is None:
+            session = AgentSession(key=f"{state.id}:{hypothesis.id}")
+
         for query_num in range(max_queries):
             # Check circuit breaker
             self.circuit_breaker.check(state.events, hypothesis.id)
@@ -405,33 +675,50 @@ class InvestigationOrchestrator:
             # Generate query (with previous error context if retrying)
             previous_error: str | None = None
             if query_num > 0:
-                failed = state.get_failed_queries(hypothesis.id)
-                previous_error = failed[-1] if failed else None
-
-            query = await self.llm.generate_query(
-                hypothesis=hypothesis,
-                schema=state.schema_context,
-                previous_error=previous_error,
-                handlers=handlers,
-            )
+                errors = state.get_query_errors(hypothesis.id)
+                previous_error = errors[-1] if errors else None
+
+            if query_num == 0 and first_query:
+                query = first_query
+            else:
+                query = await self.llm.generate_query(
+                    hypothesis=hypothesis,
+                    schema=state.schema_context,
+                    previous_error=previous_error,
+                    handlers=_role_handlers(handlers, AgentRole.QUERY, hypothesis.id),
+                    session=session,
+                    escalate=(
+                        state.get_retry_count(hypothesis.id)
+                        >= self.config.query_escalation_failures
+                    ),
+                )
 
             # Check for duplicate query (stall detection)
             if query in state.get_all_queries(hypothesis.id):
                 log.warning("Duplicate query detected - stopping hypothesis")
                 break
 
+            # Estimate cost before running; over-budget queries are sampled or rejected
+            decision = await cost_gate.check(self._current_adapter, query)
+
             # Record query submission
             state = state.append_event(
                 Event(
                     type="query_submitted",
                     timestamp=datetime.now(UTC),
-                    data={"hypothesis_id": hypothesis.id, "query": query},
+                    data={
+                        "hypothesis_id": hypothesis.id,
+                        "query": query,
+                        **decision.to_event_data(),
+                    },
                 )
             )
 
             try:
+                # A rejection is recorded as a failed query so reflexion sees why
+                decision.raise_if_rejected()
                 result = await self._current_adapter.execute_query(
-                    query,
+                    decision.sql,
                     timeout_seconds=self.config.query_timeout_seconds,
                 )
 
@@ -439,18 +726,26 @@ class InvestigationOrchestrator:
                     Event(
                         type="query_succeeded",
                         timestamp=datetime.now(UTC),
-                        data={"hypothesis_id": hypothesis.id, "row_count": result.row_count},
+                        data={
+                            "hypothesis_id": hypothesis.id,
+                            "row_count": result.row_count,
+                            "execution_time_ms": result.execution_time_ms,
+                            **_query_stats_data(result.metadata),
+                        },
                     )
                 )
 
                 # Interpret results
                 ev = await self.llm.interpret_evidence(
-                    hypothesis, query, result, handlers=handlers
+                    hypothesis,
+                    decision.sql,
+                    result,
+                    handlers=_role_handlers(handlers, AgentRole.INTERPRETATION, hypothesis.id),
                 )
 
-                # Validate interpretation if enabled
-                if self.config.validation_enabled and self.validator:
-                    ev = await self._validate_interpretation(ev, hypothesis, query, state)
+                # Queue interpretation validation if enabled
+                if self.config.validation_enabled and self.validation_queue:
+                    self._validate_interpretation(ev, hypothesis, decision.sql, state)
 
                 evidence.append(ev)
 
@@ -496,25 +791,25 @@ class InvestigationOrchestrator:
 
         return evidence
 
-    async def _validate_interpretation(
+    def _validate_interpretation(
         self,
         evidence: Evidence,
         hypothesis: Hypothesis,
         query: str,
         state: InvestigationState,
-    ) -> Evidence:
-        """Validate interpretation quality and capture training signal.
+    ) -> None:
+        """Queue interpretation quality validation and training signal capture.
+
+        Validation never changes the evidence, so the investigation does
+        not wait for it.
 
         Args:
             evidence: The evidence to validate.
             hypothesis: The hypothesis being tested.
             query: The SQL query that was executed.
             state: Current investigation state.
-
-        Returns:
-            The original evidence (validation doesn't modify it).
         """
-        assert self.validator is not None
+        assert self.validation_queue is not None
 
         # Construct InterpretationResponse from Evidence for validation
         # Note: Some fields are approximated since Evidence doesn't store all response fields
@@ -529,46 +824,27 @@ class InvestigationOrchestrator:
             next_investigation_step=None,
         )
 
-        try:
-            validation_result = await self.validator.validate_interpretation(
+        self.validation_queue.submit(
+            InterpretationCheck(
+                tenant_id=state.tenant_id,
+                investigation_id=UUID(state.id),
                 response=interpretation_response,
                 hypothesis_title=hypothesis.title,
                 query=query,
+                input_context={
+                    "hypothesis_title": hypothesis.title,
+                    "hypothesis_reasoning": hypothesis.reasoning,
+                    "query": query,
+                },
             )
-
-            logger.info(
-                f"interpretation_validated passed={validation_result.passed} "
-                f"composite={validation_result.assessment.composite_score:.2f}"
-            )
-
-            # Capture training signal if repository is available
-            if self.training_repo:
-                await self.training_repo.record_signal(
-                    signal_type="interpretation",
-                    tenant_id=state.tenant_id,
-                    investigation_id=UUID(state.id),
-                    input_context={
-                        "hypothesis_title": hypothesis.title,
-                        "hypothesis_reasoning": hypothesis.reasoning,
-                        "query": query,
-                    },
-                    output_response=interpretation_response.model_dump(),
-                    automated_score=validation_result.assessment.composite_score,
-                    automated_dimensions=validation_result.training_signals,
-                )
-
-        except Exception as e:
-            # Log but don't fail the investigation on validation errors
-            logger.warning(f"interpretation_validation_failed error={e}")
-
-        return evidence
+        )
 
     async def _synthesize(
         self,
         state: InvestigationState,
         evidence: list[Evidence],
         start_time: float,
-        handlers: StreamHandlers | None = None,
+        handlers: StreamHandlers | TokenStream | None = None,
     ) -> Finding:
         """Fan-in: Synthesize all evidence into a finding.
 
@@ -584,7 +860,7 @@ class InvestigationOrchestrator:
         finding = await self.llm.synthesize_findings(
             alert=state.alert,
             evidence=evidence,
-            handlers=handlers,
+            handlers=_role_handlers(handlers, AgentRole.SYNTHESIS),
         )
 
         # Update finding with investigation metadata
@@ -599,9 +875,9 @@ class InvestigationOrchestrator:
             duration_seconds=duration,
         )
 
-        # Validate synthesis if enabled
-        if self.config.validation_enabled and self.validator:
-            await self._validate_synthesis(finding, state)
+        # Queue synthesis validation if enabled
+        if self.config.validation_enabled and self.validation_queue:
+            self._validate_synthesis(finding, state)
 
         state.append_event(
             Event(
@@ -613,18 +889,18 @@ class InvestigationOrchestrator:
 
         return finding
 
-    async def _validate_synthesis(
+    def _validate_synthesis(
         self,
         finding: Finding,
         state: InvestigationState,
     ) -> None:
-        """Validate synthesis quality and capture training signal.
+        """Queue synthesis quality validation and training signal capture.
 
         Args:
             finding: The finding to validate.
             state: Current investigation state.
         """
-        assert self.validator is not None
+        assert self.validation_queue is not None
 
         # Construct SynthesisResponse from Finding for validation
         # Note: Some fields are approximated since Finding doesn't store all response fields
@@ -656,32 +932,48 @@ class InvestigationOrchestrator:
             f"({state.alert.deviation_pct}% deviation)"
         )
 
-        try:
-            validation_result = await self.validator.validate_synthesis(
+        self.validation_queue.submit(
+            SynthesisCheck(
+                tenant_id=state.tenant_id,
+                investigation_id=UUID(state.id),
                 response=synthesis_response,
                 alert_summary=alert_summary,
+                input_context={
+                    "alert_summary": alert_summary,
+                    "evidence_count": len(finding.evidence),
+                },
             )
+        )
 
-            logger.info(
-                f"synthesis_validated passed={validation_result.passed} "
-                f"composite={validation_result.assessment.composite_score:.2f}"
-            )
+    def _remember_finding(
+        self,
+        state: InvestigationState,
+        hypotheses: list[Hypothesis],
+        finding: Finding,
+    ) -> None:
+        """Remember a finding for similar future alerts, in the background.
 
-            # Capture training signal if repository is available
-            if self.training_repo:
-                await self.training_repo.record_signal(
-                    signal_type="synthesis",
-                    tenant_id=state.tenant_id,
-                    investigation_id=UUID(state.id),
-                    input_context={
-                        "alert_summary": alert_summary,
-                        "evidence_count": len(finding.evidence),
-                    },
-                    output_response=synthesis_response.model_dump(),
-                    automated_score=validation_result.assessment.composite_score,
-                    automated_dimensions=validation_result.training_signals,
-                )
+        Args:
+            state: Current investigation state.
+            hypotheses: Hypotheses the finding's evidence was collected for.
+            finding: The investigation's finding.
+        """
+        if self.finding_memory is None:
+            return
 
-        except Exception as e:
-            # Log but don't fail the investigation on validation errors
-            logger.warning(f"synthesis_validation_failed error={e}")
+        task = asyncio.create_task(
+            self.finding_memory.remember(state.tenant_id, state.alert, finding, hypotheses)
+        )
+        self._memory_tasks.add(task)
+        task.add_done_callback(self._memory_tasks.discard)
+
+    async def close(self) -> None:
+        """Finish queued validations and remembered findings.
+
+        Call at shutdown so accepted validations, their training signals
+        and findings being remembered are not lost.
+        """
+        if self._memory_tasks:
+            await asyncio.gather(*self._memory_tasks, return_exceptions=True)
+        if self.validation_queue is not None:
+            await self.validation_queue.close()
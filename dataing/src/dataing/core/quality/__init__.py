@@ -1,13 +1,30 @@
 """Quality validation module for LLM outputs."""
 
-from .assessment import HypothesisSetAssessment, QualityAssessment, ValidationResult
+from .assessment import (
+    BatchQualityAssessment,
+    HypothesisSetAssessment,
+    QualityAssessment,
+    ValidationResult,
+)
 from .judge import LLMJudgeValidator
-from .protocol import QualityValidator
+from .protocol import BatchInterpretationValidator, QualityValidator
+from .validation_queue import (
+    InterpretationCheck,
+    SynthesisCheck,
+    ValidationQueue,
+    ValidationQueueStats,
+)
 
 __all__ = [
+    "BatchInterpretationValidator",
+    "BatchQualityAssessment",
     "HypothesisSetAssessment",
+    "InterpretationCheck",
     "LLMJudgeValidator",
     "QualityAssessment",
     "QualityValidator",
+    "SynthesisCheck",
+    "ValidationQueue",
+    "ValidationQueueStats",
     "ValidationResult",
 ]
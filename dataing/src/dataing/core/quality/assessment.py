@@ -82,6 +82,16 @@ class ValidationResult(BaseModel):
         }
 
 
+class BatchQualityAssessment(BaseModel):
+    """Quality assessments of several responses judged in one request.
+
+    Attributes:
+        assessments: One assessment per response, in the order given.
+    """
+
+    assessments: list[QualityAssessment]
+
+
 class HypothesisSetAssessment(BaseModel):
     """Assessment of interpretation quality across hypothesis set.
 
@@ -8,9 +8,11 @@ from typing import TYPE_CHECKING
 from pydantic_ai import Agent
 from pydantic_ai.models.anthropic import AnthropicModel
 
-from .assessment import QualityAssessment, ValidationResult
+from .assessment import BatchQualityAssessment, QualityAssessment, ValidationResult
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from dataing.agents.models import (
         InterpretationResponse,
         SynthesisResponse,
@@ -74,12 +76,34 @@ Always identify the lowest_dimension and provide a specific improvement_suggesti
 (at least 20 characters) that explains how to improve that dimension."""
 
 
+def _describe_interpretation(
+    response: InterpretationResponse, hypothesis_title: str, query: str
+) -> str:
+    """Render an interpretation and what it was tested with for the judge."""
+    # Get optional fields safely
+    trigger = getattr(response, "trigger_identified", None) or "NOT PROVIDED"
+    diff_evidence = getattr(response, "differentiating_evidence", None) or "NOT PROVIDED"
+
+    return f"""HYPOTHESIS TESTED: {hypothesis_title}
+QUERY RUN: {query}
+
+RESPONSE:
+- interpretation: {response.interpretation}
+- causal_chain: {response.causal_chain}
+- trigger_identified: {trigger}
+- differentiating_evidence: {diff_evidence}
+- confidence: {response.confidence}
+- key_findings: {response.key_findings}
+- supports_hypothesis: {response.supports_hypothesis}"""
+
+
 class LLMJudgeValidator:
     """Quality validator using LLM-as-judge with dimensional scoring.
 
     Attributes:
         pass_threshold: Minimum composite score to pass validation.
         judge: Pydantic AI agent configured for quality assessment.
+        batch_judge: Agent that assesses several responses in one request.
     """
 
     def __init__(
@@ -102,6 +126,11 @@ class LLMJudgeValidator:
             output_type=QualityAssessment,
             system_prompt=JUDGE_SYSTEM_PROMPT,
         )
+        self.batch_judge: Agent[None, BatchQualityAssessment] = Agent(
+            model=AnthropicModel(model),
+            output_type=BatchQualityAssessment,
+            system_prompt=JUDGE_SYSTEM_PROMPT,
+        )
 
     async def validate_interpretation(
         self,
@@ -119,23 +148,9 @@ class LLMJudgeValidator:
         Returns:
             ValidationResult with pass/fail and dimensional scores.
         """
-        # Get optional fields safely
-        trigger = getattr(response, "trigger_identified", None) or "NOT PROVIDED"
-        diff_evidence = getattr(response, "differentiating_evidence", None) or "NOT PROVIDED"
-
         prompt = f"""Evaluate this interpretation:
 
-HYPOTHESIS TESTED: {hypothesis_title}
-QUERY RUN: {query}
-
-RESPONSE:
-- interpretation: {response.interpretation}
-- causal_chain: {response.causal_chain}
-- trigger_identified: {trigger}
-- differentiating_evidence: {diff_evidence}
-- confidence: {response.confidence}
-- key_findings: {response.key_findings}
-- supports_hypothesis: {response.supports_hypothesis}
+{_describe_interpretation(response, hypothesis_title, query)}
 
 Score each dimension. Apply differentiation bonus/penalty based on differentiating_evidence.
 Identify what needs improvement."""
@@ -147,6 +162,48 @@ Identify what needs improvement."""
             assessment=result.output,
         )
 
+    async def validate_interpretations(
+        self,
+        items: Sequence[tuple[InterpretationResponse, str, str]],
+    ) -> list[ValidationResult]:
+        """Validate several interpretation responses with one judge request.
+
+        Args:
+            items: (response, hypothesis_title, query) per interpretation.
+
+        Returns:
+            One ValidationResult per item, in the order given.
+
+        Raises:
+            ValueError: If the judge did not return one assessment per item.
+        """
+        sections = "\n\n".join(
+            f"### INTERPRETATION {i}\n\n{_describe_interpretation(*item)}"
+            for i, item in enumerate(items, start=1)
+        )
+        prompt = f"""Evaluate each of these {len(items)} interpretations independently:
+
+{sections}
+
+Return exactly {len(items)} assessments, one per interpretation, in the order given.
+For each, score every dimension, apply the differentiation bonus/penalty based on
+differentiating_evidence, and identify what needs improvement."""
+
+        result = await self.batch_judge.run(prompt)
+        assessments = result.output.assessments
+        if len(assessments) != len(items):
+            raise ValueError(
+                f"Judge returned {len(assessments)} assessments for {len(items)} interpretations"
+            )
+
+        return [
+            ValidationResult(
+                passed=assessment.composite_score >= self.pass_threshold,
+                assessment=assessment,
+            )
+            for assessment in assessments
+        ]
+
     async def validate_synthesis(
         self,
         response: SynthesisResponse,
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from dataing.agents.models import (
         InterpretationResponse,
         SynthesisResponse,
@@ -59,3 +61,26 @@ class QualityValidator(Protocol):
             ValidationResult with pass/fail and dimensional scores.
         """
         ...
+
+
+@runtime_checkable
+class BatchInterpretationValidator(Protocol):
+    """Validator that can judge several interpretations in one request.
+
+    Optional extension of QualityValidator. The validation queue uses it
+    to judge a backlog of interpretations with a single LLM call.
+    """
+
+    async def validate_interpretations(
+        self,
+        items: Sequence[tuple[InterpretationResponse, str, str]],
+    ) -> list[ValidationResult]:
+        """Validate several interpretation responses.
+
+        Args:
+            items: (response, hypothesis_title, query) per interpretation.
+
+        Returns:
+            One ValidationResult per item, in the order given.
+        """
+        ...
@@ -0,0 +1,350 @@
+"""Background queue that validates LLM outputs off the critical path.
+
+Validation never changes evidence or findings, so an investigation should
+not wait for it. The orchestrator submits each interpretation and
+synthesis to a ``ValidationQueue`` and moves on. A worker task then:
+
+- judges the interpretations waiting in the queue with one batched judge
+  request when the validator supports it, falling back to one request
+  each;
+- buffers the resulting training signals and writes them in bulk, once
+  enough have accumulated or the queue runs idle.
+
+The queue is bounded: when it is full, new work is dropped and counted
+rather than slowing investigations down. ``close`` stops intake, drains
+what was accepted and flushes the buffered signals, so a graceful
+shutdown loses nothing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import UUID
+
+import structlog
+
+from dataing.adapters.training.types import TrainingSignal
+
+from .protocol import BatchInterpretationValidator
+
+if TYPE_CHECKING:
+    from dataing.adapters.training.repository import TrainingSignalRepository
+    from dataing.agents.models import InterpretationResponse, SynthesisResponse
+
+    from .assessment import ValidationResult
+    from .protocol import QualityValidator
+
+logger = structlog.get_logger()
+
+# Validations accepted but not yet processed before new ones are dropped
+DEFAULT_MAX_PENDING = 256
+
+# Most interpretations judged in one batched judge request
+DEFAULT_BATCH_SIZE = 8
+
+# Buffered training signals that trigger a bulk write
+DEFAULT_FLUSH_SIZE = 32
+
+# Longest a graceful shutdown waits for accepted validations
+DEFAULT_SHUTDOWN_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class InterpretationCheck:
+    """An interpretation waiting for validation.
+
+    Attributes:
+        tenant_id: Tenant of the investigation.
+        investigation_id: Investigation the interpretation belongs to.
+        response: The interpretation to validate.
+        hypothesis_title: Title of the hypothesis being tested.
+        query: The SQL query that was executed.
+        input_context: Context recorded with the training signal.
+    """
+
+    tenant_id: UUID
+    investigation_id: UUID
+    response: InterpretationResponse
+    hypothesis_title: str
+    query: str
+    input_context: dict[str, Any]
+
+    signal_type: ClassVar[str] = "interpretation"
+
+
+@dataclass(frozen=True)
+class SynthesisCheck:
+    """A synthesis waiting for validation.
+
+    Attributes:
+        tenant_id: Tenant of the investigation.
+        investigation_id: Investigation the synthesis belongs to.
+        response: The synthesis to validate.
+        alert_summary: Summary of the original anomaly alert.
+        input_context: Context recorded with the training signal.
+    """
+
+    tenant_id: UUID
+    investigation_id: UUID
+    response: SynthesisResponse
+    alert_summary: str
+    input_context: dict[str, Any]
+
+    signal_type: ClassVar[str] = "synthesis"
+
+
+@dataclass
+class ValidationQueueStats:
+    """Counters of a ``ValidationQueue``.
+
+    Attributes:
+        submitted: Validations accepted into the queue.
+        dropped: Validations rejected because the queue was full or closed.
+        validated: Validations the judge scored.
+        failed: Validations whose judge call failed.
+        judge_calls: Judge requests made, batched ones counting once.
+        signals_recorded: Training signals written.
+        signals_failed: Training signals whose write failed.
+    """
+
+    submitted: int = 0
+    dropped: int = 0
+    validated: int = 0
+    failed: int = 0
+    judge_calls: int = 0
+    signals_recorded: int = 0
+    signals_failed: int = 0
+
+
+Check = InterpretationCheck | SynthesisCheck
+
+
+class ValidationQueue:
+    """Bounded queue that validates outputs and records training signals.
+
+    Example:
+        queue = ValidationQueue(validator, training_repo)
+        queue.submit(check)  # returns at once
+        await queue.close()  # at shutdown: drain and flush
+
+    Attributes:
+        validator: Judge of output quality.
+        training_repo: Where training signals are written, if anywhere.
+        batch_size: Most interpretations judged in one request.
+        flush_size: Buffered signals that trigger a bulk write.
+        stats: Counters, e.g. for logging or metrics.
+    """
+
+    def __init__(
+        self,
+        validator: QualityValidator,
+        training_repo: TrainingSignalRepository | None = None,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            validator: Judge of output quality. Interpretations are judged
+                in batches if it implements BatchInterpretationValidator.
+            training_repo: Where training signals are written, if anywhere.
+            max_pending: Accepted validations waiting before new ones are
+                dropped.
+            batch_size: Most interpretations judged in one request.
+            flush_size: Buffered signals that trigger a bulk write.
+        """
+        self.validator = validator
+        self.training_repo = training_repo
+        self.batch_size = batch_size
+        self.flush_size = flush_size
+        self.stats = ValidationQueueStats()
+        self._queue: asyncio.Queue[Check] = asyncio.Queue(maxsize=max_pending)
+        self._signals: list[TrainingSignal] = []
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Validations accepted but not yet processed."""
+        return self._queue.qsize()
+
+    def submit(self, check: Check) -> bool:
+        """Queue an output for validation without waiting for it.
+
+        Must be called from a running event loop; the worker starts on the
+        first submission.
+
+        Args:
+            check: The output to validate.
+
+        Returns:
+            True if accepted, False if dropped because the queue is full
+            or closed.
+        """
+        if self._closed:
+            self.stats.dropped += 1
+            logger.warning("validation_dropped", reason="closed", signal_type=check.signal_type)
+            return False
+
+        try:
+            self._queue.put_nowait(check)
+        except asyncio.QueueFull:
+            self.stats.dropped += 1
+            logger.warning(
+                "validation_dropped",
+                reason="queue_full",
+                signal_type=check.signal_type,
+                max_pending=self._queue.maxsize,
+            )
+            return False
+
+        self.stats.submitted += 1
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(
+                self._run(), name="validation-queue"
+            )
+        return True
+
+    async def join(self) -> None:
+        """Wait until every accepted validation is processed and recorded."""
+        await self._queue.join()
+        await self._flush()
+
+    async def close(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Stop accepting work, drain the queue and flush buffered signals.
+
+        Args:
+            timeout: Longest to wait for accepted validations to finish.
+        """
+        self._closed = True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("validation_queue_shutdown_timeout", pending=self.pending)
+
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        await self._flush()
+        logger.info(
+            "validation_queue_closed",
+            validated=self.stats.validated,
+            dropped=self.stats.dropped,
+            signals_recorded=self.stats.signals_recorded,
+        )
+
+    async def _run(self) -> None:
+        """Process batches until cancelled."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._process(batch)
+                if len(self._signals) >= self.flush_size or self._queue.empty():
+                    await self._flush()
+            except Exception as e:
+                # The worker must outlive any one batch
+                logger.warning("validation_batch_failed", error=str(e), size=len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process(self, batch: list[Check]) -> None:
+        """Judge a batch and buffer its training signals."""
+        interpretations = [c for c in batch if isinstance(c, InterpretationCheck)]
+        syntheses = [c for c in batch if isinstance(c, SynthesisCheck)]
+
+        results: list[tuple[Check, ValidationResult]] = []
+        results.extend(await self._judge_interpretations(interpretations))
+        for synthesis in syntheses:
+            result = await self._judge(synthesis)
+            if result is not None:
+                results.append((synthesis, result))
+
+        for check, result in results:
+            logger.info(
+                f"{check.signal_type}_validated",
+                passed=result.passed,
+                composite=round(result.assessment.composite_score, 2),
+            )
+            if self.training_repo is not None:
+                self._signals.append(
+                    TrainingSignal(
+                        signal_type=check.signal_type,
+                        tenant_id=check.tenant_id,
+                        investigation_id=check.investigation_id,
+                        input_context=check.input_context,
+                        output_response=check.response.model_dump(),
+                        automated_score=result.assessment.composite_score,
+                        automated_dimensions=result.training_signals,
+                    )
+                )
+
+    async def _judge_interpretations(
+        self, checks: list[InterpretationCheck]
+    ) -> list[tuple[Check, ValidationResult]]:
+        """Judge interpretations in one request if possible, else one each."""
+        if len(checks) > 1 and isinstance(self.validator, BatchInterpretationValidator):
+            self.stats.judge_calls += 1
+            try:
+                results = await self.validator.validate_interpretations(
+                    [(c.response, c.hypothesis_title, c.query) for c in checks]
+                )
+            except Exception as e:
+                logger.warning("batch_validation_failed", error=str(e), size=len(checks))
+            else:
+                self.stats.validated += len(checks)
+                return list(zip(checks, results, strict=True))
+
+        judged: list[tuple[Check, ValidationResult]] = []
+        for check in checks:
+            result = await self._judge(check)
+            if result is not None:
+                judged.append((check, result))
+        return judged
+
+    async def _judge(self, check: Check) -> ValidationResult | None:
+        """Judge one output; None if the judge call failed."""
+        self.stats.judge_calls += 1
+        try:
+            if isinstance(check, InterpretationCheck):
+                result = await self.validator.validate_interpretation(
+                    response=check.response,
+                    hypothesis_title=check.hypothesis_title,
+                    query=check.query,
+                )
+            else:
+                result = await self.validator.validate_synthesis(
+                    response=check.response,
+                    alert_summary=check.alert_summary,
+                )
+        except Exception as e:
+            # Log but never let validation affect an investigation
+            self.stats.failed += 1
+            logger.warning(f"{check.signal_type}_validation_failed", error=str(e))
+            return None
+
+        self.stats.validated += 1
+        return result
+
+    async def _flush(self) -> None:
+        """Write the buffered training signals in one bulk insert."""
+        if not self._signals or self.training_repo is None:
+            return
+
+        signals, self._signals = self._signals, []
+        try:
+            self.stats.signals_recorded += await self.training_repo.record_signals(signals)
+        except Exception as e:
+            self.stats.signals_failed += len(signals)
+            logger.warning("training_signal_flush_failed", error=str(e), count=len(signals))
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 EventType = Literal[
     "investigation_started",
     "context_gathered",
+    "prior_findings_recalled",
     "schema_discovery_failed",
     "hypothesis_generated",
     "query_submitted",
@@ -152,6 +153,21 @@ class InvestigationState:
             if e.type == "query_failed" and e.data.get("hypothesis_id") == hypothesis_id
         ]
 
+    def get_query_errors(self, hypothesis_id: str) -> list[str]:
+        """Get the error messages of failed queries for reflexion.
+
+        Args:
+            hypothesis_id: ID of the hypothesis.
+
+        Returns:
+            List of error messages, oldest first.
+        """
+        return [
+            str(e.data.get("error", ""))
+            for e in self.events
+            if e.type == "query_failed" and e.data.get("hypothesis_id") == hypothesis_id
+        ]
+
     def get_all_queries(self, hypothesis_id: str) -> list[str]:
         """Get all query texts submitted for a hypothesis.
 
@@ -12,19 +12,34 @@ from uuid import UUID
 
 from cryptography.fernet import Fernet
 from fastapi import Request
+from opentelemetry import metrics
 
+from bond import LLMGovernor, set_default_governor
+from bond.tools.memory import MemoryBackendType, create_memory_backend
 from dataing.adapters.audit import AuditRepository
 from dataing.adapters.auth.recovery_admin import AdminContactRecoveryAdapter
 from dataing.adapters.auth.recovery_console import ConsoleRecoveryAdapter
 from dataing.adapters.auth.recovery_email import EmailPasswordRecoveryAdapter
 from dataing.adapters.context import ContextEngine
 from dataing.adapters.datasource import BaseAdapter, get_registry
-from dataing.adapters.db.app_db import AppDatabase
+from dataing.adapters.datasource.sql.federated import (
+    FEDERATED_SOURCE_TYPES,
+    FederatedAdapter,
+    federation_alias,
+)
+from dataing.adapters.db.app_db import AppDatabase, tenant_settings
 from dataing.adapters.entitlements import DatabaseEntitlementsAdapter
+from dataing.adapters.finding_memory import FindingMemory
 from dataing.adapters.investigation_feedback import InvestigationFeedbackAdapter
 from dataing.adapters.lineage import BaseLineageAdapter, LineageAdapter, get_lineage_registry
-from dataing.agents import AgentClient
+from dataing.adapters.llm_cache import AppDatabaseResponseStore, SQLiteResponseStore
 from dataing.adapters.notifications.email import EmailConfig, EmailNotifier
+from dataing.agents import AgentClient
+from dataing.agents.response_cache import (
+    DEFAULT_LLM_CACHE_TTL_SECONDS,
+    CacheMode,
+    LLMResponseCache,
+)
 from dataing.core.auth.recovery import PasswordRecoveryAdapter
 from dataing.core.orchestrator import InvestigationOrchestrator, OrchestratorConfig
 from dataing.safety.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
@@ -45,6 +60,42 @@ class Settings:
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
         self.llm_model = os.getenv("LLM_MODEL", "claude-sonnet-4-20250514")
 
+        # Model per agent role; roles without one use LLM_MODEL.
+        # SQL generation and reflexion are mechanical, so they default to a
+        # fast model and escalate to LLM_MODEL when its queries keep failing.
+        self.llm_role_models = {
+            "hypothesis": os.getenv("LLM_HYPOTHESIS_MODEL", self.llm_model),
+            "query": os.getenv("LLM_QUERY_MODEL", "claude-3-5-haiku-20241022"),
+            "interpretation": os.getenv("LLM_INTERPRETATION_MODEL", self.llm_model),
+            "synthesis": os.getenv("LLM_SYNTHESIS_MODEL", self.llm_model),
+        }
+
+        # LLM response cache settings
+        # "read_write" = serve and record responses
+        # "replay" = serve only recorded responses (deterministic re-runs)
+        # "off" = always call the model
+        self.llm_cache_mode = os.getenv("LLM_CACHE_MODE", "read_write")
+        # "app_db" = shared table in the app database, "sqlite" = local file
+        self.llm_cache_backend = os.getenv("LLM_CACHE_BACKEND", "app_db")
+        self.llm_cache_path = os.getenv("LLM_CACHE_PATH", "")
+        self.llm_cache_ttl_seconds = int(
+            os.getenv("LLM_CACHE_TTL_SECONDS", str(DEFAULT_LLM_CACHE_TTL_SECONDS))
+        )
+
+        # LLM rate limit settings, shared by every agent in the process
+        # Quotas of 0 are unlimited; concurrency adapts below the maximum
+        self.llm_requests_per_minute = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "50"))
+        self.llm_tokens_per_minute = int(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+        self.llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
+        # Finding memory settings, for warm-starting similar investigations
+        # "" = off, "pgvector" = app database, "qdrant" = Qdrant server
+        self.finding_memory_backend = os.getenv("FINDING_MEMORY_BACKEND", "")
+        self.finding_memory_qdrant_url = os.getenv("FINDING_MEMORY_QDRANT_URL", "")
+        self.finding_memory_embedding_model = os.getenv(
+            "FINDING_MEMORY_EMBEDDING_MODEL", "openai:text-embedding-3-small"
+        )
+
         # Circuit breaker settings
         self.max_total_queries = int(os.getenv("MAX_TOTAL_QUERIES", "50"))
         self.max_queries_per_hypothesis = int(os.getenv("MAX_QUERIES_PER_HYPOTHESIS", "5"))
@@ -74,6 +125,73 @@ class Settings:
 settings = Settings()
 
 
+def build_finding_memory(app_db: AppDatabase) -> FindingMemory | None:
+    """Create the finding memory configured in settings.
+
+    Args:
+        app_db: Application database, used by the ``pgvector`` backend.
+
+    Returns:
+        The finding memory, or None if it is off.
+    """
+    if not settings.finding_memory_backend:
+        return None
+    backend_type = MemoryBackendType(settings.finding_memory_backend)
+    return FindingMemory(
+        create_memory_backend(
+            backend_type,
+            pool=app_db.pool if backend_type == MemoryBackendType.PGVECTOR else None,
+            qdrant_url=settings.finding_memory_qdrant_url or None,
+            embedding_model=settings.finding_memory_embedding_model,
+        )
+    )
+
+
+def build_llm_governor() -> LLMGovernor:
+    """Create the LLM governor configured in settings.
+
+    Each call's wait for admission is recorded in the
+    ``llm.governor.queue_wait`` histogram, by priority.
+
+    Returns:
+        The governor.
+    """
+    queue_wait = metrics.get_meter("dataing").create_histogram(
+        "llm.governor.queue_wait",
+        unit="s",
+        description="Time LLM calls wait for admission by the rate-limit governor",
+    )
+    return LLMGovernor(
+        requests_per_minute=settings.llm_requests_per_minute or None,
+        tokens_per_minute=settings.llm_tokens_per_minute or None,
+        max_concurrency=settings.llm_max_concurrency,
+        on_queue_wait=lambda priority, seconds: queue_wait.record(
+            seconds, {"priority": priority.name.lower()}
+        ),
+    )
+
+
+def build_llm_response_cache(app_db: AppDatabase) -> LLMResponseCache | None:
+    """Create the LLM response cache configured in settings.
+
+    Args:
+        app_db: Application database, used by the ``app_db`` backend.
+
+    Returns:
+        The cache, or None if caching is off.
+    """
+    mode = CacheMode(settings.llm_cache_mode)
+    if mode == CacheMode.OFF:
+        return None
+    if settings.llm_cache_backend == "sqlite":
+        store: AppDatabaseResponseStore | SQLiteResponseStore = SQLiteResponseStore(
+            settings.llm_cache_path or None
+        )
+    else:
+        store = AppDatabaseResponseStore(app_db)
+    return LLMResponseCache(store, mode=mode, ttl_seconds=settings.llm_cache_ttl_seconds)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan - setup and teardown.
@@ -95,9 +213,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     entitlements_adapter = DatabaseEntitlementsAdapter(pool=app_db.pool)
     app.state.entitlements_adapter = entitlements_adapter
 
+    # Every agent in the process shares one governor
+    governor = build_llm_governor()
+    set_default_governor(governor)
+
     llm = AgentClient(
         api_key=settings.anthropic_api_key,
         model=settings.llm_model,
+        response_cache=build_llm_response_cache(app_db),
+        role_models=settings.llm_role_models,
+        governor=governor,
     )
 
     # Create context engine
@@ -119,6 +244,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         context_engine=context_engine,
         circuit_breaker=circuit_breaker,
         config=OrchestratorConfig(),
+        finding_memory=build_finding_memory(app_db),
     )
 
     # Initialize investigation feedback adapter
@@ -233,6 +359,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         except Exception as e:
             logger.warning(f"adapter_close_failed: {cache_key}, error={e}")
 
+    # Finish background validations before the database goes away
+    await orchestrator.close()
+
+    set_default_governor(None)
     await app_db.close()
 
 
@@ -368,6 +498,36 @@ def get_app_db(request: Request) -> AppDatabase:
     return app_db
 
 
+def _decrypt_connection_config(ds: dict[str, Any], encryption_key: str | None) -> dict[str, Any]:
+    """Decrypt a data source's stored connection configuration.
+
+    Args:
+        ds: Data source row from the app database.
+        encryption_key: Fernet key the configuration was encrypted with.
+
+    Returns:
+        The connection configuration.
+
+    Raises:
+        RuntimeError: If the key is missing or decryption fails.
+    """
+    if not encryption_key:
+        raise RuntimeError(
+            "ENCRYPTION_KEY not set - check DATADR_ENCRYPTION_KEY or ENCRYPTION_KEY env vars"
+        )
+
+    encrypted_config = ds.get("connection_config_encrypted", "")
+    try:
+        f = Fernet(encryption_key.encode())
+        decrypted = f.decrypt(encrypted_config.encode()).decode()
+        config: dict[str, Any] = json.loads(decrypted)
+    except Exception as e:
+        raise RuntimeError(
+            f"Failed to decrypt connection config for data source {ds.get('id')}: {e}"
+        ) from e
+    return config
+
+
 async def get_tenant_adapter(
     request: Request,
     tenant_id: UUID,
@@ -415,35 +575,7 @@ async def get_tenant_adapter(
         logger.debug(f"adapter_cache_hit: {cache_key}")
         return adapter_cache[cache_key]
 
-    # Decrypt connection config
-    if not encryption_key:
-        raise RuntimeError(
-            "ENCRYPTION_KEY not set - check DATADR_ENCRYPTION_KEY or ENCRYPTION_KEY env vars"
-        )
-
-    encrypted_config = ds.get("connection_config_encrypted", "")
-    key_preview = encryption_key[:10] if encryption_key else "None"
-    print(f"[DECRYPT DEBUG] encryption_key type: {type(encryption_key)}", flush=True)
-    print(f"[DECRYPT DEBUG] encryption_key full: {encryption_key}", flush=True)
-    print(
-        f"[DECRYPT DEBUG] encryption_key length: {len(encryption_key) if encryption_key else 0}",
-        flush=True,
-    )
-    print(f"[DECRYPT DEBUG] encrypted_config length: {len(encrypted_config)}", flush=True)
-    print(f"[DECRYPT DEBUG] encrypted_config start: {encrypted_config[:50]}", flush=True)
-    try:
-        f = Fernet(encryption_key.encode())
-        decrypted = f.decrypt(encrypted_config.encode()).decode()
-        config: dict[str, Any] = json.loads(decrypted)
-        print(f"[DECRYPT DEBUG] SUCCESS: {decrypted}", flush=True)
-    except Exception as e:
-        print(f"[DECRYPT DEBUG] FAILED: {e}", flush=True)
-        import traceback
-
-        traceback.print_exc()
-        raise RuntimeError(
-            f"Failed to decrypt connection config (key_prefix={key_preview}): {e}"
-        ) from e
+    config = _decrypt_connection_config(ds, encryption_key)
 
     # Create adapter using registry
     registry = get_registry()
@@ -478,9 +610,81 @@ async def get_default_tenant_adapter(request: Request, tenant_id: UUID) -> BaseA
     return await get_tenant_adapter(request, tenant_id)
 
 
+async def get_investigation_adapter(request: Request, tenant_id: UUID) -> BaseAdapter:
+    """Get the adapter investigations query for a tenant.
+
+    Tenants with a single active data source get that source's adapter.
+    With several, the sources DuckDB can attach or read (see
+    FEDERATED_SOURCE_TYPES) are combined in a FederatedAdapter, so one
+    investigation can join across them. Each source is addressed by an
+    alias derived from its name. Sources that cannot be federated are left
+    out, and if the default source is one of them it is queried alone, as
+    it would be without federation.
+
+    Args:
+        request: The current request (for accessing app state).
+        tenant_id: The tenant's UUID.
+
+    Returns:
+        A connected adapter.
+    """
+    app_db: AppDatabase = request.app.state.app_db
+    adapter_cache: dict[str, BaseAdapter] = request.app.state.adapter_cache
+    encryption_key: str | None = request.app.state.encryption_key
+
+    data_sources = await app_db.list_data_sources(tenant_id)
+    active_sources = [d for d in data_sources if d.get("is_active", True)]
+    federated = [d for d in active_sources if d["type"] in FEDERATED_SOURCE_TYPES]
+    if len(federated) < 2:
+        return await get_tenant_adapter(request, tenant_id)
+    if federated[0] is not active_sources[0]:
+        logger.info(
+            f"federation_skipped: default source {active_sources[0].get('name')} "
+            f"of type {active_sources[0]['type']} cannot be federated"
+        )
+        return await get_tenant_adapter(request, tenant_id)
+
+    # Key the cache on the member set so adding or removing a source rebuilds it
+    member_ids = ",".join(sorted(str(d["id"]) for d in federated))
+    cache_key = f"{tenant_id}:federated:{member_ids}"
+    if cache_key in adapter_cache:
+        logger.debug(f"adapter_cache_hit: {cache_key}")
+        return adapter_cache[cache_key]
+
+    aliases: list[str] = []
+    members = []
+    for ds in federated:
+        alias = federation_alias(ds.get("name") or str(ds["id"]), aliases)
+        aliases.append(alias)
+        members.append(
+            {
+                "alias": alias,
+                "type": ds["type"],
+                "config": _decrypt_connection_config(ds, encryption_key),
+            }
+        )
+
+    excluded = [d.get("name") or str(d["id"]) for d in active_sources if d not in federated]
+    if excluded:
+        logger.warning(f"federation_sources_excluded: tenant={tenant_id}, sources={excluded}")
+
+    adapter = FederatedAdapter({"sources": members})
+    try:
+        await adapter.connect()
+    except Exception as e:
+        raise RuntimeError(f"Failed to connect federated adapter: {e}") from e
+
+    adapter_cache[cache_key] = adapter
+    logger.info(
+        f"adapter_created: type=federated, sources={adapter.attached_aliases}, key={cache_key}"
+    )
+    return adapter
+
+
 async def get_tenant_lineage_adapter(
     request: Request,
     tenant_id: UUID,
+    settings: dict[str, Any] | None = None,
 ) -> LineageAdapter | None:
     """Get a lineage adapter for a tenant based on their configuration.
 
@@ -490,21 +694,19 @@ async def get_tenant_lineage_adapter(
     Args:
         request: The current request (for accessing app state).
         tenant_id: The tenant's UUID.
+        settings: The tenant's settings if already loaded; read from the
+            tenants table otherwise.
 
     Returns:
         A LineageAdapter if configured, None if no lineage providers.
     """
-    app_db: AppDatabase = request.app.state.app_db
-
-    # Get tenant settings
-    tenant = await app_db.get_tenant(tenant_id)
-    if not tenant:
-        logger.warning(f"Tenant {tenant_id} not found for lineage adapter")
-        return None
-
-    settings = tenant.get("settings", {})
-    if isinstance(settings, str):
-        settings = json.loads(settings)
+    if settings is None:
+        app_db: AppDatabase = request.app.state.app_db
+        tenant = await app_db.get_tenant(tenant_id)
+        if not tenant:
+            logger.warning(f"Tenant {tenant_id} not found for lineage adapter")
+            return None
+        settings = tenant_settings(tenant)
 
     lineage_providers = settings.get("lineage_providers", [])
     if not lineage_providers:
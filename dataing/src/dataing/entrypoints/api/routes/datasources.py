@@ -14,7 +14,7 @@ from uuid import UUID
 
 import structlog
 from cryptography.fernet import Fernet
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from dataing.adapters.audit import audited
@@ -32,6 +32,7 @@ from dataing.entrypoints.api.middleware.auth import (
     verify_api_key,
 )
 from dataing.entrypoints.api.middleware.entitlements import require_under_limit
+from dataing.services.schema_sync import SchemaSyncService
 
 logger = structlog.get_logger(__name__)
 
@@ -185,11 +186,20 @@ class StatsResponse(BaseModel):
 
 
 class SyncResponse(BaseModel):
-    """Response for schema sync."""
+    """Response for schema sync.
+
+    Sync runs as a background job; poll the job for progress.
+    """
 
     datasets_synced: int
     datasets_removed: int
     message: str
+    job_id: str | None = None
+    status: str = "completed"
+    phase: str | None = None
+    tables_discovered: int = 0
+    tables_processed: int = 0
+    error: str | None = None
 
 
 class DatasetSummary(BaseModel):
@@ -307,6 +317,7 @@ async def test_connection(
 async def create_datasource(
     request: Request,
     body: CreateDataSourceRequest,
+    background_tasks: BackgroundTasks,
     auth: WriteScopeDep,
     app_db: AppDbDep,
 ) -> DataSourceResponse:
@@ -362,38 +373,14 @@ async def create_datasource(
     # Update health check status
     await app_db.update_data_source_health(db_result["id"], "healthy")
 
-    # Auto-sync schema to register datasets
+    # Auto-sync schema in the background to register datasets
     try:
-        adapter = registry.create(source_type, body.config)
-        async with adapter:
-            schema = await adapter.get_schema(SchemaFilter(max_tables=10000))
-
-        dataset_records: list[dict[str, Any]] = []
-        for catalog in schema.catalogs:
-            for schema_obj in catalog.schemas:
-                for table in schema_obj.tables:
-                    dataset_records.append(
-                        {
-                            "native_path": table.native_path,
-                            "name": table.name,
-                            "table_type": table.table_type,
-                            "schema_name": schema_obj.name,
-                            "catalog_name": catalog.name,
-                            "row_count": table.row_count,
-                            "column_count": len(table.columns),
-                        }
-                    )
-
-        await app_db.upsert_datasets(
-            auth.tenant_id,
-            UUID(str(db_result["id"])),
-            dataset_records,
-        )
-        logger.info(
-            "Auto-sync completed for datasource",
-            datasource_id=str(db_result["id"]),
-            datasets_synced=len(dataset_records),
-        )
+        sync_service = SchemaSyncService(app_db)
+        job, should_run = await sync_service.start(auth.tenant_id, UUID(str(db_result["id"])))
+        if should_run:
+            background_tasks.add_task(
+                sync_service.run, job, registry.create(source_type, body.config)
+            )
     except Exception as e:
         # Log but don't fail - datasource was created successfully
         logger.warning(
@@ -811,17 +798,45 @@ async def get_column_stats(
         ) from e
 
 
-@router.post("/{datasource_id}/sync", response_model=SyncResponse)
+def _sync_response(job: dict[str, Any]) -> SyncResponse:
+    """Build a sync response from a schema sync job row."""
+    status = job["status"]
+    if status == "completed":
+        message = f"Synced {job['datasets_changed']} datasets, removed {job['datasets_removed']}"
+    elif status == "failed":
+        message = f"Schema sync failed: {job.get('error')}"
+    else:
+        message = (
+            f"Schema sync {status}: {job['tables_processed']}/{job['tables_discovered']} "
+            "tables processed"
+        )
+    return SyncResponse(
+        datasets_synced=job["datasets_changed"],
+        datasets_removed=job["datasets_removed"],
+        message=message,
+        job_id=str(job["id"]),
+        status=status,
+        phase=job.get("phase"),
+        tables_discovered=job["tables_discovered"],
+        tables_processed=job["tables_processed"],
+        error=job.get("error"),
+    )
+
+
+@router.post("/{datasource_id}/sync", response_model=SyncResponse, status_code=202)
 @audited(action="datasource.sync", resource_type="datasource")
 async def sync_datasource_schema(
     datasource_id: UUID,
+    background_tasks: BackgroundTasks,
     auth: AuthDep,
     app_db: AppDbDep,
 ) -> SyncResponse:
-    """Sync schema and register/update datasets.
+    """Start a schema sync that registers/updates datasets.
 
-    Discovers all tables from the data source and upserts them
-    into the datasets table. Soft-deletes datasets that no longer exist.
+    Discovers all tables from the data source in a background job, writes
+    only the datasets that changed and soft-deletes datasets that no longer
+    exist. Returns the job immediately; a sync already in progress is
+    returned instead of starting another, and a failed one is resumed.
     """
     ds = await app_db.get_data_source(datasource_id, auth.tenant_id)
 
@@ -848,58 +863,37 @@ async def sync_datasource_schema(
             detail=f"Failed to decrypt configuration: {e!s}",
         ) from e
 
-    # Get schema
     try:
         adapter = registry.create(source_type, config)
-        async with adapter:
-            schema = await adapter.get_schema(SchemaFilter(max_tables=10000))
-
-        # Build dataset records from schema
-        dataset_records: list[dict[str, Any]] = []
-        for catalog in schema.catalogs:
-            for schema_obj in catalog.schemas:
-                for table in schema_obj.tables:
-                    dataset_records.append(
-                        {
-                            "native_path": table.native_path,
-                            "name": table.name,
-                            "table_type": table.table_type,
-                            "schema_name": schema_obj.name,
-                            "catalog_name": catalog.name,
-                            "row_count": table.row_count,
-                            "column_count": len(table.columns),
-                        }
-                    )
-
-        # Upsert datasets
-        synced_count = await app_db.upsert_datasets(
-            auth.tenant_id,
-            datasource_id,
-            dataset_records,
-        )
-
-        # Soft-delete removed datasets
-        active_paths = {d["native_path"] for d in dataset_records}
-        removed_count = await app_db.deactivate_stale_datasets(
-            auth.tenant_id,
-            datasource_id,
-            active_paths,
-        )
-
-        return SyncResponse(
-            datasets_synced=synced_count,
-            datasets_removed=removed_count,
-            message=f"Synced {synced_count} datasets, removed {removed_count}",
-        )
-
-    except HTTPException:
-        raise
+        sync_service = SchemaSyncService(app_db)
+        job, should_run = await sync_service.start(auth.tenant_id, datasource_id)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Schema sync failed: {e!s}",
         ) from e
 
+    if should_run:
+        background_tasks.add_task(sync_service.run, job, adapter)
+
+    return _sync_response(job)
+
+
+@router.get("/{datasource_id}/sync/{job_id}", response_model=SyncResponse)
+async def get_sync_job(
+    datasource_id: UUID,
+    job_id: UUID,
+    auth: AuthDep,
+    app_db: AppDbDep,
+) -> SyncResponse:
+    """Get the progress of a schema sync job."""
+    job = await app_db.get_schema_sync_job(job_id, auth.tenant_id)
+
+    if not job or job["datasource_id"] != datasource_id:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+
+    return _sync_response(job)
+
 
 @router.get("/{datasource_id}/datasets", response_model=DatasourceDatasetsResponse)
 async def list_datasource_datasets(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import uuid
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
@@ -17,7 +18,10 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from dataing.adapters.audit import audited
-from dataing.adapters.db.app_db import AppDatabase
+from dataing.adapters.db.app_db import AppDatabase, tenant_settings
+from dataing.agents.response_cache import llm_cache_enabled, llm_cache_scope
+from dataing.agents.streaming import TokenStream
+from dataing.agents.telemetry import LLMTelemetry, llm_usage_scope
 from dataing.core.domain_types import AnomalyAlert, MetricSpec
 from dataing.core.entitlements.features import Feature
 from dataing.core.orchestrator import InvestigationOrchestrator
@@ -26,13 +30,15 @@ from dataing.core.state import InvestigationState
 from dataing.entrypoints.api.deps import (
     get_app_db,
     get_context_engine_for_tenant,
-    get_default_tenant_adapter,
+    get_investigation_adapter,
     get_investigations,
     get_orchestrator,
     get_tenant_lineage_adapter,
 )
 from dataing.entrypoints.api.middleware.auth import ApiKeyContext, verify_api_key
 from dataing.entrypoints.api.middleware.entitlements import require_under_limit
+from dataing.safety.cost_gate import QueryBudget
+from dataing.services.usage import UsageTracker
 
 router = APIRouter(prefix="/investigations", tags=["investigations"])
 
@@ -94,6 +100,30 @@ class InvestigationStatusResponse(BaseModel):
     error: str | None = None
 
 
+async def _record_llm_usage(
+    app_db: AppDatabase,
+    tenant_id: uuid.UUID,
+    investigation_id: str,
+    telemetry: LLMTelemetry,
+) -> None:
+    """Record an investigation's LLM usage per agent role and model.
+
+    Failures are logged; they never fail the investigation.
+    """
+    try:
+        cost = await UsageTracker(app_db).record_llm_telemetry(
+            tenant_id, telemetry, investigation_id=uuid.UUID(investigation_id)
+        )
+        logger.info(
+            "investigation_llm_usage",
+            investigation_id=investigation_id,
+            cost=round(cost, 4),
+            roles=telemetry.summary(),
+        )
+    except Exception as e:
+        logger.warning("llm_usage_record_failed", investigation_id=investigation_id, error=str(e))
+
+
 @router.post("/", response_model=InvestigationResponse)
 @audited(action="investigation.create", resource_type="investigation")
 @require_under_limit(Feature.MAX_INVESTIGATIONS_PER_MONTH)
@@ -104,6 +134,7 @@ async def create_investigation(
     auth: AuthDep,
     orchestrator: OrchestratorDep,
     investigations: InvestigationsDep,
+    app_db: AppDbDep,
 ) -> InvestigationResponse:
     """Start a new investigation.
 
@@ -145,6 +176,9 @@ async def create_investigation(
         alert=alert,
     )
 
+    # Agent output is streamed token by token to SSE subscribers
+    token_stream = TokenStream()
+
     # Store initial state
     investigations[investigation_id] = {
         "state": state,
@@ -152,16 +186,22 @@ async def create_investigation(
         "status": "started",
         "created_at": datetime.now(UTC),
         "tenant_id": str(auth.tenant_id),
+        "token_stream": token_stream,
     }
 
     # Run investigation in background with tenant's data source
     async def run_investigation() -> None:
         try:
-            # Resolve tenant's data source adapter using AdapterRegistry
-            data_adapter = await get_default_tenant_adapter(request, auth.tenant_id)
+            # Resolve the tenant's data sources, federated if there are several
+            data_adapter = await get_investigation_adapter(request, auth.tenant_id)
+
+            # Read the tenant's settings once for lineage, budget and caching
+            settings = tenant_settings(await app_db.get_tenant(auth.tenant_id))
 
             # Get tenant's lineage adapter if configured
-            lineage_adapter = await get_tenant_lineage_adapter(request, auth.tenant_id)
+            lineage_adapter = await get_tenant_lineage_adapter(
+                request, auth.tenant_id, settings=settings
+            )
 
             # Create context engine with tenant's lineage adapter
             context_engine = get_context_engine_for_tenant(request, lineage_adapter)
@@ -169,10 +209,26 @@ async def create_investigation(
             # Update orchestrator with tenant-specific context engine
             orchestrator.context_engine = context_engine
 
+            # Apply the tenant's scan budget for generated queries
+            query_budget = QueryBudget.from_tenant_settings(settings)
+            cache_enabled = llm_cache_enabled(settings)
+
             # Run investigation against tenant's actual data
             # Cast to SQLAdapter since investigations require SQL capabilities
             sql_adapter = cast("SQLAdapter", data_adapter)
-            finding = await orchestrator.run_investigation(state, sql_adapter)
+            with (
+                llm_cache_scope(auth.tenant_id, enabled=cache_enabled),
+                llm_usage_scope() as llm_usage,
+            ):
+                try:
+                    finding = await orchestrator.run_investigation(
+                        state, sql_adapter, handlers=token_stream, query_budget=query_budget
+                    )
+                finally:
+                    # Send the last frames before the status says we are done
+                    token_stream.close()
+                    # Failed investigations still spent tokens
+                    await _record_llm_usage(app_db, auth.tenant_id, investigation_id, llm_usage)
             investigations[investigation_id]["finding"] = finding.model_dump()
             investigations[investigation_id]["status"] = "completed"
         except Exception as e:
@@ -296,34 +352,54 @@ async def stream_events(
             pass
 
     async def event_generator() -> AsyncIterator[str]:
-        """Generate SSE events."""
+        """Generate SSE events, interleaved with token frames of agent output."""
         last_event_count = 0
+        token_stream: TokenStream | None = inv.get("token_stream")
+        subscription = token_stream.subscribe() if token_stream else None
 
-        while True:
-            inv = investigations.get(investigation_id)
-            if not inv:
-                break
-
-            state: InvestigationState = inv["state"]
-            current_events = state.events
-
-            # Send new events
-            if len(current_events) > last_event_count:
-                for event in current_events[last_event_count:]:
-                    event_data = {
-                        "type": event.type,
-                        "timestamp": event.timestamp.isoformat(),
-                        "data": event.data,
-                    }
-                    yield f"data: {event_data}\n\n"
-                last_event_count = len(current_events)
-
-            # Check if investigation is complete
-            if inv["status"] in ("completed", "failed"):
-                yield f'data: {{"type": "investigation_ended", "status": "{inv["status"]}"}}\n\n'
-                break
-
-            await asyncio.sleep(0.5)
+        try:
+            while True:
+                inv_now = investigations.get(investigation_id)
+                if not inv_now:
+                    break
+
+                state: InvestigationState = inv_now["state"]
+                current_events = state.events
+
+                # Send new events
+                if len(current_events) > last_event_count:
+                    for event in current_events[last_event_count:]:
+                        event_data = {
+                            "type": event.type,
+                            "timestamp": event.timestamp.isoformat(),
+                            "data": event.data,
+                        }
+                        yield f"data: {event_data}\n\n"
+                    last_event_count = len(current_events)
+
+                # Check if investigation is complete
+                if inv_now["status"] in ("completed", "failed"):
+                    for frame in subscription.drain() if subscription else []:
+                        yield f"data: {json.dumps(frame)}\n\n"
+                    status = inv_now["status"]
+                    yield f'data: {{"type": "investigation_ended", "status": "{status}"}}\n\n'
+                    break
+
+                # Relay token frames as they arrive, polling events in between
+                if subscription is None:
+                    await asyncio.sleep(0.5)
+                    continue
+                for frame in await subscription.next_frames(timeout=0.5):
+                    yield f"data: {json.dumps(frame)}\n\n"
+        finally:
+            if token_stream and subscription:
+                token_stream.unsubscribe(subscription)
+                if subscription.dropped:
+                    logger.info(
+                        "token_frames_dropped",
+                        investigation_id=investigation_id,
+                        dropped=subscription.dropped,
+                    )
 
     return StreamingResponse(
         event_generator(),
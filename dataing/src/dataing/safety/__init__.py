@@ -3,6 +3,7 @@
 This module contains all safety-related components:
 - SQL query validation
 - Circuit breaker for runaway investigations
+- Cost gate for queries that would scan too much data
 - PII detection and redaction
 
 Safety is non-negotiable - these components are designed to be
@@ -10,12 +11,16 @@ impossible to circumvent within the normal application flow.
 """
 
 from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from .cost_gate import CostDecision, QueryBudget, QueryCostGate
 from .pii import redact_pii, scan_for_pii
 from .validator import add_limit_if_missing, validate_query
 
 __all__ = [
     "CircuitBreaker",
     "CircuitBreakerConfig",
+    "CostDecision",
+    "QueryBudget",
+    "QueryCostGate",
     "validate_query",
     "add_limit_if_missing",
     "scan_for_pii",
@@ -0,0 +1,255 @@
+"""Query Cost Gate - Budget checks before a generated query runs.
+
+Every LLM-generated query is estimated with the data source's dry run or
+EXPLAIN facility before it executes. Queries within the tenant's budget run
+unchanged. Queries over budget are rewritten to read a sample of each table
+when the source supports it, or rejected with an error that explains the
+overrun so the reflexion loop can generate a cheaper query.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING, Any, Literal
+
+import structlog
+
+from dataing.adapters.datasource.errors import QueryBudgetExceededError
+from dataing.adapters.datasource.types import QueryCostEstimate
+
+if TYPE_CHECKING:
+    from dataing.adapters.datasource.sql.base import SQLAdapter
+
+logger = structlog.get_logger()
+
+# Default bytes a single generated query may scan (10 GiB)
+DEFAULT_MAX_BYTES_SCANNED = 10 * 1024**3
+
+# Smallest sample worth running; below this the query is rejected instead
+DEFAULT_MIN_SAMPLE_PERCENT = 0.1
+
+# Key in tenants.settings holding per-tenant budget overrides
+TENANT_SETTINGS_KEY = "query_budget"
+
+CostAction = Literal["allowed", "sampled", "rejected", "unestimated"]
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    """Per-query scan budget.
+
+    Any limit set to None is not enforced. ``max_cost`` is compared with
+    planner cost units, so it only makes sense for a single source type.
+
+    Attributes:
+        max_bytes_scanned: Maximum estimated bytes scanned.
+        max_rows_scanned: Maximum estimated rows scanned.
+        max_cost: Maximum planner cost.
+        sample_over_budget: Rewrite over-budget queries to sample tables
+            instead of rejecting them.
+        min_sample_percent: Smallest sample percentage to rewrite to.
+    """
+
+    max_bytes_scanned: int | None = DEFAULT_MAX_BYTES_SCANNED
+    max_rows_scanned: int | None = None
+    max_cost: float | None = None
+    sample_over_budget: bool = True
+    min_sample_percent: float = DEFAULT_MIN_SAMPLE_PERCENT
+
+    @classmethod
+    def from_tenant_settings(cls, settings: dict[str, Any]) -> QueryBudget:
+        """Build a budget from a tenant's settings.
+
+        Args:
+            settings: The tenant's settings, as read by ``tenant_settings``.
+                Overrides are read from its ``query_budget`` key.
+
+        Returns:
+            The default budget with any tenant overrides applied.
+        """
+        overrides = settings.get(TENANT_SETTINGS_KEY) or {}
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in overrides.items() if key in known})
+
+    def overrun(self, estimate: QueryCostEstimate) -> float:
+        """Return how many times over budget an estimate is.
+
+        Args:
+            estimate: Cost estimate for a query.
+
+        Returns:
+            The largest ratio of estimate to limit across enforced limits.
+            Values above 1.0 are over budget.
+        """
+        ratios = [0.0]
+        for value, limit in (
+            (estimate.bytes_scanned, self.max_bytes_scanned),
+            (estimate.rows_scanned, self.max_rows_scanned),
+            (estimate.cost, self.max_cost),
+        ):
+            if value is not None and limit is not None:
+                ratios.append(value / limit if limit > 0 else math.inf)
+        return max(ratios)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the budget to a dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class CostDecision:
+    """Outcome of checking a query against the budget.
+
+    Attributes:
+        action: What the gate decided.
+        sql: SQL to execute; the sampled rewrite when action is "sampled".
+        estimate: The estimate for the original query, if available.
+        sampled_percent: Percentage of each table read when sampled.
+        rejection: Error to raise when action is "rejected".
+    """
+
+    action: CostAction
+    sql: str
+    estimate: QueryCostEstimate | None = None
+    sampled_percent: float | None = None
+    rejection: QueryBudgetExceededError | None = None
+
+    def raise_if_rejected(self) -> None:
+        """Raise the rejection error if the query must not run.
+
+        Raises:
+            QueryBudgetExceededError: If the query was rejected.
+        """
+        if self.rejection is not None:
+            raise self.rejection
+
+    def to_event_data(self) -> dict[str, Any]:
+        """Summarize the decision for the query_submitted event."""
+        return {
+            "cost_action": self.action,
+            "cost_estimate": self.estimate.model_dump() if self.estimate else None,
+            "sampled_percent": self.sampled_percent,
+        }
+
+
+class QueryCostGate:
+    """Estimate queries before execution and enforce a budget.
+
+    Usage:
+        gate = QueryCostGate(QueryBudget(max_bytes_scanned=10 * 1024**3))
+        decision = await gate.check(adapter, sql)
+        decision.raise_if_rejected()
+        result = await adapter.execute_query(decision.sql)
+    """
+
+    def __init__(self, budget: QueryBudget | None = None) -> None:
+        """Initialize the cost gate.
+
+        Args:
+            budget: Budget to enforce. Uses defaults if not provided.
+        """
+        self.budget = budget or QueryBudget()
+
+    async def check(
+        self,
+        adapter: SQLAdapter,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> CostDecision:
+        """Estimate a query and decide whether and how it may run.
+
+        Estimation failures let the query run: the estimate is advisory,
+        and an invalid query fails with a clearer error when executed.
+
+        Args:
+            adapter: Adapter the query will run against.
+            sql: The generated SQL query.
+            params: Optional mapping of placeholder names to values.
+
+        Returns:
+            The decision, including the SQL to execute.
+        """
+        try:
+            estimate = await adapter.estimate_query_cost(sql, params)
+        except Exception as e:
+            logger.warning("query_cost_estimate_failed", error=str(e))
+            return CostDecision(action="unestimated", sql=sql)
+
+        if estimate is None:
+            return CostDecision(action="unestimated", sql=sql)
+
+        overrun = self.budget.overrun(estimate)
+        if overrun <= 1.0:
+            return CostDecision(action="allowed", sql=sql, estimate=estimate)
+
+        if self.budget.sample_over_budget:
+            percent = math.floor(100.0 / overrun * 10_000) / 10_000
+            sampled_sql = None
+            if percent >= self.budget.min_sample_percent:
+                sampled_sql = adapter.build_sampled_query(sql, percent)
+            if sampled_sql is not None:
+                logger.info(
+                    "query_sampled_over_budget",
+                    overrun=round(overrun, 2),
+                    sampled_percent=percent,
+                )
+                return CostDecision(
+                    action="sampled",
+                    sql=sampled_sql,
+                    estimate=estimate,
+                    sampled_percent=percent,
+                )
+
+        logger.info("query_rejected_over_budget", overrun=round(overrun, 2))
+        return CostDecision(
+            action="rejected",
+            sql=sql,
+            estimate=estimate,
+            rejection=QueryBudgetExceededError(
+                message=self._rejection_message(estimate),
+                estimate=estimate.model_dump(),
+                budget=self.budget.to_dict(),
+            ),
+        )
+
+    def _rejection_message(self, estimate: QueryCostEstimate) -> str:
+        """Explain an overrun in terms the query generator can act on."""
+        budget = self.budget
+        overruns = []
+        if _exceeds(estimate.bytes_scanned, budget.max_bytes_scanned):
+            overruns.append(
+                f"estimated scan of {_format_bytes(estimate.bytes_scanned)} exceeds "
+                f"the budget of {_format_bytes(budget.max_bytes_scanned)}"
+            )
+        if _exceeds(estimate.rows_scanned, budget.max_rows_scanned):
+            overruns.append(
+                f"estimated {estimate.rows_scanned:,} rows scanned exceeds "
+                f"the budget of {budget.max_rows_scanned:,}"
+            )
+        if _exceeds(estimate.cost, budget.max_cost):
+            overruns.append(
+                f"estimated cost of {estimate.cost:,.0f} exceeds "
+                f"the budget of {budget.max_cost:,.0f}"
+            )
+        return (
+            f"Query rejected before execution: {'; '.join(overruns)}. "
+            "Rewrite it to read less data: filter on partition or date columns, "
+            "select only the columns needed, aggregate before joining, "
+            "and avoid cross joins."
+        )
+
+
+def _exceeds(value: float | None, limit: float | None) -> bool:
+    """Check whether an estimate exceeds an enforced limit."""
+    return value is not None and limit is not None and value > limit
+
+
+def _format_bytes(num_bytes: float | None) -> str:
+    """Format a byte count with a binary unit, e.g. ``1.5 TiB``."""
+    size = float(num_bytes or 0)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TiB"
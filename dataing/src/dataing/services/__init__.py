@@ -2,6 +2,7 @@
 
 from dataing.services.auth import AuthService
 from dataing.services.notification import NotificationService
+from dataing.services.schema_sync import SchemaSyncService
 from dataing.services.tenant import TenantService
 from dataing.services.usage import UsageTracker
 
@@ -10,4 +11,5 @@ __all__ = [
     "TenantService",
     "UsageTracker",
     "NotificationService",
+    "SchemaSyncService",
 ]
@@ -0,0 +1,258 @@
+"""Incremental schema sync service.
+
+Schema sync compares the tables reported by a data source with the datasets
+already stored for it and writes only the difference: new or changed tables
+are bulk-merged in chunks, and tables that disappeared are deactivated.
+Progress is recorded on a schema_sync_jobs row after every chunk, and a
+heartbeat keeps the row fresh during discovery. Because merged chunks no
+longer differ from the source, re-running an interrupted job picks up
+where it stopped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import structlog
+
+from dataing.adapters.datasource import BaseAdapter, SchemaFilter, SchemaResponse
+from dataing.adapters.db.app_db import DATASET_SYNC_COLUMNS, AppDatabase
+
+logger = structlog.get_logger()
+
+# Datasets written per COPY batch; progress is saved after each batch
+SYNC_CHUNK_SIZE = 5000
+
+# Maximum number of tables requested from the data source
+SYNC_MAX_TABLES = 100_000
+
+# Seconds without progress after which a running job is treated as abandoned
+STALE_JOB_SECONDS = 600
+
+# Seconds between heartbeats while a job waits on a long step, e.g. discovery
+HEARTBEAT_SECONDS = 60
+
+
+@dataclass
+class DatasetDiff:
+    """Difference between discovered tables and stored datasets."""
+
+    changed: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def dataset_records_from_schema(schema: SchemaResponse) -> list[dict[str, Any]]:
+    """Flatten a schema response into dataset records.
+
+    Args:
+        schema: Schema returned by an adapter.
+
+    Returns:
+        One record per table keyed by DATASET_SYNC_COLUMNS, sorted by native path.
+    """
+    records: dict[str, dict[str, Any]] = {}
+    for catalog in schema.catalogs:
+        for schema_obj in catalog.schemas:
+            for table in schema_obj.tables:
+                records[table.native_path] = {
+                    "native_path": table.native_path,
+                    "name": table.name,
+                    "table_type": table.table_type,
+                    "schema_name": schema_obj.name,
+                    "catalog_name": catalog.name,
+                    "row_count": table.row_count,
+                    "size_bytes": table.size_bytes,
+                    "column_count": len(table.columns),
+                    "description": table.description,
+                }
+    return [records[path] for path in sorted(records)]
+
+
+def diff_datasets(
+    stored: list[dict[str, Any]],
+    discovered: list[dict[str, Any]],
+) -> DatasetDiff:
+    """Work out which datasets need to be written.
+
+    Args:
+        stored: Stored dataset rows with DATASET_SYNC_COLUMNS and is_active.
+        discovered: Records built from the current schema.
+
+    Returns:
+        Records that are new, changed or inactive, and the native paths of
+        active datasets that are no longer discovered.
+    """
+    by_path = {row["native_path"]: row for row in stored}
+    diff = DatasetDiff()
+
+    for record in discovered:
+        existing = by_path.pop(record["native_path"], None)
+        if (
+            existing is not None
+            and existing.get("is_active")
+            and all(existing.get(col) == record.get(col) for col in DATASET_SYNC_COLUMNS)
+        ):
+            diff.unchanged += 1
+        else:
+            diff.changed.append(record)
+
+    diff.removed = sorted(path for path, row in by_path.items() if row.get("is_active"))
+    return diff
+
+
+class SchemaSyncService:
+    """Run schema syncs as resumable background jobs."""
+
+    def __init__(self, db: AppDatabase):
+        """Initialize the schema sync service.
+
+        Args:
+            db: Application database instance.
+        """
+        self.db = db
+
+    async def start(self, tenant_id: UUID, datasource_id: UUID) -> tuple[dict[str, Any], bool]:
+        """Get the job that should serve a sync request.
+
+        A job that is still making progress is returned as-is. A failed or
+        abandoned job is reset so it can be run again.
+
+        Args:
+            tenant_id: The tenant ID.
+            datasource_id: The datasource ID.
+
+        Returns:
+            Tuple of (job, should_run). should_run is False if the job is
+            already running elsewhere.
+        """
+        latest = await self.db.get_latest_schema_sync_job(tenant_id, datasource_id)
+        if latest is not None and latest["status"] in ("pending", "running"):
+            if not self._is_stale(latest):
+                return latest, False
+        if latest is not None and latest["status"] != "completed":
+            job = await self.db.claim_schema_sync_job(latest["id"], STALE_JOB_SECONDS)
+            if job is not None:
+                logger.info("schema_sync_resumed", job_id=str(job["id"]))
+                return job, True
+        else:
+            job = await self.db.create_schema_sync_job(tenant_id, datasource_id)
+            if job is not None:
+                return job, True
+
+        # Another request started or resumed a job first
+        current = await self.db.get_latest_schema_sync_job(tenant_id, datasource_id)
+        if current is None:
+            raise RuntimeError("Schema sync job disappeared while starting")
+        return current, False
+
+    @staticmethod
+    def _is_stale(job: dict[str, Any]) -> bool:
+        """Check whether a running job stopped reporting progress."""
+        updated_at = job.get("updated_at")
+        if updated_at is None:
+            return False
+        return bool((datetime.now(UTC) - updated_at).total_seconds() > STALE_JOB_SECONDS)
+
+    @asynccontextmanager
+    async def _heartbeat(self, job_id: UUID) -> AsyncIterator[None]:
+        """Touch the job every HEARTBEAT_SECONDS so a long step is not taken for abandoned."""
+
+        async def beat() -> None:
+            while True:
+                await asyncio.sleep(HEARTBEAT_SECONDS)
+                try:
+                    await self.db.touch_schema_sync_job(job_id)
+                except Exception as e:
+                    logger.warning("schema_sync_heartbeat_failed", job_id=str(job_id), error=str(e))
+
+        task = asyncio.create_task(beat())
+        try:
+            yield
+        finally:
+            task.cancel()
+
+    async def run(self, job: dict[str, Any], adapter: BaseAdapter) -> dict[str, Any]:
+        """Discover the schema and write the difference, reporting progress.
+
+        Errors are recorded on the job rather than raised, since this runs
+        after the HTTP response has been sent.
+
+        Args:
+            job: Job returned by ``start``.
+            adapter: Unconnected adapter for the datasource.
+
+        Returns:
+            The final state of the job.
+        """
+        job_id = job["id"]
+        tenant_id = job["tenant_id"]
+        datasource_id = job["datasource_id"]
+        changed_total = job.get("datasets_changed") or 0
+        removed_total = job.get("datasets_removed") or 0
+
+        try:
+            await self.db.update_schema_sync_job(job_id, status="running", phase="discovering")
+            async with self._heartbeat(job_id):
+                async with adapter:
+                    schema = await adapter.get_schema(SchemaFilter(max_tables=SYNC_MAX_TABLES))
+                discovered = dataset_records_from_schema(schema)
+                stored = await self.db.get_dataset_sync_state(tenant_id, datasource_id)
+            diff = diff_datasets(stored, discovered)
+            processed = diff.unchanged
+            await self.db.update_schema_sync_job(
+                job_id,
+                phase="merging",
+                tables_discovered=len(discovered),
+                tables_processed=processed,
+            )
+
+            for start in range(0, len(diff.changed), SYNC_CHUNK_SIZE):
+                chunk = diff.changed[start : start + SYNC_CHUNK_SIZE]
+                changed_total += await self.db.merge_datasets(tenant_id, datasource_id, chunk)
+                processed += len(chunk)
+                await self.db.update_schema_sync_job(
+                    job_id,
+                    tables_processed=processed,
+                    datasets_changed=changed_total,
+                )
+
+            await self.db.update_schema_sync_job(job_id, phase="removing")
+            for start in range(0, len(diff.removed), SYNC_CHUNK_SIZE):
+                chunk_paths = diff.removed[start : start + SYNC_CHUNK_SIZE]
+                removed_total += await self.db.deactivate_datasets(
+                    tenant_id, datasource_id, chunk_paths
+                )
+                await self.db.update_schema_sync_job(job_id, datasets_removed=removed_total)
+
+            final = await self.db.update_schema_sync_job(
+                job_id,
+                status="completed",
+                phase="done",
+                completed_at=datetime.now(UTC),
+            )
+            logger.info(
+                "schema_sync_completed",
+                job_id=str(job_id),
+                datasource_id=str(datasource_id),
+                tables_discovered=len(discovered),
+                datasets_changed=changed_total,
+                datasets_removed=removed_total,
+            )
+        except Exception as e:
+            logger.warning(
+                "schema_sync_failed",
+                job_id=str(job_id),
+                datasource_id=str(datasource_id),
+                error=str(e),
+                exc_info=True,
+            )
+            final = await self.db.update_schema_sync_job(job_id, status="failed", error=str(e))
+
+        return final or job
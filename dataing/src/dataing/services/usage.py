@@ -1,25 +1,37 @@
 """Usage and cost tracking service."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import structlog
 
 from dataing.adapters.db.app_db import AppDatabase
 
+if TYPE_CHECKING:
+    from dataing.agents.telemetry import LLMTelemetry
+
 logger = structlog.get_logger()
 
 # LLM pricing per 1K tokens (approximate)
 LLM_PRICING = {
     "claude-sonnet-4-20250514": {"input": 0.003, "output": 0.015},
     "claude-3-5-sonnet-20241022": {"input": 0.003, "output": 0.015},
+    "claude-3-5-haiku-20241022": {"input": 0.0008, "output": 0.004},
     "claude-3-haiku-20240307": {"input": 0.00025, "output": 0.00125},
     "default": {"input": 0.01, "output": 0.03},
 }
 
 
+def estimate_llm_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the cost of LLM tokens in USD."""
+    pricing = LLM_PRICING.get(model, LLM_PRICING["default"])
+    return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1000
+
+
 @dataclass
 class UsageSummary:
     """Usage summary for a time period."""
@@ -49,11 +61,11 @@ class UsageTracker:
         input_tokens: int,
         output_tokens: int,
         investigation_id: UUID | None = None,
+        agent_role: str | None = None,
+        latency_ms: float | None = None,
     ) -> float:
         """Record LLM token usage and return cost."""
-        pricing = LLM_PRICING.get(model, LLM_PRICING["default"])
-
-        cost = (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1000
+        cost = estimate_llm_cost(model, input_tokens, output_tokens)
 
         await self.db.record_usage(
             tenant_id=tenant_id,
@@ -65,6 +77,8 @@ class UsageTracker:
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
                 "investigation_id": str(investigation_id) if investigation_id else None,
+                "agent_role": agent_role,
+                "latency_ms": latency_ms,
             },
         )
 
@@ -78,6 +92,35 @@ class UsageTracker:
 
         return cost
 
+    async def record_llm_telemetry(
+        self,
+        tenant_id: UUID,
+        telemetry: LLMTelemetry,
+        investigation_id: UUID | None = None,
+    ) -> float:
+        """Record the LLM usage of an investigation, one record per role and model.
+
+        Args:
+            tenant_id: Tenant the usage is billed to.
+            telemetry: Usage collected with ``llm_usage_scope``.
+            investigation_id: Investigation the usage belongs to.
+
+        Returns:
+            Total cost recorded.
+        """
+        total = 0.0
+        for entry in telemetry.roles.values():
+            total += await self.record_llm_usage(
+                tenant_id=tenant_id,
+                model=entry.model,
+                input_tokens=entry.input_tokens,
+                output_tokens=entry.output_tokens,
+                investigation_id=investigation_id,
+                agent_role=entry.role,
+                latency_ms=entry.latency_ms,
+            )
+        return total
+
     async def record_query_execution(
         self,
         tenant_id: UUID,
@@ -107,6 +107,9 @@ def mock_llm_client() -> AsyncMock:
         "SELECT COUNT(*) FROM orders WHERE created_at >= '2024-01-15' LIMIT 100"
     )
 
+    # Mock generate_queries_batch (empty: every hypothesis generates its own query)
+    mock.generate_queries_batch.return_value = {}
+
     # Mock interpret_evidence
     mock.interpret_evidence.return_value = Evidence(
         hypothesis_id="h001",
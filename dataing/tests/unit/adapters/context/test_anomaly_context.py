@@ -0,0 +1,71 @@
+"""Tests for anomaly confirmation."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from dataing.adapters.context.anomaly_context import AnomalyContext, anomaly_window
+from dataing.adapters.datasource.types import QueryResult
+from dataing.core.domain_types import AnomalyAlert, MetricSpec
+
+
+def _alert(anomaly_date: str, anomaly_type: str = "row_count") -> AnomalyAlert:
+    """Create an alert for the orders table on the given date."""
+    return AnomalyAlert(
+        dataset_id="orders",
+        metric_spec=MetricSpec(metric_type="column", expression="id", display_name="orders"),
+        anomaly_type=anomaly_type,
+        expected_value=100.0,
+        actual_value=10.0,
+        deviation_pct=-90.0,
+        anomaly_date=anomaly_date,
+        severity="high",
+    )
+
+
+class TestAnomalyWindow:
+    """Tests for anomaly_window."""
+
+    def test_bounds_cover_whole_days(self) -> None:
+        """Test the window runs from midnight to the midnight after the last day."""
+        window = anomaly_window("2024-02-28", days_before=1, days_after=1)
+
+        assert window == {
+            "window_start_ts": datetime(2024, 2, 27),
+            "window_end_ts": datetime(2024, 3, 1),
+        }
+
+    def test_unparseable_date(self) -> None:
+        """Test a malformed date gives no window."""
+        assert anomaly_window("15/01/2024") is None
+
+
+class TestAnomalyContext:
+    """Tests for AnomalyContext.confirm."""
+
+    async def test_filters_on_raw_timestamp(self) -> None:
+        """Test the anomaly date is bound as timestamp bounds on created_at."""
+        adapter = MagicMock()
+        adapter.execute_query = AsyncMock(
+            return_value=QueryResult(columns=[], rows=[{"row_count": 10}], row_count=1)
+        )
+
+        confirmation = await AnomalyContext().confirm(adapter, _alert("2024-01-15"))
+
+        sql = adapter.execute_query.call_args.args[0]
+        assert "created_at >= :window_start_ts AND created_at < :window_end_ts" in sql
+        assert "DATE(created_at)" not in sql
+        assert adapter.execute_query.call_args.kwargs["params"] == anomaly_window("2024-01-15")
+        assert confirmation.exists is True
+
+    async def test_malformed_date_fails_cleanly(self) -> None:
+        """Test a malformed anomaly date is reported without querying."""
+        adapter = MagicMock()
+        adapter.execute_query = AsyncMock()
+
+        confirmation = await AnomalyContext().confirm(adapter, _alert("yesterday"))
+
+        assert confirmation.exists is False
+        assert "Invalid anomaly date" in confirmation.message
+        adapter.execute_query.assert_not_called()
@@ -0,0 +1,44 @@
+"""Tests for correlation analysis."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from dataing.adapters.context.correlation_context import CorrelationContext
+from dataing.adapters.datasource.types import QueryResult
+
+
+class TestTimeSeries:
+    """Tests for CorrelationContext.analyze_time_series."""
+
+    async def test_window_is_bound_as_timestamps(self) -> None:
+        """Test the lookback window is bound as created_at bounds."""
+        adapter = MagicMock()
+        adapter.execute_query = AsyncMock(
+            return_value=QueryResult(columns=[], rows=[], row_count=0)
+        )
+
+        await CorrelationContext(lookback_days=2).analyze_time_series(
+            adapter, "orders", "user_id", "2024-01-15"
+        )
+
+        sql = adapter.execute_query.call_args.args[0]
+        assert "created_at >= :window_start_ts" in sql
+        assert "created_at < :window_end_ts" in sql
+        assert adapter.execute_query.call_args.kwargs["params"] == {
+            "window_start_ts": datetime(2024, 1, 13),
+            "window_end_ts": datetime(2024, 1, 18),
+        }
+
+    async def test_malformed_date_returns_none(self) -> None:
+        """Test a malformed date gives no pattern without querying."""
+        adapter = MagicMock()
+        adapter.execute_query = AsyncMock()
+
+        pattern = await CorrelationContext().analyze_time_series(
+            adapter, "orders", "user_id", "not a date"
+        )
+
+        assert pattern is None
+        adapter.execute_query.assert_not_called()
@@ -0,0 +1,72 @@
+"""Tests for schema context building."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataing.adapters.context.engine import ContextEngine
+from dataing.adapters.context.schema_context import (
+    DATE_PARTITION_KEYS,
+    SchemaContextBuilder,
+    anomaly_partition_filter,
+)
+from dataing.core.domain_types import AnomalyAlert, MetricSpec
+from dataing.core.exceptions import SchemaDiscoveryError
+
+
+class TestAnomalyPartitionFilter:
+    """Tests for anomaly_partition_filter."""
+
+    def test_window_ends_on_anomaly_date(self) -> None:
+        """Test the filter keeps the anomaly date and the days before it."""
+        partition_filter = anomaly_partition_filter("2024-03-02", lookback_days=2)
+
+        assert partition_filter is not None
+        assert set(partition_filter) == set(DATE_PARTITION_KEYS)
+        assert partition_filter["dt"] == ["2024-02-29", "2024-03-01", "2024-03-02"]
+
+    def test_unparseable_date_disables_pruning(self) -> None:
+        """Test an anomaly date that is not ISO formatted prunes nothing."""
+        assert anomaly_partition_filter("last tuesday") is None
+
+
+class TestPartitionPruningInDiscovery:
+    """Tests for passing the anomaly's partition filter to adapters."""
+
+    async def test_builder_passes_partition_filter(self) -> None:
+        """Test the builder wraps the partition filter in a SchemaFilter."""
+        adapter = MagicMock()
+        adapter.get_schema = AsyncMock(return_value=MagicMock(catalogs=[]))
+
+        await SchemaContextBuilder().build(adapter, partition_filter={"dt": "2024-01-15"})
+        await SchemaContextBuilder().build(adapter)
+
+        first, second = adapter.get_schema.call_args_list
+        assert first.args[0].partition_filter == {"dt": "2024-01-15"}
+        assert second.args[0] is None
+
+    async def test_gather_prunes_to_anomaly_window(self) -> None:
+        """Test context gathering derives the filter from the alert's date."""
+        builder = MagicMock()
+        builder.build = AsyncMock(side_effect=RuntimeError("stop after discovery"))
+        alert = AnomalyAlert(
+            dataset_id="s3.events",
+            metric_spec=MetricSpec(
+                metric_type="column", expression="user_id", display_name="user_id nulls"
+            ),
+            anomaly_type="null_rate",
+            expected_value=0.01,
+            actual_value=0.2,
+            deviation_pct=1900.0,
+            anomaly_date="2024-01-15",
+            severity="high",
+        )
+
+        with pytest.raises(SchemaDiscoveryError):
+            await ContextEngine(schema_builder=builder).gather(alert, MagicMock())
+
+        partition_filter = builder.build.call_args.kwargs["partition_filter"]
+        assert partition_filter["date"][-1] == "2024-01-15"
+        assert len(partition_filter["date"]) == 8
@@ -0,0 +1,317 @@
+"""Unit tests for the federated DuckDB query engine."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from cryptography.fernet import Fernet
+
+from dataing.adapters.datasource.errors import ConnectionFailedError
+from dataing.adapters.datasource.sql.federated import (
+    FederatedAdapter,
+    FederatedSource,
+    build_attach_sql,
+    federation_alias,
+)
+from dataing.adapters.datasource.types import NormalizedType, SourceType
+from dataing.entrypoints.api.deps import get_investigation_adapter
+
+duckdb = pytest.importorskip("duckdb")
+
+
+@pytest.fixture
+def warehouse(tmp_path: Path) -> Path:
+    """Create a DuckDB database file with an orders table."""
+    path = tmp_path / "shop.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE TABLE orders (id INTEGER, customer_id INTEGER, amount DOUBLE)")
+    conn.execute("INSERT INTO orders VALUES (1, 10, 5.0), (2, 11, 7.5), (3, 10, 1.0)")
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def lake(tmp_path: Path) -> Path:
+    """Create a directory of Parquet files, one of them a dataset directory."""
+    root = tmp_path / "lake"
+    (root / "events").mkdir(parents=True)
+    conn = duckdb.connect()
+    conn.execute(
+        f"COPY (SELECT 10 AS customer_id, 'gold' AS tier UNION ALL SELECT 11, 'basic') "
+        f"TO '{root / 'customers.parquet'}' (FORMAT PARQUET)"
+    )
+    conn.execute(
+        f"COPY (SELECT 1 AS order_id, 'click' AS kind) "
+        f"TO '{root / 'events' / 'part-0.parquet'}' (FORMAT PARQUET)"
+    )
+    conn.close()
+    return root
+
+
+@pytest.fixture
+async def adapter(warehouse: Path, lake: Path) -> Any:
+    """Create a federated adapter over the warehouse file and the lake."""
+    adapter = FederatedAdapter(
+        {
+            "sources": [
+                {
+                    "alias": "shop",
+                    "type": "duckdb",
+                    "config": {"source_type": "database", "path": str(warehouse)},
+                },
+                {"alias": "lake", "type": "local_file", "config": {"path": str(lake)}},
+            ]
+        }
+    )
+    await adapter.connect()
+    yield adapter
+    await adapter.disconnect()
+
+
+class TestFederatedQueries:
+    """Tests for queries spanning several member sources."""
+
+    async def test_cross_source_join(self, adapter: FederatedAdapter) -> None:
+        """Test a database table joins a Parquet file in one query."""
+        result = await adapter.execute_query(
+            """
+            SELECT c.tier, SUM(o.amount) AS total
+            FROM shop.main.orders o
+            JOIN lake.customers c USING (customer_id)
+            WHERE o.amount > :min_amount
+            GROUP BY c.tier
+            ORDER BY c.tier
+            """,
+            {"min_amount": 2},
+        )
+
+        assert result.rows == [
+            {"tier": "basic", "total": 7.5},
+            {"tier": "gold", "total": 5.0},
+        ]
+
+    async def test_sources_are_read_only(self, adapter: FederatedAdapter) -> None:
+        """Test attached databases cannot be written to."""
+        with pytest.raises(Exception, match="read-only"):
+            await adapter.execute_query("DELETE FROM shop.main.orders")
+
+    async def test_schema_is_grouped_by_alias(self, adapter: FederatedAdapter) -> None:
+        """Test each source is a catalog with query-ready native paths."""
+        schema = await adapter.get_schema()
+
+        tables = {
+            table.native_path: table
+            for catalog in schema.catalogs
+            for db_schema in catalog.schemas
+            for table in db_schema.tables
+        }
+        assert {c.name for c in schema.catalogs} == {"shop", "lake"}
+        assert set(tables) == {"shop.main.orders", "lake.customers", "lake.events"}
+        assert [c.name for c in tables["shop.main.orders"].columns] == [
+            "id",
+            "customer_id",
+            "amount",
+        ]
+        assert tables["lake.customers"].columns[1].data_type == NormalizedType.STRING
+
+    async def test_unavailable_source_is_skipped(self, warehouse: Path, tmp_path: Path) -> None:
+        """Test a source that cannot be attached does not block the others."""
+        adapter = FederatedAdapter(
+            {
+                "sources": [
+                    {
+                        "alias": "shop",
+                        "type": "duckdb",
+                        "config": {"source_type": "database", "path": str(warehouse)},
+                    },
+                    {
+                        "alias": "gone",
+                        "type": "local_file",
+                        "config": {"path": str(tmp_path / "x")},
+                    },
+                ]
+            }
+        )
+        await adapter.connect()
+
+        assert adapter.attached_aliases == ["shop"]
+        assert "gone" in adapter.unavailable_sources
+        await adapter.disconnect()
+
+    async def test_no_attachable_source_fails(self, tmp_path: Path) -> None:
+        """Test connecting fails when every source is unavailable."""
+        adapter = FederatedAdapter(
+            {"sources": [{"alias": "gone", "type": "local_file", "config": {"path": "/nope"}}]}
+        )
+
+        with pytest.raises(ConnectionFailedError):
+            await adapter.connect()
+
+    async def test_sqlite_source(self, lake: Path, tmp_path: Path) -> None:
+        """Test SQLite databases are attached through the scanner extension."""
+        path = tmp_path / "crm.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE accounts (customer_id INTEGER, owner TEXT)")
+        conn.execute("INSERT INTO accounts VALUES (10, 'ana')")
+        conn.commit()
+        conn.close()
+        adapter = FederatedAdapter(
+            {
+                "sources": [
+                    {"alias": "crm", "type": "sqlite", "config": {"path": str(path)}},
+                    {"alias": "lake", "type": "local_file", "config": {"path": str(lake)}},
+                ]
+            }
+        )
+        await adapter.connect()
+        if "crm" not in adapter.attached_aliases:
+            await adapter.disconnect()
+            pytest.skip("DuckDB sqlite extension is not available offline")
+
+        result = await adapter.execute_query(
+            "SELECT a.owner, c.tier FROM crm.accounts a JOIN lake.customers c USING (customer_id)"
+        )
+
+        assert result.rows == [{"owner": "ana", "tier": "gold"}]
+        await adapter.disconnect()
+
+
+class TestFederatedConfig:
+    """Tests for member source configuration."""
+
+    def test_postgres_attach_statement(self) -> None:
+        """Test Postgres credentials are quoted into a read-only ATTACH."""
+        source = FederatedSource(
+            alias="orders_db",
+            source_type=SourceType.POSTGRESQL,
+            config={
+                "host": "db.internal",
+                "database": "orders",
+                "username": "reader",
+                "password": "it's secret",
+            },
+        )
+
+        assert build_attach_sql(source) == (
+            "ATTACH 'host=''db.internal'' port=''5432'' dbname=''orders'' "
+            "user=''reader'' password=''it\\''s secret''' "
+            "AS orders_db (TYPE postgres, READ_ONLY)"
+        )
+
+    def test_mysql_attach_statement(self) -> None:
+        """Test MySQL sources use the mysql scanner."""
+        source = FederatedSource(
+            alias="billing",
+            source_type=SourceType.MYSQL,
+            config={"host": "mysql", "database": "billing", "username": "ro"},
+        )
+
+        sql = build_attach_sql(source)
+
+        assert sql.endswith("AS billing (TYPE mysql, READ_ONLY)")
+        assert "database=''billing''" in sql
+
+    def test_unsupported_type_rejected(self) -> None:
+        """Test sources DuckDB cannot attach are refused."""
+        with pytest.raises(ValueError, match="cannot be federated"):
+            FederatedAdapter({"sources": [{"alias": "mongo", "type": "mongodb"}]})
+
+    def test_duplicate_alias_rejected(self) -> None:
+        """Test aliases must be unique."""
+        source = {"alias": "a", "type": "sqlite", "config": {"path": "a.db"}}
+        with pytest.raises(ValueError, match="Duplicate"):
+            FederatedAdapter({"sources": [source, source]})
+
+    def test_reserved_alias_rejected(self) -> None:
+        """Test aliases cannot shadow DuckDB's own databases."""
+        source = {"alias": "memory", "type": "sqlite", "config": {"path": "a.db"}}
+        with pytest.raises(ValueError, match="Invalid"):
+            FederatedAdapter({"sources": [source]})
+
+    @pytest.mark.parametrize(
+        ("name", "taken", "expected"),
+        [
+            ("Orders DB (prod)", [], "orders_db_prod"),
+            ("2024 Events", [], "s_2024_events"),
+            ("orders", ["orders", "orders_2"], "orders_3"),
+            ("!!!", [], "source"),
+            ("Main", [], "main_2"),
+            ("temp", [], "temp_2"),
+        ],
+    )
+    def test_federation_alias(self, name: str, taken: list[str], expected: str) -> None:
+        """Test aliases are valid, unique identifiers."""
+        assert federation_alias(name, taken) == expected
+
+
+class TestGetInvestigationAdapter:
+    """Tests for choosing the adapter an investigation queries."""
+
+    def _request(self, data_sources: list[dict[str, Any]], key: str) -> Any:
+        """Build a request whose app state lists the given data sources."""
+        app_db = SimpleNamespace(list_data_sources=AsyncMock(return_value=data_sources))
+        state = SimpleNamespace(app_db=app_db, adapter_cache={}, encryption_key=key)
+        return SimpleNamespace(app=SimpleNamespace(state=state))
+
+    def _source(self, key: str, name: str, ds_type: str, config: dict[str, Any]) -> dict[str, Any]:
+        """Build a data source row with an encrypted connection config."""
+        encrypted = Fernet(key.encode()).encrypt(json.dumps(config).encode()).decode()
+        return {
+            "id": uuid4(),
+            "name": name,
+            "type": ds_type,
+            "is_active": True,
+            "connection_config_encrypted": encrypted,
+        }
+
+    async def test_several_sources_are_federated(self, warehouse: Path, lake: Path) -> None:
+        """Test a tenant with several sources gets one cached federated adapter."""
+        key = Fernet.generate_key().decode()
+        request = self._request(
+            [
+                self._source(
+                    key, "Shop DB", "duckdb", {"source_type": "database", "path": str(warehouse)}
+                ),
+                self._source(key, "Lake", "local_file", {"path": str(lake)}),
+                self._source(key, "Mongo", "mongodb", {}),
+            ],
+            key,
+        )
+        tenant_id = uuid4()
+
+        adapter = await get_investigation_adapter(request, tenant_id)
+
+        assert isinstance(adapter, FederatedAdapter)
+        assert adapter.attached_aliases == ["shop_db", "lake"]
+        assert await get_investigation_adapter(request, tenant_id) is adapter
+        await adapter.disconnect()
+
+    async def test_unfederable_default_source_is_queried_alone(
+        self, warehouse: Path, lake: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test federation never replaces a default source it cannot attach."""
+        key = Fernet.generate_key().decode()
+        request = self._request(
+            [
+                self._source(key, "Mongo", "mongodb", {}),
+                self._source(
+                    key, "Shop DB", "duckdb", {"source_type": "database", "path": str(warehouse)}
+                ),
+                self._source(key, "Lake", "local_file", {"path": str(lake)}),
+            ],
+            key,
+        )
+        default_adapter = object()
+        get_tenant_adapter = AsyncMock(return_value=default_adapter)
+        monkeypatch.setattr("dataing.entrypoints.api.deps.get_tenant_adapter", get_tenant_adapter)
+        tenant_id = uuid4()
+
+        assert await get_investigation_adapter(request, tenant_id) is default_adapter
+        get_tenant_adapter.assert_awaited_once_with(request, tenant_id)
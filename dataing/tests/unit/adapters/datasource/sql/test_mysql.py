@@ -0,0 +1,182 @@
+"""Unit tests for MySQL adapter streaming and schema discovery."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataing.adapters.datasource.sql import mysql
+from dataing.adapters.datasource.sql.mysql import MySQLAdapter, _stream_rows
+from dataing.adapters.datasource.types import NormalizedType, SchemaFilter
+
+# Result sets returned by the schema multi-statement, in statement order
+TABLE_ROWS = [
+    ("shop", "orders", "BASE TABLE", 1200, 65536, datetime(2024, 1, 15), "Customer orders"),
+    ("shop", "order_totals", "VIEW", None, None, None, ""),
+]
+KEY_ROWS = [("shop", "orders", "id")]
+COLUMN_ROWS = [
+    ("shop", "orders", "id", "int", "int unsigned", "NO", None, ""),
+    ("shop", "orders", "status", "varchar", "varchar(20)", "YES", "'new'", "Order state"),
+    ("shop", "order_totals", "total", "decimal", "decimal(10,2)", "YES", None, ""),
+    ("shop", "archived", "id", "int", "int", "NO", None, ""),
+]
+
+
+def _acquire(conn: Any) -> MagicMock:
+    """Create a pool whose acquire() yields the given connection."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__.return_value = conn
+    return pool
+
+
+def _schema_adapter() -> tuple[MySQLAdapter, AsyncMock]:
+    """Create a connected adapter whose schema connection returns the fixtures."""
+    cursor = AsyncMock()
+    cursor.fetchall.side_effect = [TABLE_ROWS, KEY_ROWS, COLUMN_ROWS]
+    conn = MagicMock()
+    conn.cursor.return_value.__aenter__.return_value = cursor
+
+    adapter = MySQLAdapter({"database": "shop"})
+    adapter._pool = MagicMock()
+    adapter._schema_pool = _acquire(conn)
+    adapter._connected = True
+    return adapter, cursor
+
+
+class FakeStreamingCursor:
+    """Unbuffered cursor that records how many rows were read."""
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        """Hold the rows the server would send."""
+        self._rows = rows
+        self.read = 0
+
+    async def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        """Return the next batch of rows."""
+        batch = self._rows[self.read : self.read + size]
+        self.read += len(batch)
+        return batch
+
+
+class TestStreamRows:
+    """Tests for _stream_rows."""
+
+    async def test_reads_until_exhausted(self) -> None:
+        """Test every row is read when there is no limit."""
+        cursor = FakeStreamingCursor([(i, f"n{i}") for i in range(5)])
+
+        rows, truncated = await _stream_rows(cursor, ["id", "name"], None)
+
+        assert len(rows) == 5
+        assert rows[0] == {"id": 0, "name": "n0"}
+        assert truncated is False
+
+    async def test_stops_after_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test reading stops at the first batch past the limit."""
+        monkeypatch.setattr(mysql, "MYSQL_FETCH_SIZE", 10)
+        cursor = FakeStreamingCursor([(i,) for i in range(1000)])
+
+        rows, truncated = await _stream_rows(cursor, ["id"], 15)
+
+        assert len(rows) == 15
+        assert truncated is True
+        assert cursor.read == 20
+
+    async def test_exact_limit_is_not_truncated(self) -> None:
+        """Test a result of exactly the limit is complete."""
+        cursor = FakeStreamingCursor([(1,), (2,)])
+
+        rows, truncated = await _stream_rows(cursor, ["id"], 2)
+
+        assert len(rows) == 2
+        assert truncated is False
+
+
+class TestMySQLGetSchema:
+    """Tests for MySQLAdapter.get_schema."""
+
+    async def test_single_round_trip(self) -> None:
+        """Test tables, keys and columns come from one multi-statement query."""
+        adapter, cursor = _schema_adapter()
+
+        await adapter.get_schema()
+
+        cursor.execute.assert_awaited_once()
+        sql, args = cursor.execute.call_args.args
+        assert sql.count("SELECT") == 3
+        assert "KEY_COLUMN_USAGE" in sql
+        assert args == ["shop", "shop", "shop"]
+        assert cursor.nextset.await_count == 2
+
+    async def test_builds_tables_and_columns(self) -> None:
+        """Test result sets are combined into the schema response."""
+        adapter, _ = _schema_adapter()
+
+        response = await adapter.get_schema()
+
+        tables = {t.name: t for t in response.catalogs[0].schemas[0].tables}
+        assert set(tables) == {"orders", "order_totals"}
+        orders = tables["orders"]
+        assert orders.row_count == 1200
+        assert orders.size_bytes == 65536
+        assert orders.description == "Customer orders"
+        assert [c.name for c in orders.columns] == ["id", "status"]
+        assert orders.columns[0].is_primary_key is True
+        assert orders.columns[0].native_type == "int unsigned"
+        assert orders.columns[1].is_primary_key is False
+        assert orders.columns[1].description == "Order state"
+        assert tables["order_totals"].table_type == "view"
+        assert tables["order_totals"].columns[0].data_type == NormalizedType.DECIMAL
+
+    async def test_filter_is_bound(self) -> None:
+        """Test filter values are bound and views excluded from tables only."""
+        adapter, cursor = _schema_adapter()
+
+        await adapter.get_schema(
+            SchemaFilter(table_pattern="ord%", include_views=False, max_tables=50)
+        )
+
+        sql, args = cursor.execute.call_args.args
+        statements = sql.split(";")
+        assert "TABLE_TYPE = 'BASE TABLE'" in statements[0]
+        assert "LIMIT 50" in statements[0]
+        assert "TABLE_TYPE" not in statements[2]
+        assert args == ["shop", "ord%"] * 3
+
+
+class TestMySQLStreamingQuery:
+    """Tests for MySQLAdapter.execute_query with an unbuffered cursor."""
+
+    async def test_over_limit_kills_and_discards_connection(self) -> None:
+        """Test the query is killed and its connection closed past the limit."""
+        aiomysql = pytest.importorskip("aiomysql")
+        cursor = FakeStreamingCursor([(i,) for i in range(50)])
+        cursor.execute = AsyncMock()  # type: ignore[attr-defined]
+        cursor.close = AsyncMock()  # type: ignore[attr-defined]
+        cursor.description = [("id",)]  # type: ignore[attr-defined]
+        conn = MagicMock()
+        conn.cursor = AsyncMock(return_value=cursor)
+        conn.thread_id.return_value = 42
+
+        killer_cursor = AsyncMock()
+        killer = MagicMock()
+        killer.cursor.return_value.__aenter__.return_value = killer_cursor
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.side_effect = [conn, killer]
+
+        adapter = MySQLAdapter({})
+        adapter._pool = pool
+        adapter._connected = True
+
+        result = await adapter.execute_query("SELECT id FROM orders", limit=10)
+
+        assert conn.cursor.call_args.args[0] is aiomysql.SSCursor
+        assert result.row_count == 10
+        assert result.truncated is True
+        killer_cursor.execute.assert_awaited_once_with("KILL QUERY %s", (42,))
+        conn.close.assert_called_once()
+        cursor.close.assert_not_awaited()
@@ -0,0 +1,341 @@
+"""Tests for budgeted batch fetching in the Snowflake and BigQuery adapters."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataing.adapters.datasource.sql.bigquery import BigQueryAdapter
+from dataing.adapters.datasource.sql.result_batches import ResultBudget, download_batches
+from dataing.adapters.datasource.sql.snowflake import SnowflakeAdapter
+
+# Recorded result of SELECT day, orders FROM daily_orders, as Snowflake split
+# it into result batches (rows, uncompressed bytes)
+SNOWFLAKE_BATCHES = [
+    ([("2024-01-01", 120), ("2024-01-02", 98)], 4_000_000),
+    ([("2024-01-03", 143), ("2024-01-04", 110)], 4_000_000),
+    ([("2024-01-05", 87)], 2_000_000),
+]
+
+# Column descriptions Snowflake returned for the same query
+SNOWFLAKE_DESCRIPTION = [("DAY", 2, None, None, None, None, True), ("ORDERS", 0, None)]
+
+
+class FakeResultBatch:
+    """Stand-in for a snowflake.connector ResultBatch."""
+
+    def __init__(self, rows: list[tuple[Any, ...]], uncompressed_size: int) -> None:
+        """Hold recorded rows and the size Snowflake reported for them."""
+        self.rows = rows
+        self.rowcount = len(rows)
+        self.uncompressed_size = uncompressed_size
+        self.downloaded = False
+
+    def __iter__(self) -> Any:
+        """Download the batch as row tuples."""
+        self.downloaded = True
+        return iter(self.rows)
+
+    def to_arrow(self) -> Any:
+        """Download the batch as an Arrow table."""
+        import pyarrow as pa
+
+        self.downloaded = True
+        day, orders = zip(*self.rows, strict=True)
+        return pa.table({"DAY": list(day), "ORDERS": list(orders)})
+
+
+def _snowflake_adapter(batches: list[FakeResultBatch], **config: Any) -> SnowflakeAdapter:
+    """Create a connected Snowflake adapter whose cursor returns the batches."""
+    cursor = MagicMock()
+    cursor.description = SNOWFLAKE_DESCRIPTION
+    cursor.get_result_batches.return_value = batches
+    adapter = SnowflakeAdapter(config)
+    adapter._conn = MagicMock()
+    adapter._conn.cursor.return_value = cursor
+    adapter._connected = True
+    return adapter
+
+
+def _recorded_batches() -> list[FakeResultBatch]:
+    return [FakeResultBatch(rows, size) for rows, size in SNOWFLAKE_BATCHES]
+
+
+def _size(batch: tuple[int, int]) -> tuple[int, int]:
+    return batch
+
+
+class TestResultBudget:
+    """Tests for ResultBudget."""
+
+    def test_select_stops_at_row_budget(self) -> None:
+        """Test batches after the row budget is reached are left out."""
+        selected, truncated = ResultBudget(max_rows=3).select([(2, 10), (2, 10), (2, 10)], _size)
+
+        assert selected == [(2, 10), (2, 10)]
+        assert truncated is True
+
+    def test_select_stops_before_byte_budget(self) -> None:
+        """Test a batch that would go over the byte budget is not selected."""
+        selected, truncated = ResultBudget(max_bytes=25).select([(1, 10), (1, 10), (1, 10)], _size)
+
+        assert selected == [(1, 10), (1, 10)]
+        assert truncated is True
+
+    def test_select_keeps_first_oversized_batch(self) -> None:
+        """Test the first batch is kept even if it alone exceeds the budget."""
+        selected, truncated = ResultBudget(max_bytes=5).select([(1, 10), (1, 10)], _size)
+
+        assert selected == [(1, 10)]
+        assert truncated is True
+
+    def test_select_everything_within_budget(self) -> None:
+        """Test nothing is left out when the result fits."""
+        selected, truncated = ResultBudget(max_rows=10).select([(2, 10), (2, 10)], _size)
+
+        assert len(selected) == 2
+        assert truncated is False
+
+    def test_take_closes_stream_when_spent(self) -> None:
+        """Test a stream is closed once the budget is spent."""
+        consumed = []
+
+        def stream() -> Any:
+            for batch in [(2, 10), (2, 10), (2, 10), (2, 10)]:
+                consumed.append(batch)
+                yield batch
+
+        batches = stream()
+        taken, truncated = ResultBudget(max_rows=3).take(batches, _size)
+
+        assert taken == [(2, 10), (2, 10)]
+        assert truncated is True
+        assert len(consumed) == 3
+        assert batches.gi_frame is None
+
+    def test_take_whole_stream(self) -> None:
+        """Test a stream within budget is consumed to the end."""
+        taken, truncated = ResultBudget(max_bytes=100).take(iter([(1, 10), (1, 10)]), _size)
+
+        assert len(taken) == 2
+        assert truncated is False
+
+
+class TestDownloadBatches:
+    """Tests for download_batches."""
+
+    async def test_downloads_in_parallel_and_keeps_order(self) -> None:
+        """Test batches are fetched concurrently and returned in order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(batch: int) -> int:
+            barrier.wait()
+            return batch * 10
+
+        assert await download_batches([1, 2, 3], fetch, concurrency=3) == [10, 20, 30]
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test no more than the allowed downloads run at once."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        def fetch(batch: int) -> int:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.01)
+            with lock:
+                running -= 1
+            return batch
+
+        await download_batches(list(range(8)), fetch, concurrency=2)
+
+        assert peak <= 2
+
+
+class TestSnowflakeResultBatches:
+    """Tests for SnowflakeAdapter result batch fetching."""
+
+    @pytest.fixture(autouse=True)
+    def _without_pyarrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Exercise the row fallback regardless of what is installed."""
+        monkeypatch.setattr(
+            "dataing.adapters.datasource.sql.snowflake.pyarrow_available", lambda: False
+        )
+
+    async def test_rows_from_all_batches(self) -> None:
+        """Test rows from every batch are returned in order."""
+        adapter = _snowflake_adapter(_recorded_batches())
+
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders")
+
+        assert result.row_count == 5
+        assert result.rows[0] == {"DAY": "2024-01-01", "ORDERS": 120}
+        assert result.rows[-1] == {"DAY": "2024-01-05", "ORDERS": 87}
+        assert result.truncated is False
+
+    async def test_limit_skips_unneeded_batches(self) -> None:
+        """Test batches past the row limit are never downloaded."""
+        batches = _recorded_batches()
+        adapter = _snowflake_adapter(batches)
+
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders", limit=3)
+
+        assert result.row_count == 3
+        assert result.truncated is True
+        assert [b.downloaded for b in batches] == [True, True, False]
+
+    async def test_byte_budget(self) -> None:
+        """Test the configured byte budget limits the batches downloaded."""
+        batches = _recorded_batches()
+        adapter = _snowflake_adapter(batches, max_result_bytes=5_000_000)
+
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders")
+
+        assert result.row_count == 2
+        assert result.truncated is True
+        assert [b.downloaded for b in batches] == [True, False, False]
+
+    async def test_statement_without_result(self) -> None:
+        """Test statements that return no columns give an empty result."""
+        adapter = _snowflake_adapter([])
+        adapter._conn.cursor.return_value.description = None
+
+        result = await adapter.execute_query("ALTER SESSION SET TIMEZONE = 'UTC'")
+
+        assert result.columns == []
+        assert result.row_count == 0
+
+
+class TestSnowflakeArrowResults:
+    """Tests for SnowflakeAdapter.execute_query_arrow."""
+
+    async def test_batches_concatenated_and_sliced(self) -> None:
+        """Test Arrow batches form one table cut to the row limit."""
+        pytest.importorskip("pyarrow")
+        adapter = _snowflake_adapter(_recorded_batches())
+
+        result = await adapter.execute_query_arrow("SELECT day, orders FROM daily_orders", limit=3)
+
+        assert result.table.num_rows == 3
+        assert result.table.column_names == ["DAY", "ORDERS"]
+        assert result.truncated is True
+        assert result.to_query_result().rows[2] == {"DAY": "2024-01-03", "ORDERS": 143}
+
+    async def test_missing_pyarrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a clear error is raised when pyarrow is not installed."""
+        from dataing.adapters.datasource.errors import AdapterError
+
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        adapter = _snowflake_adapter(_recorded_batches())
+
+        with pytest.raises(AdapterError, match="pyarrow"):
+            await adapter.execute_query_arrow("SELECT 1")
+
+
+def _bq_field(name: str, field_type: str) -> MagicMock:
+    field = MagicMock(field_type=field_type)
+    field.name = name
+    return field
+
+
+# Schema BigQuery reported for SELECT day, orders FROM daily_orders
+BIGQUERY_SCHEMA = [_bq_field("day", "DATE"), _bq_field("orders", "INT64")]
+
+# Rows of the same result, in the order the Storage Read API streamed them
+BIGQUERY_ROWS = [
+    {"day": date(2024, 1, 1), "orders": 120},
+    {"day": date(2024, 1, 2), "orders": 98},
+    {"day": date(2024, 1, 3), "orders": 143},
+    {"day": date(2024, 1, 4), "orders": 110},
+]
+
+
+def _bigquery_adapter(results: MagicMock, **config: Any) -> BigQueryAdapter:
+    """Create a BigQuery adapter whose query jobs return the given results."""
+    adapter = BigQueryAdapter({"project_id": "proj", **config})
+    adapter._run_query = MagicMock(return_value=results)  # type: ignore[method-assign]
+    adapter._bqstorage_client = MagicMock(name="bqstorage_client")
+    return adapter
+
+
+class TestBigQueryResults:
+    """Tests for BigQueryAdapter result fetching."""
+
+    async def test_row_fallback_stops_at_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test rows are not read past the limit without pyarrow."""
+        monkeypatch.setattr(
+            "dataing.adapters.datasource.sql.bigquery.pyarrow_available", lambda: False
+        )
+        read = []
+
+        def rows() -> Any:
+            for row in BIGQUERY_ROWS:
+                read.append(row)
+                yield row
+
+        results = MagicMock(schema=BIGQUERY_SCHEMA)
+        results.__iter__.return_value = rows()
+        adapter = _bigquery_adapter(results)
+
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders", limit=2)
+
+        assert result.rows == [
+            {"day": "2024-01-01", "orders": 120},
+            {"day": "2024-01-02", "orders": 98},
+        ]
+        assert result.columns[0] == {"name": "day", "data_type": "date"}
+        assert result.truncated is True
+        assert len(read) == 3
+
+    async def test_arrow_batches_from_storage_api(self) -> None:
+        """Test Arrow batches are read with the storage client up to the budget."""
+        pa = pytest.importorskip("pyarrow")
+        batches = [
+            pa.RecordBatch.from_pylist(BIGQUERY_ROWS[:2]),
+            pa.RecordBatch.from_pylist(BIGQUERY_ROWS[2:]),
+        ]
+        results = MagicMock(schema=BIGQUERY_SCHEMA)
+        results.to_arrow_iterable.return_value = iter(batches)
+        adapter = _bigquery_adapter(results)
+
+        arrow_result = await adapter.execute_query_arrow("SELECT day, orders FROM t", limit=3)
+        result = arrow_result.to_query_result(adapter._to_json_value)
+
+        kwargs = results.to_arrow_iterable.call_args.kwargs
+        assert kwargs["bqstorage_client"] is adapter._bqstorage_client
+        assert arrow_result.table.num_rows == 3
+        assert arrow_result.truncated is True
+        assert result.rows[0] == {"day": "2024-01-01", "orders": 120}
+
+    async def test_arrow_byte_budget(self) -> None:
+        """Test batches stop once the byte budget is spent."""
+        pa = pytest.importorskip("pyarrow")
+        batches = [pa.RecordBatch.from_pylist([row]) for row in BIGQUERY_ROWS]
+        results = MagicMock(schema=BIGQUERY_SCHEMA)
+        results.to_arrow_iterable.return_value = iter(batches)
+        adapter = _bigquery_adapter(results, max_result_bytes=batches[0].nbytes)
+
+        arrow_result = await adapter.execute_query_arrow("SELECT day, orders FROM t")
+
+        assert arrow_result.table.num_rows == 1
+        assert arrow_result.truncated is True
+
+    async def test_query_errors_are_translated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test client errors map to adapter errors on the fetch path."""
+        from dataing.adapters.datasource.errors import AccessDeniedError
+
+        monkeypatch.setattr(
+            "dataing.adapters.datasource.sql.bigquery.pyarrow_available", lambda: False
+        )
+        adapter = _bigquery_adapter(MagicMock())
+        adapter._run_query.side_effect = RuntimeError("403 Access Denied: Table t")
+
+        with pytest.raises(AccessDeniedError):
+            await adapter.execute_query("SELECT * FROM t")
@@ -158,6 +158,16 @@ class TestSQLiteAdapter:
             assert result.row_count == 2
             assert result.truncated is True
 
+    async def test_execute_query_with_params(self, sample_db: str) -> None:
+        """Test query execution with bound named parameters."""
+        async with SQLiteAdapter({"path": sample_db}) as adapter:
+            result = await adapter.execute_query(
+                "SELECT name FROM users WHERE name = :name",
+                params={"name": "Bob"},
+            )
+            assert result.row_count == 1
+            assert result.rows[0]["name"] == "Bob"
+
     async def test_execute_query_empty_result(self, sample_db: str) -> None:
         """Test query with no results."""
         async with SQLiteAdapter({"path": sample_db}) as adapter:
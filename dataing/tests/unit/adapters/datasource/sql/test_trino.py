@@ -0,0 +1,276 @@
+"""Unit tests for the Trino adapter's client protocol implementation."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from urllib.parse import unquote
+
+import httpx
+import pytest
+import respx
+
+from dataing.adapters.datasource.errors import (
+    AuthenticationFailedError,
+    QuerySyntaxError,
+    QueryTimeoutError,
+)
+from dataing.adapters.datasource.sql import trino
+from dataing.adapters.datasource.sql.trino import TrinoAdapter, _format_literal
+
+COORDINATOR = "http://trino.local:8080"
+
+# Columns as the coordinator describes them
+COLUMNS = [
+    {"name": "day", "type": "date"},
+    {"name": "orders", "type": "bigint"},
+]
+
+# Result pages, one per nextUri poll after the query is queued
+PAGES = [
+    [["2024-01-01", 120], ["2024-01-02", 98]],
+    [["2024-01-03", 143], ["2024-01-04", 110]],
+    [["2024-01-05", 87]],
+]
+
+
+class MockCoordinator:
+    """Serves Trino's statement protocol for a single canned query."""
+
+    def __init__(self, pages: list[list[list[Any]]] | None = None) -> None:
+        """Initialize with the pages of data to serve."""
+        self.pages = PAGES if pages is None else pages
+        self.submitted: httpx.Request | None = None
+        self.polled: list[int] = []
+        self.deleted: list[str] = []
+        self.error: dict[str, Any] | None = None
+        self.forced_statuses: list[int] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Respond to a protocol request."""
+        if self.forced_statuses:
+            return httpx.Response(self.forced_statuses.pop(0))
+        if request.method == "DELETE":
+            self.deleted.append(request.url.path)
+            return httpx.Response(204)
+        if request.method == "POST":
+            self.submitted = request
+            return httpx.Response(200, json=self._page(0, "QUEUED"))
+
+        token = int(request.url.path.rsplit("/", 1)[-1])
+        self.polled.append(token)
+        if self.error:
+            return httpx.Response(200, json={"id": "q1", "error": self.error})
+        return httpx.Response(200, json=self._page(token, "RUNNING"))
+
+    def _page(self, token: int, state: str) -> dict[str, Any]:
+        """Build the response for a page token; token 0 is the queued response."""
+        page: dict[str, Any] = {
+            "id": "q1",
+            "stats": {
+                "state": state,
+                "processedBytes": 1024 * token,
+                "processedRows": 2 * token,
+                "elapsedTimeMillis": 10 * token,
+                "cpuTimeMillis": 5 * token,
+            },
+        }
+        if token > 0:
+            page["columns"] = COLUMNS
+            page["data"] = self.pages[token - 1]
+        if token < len(self.pages):
+            page["nextUri"] = f"{COORDINATOR}/v1/statement/executing/q1/{token + 1}"
+        else:
+            page["stats"]["state"] = "FINISHED"
+        return page
+
+
+@pytest.fixture
+def coordinator() -> Any:
+    """Route every request to the coordinator to a mock."""
+    mock = MockCoordinator()
+    with respx.mock(base_url=COORDINATOR) as router:
+        router.route().mock(side_effect=mock.handle)
+        yield mock
+
+
+@pytest.fixture
+async def adapter(coordinator: MockCoordinator) -> Any:
+    """Create a connected Trino adapter."""
+    adapter = TrinoAdapter(
+        {
+            "host": "trino.local",
+            "port": 8080,
+            "catalog": "hive",
+            "schema": "web",
+            "user": "analyst",
+        }
+    )
+    await adapter.connect()
+    yield adapter
+    await adapter.disconnect()
+
+
+class TestTrinoExecuteQuery:
+    """Tests for TrinoAdapter.execute_query."""
+
+    async def test_follows_next_uri_to_the_end(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test rows from every page are returned with the final stats."""
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders")
+
+        assert coordinator.polled == [1, 2, 3]
+        assert result.row_count == 5
+        assert result.rows[0] == {"day": "2024-01-01", "orders": 120}
+        assert result.columns == [
+            {"name": "day", "data_type": "date"},
+            {"name": "orders", "data_type": "integer"},
+        ]
+        assert result.truncated is False
+        assert result.metadata == {
+            "query_id": "q1",
+            "state": "FINISHED",
+            "processed_bytes": 3072,
+            "processed_rows": 6,
+            "elapsed_time_ms": 30,
+            "cpu_time_ms": 15,
+        }
+        assert coordinator.deleted == []
+
+    async def test_protocol_headers(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test the session is described in protocol headers."""
+        await adapter.execute_query("SELECT 1", timeout_seconds=45)
+
+        headers = coordinator.submitted.headers
+        assert headers["X-Trino-User"] == "analyst"
+        assert headers["X-Trino-Catalog"] == "hive"
+        assert headers["X-Trino-Schema"] == "web"
+        assert headers["X-Trino-Session"] == "query_max_run_time=45s"
+        assert coordinator.submitted.content == b"SELECT 1"
+
+    async def test_row_budget_cancels_query(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test the query is deleted once the limit is exceeded."""
+        result = await adapter.execute_query("SELECT day, orders FROM daily_orders", limit=3)
+
+        assert result.row_count == 3
+        assert result.truncated is True
+        assert coordinator.polled == [1, 2]
+        assert coordinator.deleted == ["/v1/statement/executing/q1/3"]
+        assert result.metadata["state"] == "RUNNING"
+
+    async def test_params_use_prepared_statement(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test parameters are bound with EXECUTE ... USING."""
+        await adapter.execute_query(
+            "SELECT * FROM orders WHERE day = :day AND region = :region",
+            {"day": date(2024, 1, 1), "region": "O'Hare"},
+        )
+
+        request = coordinator.submitted
+        name, _, prepared = request.headers["X-Trino-Prepared-Statement"].partition("=")
+        assert unquote(prepared) == "SELECT * FROM orders WHERE day = ? AND region = ?"
+        assert request.content.decode() == (f"EXECUTE {name} USING DATE '2024-01-01', 'O''Hare'")
+
+    async def test_error_payload(self, adapter: TrinoAdapter, coordinator: MockCoordinator) -> None:
+        """Test a failed query raises the matching adapter error."""
+        coordinator.error = {
+            "message": "line 1:8: mismatched input 'FORM'",
+            "errorName": "SYNTAX_ERROR",
+            "errorType": "USER_ERROR",
+        }
+
+        with pytest.raises(QuerySyntaxError, match="mismatched input"):
+            await adapter.execute_query("SELECT * FORM t")
+        assert coordinator.deleted == []
+
+    async def test_busy_coordinator_is_retried(
+        self,
+        adapter: TrinoAdapter,
+        coordinator: MockCoordinator,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test 503 responses are retried."""
+        monkeypatch.setattr(trino, "TRINO_RETRY_DELAY_SECONDS", 0)
+        coordinator.forced_statuses = [503, 503]
+
+        result = await adapter.execute_query("SELECT 1")
+
+        assert result.row_count == 5
+
+    async def test_unauthorized(self, adapter: TrinoAdapter, coordinator: MockCoordinator) -> None:
+        """Test HTTP 401 raises an authentication error."""
+        coordinator.forced_statuses = [401]
+
+        with pytest.raises(AuthenticationFailedError):
+            await adapter.execute_query("SELECT 1")
+
+    async def test_timeout_cancels_query(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test a query past its timeout is cancelled."""
+        with pytest.raises(QueryTimeoutError):
+            await adapter.execute_query("SELECT 1", timeout_seconds=-1)
+
+        assert coordinator.polled == []
+        assert coordinator.deleted == ["/v1/statement/executing/q1/1"]
+
+
+class TestTrinoStreamQuery:
+    """Tests for TrinoAdapter.stream_query."""
+
+    async def test_early_exit_cancels_query(
+        self, adapter: TrinoAdapter, coordinator: MockCoordinator
+    ) -> None:
+        """Test stopping iteration deletes the running query."""
+        rows = []
+        stream = adapter.stream_query("SELECT day, orders FROM daily_orders")
+        async for row in stream:
+            rows.append(row)
+            if len(rows) == 2:
+                break
+        await stream.aclose()
+
+        assert rows[1] == {"day": "2024-01-02", "orders": 98}
+        assert coordinator.polled == [1]
+        assert coordinator.deleted == ["/v1/statement/executing/q1/2"]
+
+
+class TestFormatLiteral:
+    """Tests for _format_literal."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, "NULL"),
+            (True, "true"),
+            (42, "42"),
+            (1.5, "1.5"),
+            (float("nan"), "nan()"),
+            (float("inf"), "infinity()"),
+            (float("-inf"), "-infinity()"),
+            (Decimal("9.99"), "DECIMAL '9.99'"),
+            (datetime(2024, 1, 1, 12, 30), "TIMESTAMP '2024-01-01 12:30:00'"),
+            (date(2024, 1, 1), "DATE '2024-01-01'"),
+            (["a", 1], "ARRAY['a', 1]"),
+            ("it's", "'it''s'"),
+        ],
+    )
+    def test_literals(self, value: Any, expected: str) -> None:
+        """Test values render as Trino literals."""
+        assert _format_literal(value) == expected
+
+
+def test_stats_fields_cover_dashboard_metrics() -> None:
+    """Test the stats used by cost dashboards are reported."""
+    assert {"processedBytes", "elapsedTimeMillis"} <= set(trino.TRINO_STATS_FIELDS)
+    assert json.dumps(trino._query_stats({"processedBytes": 1, "unrelated": 2})) == (
+        '{"processed_bytes": 1}'
+    )
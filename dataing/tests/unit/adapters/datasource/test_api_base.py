@@ -1,9 +1,21 @@
 """Tests for APIAdapter base class."""
 
-import pytest
+import asyncio
+import time
 from typing import Any
 
-from dataing.adapters.datasource.api.base import APIAdapter
+import httpx
+import pytest
+import respx
+
+from dataing.adapters.datasource.api.base import (
+    APIAdapter,
+    Page,
+    TokenBucket,
+    get_token_bucket,
+    parse_retry_after,
+)
+from dataing.adapters.datasource.errors import AuthenticationFailedError, RateLimitedError
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
     Column,
@@ -282,3 +294,184 @@ class TestAPIAdapterAbstractMethods:
 
         with pytest.raises(TypeError):
             IncompleteAPIAdapter({})
+
+
+@pytest.fixture
+def http_adapter():
+    """Create an adapter whose pooled client points at a mocked API."""
+    adapter = ConcreteAPIAdapter(
+        {"api_key": f"key-{time.monotonic_ns()}", "rate_limit_requests_per_minute": 60000}
+    )
+    adapter._client = adapter._create_client("https://api.example.com", {})
+    return adapter
+
+
+class TestTokenBucket:
+    """Tests for the token-bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_paces_requests_beyond_burst(self):
+        """Test that requests past the burst wait for refill."""
+        bucket = TokenBucket(requests_per_minute=600, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_back_callers(self):
+        """Test that a pause delays the next acquisition."""
+        bucket = TokenBucket(requests_per_minute=60000)
+        bucket.pause(0.1)
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_bucket_shared_per_key(self):
+        """Test that adapters using the same key share one bucket."""
+        assert get_token_bucket("stripe:a", 100) is get_token_bucket("stripe:a", 100)
+        assert get_token_bucket("stripe:a", 100) is not get_token_bucket("stripe:b", 100)
+
+    def test_adapter_uses_declared_rate(self):
+        """Test that the limiter reads the declared capability."""
+        adapter = ConcreteAPIAdapter({"api_key": "declared"})
+
+        assert adapter._rate_limiter().requests_per_minute == 100
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        """Test delay-seconds values."""
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        """Test HTTP-date values."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self):
+        """Test that unusable values return None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestAPIAdapterRequest:
+    """Tests for rate-limited requests with retries."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retries_after_429(self, http_adapter):
+        """Test that a 429 is retried after the Retry-After delay."""
+        route = respx.get("https://api.example.com/items").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0.05"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        start = time.monotonic()
+        response = await http_adapter._request("GET", "/items")
+
+        assert response.json() == {"ok": True}
+        assert route.call_count == 2
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_gives_up_after_max_retries(self, http_adapter):
+        """Test that persistent throttling raises RateLimitedError."""
+        http_adapter._config["max_retries"] = 1
+        respx.get("https://api.example.com/items").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "0"})
+        )
+
+        with pytest.raises(RateLimitedError):
+            await http_adapter._request("GET", "/items")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_long_retry_after_is_not_waited_out(self, http_adapter):
+        """Test that a Retry-After beyond the cap is surfaced immediately."""
+        route = respx.get("https://api.example.com/items").mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "3600"})
+        )
+
+        with pytest.raises(RateLimitedError) as exc_info:
+            await http_adapter._request("GET", "/items")
+
+        assert route.call_count == 1
+        assert exc_info.value.retry_after_seconds == 3600
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_check_response_maps_401(self, http_adapter):
+        """Test that 401 responses become AuthenticationFailedError."""
+        respx.get("https://api.example.com/items").mock(return_value=httpx.Response(401))
+
+        response = await http_adapter._request("GET", "/items")
+        with pytest.raises(AuthenticationFailedError):
+            http_adapter._check_response(response, "items")
+
+
+class TestAPIAdapterPaginate:
+    """Tests for cursor pagination up to a row budget."""
+
+    @staticmethod
+    def _pages(total: int, calls: list[tuple[str | None, int]]):
+        async def fetch_page(cursor: str | None, page_size: int) -> Page:
+            calls.append((cursor, page_size))
+            start = int(cursor or 0)
+            end = min(start + page_size, total)
+            await asyncio.sleep(0.01)
+            return Page(
+                records=[{"id": i} for i in range(start, end)],
+                next_cursor=str(end) if end < total else None,
+            )
+
+        return fetch_page
+
+    @pytest.mark.asyncio
+    async def test_stops_at_row_budget(self):
+        """Test that paging stops once the budget is filled."""
+        adapter = ConcreteAPIAdapter({})
+        calls: list[tuple[str | None, int]] = []
+
+        rows, truncated = await adapter._paginate(self._pages(1000, calls), 250, 100)
+
+        assert [r["id"] for r in rows] == list(range(250))
+        assert truncated is True
+        assert calls == [(None, 100), ("100", 100), ("200", 50)]
+
+    @pytest.mark.asyncio
+    async def test_reads_until_data_ends(self):
+        """Test that a budget larger than the data returns everything."""
+        adapter = ConcreteAPIAdapter({})
+        calls: list[tuple[str | None, int]] = []
+
+        rows, truncated = await adapter._paginate(
+            self._pages(150, calls), 500, 100, transform=lambda r: {"id": r["id"] * 2}
+        )
+
+        assert len(rows) == 150
+        assert rows[-1] == {"id": 298}
+        assert truncated is False
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_during_transform(self):
+        """Test that the next page is requested before the current is processed."""
+        adapter = ConcreteAPIAdapter({})
+        calls: list[tuple[str | None, int]] = []
+        seen_calls: list[int] = []
+
+        def transform(record: dict[str, Any]) -> dict[str, Any]:
+            seen_calls.append(len(calls))
+            return record
+
+        await adapter._paginate(self._pages(300, calls), 300, 100, transform=transform)
+
+        assert seen_calls[0] == 2
@@ -1,5 +1,7 @@
 """Tests for BaseAdapter abstract base class."""
 
+import gc
+
 import pytest
 from datetime import datetime
 from typing import Any
@@ -16,6 +18,7 @@ from dataing.adapters.datasource.types import (
     SchemaResponse,
     SourceCategory,
     SourceType,
+    Table,
 )
 
 
@@ -277,6 +280,72 @@ class TestBuildSchemaResponse:
         assert table.native_type == "TABLE"
         assert table.native_path == "minimal_table"
 
+    def test_build_schema_response_streams_tables(self):
+        """Test that tables can be passed as a generator."""
+        adapter = ConcreteAdapter({})
+        consumed = []
+
+        def tables():
+            for i in range(3):
+                consumed.append(i)
+                yield {
+                    "name": f"t{i}",
+                    "columns": [
+                        {
+                            "name": "id",
+                            "data_type": NormalizedType.INTEGER,
+                            "native_type": "bigint",
+                        }
+                    ],
+                }
+
+        response = adapter._build_schema_response(
+            source_id="test",
+            catalogs=[{"schemas": [{"tables": tables()}]}],
+        )
+
+        assert consumed == [0, 1, 2]
+        assert [t.name for t in response.catalogs[0].schemas[0].tables] == ["t0", "t1", "t2"]
+
+    def test_build_schema_response_reuses_model_instances(self):
+        """Test that Table and Column instances are used as-is."""
+        adapter = ConcreteAdapter({})
+        column = Column(name="id", data_type=NormalizedType.INTEGER, native_type="bigint")
+        table = Table(
+            name="prebuilt",
+            table_type="table",
+            native_type="TABLE",
+            native_path="public.prebuilt",
+            columns=[column],
+        )
+
+        response = adapter._build_schema_response(
+            source_id="test",
+            catalogs=[
+                {
+                    "schemas": [
+                        {"tables": [table, {"name": "mixed", "columns": [column]}]},
+                    ]
+                }
+            ],
+        )
+
+        tables = response.catalogs[0].schemas[0].tables
+        assert tables[0] is table
+        assert tables[1].columns[0] is column
+
+    def test_build_schema_response_restores_gc(self):
+        """Test that garbage collection is re-enabled after a failed build."""
+        adapter = ConcreteAdapter({})
+
+        with pytest.raises(KeyError):
+            adapter._build_schema_response(
+                source_id="test",
+                catalogs=[{"schemas": [{"tables": [{"columns": []}]}]}],
+            )
+
+        assert gc.isenabled()
+
 
 class TestGetSourceCategory:
     """Tests for _get_source_category helper method."""
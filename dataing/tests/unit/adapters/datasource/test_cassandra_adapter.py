@@ -0,0 +1,117 @@
+"""Tests for the Cassandra adapter."""
+
+import threading
+from collections import namedtuple
+from typing import Any
+
+import pytest
+
+from dataing.adapters.datasource.document.cassandra import CassandraAdapter
+
+Keyspace = namedtuple("Keyspace", ["keyspace_name"])
+TableRow = namedtuple("TableRow", ["table_name"])
+ColumnRow = namedtuple("ColumnRow", ["table_name", "column_name", "type", "kind"])
+EventRow = namedtuple("EventRow", ["id", "kind"])
+
+
+class FakeResponseFuture:
+    """Paged response future that delivers pages from a background thread."""
+
+    def __init__(self, pages: list[list[Any]]):
+        """Queue the pages to deliver."""
+        self._pages = list(pages)
+        self._callback: Any = None
+
+    @property
+    def has_more_pages(self) -> bool:
+        """Whether pages remain to be fetched."""
+        return bool(self._pages)
+
+    def add_callbacks(self, callback: Any, errback: Any) -> None:
+        """Register the page callback and fetch the first page."""
+        self._callback = callback
+        self.start_fetching_next_page()
+
+    def start_fetching_next_page(self) -> None:
+        """Deliver the next page to the callback on another thread."""
+        page = self._pages.pop(0)
+        threading.Thread(target=self._callback, args=(page,)).start()
+
+
+class FakeSession:
+    """Session answering system_schema queries and a paged table scan."""
+
+    def __init__(self):
+        """Record executed statements."""
+        self.statements: list[tuple[str, Any]] = []
+        self.pages_fetched = 0
+
+    def execute_async(self, cql: str, params: Any = None) -> FakeResponseFuture:
+        """Record the statement and answer it with canned pages."""
+        self.statements.append((cql, params))
+        if "system_schema.keyspaces" in cql:
+            return FakeResponseFuture([[Keyspace("shop"), Keyspace("system_auth")]])
+        if "system_schema.tables" in cql:
+            return FakeResponseFuture([[TableRow("orders"), TableRow("users")]])
+        if "system_schema.columns" in cql:
+            return FakeResponseFuture(
+                [
+                    [
+                        ColumnRow("orders", "id", "uuid", "partition_key"),
+                        ColumnRow("orders", "total", "decimal", "regular"),
+                    ],
+                    [ColumnRow("users", "email", "text", "partition_key")],
+                ]
+            )
+        pages = [[EventRow(i * 10 + j, "click") for j in range(10)] for i in range(5)]
+        future = FakeResponseFuture(pages)
+        original = future.start_fetching_next_page
+
+        def counting() -> None:
+            self.pages_fetched += 1
+            original()
+
+        future.start_fetching_next_page = counting  # type: ignore[method-assign]
+        return future
+
+
+@pytest.fixture
+def adapter():
+    """Create a connected Cassandra adapter backed by a fake session."""
+    adapter = CassandraAdapter({"hosts": "localhost"})
+    adapter._session = FakeSession()
+    adapter._connected = True
+    return adapter
+
+
+class TestCassandraAsyncExecution:
+    """Tests for async paged execution."""
+
+    @pytest.mark.asyncio
+    async def test_get_schema_queries_columns_once_per_keyspace(self, adapter):
+        """Test that columns are fetched per keyspace and grouped by table."""
+        schema = await adapter.get_schema()
+
+        column_queries = [s for s, _ in adapter._session.statements if "columns" in s]
+        assert len(column_queries) == 1
+        tables = {t.name: t for t in schema.catalogs[0].schemas[0].tables}
+        assert [c.name for c in tables["orders"].columns] == ["id", "total"]
+        assert tables["users"].columns[0].is_primary_key is True
+        assert [s.name for s in schema.catalogs[0].schemas] == ["shop"]
+
+    @pytest.mark.asyncio
+    async def test_scan_stops_paging_at_limit(self, adapter):
+        """Test that paging stops once enough rows are held."""
+        result = await adapter.scan_collection("events", limit=15)
+
+        assert result.row_count == 15
+        assert adapter._session.pages_fetched == 2
+
+    @pytest.mark.asyncio
+    async def test_scan_binds_filter_values(self, adapter):
+        """Test that filter values are passed as parameters."""
+        await adapter.scan_collection("events", filter={"kind": "click'"}, limit=5)
+
+        cql, params = adapter._session.statements[-1]
+        assert "kind = %s" in cql
+        assert params == ["click'"]
@@ -0,0 +1,121 @@
+"""Tests for pre-execution cost estimates from warehouse adapters."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataing.adapters.datasource.sql.bigquery import BigQueryAdapter
+from dataing.adapters.datasource.sql.snowflake import SnowflakeAdapter
+from dataing.adapters.datasource.sql.trino import TrinoAdapter
+from dataing.adapters.datasource.types import QueryResult
+
+# Recorded EXPLAIN USING JSON output from Snowflake
+SNOWFLAKE_EXPLAIN = {
+    "GlobalStats": {
+        "partitionsTotal": 4096,
+        "partitionsAssigned": 128,
+        "bytesAssigned": 5368709120,
+    },
+    "Operations": [[{"id": 0, "operation": "Result"}]],
+}
+
+# Recorded EXPLAIN (TYPE IO, FORMAT JSON) output from Trino; the second
+# table has no statistics
+TRINO_EXPLAIN_IO = {
+    "inputTableColumnInfos": [
+        {
+            "table": {"catalog": "hive", "schemaTable": {"schema": "web", "table": "events"}},
+            "estimate": {
+                "outputRowCount": 15000000.0,
+                "outputSizeInBytes": 1200000000.0,
+                "cpuCost": 1200000000.0,
+            },
+        },
+        {
+            "table": {"catalog": "hive", "schemaTable": {"schema": "web", "table": "users"}},
+            "estimate": {"outputRowCount": "NaN", "outputSizeInBytes": "NaN", "cpuCost": "NaN"},
+        },
+    ],
+    "estimate": {"outputRowCount": 10.0, "outputSizeInBytes": 90.0, "cpuCost": 2500000000.0},
+}
+
+
+def _plan_result(column: str, plan: dict) -> QueryResult:
+    """Wrap a JSON plan as the single-row result EXPLAIN returns."""
+    return QueryResult(
+        columns=[{"name": column, "data_type": "string"}],
+        rows=[{column: json.dumps(plan)}],
+        row_count=1,
+    )
+
+
+class TestSnowflakeCostEstimate:
+    """Tests for SnowflakeAdapter.estimate_query_cost."""
+
+    @pytest.mark.asyncio
+    async def test_reads_bytes_after_pruning(self):
+        """Test bytes come from the compiled plan's global stats."""
+        adapter = SnowflakeAdapter({})
+        adapter.execute_query = AsyncMock(return_value=_plan_result("content", SNOWFLAKE_EXPLAIN))
+
+        estimate = await adapter.estimate_query_cost("SELECT * FROM events LIMIT 10")
+
+        assert adapter.execute_query.call_args.args[0].startswith("EXPLAIN USING JSON SELECT")
+        assert estimate.method == "explain"
+        assert estimate.bytes_scanned == 5368709120
+        assert estimate.details == {"partitions_total": 4096, "partitions_assigned": 128}
+
+
+class TestTrinoCostEstimate:
+    """Tests for TrinoAdapter.estimate_query_cost."""
+
+    @pytest.mark.asyncio
+    async def test_sums_known_table_estimates(self):
+        """Test per-table estimates are summed and NaN estimates skipped."""
+        adapter = TrinoAdapter({})
+        adapter.execute_query = AsyncMock(return_value=_plan_result("Query Plan", TRINO_EXPLAIN_IO))
+
+        estimate = await adapter.estimate_query_cost("SELECT * FROM events JOIN users USING (id)")
+
+        sql = adapter.execute_query.call_args.args[0]
+        assert sql.startswith("EXPLAIN (TYPE IO, FORMAT JSON) SELECT")
+        assert estimate.rows_scanned == 15000000
+        assert estimate.bytes_scanned == 1200000000
+        assert estimate.cost == 2500000000.0
+
+    @pytest.mark.asyncio
+    async def test_no_statistics_is_unestimated(self):
+        """Test a plan without any known scan estimate is not reported as 0 bytes."""
+        plan = {"inputTableColumnInfos": [TRINO_EXPLAIN_IO["inputTableColumnInfos"][1]]}
+        adapter = TrinoAdapter({})
+        adapter.execute_query = AsyncMock(return_value=_plan_result("Query Plan", plan))
+
+        assert await adapter.estimate_query_cost("SELECT * FROM users") is None
+
+
+class TestBigQueryCostEstimate:
+    """Tests for BigQueryAdapter.estimate_query_cost."""
+
+    @pytest.mark.asyncio
+    async def test_dry_run_bytes(self):
+        """Test the estimate comes from a dry run that bypasses the cache."""
+        pytest.importorskip("google.cloud.bigquery")
+        adapter = BigQueryAdapter({"project_id": "proj"})
+        adapter._client = MagicMock()
+        adapter._client.query.return_value = MagicMock(total_bytes_processed=987654321)
+        adapter._connected = True
+
+        estimate = await adapter.estimate_query_cost(
+            "SELECT * FROM events WHERE day = :day LIMIT 10", {"day": "2024-01-01"}
+        )
+
+        sql, job_config = (
+            adapter._client.query.call_args.args[0],
+            adapter._client.query.call_args.kwargs["job_config"],
+        )
+        assert "@day" in sql
+        assert job_config.dry_run is True
+        assert job_config.use_query_cache is False
+        assert estimate.method == "dry_run"
+        assert estimate.bytes_scanned == 987654321
@@ -84,6 +84,17 @@ class TestDuckDBAdapter:
         assert result.row_count == 3
         assert len(result.columns) == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_query_with_params(self, connected_adapter):
+        """Test named placeholders are bound as DuckDB parameters."""
+        result = await connected_adapter.execute_query(
+            "SELECT :num + 1 as num, :text as text, ':text' as literal",
+            params={"num": 41, "text": "hello"},
+        )
+        assert result.rows[0]["num"] == 42
+        assert result.rows[0]["text"] == "hello"
+        assert result.rows[0]["literal"] == ":text"
+
     @pytest.mark.asyncio
     async def test_get_schema(self, connected_adapter):
         """Test schema discovery."""
@@ -179,6 +190,61 @@ class TestDuckDBDirectoryMode:
                 assert result.success is True
 
 
+    @pytest.mark.asyncio
+    async def test_directory_mode_with_hive_partitions(self):
+        """Test a partitioned dataset directory becomes a single glob view."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            import duckdb
+
+            conn = duckdb.connect(":memory:")
+            for day, extra in (("2026-01-10", ""), ("2026-01-11", ", 2.5 as amount")):
+                part_dir = os.path.join(tmpdir, "events", f"date={day}")
+                os.makedirs(part_dir)
+                conn.execute(
+                    f"COPY (SELECT 1 as id{extra}) TO '{part_dir}/part-0.parquet'"
+                )
+            conn.close()
+
+            adapter = DuckDBAdapter({"path": tmpdir, "source_type": "directory"})
+
+            async with adapter:
+                result = await adapter.execute_query(
+                    "SELECT COUNT(*) as cnt FROM events WHERE date = :day",
+                    params={"day": "2026-01-10"},
+                )
+                assert result.rows[0]["cnt"] == 1
+
+                schema = await adapter.get_schema()
+                tables = {t.name: t for t in schema.get_all_tables()}
+                assert set(tables) == {"events"}
+                columns = {c.name for c in tables["events"].columns}
+                # union_by_name merges drifting schemas, hive adds the partition key
+                assert columns == {"id", "amount", "date"}
+
+    @pytest.mark.asyncio
+    async def test_directory_mode_materialize_and_settings(self):
+        """Test materialized datasets and configured resource limits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "users.csv"), "w") as f:
+                f.write("id,name\n1,Alice\n")
+
+            adapter = DuckDBAdapter({
+                "path": tmpdir,
+                "source_type": "directory",
+                "threads": 2,
+                "materialize": "users",
+            })
+
+            async with adapter:
+                schema = await adapter.get_schema()
+                assert schema.get_all_tables()[0].table_type == "table"
+
+                result = await adapter.execute_query(
+                    "SELECT current_setting('threads') as threads"
+                )
+                assert result.rows[0]["threads"] == 2
+
+
 class TestDuckDBAdapterErrors:
     """Tests for DuckDB adapter error handling."""
 
@@ -214,6 +280,16 @@ class TestDuckDBAdapterErrors:
         with pytest.raises(QuerySyntaxError):
             await connected_adapter.execute_query("SELEC * FROM users")
 
+    @pytest.mark.asyncio
+    async def test_execute_query_timeout(self, connected_adapter):
+        """Test long-running queries are interrupted after the timeout."""
+        from dataing.adapters.datasource.errors import QueryTimeoutError
+
+        with pytest.raises(QueryTimeoutError):
+            await connected_adapter.execute_query(
+                "SELECT COUNT(*) FROM range(100000000000)", timeout_seconds=1
+            )
+
     @pytest.mark.asyncio
     async def test_get_schema_not_connected(self):
         """Test get_schema fails when not connected."""
@@ -285,6 +361,54 @@ class TestDuckDBAdapterSampling:
         assert result.row_count == 10
 
 
+class TestDuckDBAdapterCostEstimation:
+    """Tests for DuckDB cost estimation."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_counts_scanned_rows(self, connected_adapter):
+        """Test scanned rows come from the plan's scan cardinalities."""
+        await connected_adapter.execute_query(
+            "CREATE TABLE cost_test AS SELECT i FROM range(1000) t(i)"
+        )
+
+        estimate = await connected_adapter.estimate_query_cost(
+            "SELECT * FROM cost_test WHERE i > :low LIMIT 5", {"low": 10}
+        )
+
+        assert estimate.method == "explain"
+        assert 0 < estimate.rows_scanned <= 1000
+        assert estimate.bytes_scanned is None
+
+    @pytest.mark.asyncio
+    async def test_estimate_flags_cross_join(self, connected_adapter):
+        """Test a cross join costs the product of its inputs."""
+        await connected_adapter.execute_query(
+            "CREATE TABLE cross_test AS SELECT i FROM range(1000) t(i)"
+        )
+
+        estimate = await connected_adapter.estimate_query_cost(
+            "SELECT COUNT(*) FROM cross_test a, cross_test b LIMIT 1"
+        )
+
+        assert estimate.rows_scanned == 2000
+        assert estimate.cost >= 1000 * 1000
+
+    @pytest.mark.asyncio
+    async def test_sampled_query_runs(self, connected_adapter):
+        """Test the sampled rewrite is valid DuckDB SQL."""
+        await connected_adapter.execute_query(
+            "CREATE TABLE sampled_test AS SELECT i FROM range(100000) t(i)"
+        )
+
+        sql = connected_adapter.build_sampled_query(
+            "SELECT COUNT(*) AS cnt FROM sampled_test LIMIT 1", 10
+        )
+        result = await connected_adapter.execute_query(sql)
+
+        assert "TABLESAMPLE SYSTEM (10 PERCENT)" in sql
+        assert result.rows[0]["cnt"] < 100000
+
+
 class TestDuckDBAdapterQueryLimit:
     """Tests for query result limiting."""
 
@@ -0,0 +1,141 @@
+"""Tests for the DynamoDB adapter."""
+
+from typing import Any
+
+import pytest
+
+from dataing.adapters.datasource.document.dynamodb import DynamoDBAdapter
+from dataing.adapters.datasource.errors import RateLimitedError
+
+
+@pytest.fixture
+def adapter():
+    """Create a DynamoDB adapter against a moto table with 50 items."""
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+
+    with moto.mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="orders",
+            KeySchema=[{"AttributeName": "order_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "order_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        for i in range(50):
+            client.put_item(
+                TableName="orders",
+                Item={
+                    "order_id": {"S": f"o{i}"},
+                    "status": {"S": "paid" if i % 2 else "open"},
+                    "amount": {"N": str(i)},
+                },
+            )
+
+        adapter = DynamoDBAdapter({"region": "us-east-1", "scan_segments": 3})
+        adapter._client = client
+        adapter._connected = True
+        yield adapter
+
+
+class TestDynamoDBScan:
+    """Tests for parallel segmented scans."""
+
+    @pytest.mark.asyncio
+    async def test_scan_paginates_across_segments(self, adapter):
+        """Test that all items are returned when the limit exceeds the table."""
+        result = await adapter.scan_collection("orders", limit=100)
+
+        assert result.row_count == 50
+        assert result.truncated is False
+        assert len({row["order_id"] for row in result.rows}) == 50
+
+    @pytest.mark.asyncio
+    async def test_scan_respects_limit_and_projection(self, adapter):
+        """Test limit enforcement and projected attributes."""
+        result = await adapter.scan_collection("orders", limit=7, columns=["order_id"])
+
+        assert result.row_count == 7
+        assert result.truncated is True
+        assert all(set(row) == {"order_id"} for row in result.rows)
+
+    @pytest.mark.asyncio
+    async def test_scan_splits_limit_across_segments(self, adapter, monkeypatch):
+        """Test that each segment page reads only its share of the limit."""
+        limits: list[int] = []
+        call = adapter._call
+
+        async def spy(operation: str, **kwargs: Any) -> dict[str, Any]:
+            if operation == "scan":
+                limits.append(kwargs["Limit"])
+            return await call(operation, **kwargs)
+
+        monkeypatch.setattr(adapter, "_call", spy)
+        result = await adapter.scan_collection("orders", limit=7)
+
+        assert result.row_count == 7
+        assert limits[:3] == [3, 3, 3]
+        assert max(limits) <= 3
+
+    @pytest.mark.asyncio
+    async def test_count_with_filter_uses_segments(self, adapter):
+        """Test filtered counts across segments."""
+        assert await adapter.count_documents("orders", {"status": "paid"}) == 25
+
+    @pytest.mark.asyncio
+    async def test_get_schema_infers_non_key_attributes(self, adapter):
+        """Test that sampled attributes are added to key attributes."""
+        schema = await adapter.get_schema()
+
+        table = schema.catalogs[0].schemas[0].tables[0]
+        columns = {c.name: c for c in table.columns}
+        assert columns["order_id"].is_primary_key is True
+        assert columns["amount"].native_type == "N"
+
+
+class TestDynamoDBBackoff:
+    """Tests for throttling backoff."""
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_requests(self, monkeypatch):
+        """Test that throttled calls are retried and then succeed."""
+        adapter = DynamoDBAdapter({"max_retries": 3})
+        calls = {"n": 0}
+
+        class Throttled(Exception):
+            response = {"Error": {"Code": "ProvisionedThroughputExceededException"}}
+
+        class Client:
+            def scan(self, **params: Any) -> dict[str, Any]:
+                calls["n"] += 1
+                if calls["n"] < 3:
+                    raise Throttled()
+                return {"Items": []}
+
+        adapter._client = Client()
+        monkeypatch.setattr(
+            "dataing.adapters.datasource.document.dynamodb.random.uniform", lambda a, b: 0
+        )
+
+        assert await adapter._call("scan", TableName="t") == {"Items": []}
+        assert calls["n"] == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, monkeypatch):
+        """Test that persistent throttling surfaces as RateLimitedError."""
+        adapter = DynamoDBAdapter({"max_retries": 1})
+
+        class Throttled(Exception):
+            response = {"Error": {"Code": "ThrottlingException"}}
+
+        class Client:
+            def scan(self, **params: Any) -> dict[str, Any]:
+                raise Throttled()
+
+        adapter._client = Client()
+        monkeypatch.setattr(
+            "dataing.adapters.datasource.document.dynamodb.random.uniform", lambda a, b: 0
+        )
+
+        with pytest.raises(RateLimitedError):
+            await adapter._call("scan", TableName="t")
@@ -3,7 +3,12 @@
 import pytest
 from typing import Any
 
-from dataing.adapters.datasource.filesystem.base import FileSystemAdapter, FileInfo
+from dataing.adapters.datasource.filesystem.base import (
+    FileSystemAdapter,
+    FileInfo,
+    split_dataset_path,
+)
+from dataing.adapters.datasource.filesystem.schema_cache import SchemaCache
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
     Column,
@@ -354,3 +359,53 @@ class TestFileSystemAdapterAbstractMethods:
 
         with pytest.raises(TypeError):
             IncompleteFileSystemAdapter({})
+
+
+class TestSplitDatasetPath:
+    """Tests for split_dataset_path."""
+
+    def test_strips_hive_partitions(self):
+        """Test that trailing key=value directories become partition keys."""
+        prefix, keys = split_dataset_path("s3://b/events/year=2026/month=01/part-0.parquet")
+        assert prefix == "s3://b/events"
+        assert keys == ["year", "month"]
+
+    def test_plain_directory(self):
+        """Test a path without partition directories."""
+        prefix, keys = split_dataset_path("/data/orders/orders_1.csv")
+        assert prefix == "/data/orders"
+        assert keys == []
+
+
+class TestSchemaCache:
+    """Tests for the on-disk schema cache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Test that saved entries are visible to a new cache instance."""
+        file = FileInfo(path="/d/a.parquet", name="a.parquet", size_bytes=10, etag='"abc"')
+        cache = SchemaCache(tmp_path, namespace="s3")
+        cache.put(file, [("id", "BIGINT"), ("name", "VARCHAR")])
+        cache.save()
+
+        reloaded = SchemaCache(tmp_path, namespace="s3")
+        assert reloaded.get(file) == [("id", "BIGINT"), ("name", "VARCHAR")]
+
+    def test_changed_file_misses(self, tmp_path):
+        """Test that a size or version change invalidates the entry."""
+        file = FileInfo(
+            path="/d/a.csv", name="a.csv", size_bytes=10, last_modified="2026-01-01T00:00:00"
+        )
+        cache = SchemaCache(tmp_path)
+        cache.put(file, [("id", "BIGINT")])
+
+        grown = FileInfo(
+            path="/d/a.csv", name="a.csv", size_bytes=20, last_modified="2026-01-01T00:00:00"
+        )
+        assert cache.get(grown) is None
+
+    def test_unversioned_file_not_cached(self, tmp_path):
+        """Test that files without mtime or ETag are never cached."""
+        file = FileInfo(path="/d/a.csv", name="a.csv", size_bytes=10)
+        cache = SchemaCache(tmp_path)
+        cache.put(file, [("id", "BIGINT")])
+        assert cache.get(file) is None
@@ -0,0 +1,164 @@
+"""Tests for sharded filesystem listing."""
+
+import time
+
+import pytest
+
+from dataing.adapters.datasource.filesystem.base import FileInfo
+from dataing.adapters.datasource.filesystem.listing import (
+    ListingManifest,
+    ShardedLister,
+    partition_matches,
+)
+
+
+class FakeStore:
+    """In-memory object store that records every listing call."""
+
+    def __init__(self, keys: list[str]):
+        """Store the object keys."""
+        self.keys = list(keys)
+        self.level_calls: list[str] = []
+        self.tree_calls: list[str] = []
+
+    def _info(self, key: str) -> FileInfo:
+        return FileInfo(path=key, name=key.rsplit("/", 1)[-1], size_bytes=1, etag=key)
+
+    def list_level(self, prefix: str) -> tuple[list[FileInfo], list[str]]:
+        """List the files and child prefixes directly below a prefix."""
+        self.level_calls.append(prefix)
+        files, children = [], set()
+        for key in self.keys:
+            if not key.startswith(prefix):
+                continue
+            rest = key[len(prefix) :]
+            if "/" in rest:
+                children.add(prefix + rest.split("/", 1)[0] + "/")
+            else:
+                files.append(self._info(key))
+        return files, sorted(children)
+
+    def list_tree(self, prefix: str) -> list[FileInfo]:
+        """List every file below a prefix."""
+        self.tree_calls.append(prefix)
+        return [self._info(k) for k in self.keys if k.startswith(prefix)]
+
+
+KEYS = [
+    "events/date=2026-01-01/part-0.parquet",
+    "events/date=2026-01-02/part-0.parquet",
+    "events/date=2026-01-02/part-1.parquet",
+    "users/users.parquet",
+    "README.md",
+]
+
+
+class TestPartitionMatches:
+    """Tests for partition_matches."""
+
+    def test_matches_value_and_collection(self):
+        """Test single values and collections of accepted values."""
+        path = "s3://b/events/date=2026-01-02/part-0.parquet"
+        assert partition_matches(path, {"date": "2026-01-02"})
+        assert partition_matches(path, {"date": ["2026-01-01", "2026-01-02"]})
+        assert not partition_matches(path, {"date": "2026-01-01"})
+
+    def test_unrelated_keys_match(self):
+        """Test that keys absent from the path do not exclude it."""
+        assert partition_matches("s3://b/users/users.parquet", {"date": "2026-01-01"})
+
+
+class TestShardedLister:
+    """Tests for ShardedLister."""
+
+    @pytest.mark.asyncio
+    async def test_lists_all_files_across_shards(self):
+        """Test that every key is returned once when sharded."""
+        store = FakeStore(KEYS)
+        lister = ShardedLister(store.list_tree, store.list_level)
+
+        files = await lister.list("")
+
+        assert sorted(f.path for f in files) == sorted(KEYS)
+        assert set(store.tree_calls) == {
+            "events/date=2026-01-01/",
+            "events/date=2026-01-02/",
+        }
+
+    @pytest.mark.asyncio
+    async def test_partition_filter_prunes_prefixes(self):
+        """Test that non-matching partitions are never listed."""
+        store = FakeStore(KEYS)
+        lister = ShardedLister(store.list_tree, store.list_level)
+
+        files = await lister.list("", partition_filter={"date": "2026-01-02"})
+
+        assert "events/date=2026-01-01/" not in store.tree_calls
+        assert {f.path for f in files} == {
+            "events/date=2026-01-02/part-0.parquet",
+            "events/date=2026-01-02/part-1.parquet",
+            "users/users.parquet",
+            "README.md",
+        }
+
+    @pytest.mark.asyncio
+    async def test_manifest_reuses_fresh_shards_and_diffs_prefixes(self, tmp_path):
+        """Test that only new shards are listed and removed ones are dropped."""
+        store = FakeStore(KEYS)
+        await ShardedLister(
+            store.list_tree, store.list_level, ListingManifest(tmp_path, "s3://b/")
+        ).list("")
+
+        store.keys = [k for k in KEYS if "2026-01-01" not in k]
+        store.keys.append("events/date=2026-01-03/part-0.parquet")
+        store.tree_calls.clear()
+
+        manifest = ListingManifest(tmp_path, "s3://b/")
+        files = await ShardedLister(store.list_tree, store.list_level, manifest).list("")
+
+        assert store.tree_calls == ["events/date=2026-01-03/"]
+        assert "events/date=2026-01-01/" not in manifest.shards
+        assert "events/date=2026-01-03/part-0.parquet" in {f.path for f in files}
+
+    @pytest.mark.asyncio
+    async def test_stale_shards_are_relisted(self, tmp_path):
+        """Test that entries older than the TTL are listed again."""
+        store = FakeStore(KEYS)
+        manifest = ListingManifest(tmp_path, "root")
+        await ShardedLister(store.list_tree, manifest=manifest, manifest_ttl_seconds=60).list("")
+        manifest._shards[""]["listed_at"] = time.time() - 120
+
+        await ShardedLister(store.list_tree, manifest=manifest, manifest_ttl_seconds=60).list("")
+
+        assert store.tree_calls == ["", ""]
+
+
+class TestS3Listing:
+    """Tests for S3Adapter listing against a moto stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_list_files_with_partition_filter(self, tmp_path):
+        """Test sharded S3 listing and pruning end to end."""
+        boto3 = pytest.importorskip("boto3")
+        moto = pytest.importorskip("moto")
+
+        from dataing.adapters.datasource.filesystem.s3 import S3Adapter
+
+        with moto.mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket="lake")
+            for key in KEYS:
+                client.put_object(Bucket="lake", Key=key, Body=b"x")
+
+            adapter = S3Adapter({"bucket": "lake", "listing_manifest_dir": str(tmp_path)})
+            adapter._s3_client = client
+            adapter._connected = True
+
+            files = await adapter.list_files(partition_filter={"date": "2026-01-01"})
+
+        assert {f.path for f in files} == {
+            "s3://lake/events/date=2026-01-01/part-0.parquet",
+            "s3://lake/users/users.parquet",
+            "s3://lake/README.md",
+        }
+        assert all(f.etag for f in files)
@@ -0,0 +1,113 @@
+"""Tests for the local file adapter."""
+
+import os
+
+import pytest
+
+from dataing.adapters.datasource.filesystem.local import LocalFileAdapter
+
+
+def _write_parquet(path: str, select_sql: str) -> None:
+    """Write a parquet file from a DuckDB SELECT."""
+    import duckdb
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = duckdb.connect(":memory:")
+    conn.execute(f"COPY ({select_sql}) TO '{path}' (FORMAT PARQUET)")
+    conn.close()
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a directory with a partitioned dataset and a standalone file."""
+    root = tmp_path / "data"
+    for day in ("2026-01-01", "2026-01-02", "2026-01-03"):
+        _write_parquet(
+            str(root / "events" / f"date={day}" / "part-0.parquet"),
+            "SELECT range AS id, 'click' AS kind FROM range(5)",
+        )
+    _write_parquet(str(root / "users.parquet"), "SELECT range AS user_id FROM range(3)")
+    return root
+
+
+@pytest.fixture
+async def adapter(data_dir, tmp_path):
+    """Create and connect a local file adapter with an isolated schema cache."""
+    adapter = LocalFileAdapter({"path": str(data_dir), "schema_cache_dir": str(tmp_path / "cache")})
+    await adapter.connect()
+    yield adapter
+    await adapter.disconnect()
+
+
+def _tables(schema):
+    return {t.name: t for c in schema.catalogs for s in c.schemas for t in s.tables}
+
+
+class TestLocalFileSchemaInference:
+    """Tests for schema inference in LocalFileAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_partitioned_files_collapse_to_dataset(self, adapter, data_dir):
+        """Test that identically-shaped partition files become one table."""
+        tables = _tables(await adapter.get_schema())
+
+        assert set(tables) == {"events", "users"}
+        events = tables["events"]
+        assert events.native_path == f"{data_dir}/events/**/*.parquet"
+        assert [c.name for c in events.columns] == ["id", "kind", "date"]
+        assert events.columns[-1].is_partition_key is True
+        assert tables["users"].native_type == "LOCAL_PARQUET_FILE"
+
+    @pytest.mark.asyncio
+    async def test_differing_schemas_stay_separate(self, adapter, data_dir):
+        """Test that files with different schemas are not merged."""
+        _write_parquet(
+            str(data_dir / "events" / "date=2026-01-04" / "extra.parquet"),
+            "SELECT 1 AS other",
+        )
+
+        tables = _tables(await adapter.get_schema())
+
+        assert "events" not in tables
+        assert {"part_0", "extra", "users"} <= set(tables)
+
+    @pytest.mark.asyncio
+    async def test_cached_schema_skips_describe(self, adapter, data_dir, tmp_path):
+        """Test that a second adapter reuses the on-disk schema cache."""
+        await adapter.get_schema()
+        assert (tmp_path / "cache" / "local_file.json").exists()
+
+        second = LocalFileAdapter(
+            {"path": str(data_dir), "schema_cache_dir": str(tmp_path / "cache")}
+        )
+        await second.connect()
+        try:
+            second._conn.close()
+
+            class _NoCursor:
+                def cursor(self):
+                    raise AssertionError("schema should come from the cache")
+
+                def close(self):
+                    pass
+
+            second._conn = _NoCursor()
+            tables = _tables(await second.get_schema())
+        finally:
+            second._connected = False
+
+        assert [c.name for c in tables["users"].columns] == ["user_id"]
+
+
+class TestLocalFileQueries:
+    """Tests for query execution in LocalFileAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_params_are_bound(self, adapter, data_dir):
+        """Test that :name placeholders are bound instead of ignored."""
+        result = await adapter.execute_query(
+            "SELECT user_id FROM read_parquet(:path) WHERE user_id >= :min_id ORDER BY user_id",
+            params={"path": str(data_dir / "users.parquet"), "min_id": 1},
+        )
+
+        assert [row["user_id"] for row in result.rows] == [1, 2]
@@ -0,0 +1,134 @@
+"""Tests for the MongoDB adapter."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from dataing.adapters.datasource.document.mongodb import MongoDBAdapter
+from dataing.adapters.datasource.types import NormalizedType
+
+
+class FakeCursor:
+    """Async cursor returning canned documents."""
+
+    def __init__(self, docs: list[dict[str, Any]]):
+        """Hold the documents the cursor returns."""
+        self._docs = docs
+
+    async def to_list(self, length: int | None = None) -> list[dict[str, Any]]:
+        """Return the documents."""
+        return self._docs
+
+
+class FakeCollection:
+    """Collection that returns a canned type histogram."""
+
+    def __init__(self, db: "FakeDatabase", histogram: list[dict[str, Any]]):
+        """Hold the histogram returned by every aggregation."""
+        self._db = db
+        self._histogram = histogram
+
+    def aggregate(self, pipeline: list[dict[str, Any]]) -> FakeCursor:
+        """Record the pipeline and return the histogram."""
+        self._db.pipelines.append(pipeline)
+        return FakeCursor(self._histogram)
+
+    async def estimated_document_count(self) -> int:
+        """Return the number of documents in the collection."""
+        self._db.active += 1
+        self._db.peak = max(self._db.peak, self._db.active)
+        await asyncio.sleep(0.01)
+        self._db.active -= 1
+        return 42
+
+
+class FakeDatabase:
+    """Database holding fake collections and tracking concurrency."""
+
+    def __init__(self, collections: dict[str, list[dict[str, Any]]]):
+        """Create one collection per histogram."""
+        self._collections = {name: FakeCollection(self, h) for name, h in collections.items()}
+        self.pipelines: list[list[dict[str, Any]]] = []
+        self.active = 0
+        self.peak = 0
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        """Return a collection by name."""
+        return self._collections[name]
+
+    async def list_collection_names(self) -> list[str]:
+        """Return the collection names."""
+        return list(self._collections)
+
+
+def _group(path: str, bson_type: str, count: int) -> dict[str, Any]:
+    return {"_id": {"path": path, "type": bson_type}, "count": count}
+
+
+ORDERS_HISTOGRAM = [
+    _group("_id", "objectId", 50),
+    _group("amount", "double", 48),
+    _group("amount", "null", 2),
+    _group("customer", "object", 50),
+    _group("customer.name", "string", 50),
+    _group("status", "string", 30),
+    _group("status", "int", 20),
+]
+
+
+@pytest.fixture
+def adapter():
+    """Create a connected MongoDB adapter backed by a fake database."""
+    adapter = MongoDBAdapter(
+        {"connection_string": "mongodb://x", "database": "shop", "schema_inference_concurrency": 2}
+    )
+    adapter._db = FakeDatabase(
+        {
+            "orders": ORDERS_HISTOGRAM,
+            "a": [_group("_id", "objectId", 1)],
+            "b": [_group("_id", "objectId", 1)],
+            "c": [_group("_id", "objectId", 1)],
+            "system.views": [],
+        }
+    )
+    adapter._connected = True
+    return adapter
+
+
+class TestMongoDBSchemaInference:
+    """Tests for server-side schema inference."""
+
+    @pytest.mark.asyncio
+    async def test_infer_schema_uses_type_histograms(self, adapter):
+        """Test that field types come from the aggregated histogram."""
+        schema = await adapter.infer_schema("orders", sample_size=50)
+
+        pipeline = adapter._db.pipelines[0]
+        assert pipeline[0] == {"$sample": {"size": 50}}
+        assert pipeline[-1]["$group"]["count"] == {"$sum": 1}
+        assert schema["fields"]["amount"] == "double"
+        assert schema["fields"]["status"] == "mixed"
+        assert schema["fields"]["customer.name"] == "string"
+        assert schema["type_histograms"]["amount"] == {"double": 48, "null": 2}
+
+    @pytest.mark.asyncio
+    async def test_get_schema_bounds_concurrency(self, adapter):
+        """Test that collections are described concurrently within the bound."""
+        schema = await adapter.get_schema()
+
+        tables = {t.name: t for t in schema.catalogs[0].schemas[0].tables}
+        assert set(tables) == {"orders", "a", "b", "c"}
+        assert tables["orders"].row_count == 42
+        columns = {c.name: c for c in tables["orders"].columns}
+        assert columns["_id"].is_primary_key is True
+        assert columns["amount"].data_type == NormalizedType.FLOAT
+        assert adapter._db.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_get_schema_reuses_cached_collections(self, adapter):
+        """Test that a second schema request does not sample again."""
+        await adapter.get_schema()
+        await adapter.get_schema()
+
+        assert len(adapter._db.pipelines) == 4
@@ -1,5 +1,7 @@
 """Tests for PostgresAdapter."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Any
@@ -21,6 +23,7 @@ from dataing.adapters.datasource.errors import (
 from dataing.adapters.datasource.types import (
     NormalizedType,
     QueryLanguage,
+    QueryResult,
     SchemaFilter,
     SourceCategory,
     SourceType,
@@ -233,6 +236,45 @@ class TestPostgresAdapterExecuteQuery:
         assert "Not connected" in str(exc_info.value)
 
 
+class TestPostgresAdapterEstimateQueryCost:
+    """Tests for PostgresAdapter.estimate_query_cost method."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_reads_explain_plan(self):
+        """Test cost and scanned rows are read from the EXPLAIN plan."""
+        plan = [
+            {
+                "Plan": {
+                    "Node Type": "Hash Join",
+                    "Total Cost": 1234.5,
+                    "Plan Rows": 10,
+                    "Plan Width": 8,
+                    "Plans": [
+                        {"Node Type": "Seq Scan", "Plan Rows": 1000, "Plan Width": 16},
+                        {"Node Type": "Index Scan", "Plan Rows": 10, "Plan Width": 32},
+                    ],
+                }
+            }
+        ]
+        adapter = PostgresAdapter({})
+        adapter.execute_query = AsyncMock(
+            return_value=QueryResult(
+                columns=[{"name": "QUERY PLAN", "data_type": "string"}],
+                rows=[{"QUERY PLAN": json.dumps(plan)}],
+                row_count=1,
+            )
+        )
+
+        estimate = await adapter.estimate_query_cost("SELECT * FROM a JOIN b ON a.id = b.id")
+
+        sql = adapter.execute_query.call_args.args[0]
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert estimate.method == "explain"
+        assert estimate.cost == 1234.5
+        assert estimate.rows_scanned == 1010
+        assert estimate.bytes_scanned == 1000 * 16 + 10 * 32
+
+
 class TestPostgresAdapterGetSchema:
     """Tests for PostgresAdapter.get_schema method."""
 
@@ -4,7 +4,7 @@ import pytest
 from typing import Any
 from unittest.mock import AsyncMock, patch, MagicMock
 
-from dataing.adapters.datasource.sql.base import SQLAdapter
+from dataing.adapters.datasource.sql.base import SQLAdapter, bind_params
 from dataing.adapters.datasource.types import (
     AdapterCapabilities,
     ConnectionTestResult,
@@ -74,6 +74,56 @@ class ConcreteSQLAdapter(SQLAdapter):
         self._query_index = 0
 
 
+class TestBindParams:
+    """Tests for portable placeholder rewriting."""
+
+    def test_no_params_returns_sql_unchanged(self):
+        """Test SQL without params is passed through, including percent signs."""
+        sql = "SELECT * FROM t WHERE name LIKE 'a%'"
+        assert bind_params(sql, None, "format") == (sql, [])
+
+    def test_numeric_style_reuses_index(self):
+        """Test asyncpg style numbers each distinct name once."""
+        sql, args = bind_params(
+            "SELECT * FROM t WHERE a = :d OR b = :d OR c = :e", {"d": 1, "e": 2}, "numeric"
+        )
+        assert sql == "SELECT * FROM t WHERE a = $1 OR b = $1 OR c = $2"
+        assert args == [1, 2]
+
+    def test_format_style_escapes_percent(self):
+        """Test aiomysql style escapes literal percent signs."""
+        sql, args = bind_params("SELECT * FROM t WHERE a LIKE 'x%' AND b = :b", {"b": 3}, "format")
+        assert sql == "SELECT * FROM t WHERE a LIKE 'x%%' AND b = %s"
+        assert args == [3]
+
+    def test_qmark_style_repeats_values(self):
+        """Test qmark style emits one value per placeholder occurrence."""
+        sql, args = bind_params("SELECT :a, :b, :a", {"a": 1, "b": 2}, "qmark")
+        assert sql == "SELECT ?, ?, ?"
+        assert args == [1, 2, 1]
+
+    def test_named_style_returns_pairs(self):
+        """Test BigQuery style keeps names and returns name/value pairs."""
+        sql, args = bind_params("SELECT :a, :a", {"a": 1}, "named")
+        assert sql == "SELECT @a, @a"
+        assert args == [("a", 1)]
+
+    def test_ignores_casts_literals_and_comments(self):
+        """Test placeholders inside literals, identifiers and comments are untouched."""
+        sql, args = bind_params(
+            'SELECT x::text, \':a\', "b:c" -- :a\nFROM t WHERE y = :a /* :a */',
+            {"a": 1},
+            "numeric",
+        )
+        assert sql == 'SELECT x::text, \':a\', "b:c" -- :a\nFROM t WHERE y = $1 /* :a */'
+        assert args == [1]
+
+    def test_missing_param_raises(self):
+        """Test referencing an unknown placeholder raises ValueError."""
+        with pytest.raises(ValueError, match="missing_name"):
+            bind_params("SELECT :missing_name", {"other": 1}, "qmark")
+
+
 class TestSQLAdapterCapabilities:
     """Tests for SQLAdapter default capabilities."""
 
@@ -261,6 +311,47 @@ class TestSQLAdapterBuildSampleQuery:
         assert "public.users" in query
 
 
+class TestSQLAdapterCostEstimation:
+    """Tests for SQLAdapter cost estimation and sampled rewrites."""
+
+    @pytest.mark.asyncio
+    async def test_estimate_defaults_to_unsupported(self):
+        """Test adapters without an estimator return None."""
+        adapter = ConcreteSQLAdapter({})
+
+        assert await adapter.estimate_query_cost("SELECT 1") is None
+
+    def test_sampled_query_requires_dialect(self):
+        """Test the rewrite is disabled without a sqlglot dialect."""
+        adapter = ConcreteSQLAdapter({})
+
+        assert adapter.build_sampled_query("SELECT * FROM users LIMIT 5", 10) is None
+
+    def test_sampled_query_samples_base_tables(self, monkeypatch):
+        """Test every base table is sampled but CTE references are not."""
+        adapter = ConcreteSQLAdapter({})
+        monkeypatch.setattr(adapter, "SQL_DIALECT", "postgres")
+
+        sql = adapter.build_sampled_query(
+            "WITH recent AS (SELECT * FROM events WHERE day = :day) "
+            "SELECT * FROM recent JOIN users u ON recent.user_id = u.id LIMIT 5",
+            2.5,
+        )
+
+        assert sql is not None
+        assert "events TABLESAMPLE SYSTEM (2.5)" in sql
+        assert "AS u TABLESAMPLE SYSTEM (2.5)" in sql
+        assert "recent TABLESAMPLE" not in sql
+        assert "day = :day" in sql
+
+    def test_sampled_query_unparseable(self, monkeypatch):
+        """Test SQL that cannot be parsed is not rewritten."""
+        adapter = ConcreteSQLAdapter({})
+        monkeypatch.setattr(adapter, "SQL_DIALECT", "postgres")
+
+        assert adapter.build_sampled_query("SELECT FROM WHERE (", 10) is None
+
+
 class TestSQLAdapterGetColumnStats:
     """Tests for SQLAdapter.get_column_stats method."""
 
@@ -176,6 +176,16 @@ class TestNormalizeType:
         result = normalize_type(None, SourceType.POSTGRESQL)
         assert result == NormalizedType.UNKNOWN
 
+    def test_repeated_types_are_memoized(self):
+        """Test that repeated native types are served from the cache."""
+        normalize_type.cache_clear()
+        for _ in range(100):
+            normalize_type("character varying(255)", SourceType.POSTGRESQL)
+
+        info = normalize_type.cache_info()
+        assert info.misses == 1
+        assert info.hits == 99
+
 
 class TestGetTypeMap:
     """Tests for get_type_map function."""
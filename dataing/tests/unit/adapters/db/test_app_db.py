@@ -5,11 +5,12 @@ from __future__ import annotations
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from dataing.adapters.db.app_db import AppDatabase
+from dataing.adapters.db.app_db import AppDatabase, tenant_settings
 
 
 class TestAppDatabase:
@@ -204,6 +205,19 @@ class TestAppDatabaseTenantOperations:
 
         assert result["name"] == "New Tenant"
 
+    @pytest.mark.parametrize(
+        ("tenant", "expected"),
+        [
+            (None, {}),
+            ({"settings": None}, {}),
+            ({"settings": {"llm_cache": {"enabled": False}}}, {"llm_cache": {"enabled": False}}),
+            ({"settings": '{"query_budget": {"max_cost": 5}}'}, {"query_budget": {"max_cost": 5}}),
+        ],
+    )
+    def test_tenant_settings(self, tenant: dict[str, Any] | None, expected: dict[str, Any]) -> None:
+        """Test settings are read from a row as a dict or JSON text."""
+        assert tenant_settings(tenant) == expected
+
 
 class TestAppDatabaseApiKeyOperations:
     """Tests for API key database operations."""
@@ -279,3 +293,75 @@ class TestAppDatabaseApiKeyOperations:
         await db.update_api_key_last_used(uuid.uuid4())
 
         mock_conn.execute.assert_called_once()
+
+
+class TestAppDatabaseSchemaSyncOperations:
+    """Tests for schema sync database operations."""
+
+    @pytest.fixture
+    def mock_conn(self) -> AsyncMock:
+        """Return a mock connection with transaction support."""
+        conn = AsyncMock()
+
+        @asynccontextmanager
+        async def mock_transaction():
+            yield
+
+        conn.transaction = mock_transaction
+        return conn
+
+    @pytest.fixture
+    def db(self, mock_conn: AsyncMock) -> AppDatabase:
+        """Return an AppDatabase instance with mock pool."""
+        db = AppDatabase(dsn="postgresql://localhost/test")
+
+        mock_pool = MagicMock()
+
+        @asynccontextmanager
+        async def mock_acquire():
+            yield mock_conn
+
+        mock_pool.acquire = mock_acquire
+        db.pool = mock_pool
+        return db
+
+    async def test_merge_datasets_copies_then_merges(
+        self, db: AppDatabase, mock_conn: AsyncMock
+    ) -> None:
+        """Test that datasets are staged with COPY and merged in one statement."""
+        mock_conn.execute.side_effect = ["CREATE TABLE", "INSERT 0 2"]
+
+        count = await db.merge_datasets(
+            uuid.uuid4(),
+            uuid.uuid4(),
+            [
+                {"native_path": "public.a", "name": "a", "row_count": 1},
+                {"native_path": "public.b", "name": "b"},
+            ],
+        )
+
+        assert count == 2
+        copy_call = mock_conn.copy_records_to_table.call_args
+        assert copy_call.args[0] == "dataset_sync_stage"
+        assert copy_call.kwargs["records"][0][:3] == ("public.a", "a", None)
+        assert "ON CONFLICT (datasource_id, native_path)" in mock_conn.execute.call_args.args[0]
+        mock_conn.executemany.assert_not_called()
+
+    async def test_merge_datasets_skips_empty(self, db: AppDatabase, mock_conn: AsyncMock) -> None:
+        """Test that nothing is written for an empty batch."""
+        assert await db.merge_datasets(uuid.uuid4(), uuid.uuid4(), []) == 0
+        mock_conn.execute.assert_not_called()
+
+    async def test_create_schema_sync_job_yields_to_active_job(
+        self, db: AppDatabase, mock_conn: AsyncMock
+    ) -> None:
+        """Test that no job is created while the datasource has an active one."""
+        mock_conn.fetchrow.return_value = None
+
+        assert await db.create_schema_sync_job(uuid.uuid4(), uuid.uuid4()) is None
+        assert "ON CONFLICT (datasource_id)" in mock_conn.fetchrow.call_args.args[0]
+
+    async def test_update_schema_sync_job_rejects_unknown_fields(self, db: AppDatabase) -> None:
+        """Test that only progress columns can be updated."""
+        with pytest.raises(ValueError):
+            await db.update_schema_sync_job(uuid.uuid4(), tenant_id=uuid.uuid4())
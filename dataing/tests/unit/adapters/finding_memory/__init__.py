@@ -0,0 +1 @@
+"""Tests for finding memory adapters."""
@@ -0,0 +1,247 @@
+"""Tests for FindingMemory."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from bond.tools.memory import Error, Memory, SearchResult
+from dataing.adapters.finding_memory import FindingMemory, describe_alert
+from dataing.core.domain_types import (
+    AnomalyAlert,
+    Evidence,
+    Finding,
+    Hypothesis,
+    HypothesisCategory,
+    MetricSpec,
+)
+
+
+class InMemoryStore:
+    """Memory backend that matches on tenant and tags with a fixed score."""
+
+    def __init__(self, score: float = 0.9) -> None:
+        """Match every search with the given score."""
+        self.score = score
+        self.memories: list[tuple[UUID, Memory]] = []
+
+    async def store(
+        self, content: str, agent_id: str, *, tenant_id: UUID, **kwargs: Any
+    ) -> Memory | Error:
+        """Keep the memory under its tenant."""
+        memory = Memory(
+            id=uuid4(),
+            content=content,
+            created_at=datetime.now(UTC),
+            agent_id=agent_id,
+            conversation_id=kwargs.get("conversation_id"),
+            tags=kwargs.get("tags") or [],
+        )
+        self.memories.append((tenant_id, memory))
+        return memory
+
+    async def search(
+        self,
+        query: str,
+        *,
+        tenant_id: UUID,
+        top_k: int = 10,
+        tags: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[SearchResult] | Error:
+        """Return the tenant's memories carrying all the tags."""
+        return [
+            SearchResult(memory=memory, score=self.score)
+            for owner, memory in self.memories
+            if owner == tenant_id and set(tags or []) <= set(memory.tags)
+        ][:top_k]
+
+
+def _alert(dataset_id: str = "web.events", actual_value: float = 0.2) -> AnomalyAlert:
+    """Build a null-rate alert."""
+    return AnomalyAlert(
+        dataset_id=dataset_id,
+        metric_spec=MetricSpec(
+            metric_type="column", expression="user_id", display_name="user_id nulls"
+        ),
+        anomaly_type="null_rate",
+        expected_value=0.01,
+        actual_value=actual_value,
+        deviation_pct=1900.0,
+        anomaly_date="2024-01-15",
+        severity="high",
+    )
+
+
+def _evidence(
+    query: str, confidence: float, supports: bool | None = True, hypothesis_id: str = "h1"
+) -> Evidence:
+    """Build evidence for a query."""
+    return Evidence(
+        hypothesis_id=hypothesis_id,
+        query=query,
+        result_summary="n=485",
+        row_count=1,
+        supports_hypothesis=supports,
+        confidence=confidence,
+        interpretation="Null user_ids began after the users ETL failed.",
+    )
+
+
+def _finding(evidence: list[Evidence], root_cause: str | None = "Users ETL failed") -> Finding:
+    """Build a completed finding."""
+    return Finding(
+        investigation_id=str(uuid4()),
+        status="completed",
+        root_cause=root_cause,
+        confidence=0.92,
+        evidence=evidence,
+        recommendations=["Re-run the users ETL"],
+        duration_seconds=12.0,
+    )
+
+
+HYPOTHESES = [
+    Hypothesis(
+        id="h1",
+        title="Users ETL failed",
+        category=HypothesisCategory.UPSTREAM_DEPENDENCY,
+        reasoning="Nulls appeared after the ETL window",
+        suggested_query="SELECT 1",
+    ),
+    Hypothesis(
+        id="h2",
+        title="App release stopped sending user_id",
+        category=HypothesisCategory.DATA_QUALITY,
+        reasoning="A release went out that morning",
+        suggested_query="SELECT 2",
+    ),
+]
+
+
+@pytest.fixture
+def store() -> InMemoryStore:
+    """Create an in-memory backend."""
+    return InMemoryStore()
+
+
+class TestFindingMemory:
+    """Tests for FindingMemory."""
+
+    async def test_recalls_remembered_finding_with_decisive_queries(
+        self, store: InMemoryStore
+    ) -> None:
+        """Test a finding comes back with its confident, supporting queries first."""
+        memory = FindingMemory(store)
+        tenant_id = uuid4()
+        finding = _finding(
+            [
+                _evidence("SELECT weak LIMIT 1", 0.5),
+                _evidence("SELECT refuting LIMIT 1", 0.95, supports=False, hypothesis_id="h2"),
+                _evidence("SELECT strong LIMIT 1", 0.97),
+                _evidence("SELECT good LIMIT 1", 0.9),
+            ]
+        )
+
+        assert await memory.remember(tenant_id, _alert(), finding, HYPOTHESES) is True
+        priors = await memory.recall(tenant_id, _alert(actual_value=0.4))
+
+        assert len(priors) == 1
+        prior = priors[0]
+        assert prior.investigation_id == finding.investigation_id
+        assert prior.root_cause == "Users ETL failed"
+        assert prior.category == HypothesisCategory.UPSTREAM_DEPENDENCY
+        assert prior.decisive_queries == ["SELECT strong LIMIT 1", "SELECT good LIMIT 1"]
+        assert prior.recommendations == ["Re-run the users ETL"]
+        assert prior.similarity == pytest.approx(0.9)
+
+    async def test_findings_without_confirmation_are_not_remembered(
+        self, store: InMemoryStore
+    ) -> None:
+        """Test findings with nothing to re-run are skipped."""
+        memory = FindingMemory(store)
+        tenant_id = uuid4()
+
+        unconfirmed = _finding([_evidence("SELECT weak LIMIT 1", 0.5)])
+        no_cause = _finding([_evidence("SELECT strong LIMIT 1", 0.97)], root_cause=None)
+
+        assert await memory.remember(tenant_id, _alert(), unconfirmed, HYPOTHESES) is False
+        assert await memory.remember(tenant_id, _alert(), no_cause, HYPOTHESES) is False
+        assert store.memories == []
+
+    async def test_recall_is_scoped_to_tenant_and_dataset(self, store: InMemoryStore) -> None:
+        """Test findings of other datasets and tenants are not recalled."""
+        memory = FindingMemory(store)
+        tenant_id = uuid4()
+        finding = _finding([_evidence("SELECT strong LIMIT 1", 0.97)])
+        await memory.remember(tenant_id, _alert("web.orders"), finding, HYPOTHESES)
+
+        assert await memory.recall(tenant_id, _alert("web.events")) == []
+        assert await memory.recall(uuid4(), _alert("web.orders")) == []
+        assert len(await memory.recall(tenant_id, _alert("web.orders"))) == 1
+
+    async def test_backend_failures_are_contained(self) -> None:
+        """Test a failing backend means nothing is remembered or recalled."""
+        backend = AsyncMock()
+        backend.store.side_effect = RuntimeError("embedding API down")
+        backend.search.return_value = Error(description="connection refused")
+        memory = FindingMemory(backend)
+        finding = _finding([_evidence("SELECT strong LIMIT 1", 0.97)])
+
+        assert await memory.remember(uuid4(), _alert(), finding, HYPOTHESES) is False
+        assert await memory.recall(uuid4(), _alert()) == []
+
+    async def test_unreadable_memories_are_skipped(self, store: InMemoryStore) -> None:
+        """Test memories that are not findings do not break recall."""
+        memory = FindingMemory(store)
+        tenant_id = uuid4()
+        tags = ["investigation_finding", "dataset:web.events"]
+        await store.store("not json", "dataing-investigator", tenant_id=tenant_id, tags=tags)
+        await store.store(
+            json.dumps({"root_cause": "missing fields"}),
+            "dataing-investigator",
+            tenant_id=tenant_id,
+            tags=tags,
+        )
+
+        assert await memory.recall(tenant_id, _alert()) == []
+
+    async def test_unsafe_recalled_queries_are_dropped(self, store: InMemoryStore) -> None:
+        """Test stored queries are re-checked like generated ones before re-running."""
+        memory = FindingMemory(store)
+        tenant_id = uuid4()
+        tags = ["investigation_finding", "dataset:web.events"]
+        prior = {
+            "investigation_id": "inv-1",
+            "root_cause": "Users ETL failed",
+            "confidence": 0.9,
+            "category": "upstream_dependency",
+        }
+        for queries in (
+            ["DELETE FROM users LIMIT 1", "SELECT * FROM users LIMIT 1"],
+            ["SELECT 1 LIMIT 1; DROP TABLE users", "SELECT * FROM users"],
+        ):
+            await store.store(
+                json.dumps({**prior, "decisive_queries": queries}),
+                "dataing-investigator",
+                tenant_id=tenant_id,
+                tags=tags,
+            )
+
+        priors = await memory.recall(tenant_id, _alert())
+
+        assert [p.decisive_queries for p in priors] == [["SELECT * FROM users LIMIT 1"]]
+
+    def test_alert_description_ignores_date_and_values(self) -> None:
+        """Test recurrences of an alert are described alike."""
+        first = _alert(actual_value=0.2)
+        again = first.model_copy(update={"actual_value": 0.6, "anomaly_date": "2024-02-03"})
+
+        assert describe_alert(first) == describe_alert(again)
+        assert "web.events" in describe_alert(first)
+        assert "increased" in describe_alert(first)
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 import pytest
 from dataing.adapters.training.repository import TrainingSignalRepository
+from dataing.adapters.training.types import TrainingSignal
 
 
 class TestTrainingSignalRepository:
@@ -48,6 +49,42 @@ class TestTrainingSignalRepository:
         assert signal_id is not None
         mock_db.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_record_signals_in_bulk(
+        self, repository: TrainingSignalRepository, mock_db: MagicMock
+    ) -> None:
+        """Test several signals are written with one executemany call."""
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        mock_db.acquire.return_value.__aenter__.return_value = conn
+        signals = [
+            TrainingSignal(
+                signal_type=signal_type,
+                tenant_id=uuid4(),
+                investigation_id=uuid4(),
+                input_context={"query": "SELECT 1"},
+                output_response={"interpretation": "test result"},
+                automated_score=0.5,
+            )
+            for signal_type in ("interpretation", "synthesis")
+        ]
+
+        count = await repository.record_signals(signals)
+
+        assert count == 2
+        conn.executemany.assert_awaited_once()
+        rows = conn.executemany.call_args.args[1]
+        assert [row[1] for row in rows] == ["interpretation", "synthesis"]
+        assert rows[0][7] is None  # no dimensions
+
+    @pytest.mark.asyncio
+    async def test_record_signals_empty(
+        self, repository: TrainingSignalRepository, mock_db: MagicMock
+    ) -> None:
+        """Test an empty batch does not touch the database."""
+        assert await repository.record_signals([]) == 0
+        mock_db.acquire.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_human_feedback(
         self, repository: TrainingSignalRepository, mock_db: MagicMock
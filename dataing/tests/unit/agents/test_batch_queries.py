@@ -0,0 +1,132 @@
+"""Tests for generating the first query of several hypotheses in one call."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from bond import AgentSession
+from dataing.agents.client import AgentClient
+from dataing.agents.models import BatchQueryResponse, HypothesisQueryResponse
+from dataing.agents.prompts import query
+from dataing.core.domain_types import Hypothesis, HypothesisCategory
+from dataing.core.exceptions import LLMError
+
+
+@pytest.fixture
+def hypotheses() -> list[Hypothesis]:
+    """Create two hypotheses to batch."""
+    return [
+        Hypothesis(
+            id=f"h{i}",
+            title=f"Hypothesis number {i}",
+            category=HypothesisCategory.DATA_QUALITY,
+            reasoning="Nulls appeared after the deploy",
+            suggested_query="SELECT 1 LIMIT 1",
+        )
+        for i in (1, 2)
+    ]
+
+
+def _batch(*items: tuple[str, str]) -> BatchQueryResponse:
+    """Build a batch response from (hypothesis_id, sql) pairs."""
+    return BatchQueryResponse(
+        queries=[HypothesisQueryResponse(hypothesis_id=h_id, query=sql) for h_id, sql in items]
+    )
+
+
+class TestGenerateQueriesBatch:
+    """Tests for AgentClient.generate_queries_batch."""
+
+    async def test_one_call_for_all_hypotheses(self, hypotheses: list[Hypothesis]) -> None:
+        """Test every hypothesis gets its query from a single call."""
+        client = AgentClient(api_key="test-key")
+        ask = AsyncMock(return_value=_batch(("h2", "SELECT 2 LIMIT 1"), ("h1", "SELECT 1 LIMIT 1")))
+
+        with patch.object(client._batch_query_agent, "ask", ask):
+            queries = await client.generate_queries_batch(hypotheses, MagicMock())
+
+        ask.assert_awaited_once()
+        assert {h_id: r.query for h_id, r in queries.items()} == {
+            "h1": "SELECT 1 LIMIT 1",
+            "h2": "SELECT 2 LIMIT 1",
+        }
+        prompt = ask.call_args.args[0]
+        assert "[h1]" in prompt and "[h2]" in prompt
+
+    async def test_shares_single_query_system_prompt(self, hypotheses: list[Hypothesis]) -> None:
+        """Test the batch reuses the cached per-hypothesis system prompt."""
+        client = AgentClient(api_key="test-key")
+        ask = AsyncMock(return_value=_batch(("h1", "SELECT 1 LIMIT 1")))
+        schema = MagicMock()
+
+        with (
+            patch.object(client._batch_query_agent, "ask", ask),
+            patch.object(query, "build_system", return_value="system") as build_system,
+        ):
+            await client.generate_queries_batch(hypotheses, schema)
+
+        build_system.assert_called_once_with(schema=schema)
+        assert ask.call_args.kwargs["dynamic_instructions"] == "system"
+
+    async def test_unknown_and_duplicate_ids_are_ignored(
+        self, hypotheses: list[Hypothesis]
+    ) -> None:
+        """Test only the first query for each requested hypothesis is kept."""
+        client = AgentClient(api_key="test-key")
+        response = _batch(
+            ("h1", "SELECT 1 LIMIT 1"),
+            ("h1", "SELECT 11 LIMIT 1"),
+            ("h9", "SELECT 9 LIMIT 1"),
+        )
+
+        with patch.object(client._batch_query_agent, "ask", AsyncMock(return_value=response)):
+            queries = await client.generate_queries_batch(hypotheses, MagicMock())
+
+        assert list(queries) == ["h1"]
+        assert queries["h1"].query == "SELECT 1 LIMIT 1"
+
+    async def test_queries_are_recorded_in_sessions(self, hypotheses: list[Hypothesis]) -> None:
+        """Test each query joins its hypothesis's session for later reflexion."""
+        client = AgentClient(api_key="test-key")
+        sessions = {h.id: AgentSession(key=h.id) for h in hypotheses}
+        response = _batch(("h1", "SELECT 1 LIMIT 1"))
+
+        with patch.object(client._batch_query_agent, "ask", AsyncMock(return_value=response)):
+            await client.generate_queries_batch(hypotheses, MagicMock(), sessions=sessions)
+
+        assert sessions["h1"].turn_count == 1
+        assert "SELECT 1 LIMIT 1" in str(sessions["h1"].messages()[-1])
+        assert sessions["h2"].turn_count == 0
+
+    async def test_failure_raises_llm_error(self, hypotheses: list[Hypothesis]) -> None:
+        """Test provider failures surface as retryable LLM errors."""
+        client = AgentClient(api_key="test-key")
+
+        with (
+            patch.object(client._batch_query_agent, "ask", side_effect=RuntimeError("overloaded")),
+            pytest.raises(LLMError, match="Batch query generation failed"),
+        ):
+            await client.generate_queries_batch(hypotheses, MagicMock())
+
+    async def test_no_hypotheses_makes_no_call(self) -> None:
+        """Test an empty batch returns without calling the model."""
+        client = AgentClient(api_key="test-key")
+        ask: Any = AsyncMock()
+
+        with patch.object(client._batch_query_agent, "ask", ask):
+            assert await client.generate_queries_batch([], MagicMock()) == {}
+
+        ask.assert_not_awaited()
+
+
+class TestBatchQueryResponse:
+    """Tests for validation of batched queries."""
+
+    def test_each_query_is_validated(self) -> None:
+        """Test batched queries follow the same rules as single queries."""
+        with pytest.raises(ValidationError, match="LIMIT"):
+            _batch(("h1", "SELECT 1 LIMIT 1"), ("h2", "SELECT * FROM orders"))
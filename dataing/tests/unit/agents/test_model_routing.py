@@ -0,0 +1,189 @@
+"""Tests for per-role model routing, escalation, telemetry and governance."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.usage import RunUsage
+
+from bond import LLMGovernor, Priority
+from dataing.agents.client import AgentClient
+from dataing.agents.models import QueryResponse
+from dataing.agents.telemetry import AgentRole, LLMTelemetry, llm_usage_scope
+from dataing.core.domain_types import Hypothesis
+from dataing.core.exceptions import LLMError
+from dataing.services.usage import estimate_llm_cost
+
+STRONG = "claude-sonnet-4-20250514"
+FAST = "claude-3-5-haiku-20241022"
+
+
+@pytest.fixture
+def client() -> AgentClient:
+    """Create a client with a fast model for SQL generation."""
+    return AgentClient(api_key="test-key", model=STRONG, role_models={"query": FAST})
+
+
+def _answer(tokens: int = 100) -> Any:
+    """Create a fake ask that reports token usage and returns a query."""
+
+    async def ask(prompt: str, **kwargs: Any) -> QueryResponse:
+        kwargs["usage"].incr(RunUsage(requests=1, input_tokens=tokens, output_tokens=tokens))
+        return QueryResponse(query="SELECT 1 LIMIT 1")
+
+    return ask
+
+
+def _invalid_output() -> UnexpectedModelBehavior:
+    """Create the error an agent raises when its output keeps failing validation."""
+    return UnexpectedModelBehavior("Exceeded maximum retries (1) for output validation")
+
+
+class TestModelRouting:
+    """Tests for routing agents to their role's model."""
+
+    def test_roles_use_their_models(self, client: AgentClient) -> None:
+        """Test SQL generation runs on the fast model and the rest on the default."""
+        assert client._query_agent.model.model_name == FAST  # type: ignore[union-attr]
+        assert client._batch_query_agent.model.model_name == FAST  # type: ignore[union-attr]
+        assert client._synthesis_agent.model.model_name == STRONG  # type: ignore[union-attr]
+        assert client._escalated_query_agent is not None
+        assert client._escalated_query_agent.model.model_name == STRONG  # type: ignore[union-attr]
+
+    def test_single_model_has_no_escalation(self) -> None:
+        """Test there is nothing to escalate to when every role shares a model."""
+        client = AgentClient(api_key="test-key")
+
+        assert client._escalated_query_agent is None
+        assert set(client.role_models.values()) == {STRONG}
+
+    async def test_escalate_uses_default_model(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test an escalated query is generated by the default model."""
+        fast = AsyncMock()
+        assert client._escalated_query_agent is not None
+        with (
+            patch.object(client._query_agent, "ask", fast),
+            patch.object(client._escalated_query_agent, "ask", side_effect=_answer()),
+        ):
+            sql = await client.generate_query(sample_hypothesis, MagicMock(), escalate=True)
+
+        assert sql == "SELECT 1 LIMIT 1"
+        fast.assert_not_awaited()
+
+    async def test_invalid_fast_output_escalates(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test the default model answers when the fast model's output fails validation."""
+        assert client._escalated_query_agent is not None
+        with (
+            patch.object(client._query_agent, "ask", AsyncMock(side_effect=_invalid_output())),
+            patch.object(client._escalated_query_agent, "ask", side_effect=_answer()),
+        ):
+            sql = await client.generate_query(sample_hypothesis, MagicMock())
+
+        assert sql == "SELECT 1 LIMIT 1"
+
+    async def test_transport_failure_does_not_escalate(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test rate limits and connection errors are not retried on the default model."""
+        assert client._escalated_query_agent is not None
+        strong = AsyncMock()
+        with (
+            patch.object(client._query_agent, "ask", AsyncMock(side_effect=ConnectionError("429"))),
+            patch.object(client._escalated_query_agent, "ask", strong),
+            pytest.raises(LLMError, match="Query generation failed"),
+        ):
+            await client.generate_query(sample_hypothesis, MagicMock())
+
+        strong.assert_not_awaited()
+
+    async def test_escalated_failure_raises(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test a failure of the default model is not retried again."""
+        assert client._escalated_query_agent is not None
+        failing = AsyncMock(side_effect=_invalid_output())
+        with (
+            patch.object(client._query_agent, "ask", failing),
+            patch.object(client._escalated_query_agent, "ask", failing),
+            pytest.raises(LLMError, match="Query generation failed"),
+        ):
+            await client.generate_query(sample_hypothesis, MagicMock())
+
+        assert failing.await_count == 2
+
+
+class TestUsageTelemetry:
+    """Tests for per-role latency, token and cost counters."""
+
+    async def test_usage_is_totalled_per_role_and_model(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test escalated calls are counted separately from fast ones."""
+        assert client._escalated_query_agent is not None
+        with (
+            patch.object(client._query_agent, "ask", side_effect=_answer(100)),
+            patch.object(client._escalated_query_agent, "ask", side_effect=_answer(50)),
+        ):
+            await client.generate_query(sample_hypothesis, MagicMock())
+            await client.generate_query(sample_hypothesis, MagicMock())
+            await client.generate_query(sample_hypothesis, MagicMock(), escalate=True)
+
+        fast = client.telemetry.roles[(AgentRole.QUERY, FAST)]
+        strong = client.telemetry.roles[(AgentRole.QUERY, STRONG)]
+        assert (fast.calls, fast.input_tokens) == (2, 200)
+        assert (strong.calls, strong.output_tokens) == (1, 50)
+        assert fast.cost == pytest.approx(estimate_llm_cost(FAST, 200, 200))
+        assert fast.latency_ms > 0
+
+    async def test_scope_collects_only_its_calls(
+        self, client: AgentClient, sample_hypothesis: Hypothesis
+    ) -> None:
+        """Test an investigation's scope sees its own calls and not earlier ones."""
+        with patch.object(client._query_agent, "ask", side_effect=_answer()):
+            await client.generate_query(sample_hypothesis, MagicMock())
+            with llm_usage_scope() as ledger:
+                await client.generate_query(sample_hypothesis, MagicMock())
+
+        assert client.telemetry.roles[(AgentRole.QUERY, FAST)].calls == 2
+        assert ledger.roles[(AgentRole.QUERY, FAST)].calls == 1
+
+    def test_summary_orders_by_cost(self) -> None:
+        """Test the most expensive role comes first in the summary."""
+        telemetry = LLMTelemetry()
+        telemetry.record("query", FAST, RunUsage(requests=1, input_tokens=1000), 100.0)
+        telemetry.record("synthesis", STRONG, RunUsage(requests=1, input_tokens=1000), 300.0)
+
+        summary = telemetry.summary()
+
+        assert [s["role"] for s in summary] == ["synthesis", "query"]
+        assert summary[0]["mean_latency_ms"] == 300.0
+        assert telemetry.total_cost == pytest.approx(
+            estimate_llm_cost(FAST, 1000, 0) + estimate_llm_cost(STRONG, 1000, 0)
+        )
+
+
+class TestGovernance:
+    """Tests for routing every agent through a shared governor."""
+
+    def test_agents_share_governor_with_role_priorities(self) -> None:
+        """Test synthesis is admitted first and SQL generation last."""
+        governor = LLMGovernor()
+        client = AgentClient(api_key="test-key", governor=governor)
+
+        assert client._synthesis_agent.governor is governor
+        assert client._synthesis_agent.priority == Priority.CRITICAL
+        assert client._query_agent.priority == Priority.SPECULATIVE
+        assert client._provider.client.max_retries == 0
+
+    def test_sdk_retries_kept_without_governor(self) -> None:
+        """Test the SDK still retries rate limits when nothing else does."""
+        client = AgentClient(api_key="test-key")
+
+        assert client._provider.client.max_retries > 0
@@ -0,0 +1,150 @@
+"""Tests for prompt prefix caching and memoized schema rendering."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pydantic_ai.usage import RunUsage
+
+from dataing.adapters.datasource.types import (
+    Catalog,
+    Column,
+    NormalizedType,
+    Schema,
+    SchemaResponse,
+    SourceCategory,
+    SourceType,
+    Table,
+)
+from dataing.agents.client import PROMPT_CACHE_SETTINGS, AgentClient
+from dataing.agents.models import QueryResponse
+from dataing.agents.prompts import query, reflexion
+from dataing.agents.prompts.rendering import clear_schema_render_cache, render_schema
+from dataing.core.domain_types import Hypothesis
+
+
+@pytest.fixture
+def schema() -> SchemaResponse:
+    """Build a one-table schema response."""
+    return SchemaResponse(
+        source_id="src",
+        source_type=SourceType.POSTGRESQL,
+        source_category=SourceCategory.DATABASE,
+        fetched_at=datetime(2026, 1, 10, tzinfo=UTC),
+        catalogs=[
+            Catalog(
+                name="db",
+                schemas=[
+                    Schema(
+                        name="public",
+                        tables=[
+                            Table(
+                                name="orders",
+                                table_type="table",
+                                native_type="BASE TABLE",
+                                native_path="public.orders",
+                                columns=[
+                                    Column(
+                                        name="id",
+                                        data_type=NormalizedType.INTEGER,
+                                        native_type="integer",
+                                    )
+                                ],
+                            )
+                        ],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_render_cache() -> Any:
+    """Start every test with an empty render cache."""
+    clear_schema_render_cache()
+    yield
+    clear_schema_render_cache()
+
+
+class TestRenderSchema:
+    """Tests for render_schema."""
+
+    def test_renders_once_per_version(self, schema: SchemaResponse) -> None:
+        """Test repeated prompts reuse the first render of a schema."""
+        with patch.object(
+            SchemaResponse, "to_prompt_string", autospec=True, return_value="rendered"
+        ) as to_prompt:
+            for _ in range(5):
+                query.build_system(schema)
+                reflexion.build_system(schema)
+
+        assert to_prompt.call_count == 1
+
+    def test_new_fetch_is_rendered_again(self, schema: SchemaResponse) -> None:
+        """Test a re-fetched schema is a new version."""
+        first = render_schema(schema)
+        refetched = schema.model_copy(update={"fetched_at": schema.fetched_at.replace(year=2030)})
+
+        assert render_schema(refetched) is not first
+        assert render_schema(schema) is first
+
+    def test_system_prompt_is_unchanged(self, schema: SchemaResponse) -> None:
+        """Test memoization does not change the rendered prompt."""
+        expected = query.SYSTEM_PROMPT.format(
+            table_names=schema.get_table_names(),
+            schema=schema.to_prompt_string(),
+        )
+
+        assert query.build_system(schema) == expected
+
+
+class TestAgentClientPromptCache:
+    """Tests for cache breakpoints and usage reporting in AgentClient."""
+
+    def test_agents_mark_system_prompt_cacheable(self) -> None:
+        """Test every agent puts a cache breakpoint on its system prompt."""
+        client = AgentClient(api_key="test-key")
+
+        for agent in (
+            client._hypothesis_agent,
+            client._interpretation_agent,
+            client._synthesis_agent,
+            client._query_agent,
+        ):
+            assert agent.model_settings == PROMPT_CACHE_SETTINGS
+        assert PROMPT_CACHE_SETTINGS["anthropic_cache_instructions"] is True
+
+    async def test_cache_usage_is_recorded(
+        self,
+        sample_hypothesis: Hypothesis,
+        schema: SchemaResponse,
+    ) -> None:
+        """Test cache reads and writes are totalled per agent."""
+        client = AgentClient(api_key="test-key")
+        calls: list[dict[str, Any]] = []
+        # The first call writes the prefix to the cache, later calls read it
+        call_usage = [
+            RunUsage(requests=1, input_tokens=2100, cache_write_tokens=2000),
+            RunUsage(requests=1, input_tokens=2100, cache_read_tokens=2000),
+        ]
+
+        async def fake_ask(prompt: str, **kwargs: Any) -> QueryResponse:
+            calls.append(kwargs)
+            kwargs["usage"].incr(call_usage[len(calls) - 1])
+            return QueryResponse(query="SELECT 1 LIMIT 1", explanation="Checks the table")
+
+        with patch.object(client._query_agent, "ask", side_effect=fake_ask):
+            await client.generate_query(sample_hypothesis, schema)
+            await client.generate_query(sample_hypothesis, schema)
+
+        assert calls[0]["dynamic_instructions"] == calls[1]["dynamic_instructions"]
+        stats = client.cache_stats()["sql-generator"]
+        assert stats["requests"] == 2
+        assert stats["cache_write_tokens"] == 2000
+        assert stats["cache_read_tokens"] == 2000
+        assert stats["uncached_input_tokens"] == 200
+        assert stats["cache_hit_ratio"] == pytest.approx(2000 / 4200)
@@ -0,0 +1,224 @@
+"""Tests for the LLM response cache and deterministic replay."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic_ai.messages import ModelRequest, UserPromptPart
+
+from bond import AgentSession
+from dataing.adapters.llm_cache import AppDatabaseResponseStore, SQLiteResponseStore
+from dataing.adapters.llm_cache.base import EXPIRED_RETENTION_SECONDS
+from dataing.agents.client import AgentClient
+from dataing.agents.models import QueryResponse
+from dataing.agents.response_cache import (
+    CacheMode,
+    LLMResponseCache,
+    llm_cache_enabled,
+    llm_cache_scope,
+    response_cache_key,
+)
+from dataing.core.exceptions import LLMError
+
+
+@pytest.fixture
+def store() -> SQLiteResponseStore:
+    """Create an in-memory response store."""
+    return SQLiteResponseStore(":memory:")
+
+
+def _client(store: SQLiteResponseStore, mode: CacheMode = CacheMode.READ_WRITE) -> AgentClient:
+    """Create a client whose responses are cached in the store."""
+    return AgentClient(api_key="test-key", response_cache=LLMResponseCache(store, mode=mode))
+
+
+async def _ask(client: AgentClient, prompt: str, session: AgentSession | None = None) -> str:
+    """Ask the query agent and return the generated SQL."""
+    response = await client._ask(client._query_agent, prompt, "system", None, session)
+    return response.query
+
+
+class TestResponseCacheKey:
+    """Tests for response_cache_key."""
+
+    def test_history_timestamps_are_ignored(self) -> None:
+        """Test the same conversation at different times gets the same key."""
+        keys = [
+            response_cache_key(
+                agent_name="a",
+                model="m",
+                system="s",
+                prompt="p",
+                output_schema={},
+                history=[ModelRequest(parts=[UserPromptPart(content="hi", timestamp=ts)])],
+            )
+            for ts in (datetime(2024, 1, 1, tzinfo=UTC), datetime(2025, 6, 1, tzinfo=UTC))
+        ]
+
+        assert keys[0] == keys[1]
+
+    def test_prompt_and_model_change_the_key(self) -> None:
+        """Test any input that changes the response changes the key."""
+        base = {"agent_name": "a", "model": "m", "system": "s", "prompt": "p", "output_schema": {}}
+
+        assert response_cache_key(**base) != response_cache_key(**base | {"prompt": "q"})
+        assert response_cache_key(**base) != response_cache_key(**base | {"model": "n"})
+
+
+class TestLLMResponseCache:
+    """Tests for caching AgentClient calls."""
+
+    async def test_repeat_call_is_served_from_cache(self, store: SQLiteResponseStore) -> None:
+        """Test the model is called once for two identical calls."""
+        client = _client(store)
+        ask = AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1"))
+
+        with patch.object(client._query_agent, "ask", ask):
+            first = await _ask(client, "prompt")
+            second = await _ask(client, "prompt")
+
+        ask.assert_awaited_once()
+        assert first == second == "SELECT 1 LIMIT 1"
+        assert client.response_cache is not None
+        assert client.response_cache.hits == 1
+
+    async def test_replay_serves_recording_and_fails_on_miss(
+        self, store: SQLiteResponseStore
+    ) -> None:
+        """Test replay mode never calls the model."""
+        recorder = _client(store)
+        with patch.object(
+            recorder._query_agent,
+            "ask",
+            AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1")),
+        ):
+            await _ask(recorder, "recorded")
+
+        replayer = _client(store, CacheMode.REPLAY)
+        ask = AsyncMock()
+        with patch.object(replayer._query_agent, "ask", ask):
+            assert await _ask(replayer, "recorded") == "SELECT 1 LIMIT 1"
+            with pytest.raises(LLMError, match="replay mode") as exc_info:
+                await _ask(replayer, "never recorded")
+
+        ask.assert_not_awaited()
+        assert exc_info.value.retryable is False
+
+    async def test_replay_matches_session_history(self, store: SQLiteResponseStore) -> None:
+        """Test later calls in a replayed session hit their recorded keys."""
+        recorder = _client(store)
+        answers = [QueryResponse(query="SELECT 1 LIMIT 1"), QueryResponse(query="SELECT 2 LIMIT 1")]
+        with patch.object(recorder._query_agent, "ask", AsyncMock(side_effect=answers)):
+            session = AgentSession(key="inv:h1")
+            await _ask(recorder, "first", session)
+            await _ask(recorder, "second", session)
+
+        replayer = _client(store, CacheMode.REPLAY)
+        session = AgentSession(key="inv:h1")
+        assert await _ask(replayer, "first", session) == "SELECT 1 LIMIT 1"
+        assert await _ask(replayer, "second", session) == "SELECT 2 LIMIT 1"
+        assert session.turn_count == 2
+
+    async def test_tenants_are_partitioned(self, store: SQLiteResponseStore) -> None:
+        """Test one tenant's recorded responses are not served to another."""
+        client = _client(store)
+        ask = AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1"))
+
+        with patch.object(client._query_agent, "ask", ask):
+            for tenant_id in (uuid4(), uuid4()):
+                with llm_cache_scope(tenant_id):
+                    await _ask(client, "prompt")
+
+        assert ask.await_count == 2
+
+    async def test_opted_out_tenant_bypasses_cache(self, store: SQLiteResponseStore) -> None:
+        """Test a tenant that opted out always gets a fresh response."""
+        client = _client(store)
+        ask = AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1"))
+
+        with (
+            patch.object(client._query_agent, "ask", ask),
+            llm_cache_scope(uuid4(), enabled=False),
+        ):
+            await _ask(client, "prompt")
+            await _ask(client, "prompt")
+
+        assert ask.await_count == 2
+        assert await store.get("global", "anything") is None
+
+    async def test_expired_entries_are_refreshed(self, store: SQLiteResponseStore) -> None:
+        """Test entries past their TTL are not served in read_write mode."""
+        client = AgentClient(
+            api_key="test-key", response_cache=LLMResponseCache(store, ttl_seconds=-1)
+        )
+        ask = AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1"))
+
+        with patch.object(client._query_agent, "ask", ask):
+            await _ask(client, "prompt")
+            await _ask(client, "prompt")
+
+        assert ask.await_count == 2
+
+    async def test_store_failure_falls_back_to_model(self) -> None:
+        """Test an unavailable store never fails a live call."""
+        broken = AsyncMock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.put.side_effect = ConnectionError("down")
+        client = AgentClient(api_key="test-key", response_cache=LLMResponseCache(broken))
+
+        with patch.object(
+            client._query_agent,
+            "ask",
+            AsyncMock(return_value=QueryResponse(query="SELECT 1 LIMIT 1")),
+        ):
+            assert await _ask(client, "prompt") == "SELECT 1 LIMIT 1"
+
+
+class TestExpiredEntryPurge:
+    """Tests for deleting long-expired entries on write."""
+
+    async def test_sqlite_write_purges_long_expired_entries(
+        self, store: SQLiteResponseStore
+    ) -> None:
+        """Test expired entries are kept for replay until the retention passes."""
+        record = {"agent_name": "query", "model": "m"}
+        await store.put("global", "recent", "{}", ttl_seconds=-1, **record)
+        store._next_purge = 0.0
+        await store.put(
+            "global", "old", "{}", ttl_seconds=-EXPIRED_RETENTION_SECONDS - 60, **record
+        )
+
+        assert await store.get("global", "recent", include_expired=True) == "{}"
+        assert await store.get("global", "old", include_expired=True) is None
+
+    async def test_app_db_write_purges_at_most_once_per_interval(self) -> None:
+        """Test writes delete expired rows without a DELETE on every write."""
+        db = AsyncMock()
+        db.execute.return_value = "DELETE 0"
+        store = AppDatabaseResponseStore(db)
+
+        for key in ("a", "b"):
+            await store.put("global", key, "{}", agent_name="query", model="m", ttl_seconds=60)
+
+        statements = [call.args[0] for call in db.execute.await_args_list]
+        assert len(statements) == 3
+        assert sum("DELETE FROM llm_response_cache" in sql for sql in statements) == 1
+
+
+class TestLLMCacheEnabled:
+    """Tests for reading the tenant opt-out."""
+
+    @pytest.mark.parametrize(
+        ("settings", "expected"),
+        [
+            ({}, True),
+            ({"llm_cache": {}}, True),
+            ({"llm_cache": {"enabled": False}}, False),
+        ],
+    )
+    def test_settings(self, settings: dict[str, object], expected: bool) -> None:
+        """Test the opt-out is read from the tenant settings."""
+        assert llm_cache_enabled(settings) is expected
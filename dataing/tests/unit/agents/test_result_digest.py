@@ -0,0 +1,121 @@
+"""Tests for statistical query result digests."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+from typing import Any
+from uuid import uuid4
+
+from dataing.adapters.datasource.types import QueryResult
+from dataing.agents.prompts import interpretation
+from dataing.agents.prompts.digest import CHARS_PER_TOKEN, build_result_digest
+from dataing.core.domain_types import Hypothesis
+
+
+def _result(rows: list[dict[str, Any]], truncated: bool = False) -> QueryResult:
+    """Wrap rows in a query result."""
+    columns = [{"name": name} for name in rows[0]] if rows else []
+    return QueryResult(columns=columns, rows=rows, row_count=len(rows), truncated=truncated)
+
+
+def _orders(days: int = 30, per_day: int = 40) -> list[dict[str, Any]]:
+    """Build raw order rows whose ios user_ids turn null from day 15."""
+    channels = ["web", "ios", "android", "partner"]
+    rows = []
+    for day in range(days):
+        for i in range(per_day):
+            channel = channels[i % len(channels)]
+            rows.append(
+                {
+                    "order_date": date(2024, 1, 1) + timedelta(days=day),
+                    "channel": channel,
+                    "user_id": None if channel == "ios" and day >= 14 else day * per_day + i,
+                    "amount": float(i % 7),
+                }
+            )
+    return rows
+
+
+class TestBuildResultDigest:
+    """Tests for build_result_digest."""
+
+    def test_empty_result(self) -> None:
+        """Test an empty result is reported as such."""
+        assert build_result_digest(_result([])) == "No rows returned"
+
+    def test_anomalous_segment_deep_in_result_is_found(self) -> None:
+        """Test the deviating group ranks first even when it is row 300."""
+        rows = [{"channel": f"c{i}", "orders": 500 + i % 7} for i in range(400)]
+        rows[300]["orders"] = 3
+
+        digest = build_result_digest(_result(rows))
+
+        segments = digest.split("Top segments by deviation")[1].splitlines()
+        assert segments[1].startswith("- channel=c300: orders 3")
+
+    def test_null_rate_by_segment(self) -> None:
+        """Test null rates are compared across segments."""
+        digest = build_result_digest(_result(_orders()))
+
+        segments = digest.split("Top segments by deviation")[1].splitlines()
+        assert segments[1].startswith("- channel=ios: user_id null rate 53.3%")
+
+    def test_before_after_split_at_shift(self) -> None:
+        """Test measures are compared before and after their largest shift."""
+        digest = build_result_digest(_result(_orders()))
+
+        assert "Before/after split at 2024-01-15 (largest shift in user_id null rate" in digest
+        assert "- user_id null rate: mean 0.0% before -> 25.0% after" in digest
+
+    def test_text_dates_are_parsed(self) -> None:
+        """Test ISO date strings are treated as time columns."""
+        rows = [{"day": f"2024-01-{d:02d}", "n": 100 if d < 10 else 20} for d in range(1, 20)]
+
+        digest = build_result_digest(_result(rows))
+
+        assert "day (time)" in digest
+        assert "- n: mean 100 before -> 20 after (-80.0%)" in digest
+
+    def test_respects_token_budget(self) -> None:
+        """Test wide results are cut to the budget, highest-priority sections first."""
+        rows = [{f"col_{c}": "x" * 200 for c in range(50)} | {"n": i} for i in range(100)]
+
+        digest = build_result_digest(_result(rows), token_budget=200)
+
+        assert len(digest) <= 200 * CHARS_PER_TOKEN
+        assert digest.startswith("Rows: 100")
+        assert digest.endswith("omitted to fit the token budget")
+
+    def test_unusual_values_are_rendered(self) -> None:
+        """Test values polars cannot type are profiled as text."""
+        rows = [{"id": uuid4(), "flag": i % 2 == 0} for i in range(5)]
+
+        digest = build_result_digest(_result(rows, truncated=True))
+
+        assert "(truncated; digest covers the first 5)" in digest
+        assert "- id: nulls 0.0%, all values distinct" in digest
+
+    def test_scales_to_large_results(self) -> None:
+        """Test a 10k-row result is digested quickly."""
+        result = _result(_orders(days=50, per_day=200))
+
+        start = time.perf_counter()
+        build_result_digest(result)
+
+        assert time.perf_counter() - start < 2.0
+
+
+class TestInterpretationPrompt:
+    """Tests for the interpretation user prompt."""
+
+    def test_uses_digest(self, sample_hypothesis: Hypothesis) -> None:
+        """Test the prompt carries the digest rather than a row dump."""
+        prompt = interpretation.build_user(
+            hypothesis=sample_hypothesis,
+            query="SELECT 1",
+            results=_result(_orders()),
+        )
+
+        assert "RESULTS (1200 rows):" in prompt
+        assert "Top segments by deviation" in prompt
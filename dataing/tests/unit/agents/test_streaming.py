@@ -0,0 +1,193 @@
+"""Tests for coalesced token streaming of agent output."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from dataing.agents.streaming import TokenStream
+from dataing.agents.telemetry import AgentRole
+from dataing.core.domain_types import AnomalyAlert, Finding, MetricSpec
+from dataing.core.orchestrator import InvestigationOrchestrator
+from dataing.core.state import InvestigationState
+
+
+def _texts(frames: list[dict[str, Any]]) -> list[tuple[str, str | None, str, bool]]:
+    """Reduce frames to (role, hypothesis_id, text, done)."""
+    return [
+        (f["data"]["role"], f["data"]["hypothesis_id"], f["data"]["text"], f["data"]["done"])
+        for f in frames
+    ]
+
+
+class TestTokenStream:
+    """Tests for TokenStream."""
+
+    async def test_deltas_are_coalesced_into_frames(self) -> None:
+        """Test deltas within one interval arrive as a single frame."""
+        stream = TokenStream(frame_interval=0.05)
+        subscription = stream.subscribe()
+        handlers = stream.handlers(AgentRole.QUERY, "h1")
+        assert handlers.on_text_delta is not None
+
+        for token in ["SELECT ", "count(*) ", "FROM ", "orders"]:
+            handlers.on_text_delta(token)
+        frames = await subscription.next_frames(timeout=1.0)
+
+        assert _texts(frames) == [("query", "h1", "SELECT count(*) FROM orders", False)]
+        assert frames[0]["type"] == "llm_delta"
+
+    async def test_first_delta_after_pause_is_not_delayed(self) -> None:
+        """Test an idle stream sends its first delta on the next loop turn."""
+        stream = TokenStream(frame_interval=10.0)
+        subscription = stream.subscribe()
+        handlers = stream.handlers(AgentRole.HYPOTHESIS)
+        assert handlers.on_text_delta is not None
+
+        start = time.monotonic()
+        handlers.on_text_delta('{"hypotheses"')
+        frames = await subscription.next_frames(timeout=1.0)
+
+        assert _texts(frames) == [("hypothesis", None, '{"hypotheses"', False)]
+        assert time.monotonic() - start < 0.5
+
+    async def test_parallel_outputs_get_their_own_frames(self) -> None:
+        """Test each role and hypothesis is framed separately, with completion."""
+        stream = TokenStream()
+        subscription = stream.subscribe()
+        first = stream.handlers(AgentRole.INTERPRETATION, "h1")
+        second = stream.handlers(AgentRole.INTERPRETATION, "h2")
+        assert first.on_text_delta and second.on_text_delta and first.on_complete
+
+        first.on_text_delta("Supports")
+        second.on_text_delta("Refutes")
+        first.on_text_delta(" the hypothesis")
+        first.on_complete(None)
+        stream.flush()
+
+        assert _texts(subscription.drain()) == [
+            ("interpretation", "h1", "Supports the hypothesis", True),
+            ("interpretation", "h2", "Refutes", False),
+        ]
+
+    async def test_slow_subscriber_drops_frames(self) -> None:
+        """Test a full subscriber loses frames without affecting others."""
+        stream = TokenStream(max_queued_frames=2)
+        slow = stream.subscribe()
+        fast = stream.subscribe()
+        handlers = stream.handlers(AgentRole.SYNTHESIS)
+        assert handlers.on_text_delta is not None
+
+        received: list[dict[str, Any]] = []
+        for i in range(4):
+            handlers.on_text_delta(f"part {i}")
+            stream.flush()
+            received.extend(fast.drain())
+
+        assert len(received) == 4
+        assert [f["data"]["text"] for f in slow.drain()] == ["part 0", "part 1"]
+        assert slow.dropped == 2
+
+    async def test_close_sends_pending_and_ignores_later_deltas(self) -> None:
+        """Test closing flushes what is buffered and then stops."""
+        stream = TokenStream(frame_interval=10.0)
+        subscription = stream.subscribe()
+        handlers = stream.handlers(AgentRole.SYNTHESIS)
+        assert handlers.on_text_delta is not None
+
+        handlers.on_text_delta("Root cause")
+        stream.close()
+        handlers.on_text_delta(" ignored")
+        await asyncio.sleep(0)
+
+        assert _texts(subscription.drain()) == [("synthesis", None, "Root cause", False)]
+
+    async def test_restarted_output_resets_its_stream(self) -> None:
+        """Test a retried response drops the discarded text and marks the reset."""
+        stream = TokenStream(frame_interval=10.0)
+        subscription = stream.subscribe()
+        handlers = stream.handlers(AgentRole.QUERY, "h1")
+        assert handlers.on_text_delta and handlers.on_attempt
+
+        handlers.on_text_delta("SELECT 1")
+        stream.flush()
+        handlers.on_text_delta(" FROM")
+        handlers.on_attempt(2)
+        handlers.on_text_delta("SELECT 1 LIMIT 1")
+        stream.flush()
+
+        data = [f["data"] for f in subscription.drain()]
+        assert [(d["text"], d["attempt"], d["reset"]) for d in data] == [
+            ("SELECT 1", 1, False),
+            ("SELECT 1 LIMIT 1", 2, True),
+        ]
+
+    async def test_unsubscribed_stream_sends_nothing(self) -> None:
+        """Test frames go only to current subscribers."""
+        stream = TokenStream()
+        subscription = stream.subscribe()
+        stream.unsubscribe(subscription)
+        handlers = stream.handlers(AgentRole.QUERY, "h1")
+        assert handlers.on_text_delta is not None
+
+        handlers.on_text_delta("SELECT 1")
+        stream.flush()
+
+        assert subscription.drain() == []
+        assert await subscription.next_frames(timeout=0.01) == []
+
+
+class TestOrchestratorStreaming:
+    """Tests for the orchestrator labelling streamed output."""
+
+    async def test_synthesis_output_is_labelled(self) -> None:
+        """Test synthesis deltas reach a TokenStream under the synthesis role."""
+
+        async def synthesize(**kwargs: Any) -> Finding:
+            handlers = kwargs["handlers"]
+            handlers.on_text_delta('{"root_cause": ')
+            handlers.on_text_delta('"stale users table"}')
+            handlers.on_complete(None)
+            return Finding(
+                investigation_id="",
+                status="completed",
+                root_cause="stale users table",
+                confidence=0.9,
+                evidence=[],
+                recommendations=[],
+                duration_seconds=0.0,
+            )
+
+        llm = MagicMock()
+        llm.synthesize_findings = AsyncMock(side_effect=synthesize)
+        orchestrator = InvestigationOrchestrator(
+            db=None, llm=llm, context_engine=MagicMock(), circuit_breaker=MagicMock()
+        )
+        state = InvestigationState(
+            id=str(uuid4()),
+            tenant_id=uuid4(),
+            alert=AnomalyAlert(
+                dataset_id="web.events",
+                metric_spec=MetricSpec(
+                    metric_type="column", expression="user_id", display_name="user_id nulls"
+                ),
+                anomaly_type="null_rate",
+                expected_value=0.01,
+                actual_value=0.2,
+                deviation_pct=1900.0,
+                anomaly_date="2024-01-15",
+                severity="high",
+            ),
+        )
+        stream = TokenStream()
+        subscription = stream.subscribe()
+
+        await orchestrator._synthesize(state, [], time.time(), stream)
+        stream.close()
+
+        assert _texts(subscription.drain()) == [
+            ("synthesis", None, '{"root_cause": "stale users table"}', True)
+        ]
@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from dataing.agents.models import InterpretationResponse, SynthesisResponse
-from dataing.core.quality.assessment import QualityAssessment
+from dataing.core.quality.assessment import BatchQualityAssessment, QualityAssessment
 from dataing.core.quality.judge import LLMJudgeValidator
 
 
@@ -24,6 +24,7 @@ class TestLLMJudgeValidator:
         validator = LLMJudgeValidator.__new__(LLMJudgeValidator)
         validator.pass_threshold = 0.6
         validator.judge = mock_judge_agent
+        validator.batch_judge = MagicMock(run=AsyncMock())
         return validator
 
     @pytest.mark.asyncio
@@ -161,3 +162,61 @@ class TestLLMJudgeValidator:
         assert "specificity" in signals
         assert "actionability" in signals
         assert "composite" in signals
+
+    @pytest.mark.asyncio
+    async def test_validate_interpretations_batched(self, validator: LLMJudgeValidator) -> None:
+        """Test several interpretations are judged with one request."""
+        assessments = [
+            QualityAssessment(
+                causal_depth=score,
+                specificity=score,
+                actionability=score,
+                lowest_dimension="causal_depth",
+                improvement_suggestion="Explain the trigger behind the stale table",
+            )
+            for score in (0.8, 0.3)
+        ]
+        validator.batch_judge.run.return_value = MagicMock(
+            output=BatchQualityAssessment(assessments=assessments)
+        )
+        response = InterpretationResponse(
+            supports_hypothesis=True,
+            confidence=0.8,
+            interpretation="NULL user_ids started after the 03:14 UTC ETL run.",
+            causal_chain="ETL stopped -> stale users -> JOIN NULLs",
+            key_findings=["485 orders affected"],
+        )
+
+        results = await validator.validate_interpretations(
+            [
+                (response, "Users ETL failure", "SELECT 1 LIMIT 1"),
+                (response, "Schema change", "SELECT 2 LIMIT 1"),
+            ]
+        )
+
+        assert [r.passed for r in results] == [True, False]
+        validator.batch_judge.run.assert_awaited_once()
+        prompt = validator.batch_judge.run.call_args.args[0]
+        assert "INTERPRETATION 2" in prompt
+        assert "HYPOTHESIS TESTED: Schema change" in prompt
+
+    @pytest.mark.asyncio
+    async def test_validate_interpretations_count_mismatch(
+        self, validator: LLMJudgeValidator
+    ) -> None:
+        """Test a batch answer missing assessments is rejected."""
+        validator.batch_judge.run.return_value = MagicMock(
+            output=BatchQualityAssessment(assessments=[])
+        )
+        response = InterpretationResponse(
+            supports_hypothesis=False,
+            confidence=0.4,
+            interpretation="Row counts were flat for the week around the anomaly date.",
+            causal_chain="No volume change, so an upstream drop is unlikely",
+            key_findings=["Row counts stable"],
+        )
+
+        with pytest.raises(ValueError, match="0 assessments for 1"):
+            await validator.validate_interpretations(
+                [(response, "Volume drop", "SELECT 1 LIMIT 1")]
+            )
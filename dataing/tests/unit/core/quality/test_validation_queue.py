@@ -0,0 +1,209 @@
+"""Tests for the background validation queue."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from dataing.agents.models import InterpretationResponse, SynthesisResponse
+from dataing.core.quality.assessment import QualityAssessment, ValidationResult
+from dataing.core.quality.validation_queue import (
+    InterpretationCheck,
+    SynthesisCheck,
+    ValidationQueue,
+)
+
+
+def _result(score: float = 0.7) -> ValidationResult:
+    """Build a validation result with every dimension at ``score``."""
+    return ValidationResult(
+        passed=score >= 0.6,
+        assessment=QualityAssessment(
+            causal_depth=score,
+            specificity=score,
+            actionability=score,
+            lowest_dimension="actionability",
+            improvement_suggestion="Name the exact job and the time it failed",
+        ),
+    )
+
+
+def _interpretation(title: str = "Users ETL failure") -> InterpretationCheck:
+    """Build an interpretation waiting for validation."""
+    return InterpretationCheck(
+        tenant_id=uuid4(),
+        investigation_id=uuid4(),
+        response=InterpretationResponse(
+            supports_hypothesis=True,
+            confidence=0.8,
+            interpretation="485 orders lost their user after the 03:14 UTC ETL run.",
+            causal_chain="ETL stopped -> stale users -> JOIN NULLs",
+            key_findings=["485 orders affected"],
+        ),
+        hypothesis_title=title,
+        query="SELECT COUNT(*) FROM orders WHERE user_id IS NULL LIMIT 1",
+        input_context={"hypothesis_title": title},
+    )
+
+
+def _synthesis() -> SynthesisCheck:
+    """Build a synthesis waiting for validation."""
+    return SynthesisCheck(
+        tenant_id=uuid4(),
+        investigation_id=uuid4(),
+        response=SynthesisResponse(
+            root_cause="Users ETL job timed out at 03:14 UTC due to API rate limiting",
+            confidence=0.85,
+            causal_chain=["API rate limit", "ETL timeout", "JOIN NULLs"],
+            estimated_onset="03:14 UTC",
+            affected_scope="orders table",
+            supporting_evidence=["485 NULLs"],
+            recommendations=["Re-run stg_users with backfill"],
+        ),
+        alert_summary="null_count on orders.user_id: expected 0, got 485",
+        input_context={"evidence_count": 1},
+    )
+
+
+class BatchValidator:
+    """Validator that judges interpretations in batches."""
+
+    def __init__(self) -> None:
+        """Record calls instead of calling a judge."""
+        self.batches: list[int] = []
+        self.validate_synthesis = AsyncMock(return_value=_result())
+        self.validate_interpretation = AsyncMock(return_value=_result())
+
+    async def validate_interpretations(
+        self, items: Sequence[tuple[InterpretationResponse, str, str]]
+    ) -> list[ValidationResult]:
+        """Judge a batch, one result per item."""
+        self.batches.append(len(items))
+        return [_result() for _ in items]
+
+
+@pytest.fixture
+def training_repo() -> MagicMock:
+    """Create a repository that accepts bulk writes."""
+    repo = MagicMock()
+    repo.record_signals = AsyncMock(side_effect=lambda signals: len(signals))
+    return repo
+
+
+class TestValidationQueue:
+    """Tests for ValidationQueue."""
+
+    async def test_submit_does_not_wait_for_judge(self, training_repo: MagicMock) -> None:
+        """Test submitting returns before a slow judge call finishes."""
+        gate = asyncio.Event()
+        validator = MagicMock()
+
+        async def slow_judge(**kwargs: object) -> ValidationResult:
+            await gate.wait()
+            return _result()
+
+        validator.validate_synthesis = AsyncMock(side_effect=slow_judge)
+        queue = ValidationQueue(validator, training_repo)
+
+        assert queue.submit(_synthesis()) is True
+        await asyncio.sleep(0)
+        training_repo.record_signals.assert_not_called()
+
+        gate.set()
+        await queue.close()
+
+        assert queue.stats.validated == 1
+        assert queue.stats.signals_recorded == 1
+
+    async def test_waiting_interpretations_share_one_judge_call(
+        self, training_repo: MagicMock
+    ) -> None:
+        """Test a backlog of interpretations is judged in one batched request."""
+        validator = BatchValidator()
+        queue = ValidationQueue(validator, training_repo, batch_size=8)
+
+        for i in range(5):
+            queue.submit(_interpretation(f"Hypothesis {i}"))
+        queue.submit(_synthesis())
+        await queue.join()
+
+        assert validator.batches == [5]
+        validator.validate_interpretation.assert_not_called()
+        assert queue.stats.judge_calls == 2
+        # All six signals go out in one bulk write
+        training_repo.record_signals.assert_awaited_once()
+        signals = training_repo.record_signals.call_args.args[0]
+        assert [s.signal_type for s in signals] == ["interpretation"] * 5 + ["synthesis"]
+        assert signals[0].input_context == {"hypothesis_title": "Hypothesis 0"}
+        assert signals[0].automated_dimensions["composite"] == pytest.approx(0.7)
+
+    async def test_failed_batch_falls_back_to_single_calls(self, training_repo: MagicMock) -> None:
+        """Test interpretations are judged one by one if the batch call fails."""
+        validator = BatchValidator()
+        validator.validate_interpretations = AsyncMock(  # type: ignore[method-assign]
+            side_effect=ValueError("Judge returned 2 assessments for 3 interpretations")
+        )
+        queue = ValidationQueue(validator, training_repo)
+
+        for _ in range(3):
+            queue.submit(_interpretation())
+        await queue.join()
+
+        assert validator.validate_interpretation.await_count == 3
+        assert queue.stats.validated == 3
+        assert queue.stats.signals_recorded == 3
+
+    async def test_judge_failure_is_contained(self, training_repo: MagicMock) -> None:
+        """Test a failing judge call skips its signal and the worker carries on."""
+        validator = MagicMock()
+        validator.validate_interpretation = AsyncMock(
+            side_effect=[RuntimeError("judge down"), _result()]
+        )
+        queue = ValidationQueue(validator, training_repo, batch_size=1)
+
+        queue.submit(_interpretation())
+        queue.submit(_interpretation())
+        await queue.join()
+
+        assert queue.stats.failed == 1
+        assert queue.stats.signals_recorded == 1
+
+    async def test_full_queue_drops_new_work(self, training_repo: MagicMock) -> None:
+        """Test the queue is bounded and counts what it drops."""
+        validator = BatchValidator()
+        queue = ValidationQueue(validator, training_repo, max_pending=2)
+
+        accepted = [queue.submit(_interpretation()) for _ in range(3)]
+        await queue.close()
+
+        assert accepted == [True, True, False]
+        assert queue.stats.dropped == 1
+        assert queue.stats.signals_recorded == 2
+
+    async def test_close_flushes_every_accepted_signal(self, training_repo: MagicMock) -> None:
+        """Test shutdown drains the queue and flushes buffered signals."""
+        validator = BatchValidator()
+        queue = ValidationQueue(validator, training_repo, batch_size=2, flush_size=100)
+
+        for _ in range(5):
+            queue.submit(_interpretation())
+        await queue.close()
+
+        assert queue.stats.signals_recorded == 5
+        assert queue.submit(_interpretation()) is False
+        assert queue.stats.dropped == 1
+
+    async def test_without_repository_only_validates(self) -> None:
+        """Test outputs are still judged when there is nowhere to record signals."""
+        validator = BatchValidator()
+        queue = ValidationQueue(validator)
+
+        queue.submit(_synthesis())
+        await queue.close()
+
+        assert queue.stats.validated == 1
+        assert queue.stats.signals_recorded == 0
@@ -0,0 +1,291 @@
+"""Tests for the orchestrator's hypothesis loop: cost gate, LLM sessions and escalation."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from bond import AgentSession
+from dataing.adapters.datasource.types import QueryCostEstimate, QueryResult
+from dataing.agents.models import QueryResponse
+from dataing.core.domain_types import (
+    AnomalyAlert,
+    Evidence,
+    Hypothesis,
+    HypothesisCategory,
+    MetricSpec,
+)
+from dataing.core.orchestrator import InvestigationOrchestrator, OrchestratorConfig
+from dataing.core.state import InvestigationState
+from dataing.safety.cost_gate import QueryBudget
+
+GIB = 1024**3
+
+
+class FakeAdapter:
+    """Adapter whose estimates are looked up by SQL text."""
+
+    def __init__(self, estimates: dict[str, int], can_sample: bool = False) -> None:
+        """Estimate queries from the given table of bytes."""
+        self._estimates = estimates
+        self._can_sample = can_sample
+        self.execute_query = AsyncMock(
+            return_value=QueryResult(columns=[{"name": "n"}], rows=[{"n": 1}], row_count=1)
+        )
+
+    async def estimate_query_cost(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> QueryCostEstimate:
+        """Return the estimate recorded for the SQL."""
+        return QueryCostEstimate(method="dry_run", bytes_scanned=self._estimates[sql])
+
+    def build_sampled_query(self, sql: str, percent: float) -> str | None:
+        """Sample the query if supported."""
+        return f"{sql} TABLESAMPLE SYSTEM ({percent})" if self._can_sample else None
+
+
+@pytest.fixture
+def state() -> InvestigationState:
+    """Create an investigation state with schema context."""
+    alert = AnomalyAlert(
+        dataset_id="web.events",
+        metric_spec=MetricSpec(
+            metric_type="column", expression="user_id", display_name="user_id nulls"
+        ),
+        anomaly_type="null_rate",
+        expected_value=0.01,
+        actual_value=0.2,
+        deviation_pct=1900.0,
+        anomaly_date="2024-01-15",
+        severity="high",
+    )
+    return InvestigationState(
+        id=str(uuid4()), tenant_id=uuid4(), alert=alert, schema_context=MagicMock()
+    )
+
+
+@pytest.fixture
+def hypothesis() -> Hypothesis:
+    """Create a hypothesis to investigate."""
+    return Hypothesis(
+        id="h1",
+        title="Upstream join dropped users",
+        category=HypothesisCategory.UPSTREAM_DEPENDENCY,
+        reasoning="Nulls appeared after the ETL change",
+        suggested_query="SELECT 1",
+    )
+
+
+def _orchestrator(llm: MagicMock, circuit_breaker: MagicMock) -> InvestigationOrchestrator:
+    """Create an orchestrator with a 10 GiB budget and no validation."""
+    return InvestigationOrchestrator(
+        db=None,
+        llm=llm,
+        context_engine=MagicMock(),
+        circuit_breaker=circuit_breaker,
+        config=OrchestratorConfig(
+            validation_enabled=False,
+            query_budget=QueryBudget(max_bytes_scanned=10 * GIB),
+        ),
+    )
+
+
+def _llm(queries: list[str]) -> MagicMock:
+    """Create an LLM mock that generates the given queries in order."""
+    llm = MagicMock()
+    llm.generate_query = AsyncMock(side_effect=queries)
+    llm.interpret_evidence = AsyncMock(
+        return_value=Evidence(
+            hypothesis_id="h1",
+            query="",
+            result_summary="",
+            row_count=1,
+            supports_hypothesis=True,
+            confidence=0.9,
+            interpretation="Confirmed",
+        )
+    )
+    return llm
+
+
+class TestOrchestratorCostGate:
+    """Tests for cost checks before generated queries run."""
+
+    async def test_rejected_query_feeds_reflexion(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test an over-budget query never runs and its reason reaches the LLM."""
+        llm = _llm(["SELECT * FROM a, b", "SELECT * FROM a WHERE day = '2024-01-15'"])
+        circuit_breaker = MagicMock()
+        adapter = FakeAdapter(
+            {"SELECT * FROM a, b": 500 * GIB, "SELECT * FROM a WHERE day = '2024-01-15'": GIB}
+        )
+        orchestrator = _orchestrator(llm, circuit_breaker)
+        orchestrator._current_adapter = adapter  # type: ignore[assignment]
+
+        evidence = await orchestrator._investigate_hypothesis(state, hypothesis)
+
+        assert len(evidence) == 1
+        adapter.execute_query.assert_awaited_once()
+        assert adapter.execute_query.call_args.args[0] == "SELECT * FROM a WHERE day = '2024-01-15'"
+        previous_error = llm.generate_query.call_args_list[1].kwargs["previous_error"]
+        assert previous_error.startswith("Query rejected before execution")
+        assert "500.0 GiB" in previous_error
+
+        events = circuit_breaker.check.call_args_list[1].args[0]
+        submitted = next(e for e in events if e.type == "query_submitted")
+        assert submitted.data["cost_action"] == "rejected"
+        assert submitted.data["cost_estimate"]["bytes_scanned"] == 500 * GIB
+        assert [e.type for e in events][-2:] == ["query_failed", "reflexion_attempted"]
+
+    async def test_over_budget_query_runs_sampled(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test the sampled rewrite is executed and interpreted."""
+        llm = _llm(["SELECT * FROM events"])
+        adapter = FakeAdapter({"SELECT * FROM events": 40 * GIB}, can_sample=True)
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = adapter  # type: ignore[assignment]
+
+        await orchestrator._investigate_hypothesis(state, hypothesis)
+
+        sampled = "SELECT * FROM events TABLESAMPLE SYSTEM (25.0)"
+        assert adapter.execute_query.call_args.args[0] == sampled
+        assert llm.interpret_evidence.call_args.args[1] == sampled
+
+    async def test_query_stats_are_flattened_into_the_event(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test scalar query stats are recorded as event fields and nested ones dropped."""
+        llm = _llm(["SELECT 1", "SELECT 1"])
+        llm.interpret_evidence.return_value = llm.interpret_evidence.return_value.model_copy(
+            update={"confidence": 0.5}
+        )
+        circuit_breaker = MagicMock()
+        adapter = FakeAdapter({"SELECT 1": GIB})
+        adapter.execute_query.return_value = QueryResult(
+            columns=[{"name": "n"}],
+            rows=[{"n": 1}],
+            row_count=1,
+            metadata={"query_id": "q1", "processed_bytes": 2048, "plan": {"nodes": 3}},
+        )
+        orchestrator = _orchestrator(llm, circuit_breaker)
+        orchestrator._current_adapter = adapter  # type: ignore[assignment]
+
+        await orchestrator._investigate_hypothesis(state, hypothesis)
+
+        # The check before the second query sees the first query's events
+        events = circuit_breaker.check.call_args_list[1].args[0]
+        succeeded = next(e for e in events if e.type == "query_succeeded")
+        assert succeeded.data["query_id"] == "q1"
+        assert succeeded.data["query_processed_bytes"] == 2048
+        assert "query_plan" not in succeeded.data
+
+
+class TestHypothesisSession:
+    """Tests for the LLM conversation scope of each hypothesis."""
+
+    async def test_attempts_share_one_session_per_hypothesis(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test reflexion retries share a session that other hypotheses do not."""
+        llm = _llm(["SELECT * FROM a, b", "SELECT 1", "SELECT 2"])
+        adapter = FakeAdapter({"SELECT * FROM a, b": 500 * GIB, "SELECT 1": 1, "SELECT 2": 1})
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = adapter  # type: ignore[assignment]
+        other = hypothesis.model_copy(update={"id": "h2"})
+
+        await orchestrator._investigate_hypothesis(state, hypothesis)
+        await orchestrator._investigate_hypothesis(state, other)
+
+        sessions = [call.kwargs["session"] for call in llm.generate_query.call_args_list]
+        assert all(isinstance(session, AgentSession) for session in sessions)
+        assert sessions[0] is sessions[1]
+        assert sessions[2] is not sessions[0]
+        assert sessions[0].key == f"{state.id}:h1"
+        assert sessions[2].key == f"{state.id}:h2"
+
+
+class TestBatchedFirstQueries:
+    """Tests for generating every hypothesis's first query in one call."""
+
+    async def test_first_wave_uses_batch_and_reflexion_does_not(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test batched queries run first and only failed hypotheses call generate_query."""
+        other = hypothesis.model_copy(update={"id": "h2"})
+        llm = _llm(["SELECT 3"])
+        llm.generate_queries_batch = AsyncMock(
+            return_value={
+                "h1": QueryResponse(query="SELECT * FROM a, b LIMIT 1"),
+                "h2": QueryResponse(query="SELECT 2 LIMIT 1"),
+            }
+        )
+        adapter = FakeAdapter(
+            {"SELECT * FROM a, b LIMIT 1": 500 * GIB, "SELECT 2 LIMIT 1": 1, "SELECT 3": 1}
+        )
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = adapter  # type: ignore[assignment]
+
+        evidence = await orchestrator._investigate_parallel(state, [hypothesis, other])
+
+        assert len(evidence) == 2
+        llm.generate_queries_batch.assert_awaited_once()
+        sessions = llm.generate_queries_batch.call_args.kwargs["sessions"]
+        llm.generate_query.assert_awaited_once()
+        retry = llm.generate_query.call_args.kwargs
+        assert retry["hypothesis"].id == "h1"
+        assert retry["previous_error"].startswith("Query rejected before execution")
+        assert retry["session"] is sessions["h1"]
+
+    async def test_failed_batch_falls_back_to_single_queries(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test a failed batch call does not fail the hypotheses."""
+        other = hypothesis.model_copy(update={"id": "h2"})
+        llm = _llm(["SELECT 1", "SELECT 1"])
+        llm.generate_queries_batch = AsyncMock(side_effect=RuntimeError("overloaded"))
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = FakeAdapter({"SELECT 1": 1, "SELECT 2": 1})  # type: ignore[assignment]
+
+        evidence = await orchestrator._investigate_parallel(state, [hypothesis, other])
+
+        assert len(evidence) == 2
+        assert llm.generate_query.await_count == 2
+
+    async def test_single_hypothesis_is_not_batched(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test a lone hypothesis generates its query directly."""
+        llm = _llm(["SELECT 1"])
+        llm.generate_queries_batch = AsyncMock()
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = FakeAdapter({"SELECT 1": 1})  # type: ignore[assignment]
+
+        await orchestrator._investigate_parallel(state, [hypothesis])
+
+        llm.generate_queries_batch.assert_not_awaited()
+        llm.generate_query.assert_awaited_once()
+
+
+class TestQueryEscalation:
+    """Tests for escalating SQL generation after repeated failures."""
+
+    async def test_escalates_after_two_failed_queries(
+        self, state: InvestigationState, hypothesis: Hypothesis
+    ) -> None:
+        """Test the third attempt asks for the strongest model."""
+        llm = _llm(["SELECT * FROM a", "SELECT * FROM b", "SELECT * FROM c"])
+        orchestrator = _orchestrator(llm, MagicMock())
+        orchestrator._current_adapter = FakeAdapter(  # type: ignore[assignment]
+            {"SELECT * FROM a": 500 * GIB, "SELECT * FROM b": 500 * GIB, "SELECT * FROM c": GIB}
+        )
+
+        evidence = await orchestrator._investigate_hypothesis(state, hypothesis)
+
+        assert len(evidence) == 1
+        escalated = [call.kwargs["escalate"] for call in llm.generate_query.call_args_list]
+        assert escalated == [False, False, True]
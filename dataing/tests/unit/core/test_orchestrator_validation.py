@@ -0,0 +1,185 @@
+"""Tests for the orchestrator's background quality validation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from dataing.core.domain_types import (
+    AnomalyAlert,
+    Evidence,
+    Finding,
+    Hypothesis,
+    HypothesisCategory,
+    MetricSpec,
+)
+from dataing.core.orchestrator import InvestigationOrchestrator, OrchestratorConfig
+from dataing.core.quality.assessment import QualityAssessment, ValidationResult
+from dataing.core.state import InvestigationState
+
+EVIDENCE = Evidence(
+    hypothesis_id="h1",
+    query="SELECT 1 LIMIT 1",
+    result_summary="n=1",
+    row_count=1,
+    supports_hypothesis=True,
+    confidence=0.9,
+    interpretation="Null user_ids began right after the 03:14 UTC users ETL run failed.",
+)
+
+
+@pytest.fixture
+def state() -> InvestigationState:
+    """Create an investigation state."""
+    alert = AnomalyAlert(
+        dataset_id="web.events",
+        metric_spec=MetricSpec(
+            metric_type="column", expression="user_id", display_name="user_id nulls"
+        ),
+        anomaly_type="null_rate",
+        expected_value=0.01,
+        actual_value=0.2,
+        deviation_pct=1900.0,
+        anomaly_date="2024-01-15",
+        severity="high",
+    )
+    return InvestigationState(id=str(uuid4()), tenant_id=uuid4(), alert=alert)
+
+
+@pytest.fixture
+def judge_gate() -> asyncio.Event:
+    """Event that holds every judge call until set."""
+    return asyncio.Event()
+
+
+@pytest.fixture
+def validator(judge_gate: asyncio.Event) -> MagicMock:
+    """Create a validator whose judge calls wait for the gate."""
+
+    async def judge(**kwargs: object) -> ValidationResult:
+        await judge_gate.wait()
+        return ValidationResult(
+            passed=True,
+            assessment=QualityAssessment(
+                causal_depth=0.8,
+                specificity=0.7,
+                actionability=0.6,
+                lowest_dimension="actionability",
+                improvement_suggestion="Give the exact command to backfill the table",
+            ),
+        )
+
+    validator = MagicMock(spec=["validate_interpretation", "validate_synthesis"])
+    validator.validate_interpretation = AsyncMock(side_effect=judge)
+    validator.validate_synthesis = AsyncMock(side_effect=judge)
+    return validator
+
+
+@pytest.fixture
+def training_repo() -> MagicMock:
+    """Create a repository that accepts bulk writes."""
+    repo = MagicMock()
+    repo.record_signals = AsyncMock(side_effect=lambda signals: len(signals))
+    return repo
+
+
+@pytest.fixture
+def llm() -> MagicMock:
+    """Create an LLM mock that synthesizes a fixed finding."""
+    llm = MagicMock()
+    llm.synthesize_findings = AsyncMock(
+        return_value=Finding(
+            investigation_id="",
+            status="completed",
+            root_cause="Users ETL failed at 03:14 UTC",
+            confidence=0.9,
+            evidence=[],
+            recommendations=["Backfill users"],
+            duration_seconds=0.0,
+        )
+    )
+    return llm
+
+
+@pytest.fixture
+def orchestrator(
+    llm: MagicMock, validator: MagicMock, training_repo: MagicMock
+) -> InvestigationOrchestrator:
+    """Create an orchestrator with background validation."""
+    return InvestigationOrchestrator(
+        db=None,
+        llm=llm,
+        context_engine=MagicMock(),
+        circuit_breaker=MagicMock(),
+        config=OrchestratorConfig(),
+        validator=validator,
+        training_repo=training_repo,
+    )
+
+
+class TestBackgroundValidation:
+    """Tests for validation off the investigation's critical path."""
+
+    async def test_synthesis_returns_before_judge(
+        self,
+        orchestrator: InvestigationOrchestrator,
+        state: InvestigationState,
+        judge_gate: asyncio.Event,
+        training_repo: MagicMock,
+    ) -> None:
+        """Test the finding is returned while its validation is still pending."""
+        hypothesis = Hypothesis(
+            id="h1",
+            title="Upstream join dropped users",
+            category=HypothesisCategory.UPSTREAM_DEPENDENCY,
+            reasoning="Nulls appeared after the ETL change",
+            suggested_query="SELECT 1",
+        )
+        orchestrator._validate_interpretation(EVIDENCE, hypothesis, "SELECT 1 LIMIT 1", state)
+
+        finding = await orchestrator._synthesize(state, [EVIDENCE], time.time())
+
+        assert finding.root_cause == "Users ETL failed at 03:14 UTC"
+        training_repo.record_signals.assert_not_called()
+
+        judge_gate.set()
+        await orchestrator.close()
+
+        signals = training_repo.record_signals.call_args.args[0]
+        assert [s.signal_type for s in signals] == ["interpretation", "synthesis"]
+        assert {s.investigation_id for s in signals} == {UUID(state.id)}
+        assert signals[1].input_context["evidence_count"] == 1
+
+    async def test_disabled_validation_queues_nothing(
+        self, llm: MagicMock, validator: MagicMock, state: InvestigationState
+    ) -> None:
+        """Test validation_enabled=False skips the judge entirely."""
+        orchestrator = InvestigationOrchestrator(
+            db=None,
+            llm=llm,
+            context_engine=MagicMock(),
+            circuit_breaker=MagicMock(),
+            config=OrchestratorConfig(validation_enabled=False),
+            validator=validator,
+        )
+
+        await orchestrator._synthesize(state, [], time.time())
+        await orchestrator.close()
+
+        assert orchestrator.validation_queue is not None
+        assert orchestrator.validation_queue.stats.submitted == 0
+        validator.validate_synthesis.assert_not_called()
+
+    async def test_close_without_validator(self) -> None:
+        """Test shutdown is a no-op when nothing is validated."""
+        orchestrator = InvestigationOrchestrator(
+            db=None, llm=MagicMock(), context_engine=MagicMock(), circuit_breaker=MagicMock()
+        )
+
+        await orchestrator.close()
+
+        assert orchestrator.validation_queue is None
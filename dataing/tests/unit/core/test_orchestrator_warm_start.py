@@ -0,0 +1,229 @@
+"""Tests for warm-starting investigations from prior findings."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from dataing.adapters.datasource.types import QueryResult
+from dataing.agents.prompts import hypothesis as hypothesis_prompt
+from dataing.core.domain_types import (
+    AnomalyAlert,
+    Evidence,
+    Finding,
+    Hypothesis,
+    HypothesisCategory,
+    InvestigationContext,
+    MetricSpec,
+    PriorFinding,
+)
+from dataing.core.orchestrator import InvestigationOrchestrator
+from dataing.core.state import InvestigationState
+
+PRIOR = PriorFinding(
+    investigation_id="inv-1",
+    root_cause="Users ETL job timed out, leaving stale user rows",
+    confidence=0.92,
+    category=HypothesisCategory.UPSTREAM_DEPENDENCY,
+    decisive_queries=["SELECT decisive_1 LIMIT 1", "SELECT decisive_2 LIMIT 1"],
+    recommendations=["Re-run the users ETL"],
+    similarity=0.93,
+)
+
+NEW_HYPOTHESIS = Hypothesis(
+    id="h1",
+    title="App release stopped sending user_id",
+    category=HypothesisCategory.DATA_QUALITY,
+    reasoning="A release went out that morning",
+    suggested_query="SELECT 1",
+)
+
+
+def _evidence(hypothesis_id: str, query: str, confidence: float) -> Evidence:
+    """Build supporting evidence."""
+    return Evidence(
+        hypothesis_id=hypothesis_id,
+        query=query,
+        result_summary="n=485",
+        row_count=1,
+        supports_hypothesis=True,
+        confidence=confidence,
+        interpretation="485 orders lost their user after 03:14 UTC.",
+    )
+
+
+@pytest.fixture
+def state() -> InvestigationState:
+    """Create an investigation state."""
+    alert = AnomalyAlert(
+        dataset_id="web.events",
+        metric_spec=MetricSpec(
+            metric_type="column", expression="user_id", display_name="user_id nulls"
+        ),
+        anomaly_type="null_rate",
+        expected_value=0.01,
+        actual_value=0.2,
+        deviation_pct=1900.0,
+        anomaly_date="2024-01-15",
+        severity="high",
+    )
+    return InvestigationState(id=str(uuid4()), tenant_id=uuid4(), alert=alert)
+
+
+@pytest.fixture
+def adapter() -> MagicMock:
+    """Create a data adapter that returns one row per query."""
+    adapter = MagicMock()
+    adapter.estimate_query_cost = AsyncMock(return_value=None)
+    adapter.execute_query = AsyncMock(
+        return_value=QueryResult(columns=[{"name": "n"}], rows=[{"n": 485}], row_count=1)
+    )
+    return adapter
+
+
+@pytest.fixture
+def llm() -> MagicMock:
+    """Create an LLM mock; interpretations are set per test."""
+
+    async def synthesize(**kwargs: Any) -> Finding:
+        return Finding(
+            investigation_id="",
+            status="completed",
+            root_cause="Users ETL job timed out again",
+            confidence=0.9,
+            evidence=kwargs["evidence"],
+            recommendations=["Re-run the users ETL"],
+            duration_seconds=0.0,
+        )
+
+    llm = MagicMock()
+    llm.generate_hypotheses = AsyncMock(return_value=[NEW_HYPOTHESIS])
+    llm.generate_query = AsyncMock(return_value="SELECT new_query LIMIT 1")
+    llm.synthesize_findings = AsyncMock(side_effect=synthesize)
+    return llm
+
+
+@pytest.fixture
+def finding_memory() -> MagicMock:
+    """Create a finding memory that recalls one prior finding."""
+    memory = MagicMock()
+    memory.recall = AsyncMock(return_value=[PRIOR])
+    memory.remember = AsyncMock(return_value=True)
+    return memory
+
+
+def _orchestrator(llm: MagicMock, finding_memory: MagicMock | None) -> InvestigationOrchestrator:
+    """Create an orchestrator whose context has one table."""
+    context = MagicMock()
+    context.schema.is_empty.return_value = False
+    context.schema.table_count.return_value = 1
+    context.lineage = None
+    context_engine = MagicMock()
+    context_engine.gather = AsyncMock(return_value=context)
+    return InvestigationOrchestrator(
+        db=None,
+        llm=llm,
+        context_engine=context_engine,
+        circuit_breaker=MagicMock(),
+        finding_memory=finding_memory,
+    )
+
+
+class TestWarmStart:
+    """Tests for re-running prior decisive queries before new hypotheses."""
+
+    async def test_reconfirmed_cause_skips_hypotheses(
+        self,
+        llm: MagicMock,
+        adapter: MagicMock,
+        finding_memory: MagicMock,
+        state: InvestigationState,
+    ) -> None:
+        """Test a reconfirmed past cause goes straight to synthesis."""
+        llm.interpret_evidence = AsyncMock(
+            side_effect=lambda h, sql, result, **kw: _evidence(h.id, sql, 0.95)
+        )
+        orchestrator = _orchestrator(llm, finding_memory)
+
+        finding = await orchestrator.run_investigation(state, adapter)
+        await orchestrator.close()
+
+        llm.generate_hypotheses.assert_not_called()
+        llm.generate_query.assert_not_called()
+        # The first decisive query reconfirmed the cause; the second never ran
+        adapter.execute_query.assert_awaited_once()
+        assert adapter.execute_query.call_args.args[0] == "SELECT decisive_1 LIMIT 1"
+        assert [ev.query for ev in finding.evidence] == ["SELECT decisive_1 LIMIT 1"]
+        tested = llm.interpret_evidence.call_args.args[0]
+        assert tested.title == PRIOR.root_cause
+        assert tested.category == PRIOR.category
+        finding_memory.recall.assert_awaited_once()
+        assert finding_memory.recall.call_args.kwargs == {"top_k": 3, "min_similarity": 0.8}
+        # The cause is already remembered
+        finding_memory.remember.assert_not_called()
+
+    async def test_unconfirmed_cause_seeds_hypotheses(
+        self,
+        llm: MagicMock,
+        adapter: MagicMock,
+        finding_memory: MagicMock,
+        state: InvestigationState,
+    ) -> None:
+        """Test a past cause that no longer holds is passed to hypothesis generation."""
+
+        def interpret(h: Hypothesis, sql: str, result: QueryResult, **kw: Any) -> Evidence:
+            return _evidence(h.id, sql, 0.95 if h.id == "h1" else 0.3)
+
+        llm.interpret_evidence = AsyncMock(side_effect=interpret)
+        orchestrator = _orchestrator(llm, finding_memory)
+
+        finding = await orchestrator.run_investigation(state, adapter)
+        await orchestrator.close()
+
+        executed = [c.args[0] for c in adapter.execute_query.call_args_list]
+        assert executed[:2] == PRIOR.decisive_queries
+        assert llm.generate_hypotheses.call_args.kwargs["prior_findings"] == [PRIOR]
+        assert [ev.query for ev in finding.evidence] == [
+            "SELECT decisive_1 LIMIT 1",
+            "SELECT decisive_2 LIMIT 1",
+            "SELECT new_query LIMIT 1",
+        ]
+        finding_memory.remember.assert_awaited_once()
+        tenant_id, alert, remembered, hypotheses = finding_memory.remember.call_args.args
+        assert tenant_id == state.tenant_id
+        assert remembered.root_cause == "Users ETL job timed out again"
+        assert hypotheses == [NEW_HYPOTHESIS]
+
+    async def test_without_memory_starts_cold(
+        self, llm: MagicMock, adapter: MagicMock, state: InvestigationState
+    ) -> None:
+        """Test investigations without a finding memory are unchanged."""
+        llm.interpret_evidence = AsyncMock(
+            side_effect=lambda h, sql, result, **kw: _evidence(h.id, sql, 0.95)
+        )
+        orchestrator = _orchestrator(llm, None)
+
+        await orchestrator.run_investigation(state, adapter)
+        await orchestrator.close()
+
+        assert llm.generate_hypotheses.call_args.kwargs["prior_findings"] is None
+        assert adapter.execute_query.call_args.args[0] == "SELECT new_query LIMIT 1"
+
+
+class TestHypothesisPromptPriors:
+    """Tests for prior findings in the hypothesis prompt."""
+
+    def test_prior_causes_are_listed(self, state: InvestigationState) -> None:
+        """Test recalled root causes appear in the user prompt."""
+        context = InvestigationContext(schema=MagicMock())
+
+        with_priors = hypothesis_prompt.build_user(state.alert, context, prior_findings=[PRIOR])
+        without = hypothesis_prompt.build_user(state.alert, context)
+
+        assert "## Similar Past Incidents" in with_priors
+        assert PRIOR.root_cause in with_priors
+        assert "similarity: 0.93" in with_priors
+        assert "Similar Past Incidents" not in without
@@ -0,0 +1,176 @@
+"""Unit tests for QueryCostGate."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from dataing.adapters.datasource.errors import QueryBudgetExceededError
+from dataing.adapters.datasource.types import QueryCostEstimate
+from dataing.safety.cost_gate import QueryBudget, QueryCostGate
+
+GIB = 1024**3
+
+
+class FakeAdapter:
+    """Adapter stand-in with a fixed estimate and optional sampling support."""
+
+    def __init__(
+        self,
+        estimate: QueryCostEstimate | None = None,
+        error: Exception | None = None,
+        can_sample: bool = True,
+    ) -> None:
+        """Return the given estimate, or raise the given error."""
+        self._estimate = estimate
+        self._error = error
+        self._can_sample = can_sample
+        self.sampled_percent: float | None = None
+
+    async def estimate_query_cost(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> QueryCostEstimate | None:
+        """Return the configured estimate."""
+        if self._error:
+            raise self._error
+        return self._estimate
+
+    def build_sampled_query(self, sql: str, percent: float) -> str | None:
+        """Record the sample size and sample if supported."""
+        self.sampled_percent = percent
+        return f"{sql} /* sampled {percent} */" if self._can_sample else None
+
+
+class TestQueryBudget:
+    """Tests for QueryBudget."""
+
+    def test_default_values(self) -> None:
+        """Test default budget limits only bytes scanned."""
+        budget = QueryBudget()
+
+        assert budget.max_bytes_scanned == 10 * GIB
+        assert budget.max_rows_scanned is None
+        assert budget.max_cost is None
+        assert budget.sample_over_budget is True
+
+    def test_from_tenant_settings(self) -> None:
+        """Test tenant overrides are applied and unknown keys ignored."""
+        settings = {"query_budget": {"max_bytes_scanned": GIB, "max_cost": 500, "colour": "red"}}
+
+        budget = QueryBudget.from_tenant_settings(settings)
+
+        assert budget.max_bytes_scanned == GIB
+        assert budget.max_cost == 500
+        assert budget.sample_over_budget is True
+
+    def test_from_missing_settings_uses_defaults(self) -> None:
+        """Test missing settings give the default budget."""
+        assert QueryBudget.from_tenant_settings({}) == QueryBudget()
+        assert QueryBudget.from_tenant_settings({"other": 1}) == QueryBudget()
+
+    def test_overrun_uses_largest_ratio(self) -> None:
+        """Test overrun reports the worst enforced limit."""
+        budget = QueryBudget(max_bytes_scanned=100, max_rows_scanned=10)
+        estimate = QueryCostEstimate(method="explain", bytes_scanned=50, rows_scanned=40)
+
+        assert budget.overrun(estimate) == 4.0
+
+    def test_overrun_ignores_unenforced_limits(self) -> None:
+        """Test estimates without a matching limit do not count."""
+        estimate = QueryCostEstimate(method="explain", cost=1e12)
+
+        assert QueryBudget().overrun(estimate) == 0.0
+
+
+class TestQueryCostGate:
+    """Tests for QueryCostGate.check."""
+
+    async def test_within_budget_runs_unchanged(self) -> None:
+        """Test a cheap query is allowed as-is."""
+        estimate = QueryCostEstimate(method="dry_run", bytes_scanned=GIB)
+        gate = QueryCostGate(QueryBudget(max_bytes_scanned=2 * GIB))
+
+        decision = await gate.check(FakeAdapter(estimate), "SELECT 1")
+
+        assert decision.action == "allowed"
+        assert decision.sql == "SELECT 1"
+        decision.raise_if_rejected()
+
+    async def test_over_budget_is_sampled(self) -> None:
+        """Test an over-budget query is rewritten to fit the budget."""
+        adapter = FakeAdapter(QueryCostEstimate(method="dry_run", bytes_scanned=400 * GIB))
+        gate = QueryCostGate(QueryBudget(max_bytes_scanned=10 * GIB))
+
+        decision = await gate.check(adapter, "SELECT * FROM events LIMIT 10")
+
+        assert decision.action == "sampled"
+        assert decision.sampled_percent == 2.5
+        assert adapter.sampled_percent == 2.5
+        assert decision.sql.endswith("/* sampled 2.5 */")
+
+    async def test_rejected_when_sampling_unsupported(self) -> None:
+        """Test the query is rejected when the source cannot sample."""
+        adapter = FakeAdapter(
+            QueryCostEstimate(method="dry_run", bytes_scanned=20 * GIB), can_sample=False
+        )
+        gate = QueryCostGate(QueryBudget(max_bytes_scanned=10 * GIB))
+
+        decision = await gate.check(adapter, "SELECT * FROM events LIMIT 10")
+
+        assert decision.action == "rejected"
+        with pytest.raises(QueryBudgetExceededError) as exc_info:
+            decision.raise_if_rejected()
+        message = str(exc_info.value)
+        assert "20.0 GiB" in message
+        assert "10.0 GiB" in message
+        assert "partition" in message
+        assert exc_info.value.details["estimate"]["bytes_scanned"] == 20 * GIB
+
+    async def test_rejected_when_sample_too_small(self) -> None:
+        """Test a query needing a tiny sample is rejected instead."""
+        adapter = FakeAdapter(QueryCostEstimate(method="explain", cost=1e9))
+        gate = QueryCostGate(QueryBudget(max_bytes_scanned=None, max_cost=1000))
+
+        decision = await gate.check(adapter, "SELECT 1")
+
+        assert decision.action == "rejected"
+        assert adapter.sampled_percent is None
+
+    async def test_rejected_when_sampling_disabled(self) -> None:
+        """Test sampling can be turned off per budget."""
+        adapter = FakeAdapter(QueryCostEstimate(method="explain", rows_scanned=200))
+        gate = QueryCostGate(QueryBudget(max_rows_scanned=100, sample_over_budget=False))
+
+        decision = await gate.check(adapter, "SELECT 1")
+
+        assert decision.action == "rejected"
+        assert "200 rows" in str(decision.rejection)
+
+    async def test_unestimated_when_source_cannot_estimate(self) -> None:
+        """Test sources without estimates are allowed."""
+        decision = await QueryCostGate().check(FakeAdapter(None), "SELECT 1")
+
+        assert decision.action == "unestimated"
+        assert decision.estimate is None
+
+    async def test_unestimated_when_estimate_fails(self) -> None:
+        """Test estimation errors do not block the query."""
+        adapter = FakeAdapter(error=RuntimeError("EXPLAIN not permitted"))
+
+        decision = await QueryCostGate().check(adapter, "SELECT 1")
+
+        assert decision.action == "unestimated"
+        assert decision.sql == "SELECT 1"
+
+    async def test_event_data(self) -> None:
+        """Test the decision summary recorded on query_submitted."""
+        estimate = QueryCostEstimate(method="dry_run", bytes_scanned=GIB)
+
+        decision = await QueryCostGate().check(FakeAdapter(estimate), "SELECT 1")
+
+        assert decision.to_event_data() == {
+            "cost_action": "allowed",
+            "cost_estimate": estimate.model_dump(),
+            "sampled_percent": None,
+        }
@@ -0,0 +1,345 @@
+"""Unit tests for SchemaSyncService."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from dataing.adapters.datasource.types import (
+    Catalog,
+    Schema,
+    SchemaResponse,
+    SourceCategory,
+    SourceType,
+    Table,
+)
+from dataing.services import schema_sync
+from dataing.services.schema_sync import (
+    SchemaSyncService,
+    dataset_records_from_schema,
+    diff_datasets,
+)
+
+
+def _schema(paths: list[str], row_count: int = 10) -> SchemaResponse:
+    """Build a schema response with one table per native path."""
+    return SchemaResponse(
+        source_id="src",
+        source_type=SourceType.POSTGRESQL,
+        source_category=SourceCategory.DATABASE,
+        fetched_at=datetime.now(UTC),
+        catalogs=[
+            Catalog(
+                name="db",
+                schemas=[
+                    Schema(
+                        name="public",
+                        tables=[
+                            Table(
+                                name=path.split(".")[-1],
+                                table_type="table",
+                                native_type="BASE TABLE",
+                                native_path=path,
+                                columns=[],
+                                row_count=row_count,
+                            )
+                            for path in paths
+                        ],
+                    )
+                ],
+            )
+        ],
+    )
+
+
+class FakeAdapter:
+    """Adapter stand-in returning a fixed schema."""
+
+    def __init__(self, schema: SchemaResponse, delay: float = 0.0):
+        """Serve the given schema after a delay."""
+        self._schema = schema
+        self._delay = delay
+
+    async def __aenter__(self) -> FakeAdapter:
+        """Enter the adapter context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the adapter context."""
+        return None
+
+    async def get_schema(self, filter: Any = None) -> SchemaResponse:
+        """Return the configured schema."""
+        await asyncio.sleep(self._delay)
+        return self._schema
+
+
+class FakeDatabase:
+    """In-memory stand-in for the datasets and schema_sync_jobs tables."""
+
+    def __init__(self) -> None:
+        """Start with no datasets and no jobs."""
+        self.datasets: dict[str, dict[str, Any]] = {}
+        self.jobs: dict[uuid.UUID, dict[str, Any]] = {}
+        self.merged_batches: list[int] = []
+        self.fail_merge_after: int | None = None
+        self.heartbeats = 0
+
+    async def get_dataset_sync_state(self, tenant_id: Any, datasource_id: Any) -> list[dict]:
+        """Return the stored datasets of the datasource."""
+        return [dict(row) for row in self.datasets.values()]
+
+    async def merge_datasets(
+        self, tenant_id: Any, datasource_id: Any, datasets: list[dict[str, Any]]
+    ) -> int:
+        """Upsert datasets and count the writes."""
+        if self.fail_merge_after is not None and len(self.merged_batches) >= self.fail_merge_after:
+            raise ConnectionError("connection lost")
+        for dataset in datasets:
+            self.datasets[dataset["native_path"]] = {**dataset, "is_active": True}
+        self.merged_batches.append(len(datasets))
+        return len(datasets)
+
+    async def deactivate_datasets(
+        self, tenant_id: Any, datasource_id: Any, native_paths: list[str]
+    ) -> int:
+        """Mark datasets inactive."""
+        for path in native_paths:
+            self.datasets[path]["is_active"] = False
+        return len(native_paths)
+
+    async def create_schema_sync_job(self, tenant_id: Any, datasource_id: Any) -> dict | None:
+        """Create a pending sync job unless one is active, like the unique index."""
+        if any(
+            j["datasource_id"] == datasource_id and j["status"] in ("pending", "running")
+            for j in self.jobs.values()
+        ):
+            return None
+        job = {
+            "id": uuid.uuid4(),
+            "tenant_id": tenant_id,
+            "datasource_id": datasource_id,
+            "status": "pending",
+            "phase": "discovering",
+            "tables_discovered": 0,
+            "tables_processed": 0,
+            "datasets_changed": 0,
+            "datasets_removed": 0,
+            "error": None,
+            "created_at": datetime.now(UTC),
+            "updated_at": datetime.now(UTC),
+        }
+        self.jobs[job["id"]] = job
+        return dict(job)
+
+    async def get_latest_schema_sync_job(self, tenant_id: Any, datasource_id: Any) -> dict | None:
+        """Return the most recent sync job."""
+        jobs = sorted(self.jobs.values(), key=lambda j: j["created_at"])
+        return dict(jobs[-1]) if jobs else None
+
+    async def update_schema_sync_job(self, job_id: uuid.UUID, **fields: Any) -> dict:
+        """Update a sync job with the given fields."""
+        self.jobs[job_id].update(fields, updated_at=datetime.now(UTC))
+        return dict(self.jobs[job_id])
+
+    async def claim_schema_sync_job(self, job_id: uuid.UUID, stale_seconds: float) -> dict | None:
+        """Reset a failed or abandoned job to pending unless it is progressing."""
+        job = self.jobs[job_id]
+        idle = (datetime.now(UTC) - job["updated_at"]).total_seconds()
+        if job["status"] != "failed" and not (
+            job["status"] in ("pending", "running") and idle > stale_seconds
+        ):
+            return None
+        return await self.update_schema_sync_job(job_id, status="pending", error=None)
+
+    async def touch_schema_sync_job(self, job_id: uuid.UUID) -> None:
+        """Record a heartbeat."""
+        self.heartbeats += 1
+        self.jobs[job_id]["updated_at"] = datetime.now(UTC)
+
+
+def _stored(path: str, row_count: int = 10, is_active: bool = True) -> dict[str, Any]:
+    """Build a stored dataset row matching a discovered table."""
+    record = dataset_records_from_schema(_schema([path], row_count))[0]
+    return {**record, "is_active": is_active}
+
+
+class TestDiffDatasets:
+    """Tests for diff_datasets."""
+
+    def test_detects_new_changed_and_removed(self) -> None:
+        """Test that only differing datasets are returned."""
+        stored = [_stored("public.same"), _stored("public.grew", 5), _stored("public.gone")]
+        discovered = dataset_records_from_schema(
+            _schema(["public.same", "public.grew", "public.new"])
+        )
+
+        diff = diff_datasets(stored, discovered)
+
+        assert [d["native_path"] for d in diff.changed] == ["public.grew", "public.new"]
+        assert diff.removed == ["public.gone"]
+        assert diff.unchanged == 1
+
+    def test_reactivates_inactive_datasets(self) -> None:
+        """Test that a reappearing table is written even if unchanged."""
+        diff = diff_datasets(
+            [_stored("public.back", is_active=False), _stored("public.old", is_active=False)],
+            dataset_records_from_schema(_schema(["public.back"])),
+        )
+
+        assert [d["native_path"] for d in diff.changed] == ["public.back"]
+        assert diff.removed == []
+
+
+class TestSchemaSyncService:
+    """Tests for SchemaSyncService."""
+
+    @pytest.fixture
+    def db(self) -> FakeDatabase:
+        """Return an in-memory database."""
+        return FakeDatabase()
+
+    @pytest.fixture
+    def service(self, db: FakeDatabase) -> SchemaSyncService:
+        """Return a schema sync service."""
+        return SchemaSyncService(db)  # type: ignore[arg-type]
+
+    async def test_run_writes_only_the_difference(
+        self, db: FakeDatabase, service: SchemaSyncService
+    ) -> None:
+        """Test that unchanged datasets are not rewritten."""
+        db.datasets = {"public.a": _stored("public.a"), "public.z": _stored("public.z")}
+        job, should_run = await service.start(uuid.uuid4(), uuid.uuid4())
+
+        final = await service.run(job, FakeAdapter(_schema(["public.a", "public.b"])))
+
+        assert should_run is True
+        assert db.merged_batches == [1]
+        assert final["status"] == "completed"
+        assert final["tables_discovered"] == 2
+        assert final["tables_processed"] == 2
+        assert final["datasets_changed"] == 1
+        assert final["datasets_removed"] == 1
+        assert db.datasets["public.z"]["is_active"] is False
+
+    async def test_failed_job_resumes_where_it_stopped(
+        self,
+        db: FakeDatabase,
+        service: SchemaSyncService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that re-running a failed job only merges the remaining chunks."""
+        monkeypatch.setattr(schema_sync, "SYNC_CHUNK_SIZE", 2)
+        adapter = FakeAdapter(_schema([f"public.t{i}" for i in range(5)]))
+        tenant_id, datasource_id = uuid.uuid4(), uuid.uuid4()
+
+        db.fail_merge_after = 1
+        job, _ = await service.start(tenant_id, datasource_id)
+        failed = await service.run(job, adapter)
+        assert failed["status"] == "failed"
+        assert failed["tables_processed"] == 2
+
+        db.fail_merge_after = None
+        resumed, should_run = await service.start(tenant_id, datasource_id)
+        final = await service.run(resumed, adapter)
+
+        assert should_run is True
+        assert resumed["id"] == job["id"]
+        assert db.merged_batches == [2, 2, 1]
+        assert final["status"] == "completed"
+        assert final["datasets_changed"] == 5
+
+    async def test_running_job_is_not_started_twice(
+        self, db: FakeDatabase, service: SchemaSyncService
+    ) -> None:
+        """Test that a sync in progress is returned instead of duplicated."""
+        tenant_id, datasource_id = uuid.uuid4(), uuid.uuid4()
+        job, _ = await service.start(tenant_id, datasource_id)
+        await db.update_schema_sync_job(job["id"], status="running")
+
+        again, should_run = await service.start(tenant_id, datasource_id)
+
+        assert again["id"] == job["id"]
+        assert should_run is False
+
+    async def test_stale_running_job_is_resumed(
+        self, db: FakeDatabase, service: SchemaSyncService
+    ) -> None:
+        """Test that a job that stopped reporting progress is run again."""
+        tenant_id, datasource_id = uuid.uuid4(), uuid.uuid4()
+        job, _ = await service.start(tenant_id, datasource_id)
+        db.jobs[job["id"]].update(
+            status="running", updated_at=datetime.now(UTC) - timedelta(hours=1)
+        )
+
+        again, should_run = await service.start(tenant_id, datasource_id)
+
+        assert again["id"] == job["id"]
+        assert should_run is True
+
+    async def test_resumed_job_is_claimed_once(
+        self, db: FakeDatabase, service: SchemaSyncService
+    ) -> None:
+        """Test that of two requests resuming a stale job only one runs it."""
+        tenant_id, datasource_id = uuid.uuid4(), uuid.uuid4()
+        job, _ = await service.start(tenant_id, datasource_id)
+        stale = {"status": "running", "updated_at": datetime.now(UTC) - timedelta(hours=1)}
+        db.jobs[job["id"]].update(stale)
+        seen = dict(db.jobs[job["id"]])
+
+        first = await service.start(tenant_id, datasource_id)
+        # The second request read the job before the first one claimed it
+        db.get_latest_schema_sync_job = _returns_once(seen, db.get_latest_schema_sync_job)
+        second = await service.start(tenant_id, datasource_id)
+
+        assert first[1] is True
+        assert second == (dict(db.jobs[job["id"]]), False)
+
+    async def test_concurrent_create_does_not_duplicate(
+        self, db: FakeDatabase, service: SchemaSyncService
+    ) -> None:
+        """Test that a request losing the insert race returns the other job."""
+        tenant_id, datasource_id = uuid.uuid4(), uuid.uuid4()
+        job, _ = await service.start(tenant_id, datasource_id)
+        # The second request read no job before the first one inserted it
+        db.get_latest_schema_sync_job = _returns_once(None, db.get_latest_schema_sync_job)
+
+        again, should_run = await service.start(tenant_id, datasource_id)
+
+        assert again["id"] == job["id"]
+        assert should_run is False
+        assert len(db.jobs) == 1
+
+    async def test_discovery_sends_heartbeats(
+        self,
+        db: FakeDatabase,
+        service: SchemaSyncService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a slow discovery keeps the job fresh and heartbeats stop after it."""
+        monkeypatch.setattr(schema_sync, "HEARTBEAT_SECONDS", 0.01)
+        job, _ = await service.start(uuid.uuid4(), uuid.uuid4())
+
+        final = await service.run(job, FakeAdapter(_schema(["public.a"]), delay=0.05))
+        beats = db.heartbeats
+        await asyncio.sleep(0.03)
+
+        assert final["status"] == "completed"
+        assert beats >= 2
+        assert db.heartbeats == beats
+
+
+def _returns_once(value: dict[str, Any] | None, then: Any) -> Any:
+    """Return ``value`` on the first call and delegate to ``then`` afterwards."""
+    calls = 0
+
+    async def fetch(*args: Any) -> dict[str, Any] | None:
+        nonlocal calls
+        calls += 1
+        return value if calls == 1 else await then(*args)
+
+    return fetch
@@ -6,7 +6,9 @@ import uuid
 from unittest.mock import AsyncMock
 
 import pytest
+from pydantic_ai.usage import RunUsage
 
+from dataing.agents.telemetry import LLMTelemetry
 from dataing.services.usage import UsageSummary, UsageTracker
 
 
@@ -88,6 +90,30 @@ class TestUsageTracker:
         # Default pricing is higher than known models
         assert cost > 0
 
+    async def test_record_llm_telemetry(
+        self,
+        tracker: UsageTracker,
+        tenant_id: uuid.UUID,
+        mock_db: AsyncMock,
+    ) -> None:
+        """Test an investigation's usage is recorded per role and model."""
+        telemetry = LLMTelemetry()
+        telemetry.record(
+            "query", "claude-3-5-haiku-20241022", RunUsage(requests=1, input_tokens=1000), 80.0
+        )
+        telemetry.record(
+            "synthesis", "claude-sonnet-4-20250514", RunUsage(requests=1, input_tokens=1000), 900.0
+        )
+
+        cost = await tracker.record_llm_telemetry(tenant_id, telemetry)
+
+        assert cost == pytest.approx(telemetry.total_cost)
+        metadata = [c.kwargs["metadata"] for c in mock_db.record_usage.call_args_list]
+        assert [(m["agent_role"], m["latency_ms"]) for m in metadata] == [
+            ("query", 80.0),
+            ("synthesis", 900.0),
+        ]
+
     async def test_record_query_execution(
         self,
         tracker: UsageTracker,
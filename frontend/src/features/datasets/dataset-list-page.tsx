@@ -1,6 +1,7 @@
 import * as React from 'react'
 import { useParams, Link } from 'react-router-dom'
 import { Table, AlertCircle, RefreshCw } from 'lucide-react'
+import { toast } from 'sonner'
 
 import { Button } from '@/components/ui/Button'
 import { PageHeader } from '@/components/shared/page-header'
@@ -22,9 +23,13 @@ export function DatasetListPage() {
   const handleSync = React.useCallback(() => {
     if (datasourceId) {
       syncMutation.mutate(datasourceId, {
-        onSuccess: () => {
+        onSuccess: (result) => {
+          toast.success(result.message)
           refetch()
         },
+        onError: (error) => {
+          toast.error(`Sync failed: ${error.message}`)
+        },
       })
     }
   }, [datasourceId, syncMutation, refetch])
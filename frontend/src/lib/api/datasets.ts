@@ -1,5 +1,6 @@
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 import {
+  getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet,
   listDatasourceDatasetsApiV1DatasourcesDatasourceIdDatasetsGet,
   syncDatasourceSchemaApiV1DatasourcesDatasourceIdSyncPost,
 } from './generated/datasources/datasources'
@@ -65,17 +66,31 @@ export function useDatasetInvestigations(datasetId: string | null) {
   })
 }
 
+// How often to poll a running schema sync job
+const SYNC_POLL_INTERVAL_MS = 2000
+
 /**
  * Hook to sync a datasource's schema and update datasets.
+ *
+ * The sync runs as a background job on the server; the mutation polls the
+ * job and resolves once it has completed (or rejects if it failed).
  */
 export function useSyncDatasource() {
   const queryClient = useQueryClient()
 
   return useMutation({
     mutationFn: async (datasourceId: string): Promise<SyncResponse> => {
-      return syncDatasourceSchemaApiV1DatasourcesDatasourceIdSyncPost(datasourceId)
+      let job = await syncDatasourceSchemaApiV1DatasourcesDatasourceIdSyncPost(datasourceId)
+      while (job.job_id && (job.status === 'pending' || job.status === 'running')) {
+        await new Promise((resolve) => setTimeout(resolve, SYNC_POLL_INTERVAL_MS))
+        job = await getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet(datasourceId, job.job_id)
+      }
+      if (job.status === 'failed') {
+        throw new Error(job.error ?? 'Schema sync failed')
+      }
+      return job
     },
-    onSuccess: (_, datasourceId) => {
+    onSettled: (_, __, datasourceId) => {
       queryClient.invalidateQueries({
         queryKey: queryKeys.datasets.all(datasourceId),
       })
@@ -985,10 +985,12 @@ export const useGetColumnStatsApiV1DatasourcesDatasourceIdStatsPost = <
   return useMutation(mutationOptions);
 };
 /**
- * Sync schema and register/update datasets.
+ * Start a schema sync that registers/updates datasets.
 
-Discovers all tables from the data source and upserts them
-into the datasets table. Soft-deletes datasets that no longer exist.
+Discovers all tables from the data source in a background job, writes
+only the datasets that changed and soft-deletes datasets that no longer
+exist. Returns the job immediately; a sync already in progress is
+returned instead of starting another, and a failed one is resumed.
  * @summary Sync Datasource Schema
  */
 export const syncDatasourceSchemaApiV1DatasourcesDatasourceIdSyncPost = (
@@ -1086,6 +1088,129 @@ export const useSyncDatasourceSchemaApiV1DatasourcesDatasourceIdSyncPost = <
 
   return useMutation(mutationOptions);
 };
+/**
+ * Get the progress of a schema sync job.
+ * @summary Get Sync Job
+ */
+export const getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet = (
+  datasourceId: string,
+  jobId: string,
+  signal?: AbortSignal,
+) => {
+  return customInstance<SyncResponse>({
+    url: `/api/v1/datasources/${datasourceId}/sync/${jobId}`,
+    method: "GET",
+    signal,
+  });
+};
+
+export const getGetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryKey =
+  (datasourceId: string, jobId: string) => {
+    return [`/api/v1/datasources/${datasourceId}/sync/${jobId}`] as const;
+  };
+
+export const getGetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryOptions =
+  <
+    TData = Awaited<
+      ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+    >,
+    TError = HTTPValidationError,
+  >(
+    datasourceId: string,
+    jobId: string,
+    options?: {
+      query?: Partial<
+        UseQueryOptions<
+          Awaited<
+            ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+          >,
+          TError,
+          TData
+        >
+      >;
+    },
+  ) => {
+    const { query: queryOptions } = options ?? {};
+
+    const queryKey =
+      queryOptions?.queryKey ??
+      getGetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryKey(
+        datasourceId,
+        jobId,
+      );
+
+    const queryFn: QueryFunction<
+      Awaited<
+        ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+      >
+    > = ({ signal }) =>
+      getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet(
+        datasourceId,
+        jobId,
+        signal,
+      );
+
+    return {
+      queryKey,
+      queryFn,
+      enabled: !!(datasourceId && jobId),
+      ...queryOptions,
+    } as UseQueryOptions<
+      Awaited<
+        ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+      >,
+      TError,
+      TData
+    > & { queryKey: QueryKey };
+  };
+
+export type GetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryResult =
+  NonNullable<
+    Awaited<
+      ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+    >
+  >;
+export type GetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryError =
+  HTTPValidationError;
+
+/**
+ * @summary Get Sync Job
+ */
+export const useGetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet = <
+  TData = Awaited<
+    ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  datasourceId: string,
+  jobId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGet>
+        >,
+        TError,
+        TData
+      >
+    >;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } => {
+  const queryOptions =
+    getGetSyncJobApiV1DatasourcesDatasourceIdSyncJobIdGetQueryOptions(
+      datasourceId,
+      jobId,
+      options,
+    );
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  query.queryKey = queryOptions.queryKey;
+
+  return query;
+};
 /**
  * List datasets for a datasource.
  * @summary List Datasource Datasets
@@ -2183,10 +2308,12 @@ export const useGetColumnStatsApiV1V2DatasourcesDatasourceIdStatsPost = <
   return useMutation(mutationOptions);
 };
 /**
- * Sync schema and register/update datasets.
+ * Start a schema sync that registers/updates datasets.
 
-Discovers all tables from the data source and upserts them
-into the datasets table. Soft-deletes datasets that no longer exist.
+Discovers all tables from the data source in a background job, writes
+only the datasets that changed and soft-deletes datasets that no longer
+exist. Returns the job immediately; a sync already in progress is
+returned instead of starting another, and a failed one is resumed.
  * @summary Sync Datasource Schema
  */
 export const syncDatasourceSchemaApiV1V2DatasourcesDatasourceIdSyncPost = (
@@ -2286,6 +2413,129 @@ export const useSyncDatasourceSchemaApiV1V2DatasourcesDatasourceIdSyncPost = <
 
   return useMutation(mutationOptions);
 };
+/**
+ * Get the progress of a schema sync job.
+ * @summary Get Sync Job
+ */
+export const getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet = (
+  datasourceId: string,
+  jobId: string,
+  signal?: AbortSignal,
+) => {
+  return customInstance<SyncResponse>({
+    url: `/api/v1/v2/datasources/${datasourceId}/sync/${jobId}`,
+    method: "GET",
+    signal,
+  });
+};
+
+export const getGetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryKey =
+  (datasourceId: string, jobId: string) => {
+    return [`/api/v1/v2/datasources/${datasourceId}/sync/${jobId}`] as const;
+  };
+
+export const getGetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryOptions =
+  <
+    TData = Awaited<
+      ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+    >,
+    TError = HTTPValidationError,
+  >(
+    datasourceId: string,
+    jobId: string,
+    options?: {
+      query?: Partial<
+        UseQueryOptions<
+          Awaited<
+            ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+          >,
+          TError,
+          TData
+        >
+      >;
+    },
+  ) => {
+    const { query: queryOptions } = options ?? {};
+
+    const queryKey =
+      queryOptions?.queryKey ??
+      getGetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryKey(
+        datasourceId,
+        jobId,
+      );
+
+    const queryFn: QueryFunction<
+      Awaited<
+        ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+      >
+    > = ({ signal }) =>
+      getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet(
+        datasourceId,
+        jobId,
+        signal,
+      );
+
+    return {
+      queryKey,
+      queryFn,
+      enabled: !!(datasourceId && jobId),
+      ...queryOptions,
+    } as UseQueryOptions<
+      Awaited<
+        ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+      >,
+      TError,
+      TData
+    > & { queryKey: QueryKey };
+  };
+
+export type GetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryResult =
+  NonNullable<
+    Awaited<
+      ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+    >
+  >;
+export type GetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryError =
+  HTTPValidationError;
+
+/**
+ * @summary Get Sync Job
+ */
+export const useGetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet = <
+  TData = Awaited<
+    ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+  >,
+  TError = HTTPValidationError,
+>(
+  datasourceId: string,
+  jobId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<typeof getSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGet>
+        >,
+        TError,
+        TData
+      >
+    >;
+  },
+): UseQueryResult<TData, TError> & { queryKey: QueryKey } => {
+  const queryOptions =
+    getGetSyncJobApiV1V2DatasourcesDatasourceIdSyncJobIdGetQueryOptions(
+      datasourceId,
+      jobId,
+      options,
+    );
+
+  const query = useQuery(queryOptions) as UseQueryResult<TData, TError> & {
+    queryKey: QueryKey;
+  };
+
+  query.queryKey = queryOptions.queryKey;
+
+  return query;
+};
 /**
  * List datasets for a datasource.
  * @summary List Datasource Datasets
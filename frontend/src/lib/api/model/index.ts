@@ -258,6 +258,9 @@ export * from "./statsResponse";
 export * from "./statsResponseColumns";
 export * from "./statsResponseRowCount";
 export * from "./syncResponse";
+export * from "./syncResponseError";
+export * from "./syncResponseJobId";
+export * from "./syncResponsePhase";
 export * from "./tagCreate";
 export * from "./tagListResponse";
 export * from "./tagResponse";
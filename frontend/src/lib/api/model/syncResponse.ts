@@ -5,12 +5,23 @@
  * Autonomous Data Quality Investigation
  * OpenAPI spec version: 2.0.0
  */
+import type { SyncResponseError } from "./syncResponseError";
+import type { SyncResponseJobId } from "./syncResponseJobId";
+import type { SyncResponsePhase } from "./syncResponsePhase";
 
 /**
  * Response for schema sync.
+
+Sync runs as a background job; poll the job for progress.
  */
 export interface SyncResponse {
   datasets_removed: number;
   datasets_synced: number;
+  error?: SyncResponseError;
+  job_id?: SyncResponseJobId;
   message: string;
+  phase?: SyncResponsePhase;
+  status?: string;
+  tables_discovered?: number;
+  tables_processed?: number;
 }